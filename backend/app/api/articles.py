@@ -2,65 +2,68 @@
 매물 관련 API 엔드포인트
 """
 from typing import List, Optional, Dict
-from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks, Response
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_
 
 from app.core.database import get_db
-from app.models.complex import Article, ArticleChange
+from app.core.dependencies import get_current_user
+from app.core.pagination import keyset_paginate, resolve_page_limit, set_pagination_headers
+from app.models.complex import Article, ArticleChange, User
 from app.schemas.complex import ArticleResponse
 from app.services.article_tracker import ArticleTracker
+from app.services.search_filters import article_conditions
 
 router = APIRouter(prefix="/articles", tags=["articles"])
 
 
 @router.get("/", response_model=List[ArticleResponse])
 def search_articles(
+    response: Response,
     complex_id: Optional[str] = Query(None, description="단지 ID"),
     trade_type: Optional[str] = Query(None, description="거래 유형 (매매/전세/월세)"),
     area_name: Optional[str] = Query(None, description="면적 타입"),
     building_name: Optional[str] = Query(None, description="동 정보"),
     min_area: Optional[float] = Query(None, description="최소 면적(㎡)"),
     max_area: Optional[float] = Query(None, description="최대 면적(㎡)"),
+    min_price: Optional[int] = Query(None, ge=0, description="최소 가격(만원) - 매매가/전세금/월세 보증금"),
+    max_price: Optional[int] = Query(None, ge=0, description="최대 가격(만원) - 매매가/전세금/월세 보증금"),
+    max_monthly_rent: Optional[int] = Query(None, ge=0, description="최대 월세(만원)"),
     is_active: bool = Query(True, description="활성 매물만"),
-    skip: int = Query(0, ge=0),
-    limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 X-Next-Cursor)"),
+    order: str = Query("desc", pattern="^(asc|desc)$", description="last_seen_at 정렬 방향"),
+    include_total: bool = Query(False, description="X-Total-Count 헤더 포함 (PostgreSQL은 추정치)"),
+    skip: int = Query(0, ge=0, description="건너뛸 개수 (하위호환용 - cursor 사용 권장)"),
+    limit: int = Query(50, ge=1, description="페이지 크기 (비로그인 최대 100, 로그인 최대 1000)"),
+    current_user: Optional[User] = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
     매물 검색
 
     다양한 조건으로 매물을 검색합니다.
+    (last_seen_at, id) 키셋 페이지네이션 - 다음 페이지는 X-Next-Cursor 헤더 값을 cursor로 전달합니다.
     """
-    query = db.query(Article)
-
-    # 필터 적용
-    if complex_id:
-        query = query.filter(Article.complex_id == complex_id)
-
-    if trade_type:
-        query = query.filter(Article.trade_type == trade_type)
-
-    if area_name:
-        query = query.filter(Article.area_name == area_name)
-
-    if building_name:
-        query = query.filter(Article.building_name.like(f"%{building_name}%"))
-
-    if min_area:
-        query = query.filter(Article.area1 >= min_area)
-
-    if max_area:
-        query = query.filter(Article.area1 <= max_area)
-
-    if is_active:
-        query = query.filter(Article.is_active == True)
-
-    # 최신순 정렬
-    query = query.order_by(Article.last_seen_at.desc())
-
-    # 페이지네이션
-    articles = query.offset(skip).limit(limit).all()
+    limit = resolve_page_limit(limit, current_user)
+    query = db.query(Article).filter(*article_conditions(
+        complex_id=complex_id,
+        trade_type=trade_type,
+        area_name=area_name,
+        building_name=building_name,
+        min_area=min_area,
+        max_area=max_area,
+        min_price=min_price,
+        max_price=max_price,
+        max_monthly_rent=max_monthly_rent,
+        is_active=is_active
+    ))
+
+    # 최신순 정렬 + 키셋 페이지네이션
+    articles, next_cursor = keyset_paginate(
+        query, (Article.last_seen_at, Article.id), cursor, limit,
+        descending=order == "desc", offset=skip
+    )
+    set_pagination_headers(response, next_cursor, query if include_total else None)
 
     return articles
 
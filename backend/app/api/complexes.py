@@ -2,13 +2,25 @@
 단지 관련 API 엔드포인트
 """
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
-from app.models.complex import Complex, Article, Transaction
+from app.core.dependencies import get_current_user
+from app.core.pagination import keyset_paginate, resolve_page_limit, set_pagination_headers
+from app.models.complex import Complex, Article, Transaction, RentTransaction, ComplexSummary, User
+from app.services.complex_stats import MAX_BATCH_COMPLEXES, get_complex_stats_batch
+from app.services.complex_geo import (
+    MAX_GEO_RESULTS,
+    MAX_NEARBY_RADIUS_M,
+    find_complexes_in_bbox,
+    find_nearby_complexes,
+)
+from app.services.complex_summary import summary_to_dict
 from app.schemas.complex import (
     ComplexResponse,
+    ComplexListItemResponse,
+    ComplexGeoResponse,
     ComplexDetailResponse,
     ArticleResponse,
     TransactionResponse,
@@ -18,20 +30,118 @@ from app.schemas.complex import (
 router = APIRouter(prefix="/complexes", tags=["complexes"])
 
 
-@router.get("/", response_model=List[ComplexResponse])
+@router.get("/", response_model=List[ComplexListItemResponse])
 def get_complexes(
-    skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=100),
+    response: Response,
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 X-Next-Cursor)"),
+    include_total: bool = Query(False, description="X-Total-Count 헤더 포함 (PostgreSQL은 추정치)"),
+    skip: int = Query(0, ge=0, description="건너뛸 개수 (하위호환용 - cursor 사용 권장)"),
+    limit: int = Query(100, ge=1, description="페이지 크기 (비로그인 최대 100, 로그인 최대 1000)"),
+    include_summary: bool = Query(False, description="단지 요약(매물 수, 가격 범위, 변동, 실거래) 포함 여부"),
+    current_user: Optional[User] = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    단지 목록 조회 (complex_id 순)
+
+    - **cursor**: 다음 페이지 커서 (응답 헤더 X-Next-Cursor)
+    - **skip**: 건너뛸 개수 (하위호환용)
+    - **limit**: 가져올 최대 개수 (비로그인 최대 100)
+    - **include_summary**: complex_summary 테이블을 JOIN 하여 요약 포함 (요약이 아직 없는 단지는 null)
+    """
+    limit = resolve_page_limit(limit, current_user)
+    query = db.query(Complex)
+
+    if not include_summary:
+        complexes, next_cursor = keyset_paginate(
+            query, (Complex.complex_id,), cursor, limit, descending=False, offset=skip
+        )
+        set_pagination_headers(response, next_cursor, query if include_total else None)
+        return complexes
+
+    rows, next_cursor = keyset_paginate(
+        db.query(Complex, ComplexSummary)
+        .outerjoin(ComplexSummary, ComplexSummary.complex_id == Complex.complex_id),
+        (Complex.complex_id,), cursor, limit, descending=False, offset=skip
+    )
+    set_pagination_headers(response, next_cursor, query if include_total else None)
+    return [
+        ComplexListItemResponse(
+            **ComplexResponse.model_validate(complex_obj).model_dump(),
+            summary=summary_to_dict(summary)
+        )
+        for complex_obj, summary in rows
+    ]
+
+
+@router.get("/stats")
+def get_complexes_stats(
+    ids: str = Query(..., description="단지 ID 목록 (쉼표 구분, 최대 100개)"),
+    db: Session = Depends(get_db)
+):
+    """
+    여러 단지 통계 일괄 조회 (대시보드 카드용)
+
+    - **ids**: 쉼표로 구분한 단지 ID (예: 109208,22627)
+
+    단지 ID → 통계 객체 (/{complex_id}/stats 와 같은 형식). 없는 단지는 제외됩니다.
+    """
+    complex_ids = [complex_id.strip() for complex_id in ids.split(",") if complex_id.strip()]
+
+    if len(complex_ids) > MAX_BATCH_COMPLEXES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 최대 {MAX_BATCH_COMPLEXES}개 단지까지 조회할 수 있습니다"
+        )
+
+    return get_complex_stats_batch(db, complex_ids)
+
+
+@router.get("/nearby", response_model=List[ComplexGeoResponse])
+def get_nearby_complexes(
+    lat: float = Query(..., ge=-90, le=90, description="중심 위도"),
+    lng: float = Query(..., ge=-180, le=180, description="중심 경도"),
+    radius: float = Query(1000, gt=0, le=MAX_NEARBY_RADIUS_M, description="반경(m)"),
+    limit: int = Query(100, ge=1, le=MAX_GEO_RESULTS, description="최대 결과 수"),
+    db: Session = Depends(get_db)
+):
+    """
+    반경 내 단지 검색 (가까운 순)
+
+    - **lat**, **lng**: 중심 좌표 (예: 역 위치)
+    - **radius**: 반경(m, 최대 50km)
+
+    각 단지에 중심까지 거리(distance_m)가 포함됩니다. 좌표가 없는 단지는 제외됩니다.
+    """
+    return [
+        ComplexGeoResponse(**ComplexResponse.model_validate(complex_obj).model_dump(), distance_m=distance)
+        for complex_obj, distance in find_nearby_complexes(db, lat, lng, radius, limit)
+    ]
+
+
+@router.get("/bbox", response_model=List[ComplexGeoResponse])
+def get_complexes_in_bbox(
+    south: float = Query(..., ge=-90, le=90, description="남쪽 위도"),
+    west: float = Query(..., ge=-180, le=180, description="서쪽 경도"),
+    north: float = Query(..., ge=-90, le=90, description="북쪽 위도"),
+    east: float = Query(..., ge=-180, le=180, description="동쪽 경도"),
+    limit: int = Query(500, ge=1, le=MAX_GEO_RESULTS, description="최대 결과 수"),
     db: Session = Depends(get_db)
 ):
     """
-    단지 목록 조회
+    지도 영역 내 단지 검색 (영역 중심에서 가까운 순)
 
-    - **skip**: 건너뛸 개수 (페이지네이션)
-    - **limit**: 가져올 최대 개수 (최대 100)
+    - **south**, **west**, **north**, **east**: 지도 화면 영역
+
+    영역 안 단지가 limit보다 많으면 중심에 가까운 단지부터 반환합니다.
     """
-    complexes = db.query(Complex).offset(skip).limit(limit).all()
-    return complexes
+    if south > north or west > east:
+        raise HTTPException(status_code=400, detail="영역 좌표가 올바르지 않습니다 (south ≤ north, west ≤ east)")
+
+    return [
+        ComplexGeoResponse(**ComplexResponse.model_validate(complex_obj).model_dump(), distance_m=distance)
+        for complex_obj, distance in find_complexes_in_bbox(db, south, west, north, east, limit)
+    ]
 
 
 @router.get("/{complex_id}", response_model=ComplexDetailResponse)
@@ -129,135 +239,12 @@ def get_complex_stats(
 
     - **complex_id**: 네이버 단지 ID
     """
-    complex_obj = db.query(Complex).filter(Complex.complex_id == complex_id).first()
+    stats = get_complex_stats_batch(db, [complex_id]).get(complex_id)
 
-    if not complex_obj:
+    if not stats:
         raise HTTPException(status_code=404, detail="단지를 찾을 수 없습니다")
 
-    # 매물 통계
-    total_articles = db.query(Article).filter(
-        Article.complex_id == complex_id,
-        Article.is_active == True
-    ).count()
-
-    sale_count = db.query(Article).filter(
-        Article.complex_id == complex_id,
-        Article.is_active == True,
-        Article.trade_type == "매매"
-    ).count()
-
-    lease_count = db.query(Article).filter(
-        Article.complex_id == complex_id,
-        Article.is_active == True,
-        Article.trade_type == "전세"
-    ).count()
-
-    monthly_count = db.query(Article).filter(
-        Article.complex_id == complex_id,
-        Article.is_active == True,
-        Article.trade_type == "월세"
-    ).count()
-
-    # 실거래 통계
-    total_transactions = db.query(Transaction).filter(
-        Transaction.complex_id == complex_id
-    ).count()
-
-    # 최근 실거래가
-    recent_transaction = db.query(Transaction).filter(
-        Transaction.complex_id == complex_id
-    ).order_by(Transaction.trade_date.desc()).first()
-
-    # Note: Article prices are stored as strings (e.g. "3억 5,000") so we cannot calculate min/max
-    # Price range information comes from Complex table fields
-
-    # 월세 가격 범위 계산 (보증금 및 월세)
-    monthly_articles = db.query(Article.price, Article.monthly_rent).filter(
-        Article.complex_id == complex_id,
-        Article.is_active == True,
-        Article.trade_type == "월세",
-        Article.price.isnot(None)
-    ).all()
-
-    monthly_deposit_min = None
-    monthly_deposit_max = None
-    monthly_rent_min = None
-    monthly_rent_max = None
-
-    if monthly_articles:
-        # price 문자열에서 숫자 추출하여 비교
-        def extract_price_number(price_str):
-            if not price_str:
-                return 0
-            import re
-            # "12억", "5,000" 등에서 숫자 추출
-            price_str = price_str.replace(',', '')
-            if '억' in price_str:
-                parts = price_str.split('억')
-                eok = int(re.sub(r'\D', '', parts[0])) if parts[0].strip() else 0
-                man = int(re.sub(r'\D', '', parts[1])) if len(parts) > 1 and parts[1].strip() else 0
-                return eok * 10000 + man
-            else:
-                return int(re.sub(r'\D', '', price_str)) if re.sub(r'\D', '', price_str) else 0
-
-        # 보증금 범위
-        price_numbers = [(p[0], extract_price_number(p[0])) for p in monthly_articles if p[0]]
-        if price_numbers:
-            price_numbers.sort(key=lambda x: x[1])
-            monthly_deposit_min = price_numbers[0][0]
-            monthly_deposit_max = price_numbers[-1][0]
-
-        # 월세 범위
-        rent_numbers = [(p[1], extract_price_number(p[1])) for p in monthly_articles if p[1]]
-        if rent_numbers:
-            rent_numbers.sort(key=lambda x: x[1])
-            monthly_rent_min = rent_numbers[0][0]
-            monthly_rent_max = rent_numbers[-1][0]
-
-    # 24시간 변경사항 계산
-    from datetime import datetime, timezone, timedelta
-    from app.models.complex import ArticleChange
-
-    cutoff = datetime.now(timezone.utc) - timedelta(hours=24)
-    changes_24h = db.query(ArticleChange).filter(
-        ArticleChange.complex_id == complex_id,
-        ArticleChange.detected_at >= cutoff
-    ).all()
-
-    changes_summary = {
-        "new": sum(1 for c in changes_24h if c.change_type == 'NEW'),
-        "removed": sum(1 for c in changes_24h if c.change_type == 'REMOVED'),
-        "price_up": sum(1 for c in changes_24h if c.change_type == 'PRICE_UP'),
-        "price_down": sum(1 for c in changes_24h if c.change_type == 'PRICE_DOWN')
-    }
-
-    return {
-        "complex_id": complex_id,
-        "complex_name": complex_obj.complex_name,
-        "total_households": complex_obj.total_households,
-        "address": complex_obj.address,
-        "articles": {
-            "total": total_articles,
-            "sale": sale_count,
-            "lease": lease_count,
-            "monthly": monthly_count,
-        },
-        "price_range": {
-            "sale_min": complex_obj.max_price,  # 비싼가격을 앞에
-            "sale_max": complex_obj.min_price,  # 낮은가격을 뒤에
-            "lease_min": complex_obj.max_lease_price,  # 비싼가격을 앞에
-            "lease_max": complex_obj.min_lease_price,  # 낮은가격을 뒤에
-            "monthly_deposit_min": monthly_deposit_max,  # 비싼가격을 앞에
-            "monthly_deposit_max": monthly_deposit_min,  # 낮은가격을 뒤에
-            "monthly_rent_min": monthly_rent_max,  # 비싼가격을 앞에
-            "monthly_rent_max": monthly_rent_min,  # 낮은가격을 뒤에
-        },
-        "transactions": {
-            "total": total_transactions,
-            "recent": TransactionResponse.model_validate(recent_transaction) if recent_transaction else None
-        },
-        "changes_24h": changes_summary
-    }
+    return stats
 
 
 @router.post("/", response_model=ComplexResponse)
@@ -385,6 +372,7 @@ def delete_complex(
 
     # 관련된 실거래가 삭제
     db.query(Transaction).filter(Transaction.complex_id == complex_id).delete()
+    db.query(RentTransaction).filter(RentTransaction.complex_id == complex_id).delete()
 
     # 관련된 스냅샷 삭제
     from app.models.complex import ArticleSnapshot, ArticleChange
@@ -0,0 +1,205 @@
+"""
+대량 데이터 내보내기 API 엔드포인트
+
+매물/실거래가/변동 이력을 NDJSON 또는 CSV로 스트리밍합니다.
+서버 측 커서(yield_per)로 EXPORT_BATCH_SIZE 행씩 읽어 바로 응답에 쓰므로
+전체 행 수와 관계없이 메모리 사용량이 일정합니다. (Pydantic 변환 없이 컬럼 값을 그대로 기록)
+
+- **format**: ndjson (기본) / csv
+- **gzip**: true면 gzip 압축 파일(.gz)로 내려줍니다
+
+행 수 제한 없이 테이블 전체를 내려줄 수 있으므로 로그인한 활성 사용자만 사용할 수 있습니다.
+"""
+import csv
+import io
+import json
+import os
+import zlib
+from datetime import date, datetime, timedelta, timezone
+from typing import Iterable, Iterator, List, Optional
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+
+from app.core.database import SessionLocal
+from app.core.dependencies import get_current_active_user
+from app.models.complex import Article, Transaction, ArticleChange, User
+from app.services.search_filters import article_conditions, transaction_conditions
+
+router = APIRouter(prefix="/export", tags=["export"])
+
+# 서버 측 커서에서 한 번에 가져오는 행 수
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "2000"))
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def _to_json_value(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def _encode_ndjson(rows: Iterable, columns: List[str], first: bool) -> str:
+    return "".join(
+        json.dumps(
+            {name: _to_json_value(value) for name, value in zip(columns, row)},
+            ensure_ascii=False
+        ) + "\n"
+        for row in rows
+    )
+
+
+def _encode_csv(rows: Iterable, columns: List[str], first: bool) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if first:
+        # 엑셀에서 한글이 깨지지 않도록 BOM + 헤더
+        buffer.write("\ufeff")
+        writer.writerow(columns)
+    writer.writerows(
+        [_to_json_value(value) for value in row]
+        for row in rows
+    )
+    return buffer.getvalue()
+
+
+def _stream_rows(statement, columns: List[str], fmt: str, compress: bool) -> Iterator[bytes]:
+    """
+    쿼리 결과를 배치 단위로 인코딩하여 전달
+
+    요청 세션(get_db)은 응답 스트리밍 전에 닫힐 수 있으므로 전용 세션을 사용합니다.
+    """
+    encode = _encode_csv if fmt == "csv" else _encode_ndjson
+    compressor = zlib.compressobj(wbits=31) if compress else None  # wbits=31: gzip 헤더
+    db = SessionLocal()
+
+    try:
+        result = db.execute(statement.execution_options(yield_per=EXPORT_BATCH_SIZE))
+        first = True
+
+        for partition in result.partitions():
+            chunk = encode(partition, columns, first).encode("utf-8")
+            first = False
+            if compressor:
+                chunk = compressor.compress(chunk)
+            if chunk:
+                yield chunk
+
+        if first and fmt == "csv":
+            # 결과가 없어도 헤더는 기록
+            chunk = encode([], columns, True).encode("utf-8")
+            yield compressor.compress(chunk) if compressor else chunk
+
+        if compressor:
+            yield compressor.flush()
+    finally:
+        db.close()
+
+
+def _export_response(name: str, model, conditions: List, order_by, fmt: str, compress: bool) -> StreamingResponse:
+    """테이블 전체 컬럼을 조건/정렬에 맞춰 스트리밍 응답으로 반환"""
+    table = model.__table__
+    columns = [column.name for column in table.columns]
+    statement = select(*table.columns).where(*conditions).order_by(*order_by)
+
+    filename = f"{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{fmt}"
+    media_type = MEDIA_TYPES[fmt]
+    if compress:
+        filename += ".gz"
+        media_type = "application/gzip"
+
+    return StreamingResponse(
+        _stream_rows(statement, columns, fmt, compress),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
+@router.get("/articles")
+def export_articles(
+    complex_id: Optional[str] = Query(None, description="단지 ID"),
+    trade_type: Optional[str] = Query(None, description="거래 유형 (매매/전세/월세)"),
+    area_name: Optional[str] = Query(None, description="면적 타입"),
+    building_name: Optional[str] = Query(None, description="동 정보"),
+    min_area: Optional[float] = Query(None, description="최소 면적(㎡)"),
+    max_area: Optional[float] = Query(None, description="최대 면적(㎡)"),
+    min_price: Optional[int] = Query(None, ge=0, description="최소 가격(만원) - 매매가/전세금/월세 보증금"),
+    max_price: Optional[int] = Query(None, ge=0, description="최대 가격(만원) - 매매가/전세금/월세 보증금"),
+    max_monthly_rent: Optional[int] = Query(None, ge=0, description="최대 월세(만원)"),
+    is_active: bool = Query(True, description="활성 매물만"),
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$", description="출력 형식"),
+    gzip: bool = Query(False, description="gzip 압축 여부"),
+    current_user: User = Depends(get_current_active_user),
+):
+    """
+    매물 내보내기 (/api/articles/ 검색과 같은 필터, id 순)
+    """
+    conditions = article_conditions(
+        complex_id=complex_id,
+        trade_type=trade_type,
+        area_name=area_name,
+        building_name=building_name,
+        min_area=min_area,
+        max_area=max_area,
+        min_price=min_price,
+        max_price=max_price,
+        max_monthly_rent=max_monthly_rent,
+        is_active=is_active
+    )
+    return _export_response("articles", Article, conditions, [Article.id], format, gzip)
+
+
+@router.get("/transactions")
+def export_transactions(
+    complex_id: Optional[str] = Query(None, description="단지 ID"),
+    start_date: Optional[str] = Query(None, description="시작일 (YYYYMMDD)"),
+    end_date: Optional[str] = Query(None, description="종료일 (YYYYMMDD)"),
+    min_price: Optional[int] = Query(None, description="최소 거래가 (만원)"),
+    max_price: Optional[int] = Query(None, description="최대 거래가 (만원)"),
+    min_floor: Optional[int] = Query(None, description="최소 층"),
+    max_floor: Optional[int] = Query(None, description="최대 층"),
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$", description="출력 형식"),
+    gzip: bool = Query(False, description="gzip 압축 여부"),
+    current_user: User = Depends(get_current_active_user),
+):
+    """
+    실거래가 내보내기 (/api/transactions/ 검색과 같은 필터, id 순)
+    """
+    conditions = transaction_conditions(
+        complex_id=complex_id,
+        start_date=start_date,
+        end_date=end_date,
+        min_price=min_price,
+        max_price=max_price,
+        min_floor=min_floor,
+        max_floor=max_floor
+    )
+    return _export_response("transactions", Transaction, conditions, [Transaction.id], format, gzip)
+
+
+@router.get("/changes")
+def export_changes(
+    complex_id: Optional[str] = Query(None, description="단지 ID"),
+    change_type: Optional[str] = Query(None, description="변동 유형 (NEW/REMOVED/PRICE_UP/PRICE_DOWN)"),
+    hours: Optional[int] = Query(None, ge=1, description="최근 N시간 (없으면 전체)"),
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$", description="출력 형식"),
+    gzip: bool = Query(False, description="gzip 압축 여부"),
+    current_user: User = Depends(get_current_active_user),
+):
+    """
+    매물 변동 이력 내보내기 (id 순)
+    """
+    conditions = []
+    if complex_id:
+        conditions.append(ArticleChange.complex_id == complex_id)
+    if change_type:
+        conditions.append(ArticleChange.change_type == change_type)
+    if hours:
+        conditions.append(ArticleChange.detected_at >= datetime.now(timezone.utc) - timedelta(hours=hours))
+
+    return _export_response("changes", ArticleChange, conditions, [ArticleChange.id], format, gzip)
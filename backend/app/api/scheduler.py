@@ -6,7 +6,7 @@ from typing import Dict, Any, Optional
 from pydantic import BaseModel
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
-from celery.schedules import crontab
+from celery.schedules import crontab, schedule as interval_schedule
 from app.core.celery_app import celery_app
 from app.core.database import get_db
 from app.models.complex import CrawlJob, Complex
@@ -16,16 +16,28 @@ from app.core.schedule_manager import (
     delete_schedule_from_file,
     get_schedule_raw_data
 )
+from app.services.crawl_priority import CrawlPriorityPlanner
 
 router = APIRouter(prefix="/api/scheduler", tags=["scheduler"])
 
+# 스케줄에 등록 가능한 태스크
+AVAILABLE_TASKS = [
+    "app.tasks.scheduler.crawl_all_complexes",
+    "app.tasks.scheduler.crawl_priority_queue",
+    "app.tasks.scheduler.crawl_complex_async",
+    "app.tasks.scheduler.cleanup_old_snapshots",
+    "app.tasks.briefing_tasks.send_weekly_briefing",
+    "app.tasks.briefing_tasks.send_custom_briefing"
+]
+
 
 class ScheduleCreate(BaseModel):
     """스케줄 생성/수정 모델"""
     name: str
     task: str
-    hour: int
-    minute: int
+    hour: int = 0
+    minute: int = 0
+    interval_minutes: Optional[int] = None  # 지정하면 시각 대신 N분 간격 반복 (hour/minute/day_of_week 무시)
     day_of_week: Optional[str] = "*"  # 0-6 or * for every day, comma-separated for multiple days
     complex_id: Optional[str] = None  # 특정 단지 크롤링 시 단지 ID
     description: Optional[str] = None
@@ -36,6 +48,7 @@ class ScheduleUpdate(BaseModel):
     task: Optional[str] = None
     hour: Optional[int] = None
     minute: Optional[int] = None
+    interval_minutes: Optional[int] = None
     day_of_week: Optional[str] = None
     complex_id: Optional[str] = None
     enabled: Optional[bool] = None
@@ -311,20 +324,15 @@ def create_schedule(schedule: ScheduleCreate):
     try:
         from redbeat import RedBeatSchedulerEntry
         # 태스크 이름 검증
-        available_tasks = [
-            "app.tasks.scheduler.crawl_all_complexes",
-            "app.tasks.scheduler.crawl_complex_async",
-            "app.tasks.scheduler.cleanup_old_snapshots",
-            "app.tasks.briefing_tasks.send_weekly_briefing",
-            "app.tasks.briefing_tasks.send_custom_briefing"
-        ]
-
-        if schedule.task not in available_tasks:
+        if schedule.task not in AVAILABLE_TASKS:
             raise HTTPException(
                 status_code=400,
-                detail=f"유효하지 않은 태스크입니다. 사용 가능한 태스크: {available_tasks}"
+                detail=f"유효하지 않은 태스크입니다. 사용 가능한 태스크: {AVAILABLE_TASKS}"
             )
 
+        if schedule.interval_minutes is not None and schedule.interval_minutes < 1:
+            raise HTTPException(status_code=400, detail="interval_minutes는 1 이상이어야 합니다.")
+
         # 특정 단지 크롤링 시 complex_id 필수
         if schedule.task == "app.tasks.scheduler.crawl_complex_async" and not schedule.complex_id:
             raise HTTPException(
@@ -340,7 +348,10 @@ def create_schedule(schedule: ScheduleCreate):
             )
 
         # Crontab 생성 (특수 스케줄 처리)
-        if schedule.day_of_week == "*":
+        if schedule.interval_minutes:
+            # N분 간격 반복
+            schedule_obj = interval_schedule(timedelta(minutes=schedule.interval_minutes))
+        elif schedule.day_of_week == "*":
             schedule_obj = crontab(hour=schedule.hour, minute=schedule.minute)
         elif schedule.day_of_week == 'QUARTERLY_1':
             # 분기별 1일 (1월, 4월, 7월, 10월 1일)
@@ -389,18 +400,22 @@ def create_schedule(schedule: ScheduleCreate):
             schedule=schedule_obj,
             args=entry_args,
             app=celery_app,
-            options={"expires": 3600}
+            options={"expires": schedule.interval_minutes * 60 if schedule.interval_minutes else 3600}
         )
         entry.save()  # Redis에 저장
 
         # JSON 파일에도 저장 (Beat 재시작 시 유지용)
-        schedule_data = {
-            "task": schedule.task,
-            "schedule": {
+        if schedule.interval_minutes:
+            schedule_config = {"every_minutes": schedule.interval_minutes}
+        else:
+            schedule_config = {
                 "hour": schedule.hour,
                 "minute": schedule.minute,
                 "day_of_week": schedule.day_of_week
-            },
+            }
+        schedule_data = {
+            "task": schedule.task,
+            "schedule": schedule_config,
             "args": [schedule.complex_id] if schedule.complex_id else [],
             "enabled": True,
             "description": schedule.description or "",
@@ -417,6 +432,7 @@ def create_schedule(schedule: ScheduleCreate):
                 "task": schedule.task,
                 "hour": schedule.hour,
                 "minute": schedule.minute,
+                "interval_minutes": schedule.interval_minutes,
                 "day_of_week": schedule.day_of_week,
                 "description": schedule.description
             },
@@ -456,22 +472,47 @@ def update_schedule(schedule_name: str, schedule_update: ScheduleUpdate):
             )
 
         # 작업 유형 검증 (변경하려는 경우)
-        if schedule_update.task is not None:
-            available_tasks = [
-                "app.tasks.scheduler.crawl_all_complexes",
-                "app.tasks.scheduler.crawl_complex_async",
-                "app.tasks.scheduler.cleanup_old_snapshots",
-                "app.tasks.briefing_tasks.send_weekly_briefing",
-                "app.tasks.briefing_tasks.send_custom_briefing"
-            ]
-            if schedule_update.task not in available_tasks:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"유효하지 않은 태스크입니다. 사용 가능한 태스크: {available_tasks}"
-                )
+        if schedule_update.task is not None and schedule_update.task not in AVAILABLE_TASKS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"유효하지 않은 태스크입니다. 사용 가능한 태스크: {AVAILABLE_TASKS}"
+            )
 
         # 현재 값에서 업데이트할 값 가져오기
         task = schedule_update.task if schedule_update.task is not None else entry.task
+        complex_id = schedule_update.complex_id if schedule_update.complex_id is not None else (entry.args[0] if entry.args else None)
+
+        # N분 간격 스케줄: interval_minutes를 지정했거나, 기존이 간격 스케줄이고 시각을 지정하지 않은 경우
+        is_interval = not isinstance(entry.schedule, crontab)
+        if schedule_update.interval_minutes is not None or (
+            is_interval and schedule_update.hour is None and schedule_update.minute is None
+        ):
+            interval_minutes = schedule_update.interval_minutes or int(entry.schedule.run_every.total_seconds() // 60)
+            if interval_minutes < 1:
+                raise HTTPException(status_code=400, detail="interval_minutes는 1 이상이어야 합니다.")
+
+            entry.task = task
+            entry.schedule = interval_schedule(timedelta(minutes=interval_minutes))
+            entry.args = [complex_id] if complex_id else []
+            entry.save()
+
+            schedules_data = get_schedule_raw_data()
+            if schedule_name in schedules_data:
+                schedules_data[schedule_name]["task"] = task
+                schedules_data[schedule_name]["schedule"] = {"every_minutes": interval_minutes}
+                schedules_data[schedule_name]["args"] = [complex_id] if complex_id else []
+                schedules_data[schedule_name]["complex_id"] = complex_id
+                update_schedule_in_file(schedule_name, schedules_data[schedule_name])
+
+            return {
+                "message": f"스케줄 '{schedule_name}'이 수정되었습니다.",
+                "schedule": {
+                    "name": schedule_name,
+                    "task": task,
+                    "interval_minutes": interval_minutes
+                },
+                "note": "✅ Redis에 저장! 5초 이내 자동 반영됩니다 (재시작 불필요)"
+            }
 
         # crontab에서 현재 값 추출
         current_cron = entry.schedule
@@ -493,9 +534,6 @@ def update_schedule(schedule_name: str, schedule_update: ScheduleUpdate):
             else:
                 day_of_week = "*"
 
-        # complex_id 처리
-        complex_id = schedule_update.complex_id if schedule_update.complex_id is not None else (entry.args[0] if entry.args else None)
-
         # 새 Crontab 생성
         if day_of_week == "*":
             new_schedule = crontab(hour=hour, minute=minute)
@@ -512,9 +550,11 @@ def update_schedule(schedule_name: str, schedule_update: ScheduleUpdate):
         schedules_data = get_schedule_raw_data()
         if schedule_name in schedules_data:
             schedules_data[schedule_name]["task"] = task
-            schedules_data[schedule_name]["schedule"]["hour"] = hour
-            schedules_data[schedule_name]["schedule"]["minute"] = minute
-            schedules_data[schedule_name]["schedule"]["day_of_week"] = day_of_week
+            schedules_data[schedule_name]["schedule"] = {
+                "hour": hour,
+                "minute": minute,
+                "day_of_week": day_of_week
+            }
             schedules_data[schedule_name]["args"] = [complex_id] if complex_id else []
             schedules_data[schedule_name]["complex_id"] = complex_id
             update_schedule_in_file(schedule_name, schedules_data[schedule_name])
@@ -626,6 +666,7 @@ def get_job_history(
                 "articles_collected": job.articles_collected,
                 "articles_new": job.articles_new,
                 "articles_updated": job.articles_updated,
+                "articles_removed": job.articles_removed,
                 "error_message": job.error_message,
                 "celery_task_id": job.celery_task_id
             })
@@ -801,6 +842,29 @@ def get_complexes_for_schedule(db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"단지 목록 조회 실패: {str(e)}")
 
 
+@router.get("/priority-queue", response_model=Dict[str, Any])
+def get_priority_queue(limit: int = 50, db: Session = Depends(get_db)):
+    """
+    우선순위 크롤링 큐 조회 (crawl_priority_queue 태스크가 다음 실행에서 고를 단지)
+
+    Args:
+        limit: 큐에서 반환할 단지 수 (기본: 50)
+
+    Returns:
+        budget (시간당 예산/사용량/이번 실행 예산), selected (다음 실행 선택 단지), queue (우선순위 상위 단지)
+    """
+    try:
+        plan = CrawlPriorityPlanner(db).plan()
+        return {
+            "budget": plan["budget"],
+            "selected": plan["selected"],
+            "total": len(plan["queue"]),
+            "queue": plan["queue"][:max(limit, 0)]
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"우선순위 큐 조회 실패: {str(e)}")
+
+
 @router.get("/jobs/running/current", response_model=Dict[str, Any])
 def get_running_jobs():
     """
@@ -898,8 +962,8 @@ def get_job_detail(job_id: str, db: Session = Depends(get_db)):
     Returns:
         작업 상세 정보, 스냅샷, 변경사항
     """
-    from app.models.complex import ArticleSnapshot, ArticleChange
-    from sqlalchemy import and_
+    from app.models.complex import ArticleSnapshot, ArticleChange, CrawlSession
+    from sqlalchemy import tuple_
 
     try:
         # 작업 조회
@@ -924,84 +988,104 @@ def get_job_detail(job_id: str, db: Session = Depends(get_db)):
             "articles_collected": job.articles_collected,
             "articles_new": job.articles_new,
             "articles_updated": job.articles_updated,
+            "articles_removed": job.articles_removed,
             "error_message": job.error_message,
             "error_traceback": job.error_traceback,
             "celery_task_id": job.celery_task_id,
             "created_at": job.created_at.isoformat() if job.created_at else None
         }
 
-        # 해당 작업 시간대의 스냅샷 조회 (작업 시작~종료 시간 사이)
         snapshots = []
         changes = []
-
-        if job.complex_id and job.started_at:
-            # 스냅샷 조회
-            snapshot_query = db.query(ArticleSnapshot).filter(
-                ArticleSnapshot.complex_id == job.complex_id
-            )
-
-            if job.finished_at:
-                snapshot_query = snapshot_query.filter(
-                    and_(
-                        ArticleSnapshot.snapshot_date >= job.started_at,
-                        ArticleSnapshot.snapshot_date <= job.finished_at
+        sessions = []
+        change_complex_ids = []
+
+        if job.started_at:
+            # 이 작업이 만든 크롤링 세션 (crawl_sessions.crawl_job_id 인덱스)
+            sessions = db.query(CrawlSession).filter(
+                CrawlSession.crawl_job_id == job.job_id
+            ).all()
+
+            if sessions:
+                # (complex_id, crawl_session_id) 복합 인덱스로 스냅샷 조회
+                snapshot_query = db.query(ArticleSnapshot).filter(
+                    tuple_(ArticleSnapshot.complex_id, ArticleSnapshot.crawl_session_id).in_(
+                        [(s.complex_id, s.session_id) for s in sessions]
                     )
                 )
-            else:
-                snapshot_query = snapshot_query.filter(
+                change_complex_ids = list({s.complex_id for s in sessions})
+            elif job.complex_id:
+                # 세션 연결 이전 작업: 작업 시작~종료 시간 사이의 스냅샷
+                snapshot_query = db.query(ArticleSnapshot).filter(
+                    ArticleSnapshot.complex_id == job.complex_id,
                     ArticleSnapshot.snapshot_date >= job.started_at
                 )
-
-            snapshot_records = snapshot_query.order_by(ArticleSnapshot.snapshot_date.desc()).limit(100).all()
-
-            for snapshot in snapshot_records:
-                snapshots.append({
-                    "snapshot_id": snapshot.id,
-                    "article_no": snapshot.article_no,
-                    "article_name": snapshot.area_name or f"{snapshot.building_name} {snapshot.floor_info}",
-                    "trade_type": snapshot.trade_type,
-                    "price": snapshot.price,
-                    "area": snapshot.area1,
-                    "floor": snapshot.floor_info,
-                    "direction": snapshot.direction,
-                    "is_active": True,  # 스냅샷은 기본적으로 활성
-                    "captured_at": snapshot.snapshot_date.isoformat() if snapshot.snapshot_date else None
-                })
-
-            # 변경사항 조회
+                if job.finished_at:
+                    snapshot_query = snapshot_query.filter(
+                        ArticleSnapshot.snapshot_date <= job.finished_at
+                    )
+                change_complex_ids = [job.complex_id]
+            else:
+                snapshot_query = None
+
+            if snapshot_query is not None:
+                snapshot_records = snapshot_query.order_by(ArticleSnapshot.snapshot_date.desc()).limit(100).all()
+
+                for snapshot in snapshot_records:
+                    snapshots.append({
+                        "snapshot_id": snapshot.id,
+                        "complex_id": snapshot.complex_id,
+                        "article_no": snapshot.article_no,
+                        "article_name": snapshot.area_name or f"{snapshot.building_name} {snapshot.floor_info}",
+                        "trade_type": snapshot.trade_type,
+                        "price": snapshot.price,
+                        "area": snapshot.area1,
+                        "floor": snapshot.floor_info,
+                        "direction": snapshot.direction,
+                        "is_active": True,  # 스냅샷은 기본적으로 활성
+                        "captured_at": snapshot.snapshot_date.isoformat() if snapshot.snapshot_date else None
+                    })
+
+        if change_complex_ids:
+            # 변경사항 조회 ((complex_id, detected_at) 복합 인덱스)
             change_query = db.query(ArticleChange).filter(
-                ArticleChange.complex_id == job.complex_id
+                ArticleChange.complex_id.in_(change_complex_ids),
+                ArticleChange.detected_at >= job.started_at
             )
-
             if job.finished_at:
                 change_query = change_query.filter(
-                    and_(
-                        ArticleChange.detected_at >= job.started_at,
-                        ArticleChange.detected_at <= job.finished_at
-                    )
-                )
-            else:
-                change_query = change_query.filter(
-                    ArticleChange.detected_at >= job.started_at
+                    ArticleChange.detected_at <= job.finished_at
                 )
 
             change_records = change_query.order_by(ArticleChange.detected_at.desc()).limit(100).all()
 
             for change in change_records:
                 changes.append({
-                    "change_id": change.change_id,
+                    "change_id": change.id,
+                    "complex_id": change.complex_id,
                     "article_no": change.article_no,
                     "change_type": change.change_type,
-                    "article_name": change.article_name,
+                    "article_name": change.area_name or f"{change.building_name} {change.floor_info}",
                     "trade_type": change.trade_type,
                     "old_price": change.old_price,
                     "new_price": change.new_price,
-                    "price_diff": change.price_diff,
+                    "price_diff": change.price_change_amount,
+                    "price_change_percent": change.price_change_percent,
                     "detected_at": change.detected_at.isoformat() if change.detected_at else None
                 })
 
         return {
             "job": job_data,
+            "sessions": [
+                {
+                    "session_id": session.session_id,
+                    "complex_id": session.complex_id,
+                    "started_at": session.started_at.isoformat() if session.started_at else None,
+                    "finished_at": session.finished_at.isoformat() if session.finished_at else None,
+                    "article_count": session.article_count
+                }
+                for session in sessions
+            ],
             "snapshots": {
                 "count": len(snapshots),
                 "data": snapshots
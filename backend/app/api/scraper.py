@@ -7,11 +7,11 @@ from datetime import datetime
 from typing import Optional
 from fastapi import APIRouter, HTTPException, Query, BackgroundTasks, Depends
 from pydantic import BaseModel
-from playwright.async_api import async_playwright
 from sqlalchemy.orm import Session
 from ..core.database import get_db
-from ..models.complex import Complex, Article, Transaction
+from ..models.complex import Complex, Transaction
 from ..services.article_tracker import ArticleTracker
+from ..services.browser_pool import get_browser_pool
 
 router = APIRouter(prefix="/scraper", tags=["scraper"])
 
@@ -65,44 +65,21 @@ async def scrape_complex_info(url: str = Query(..., description="네이버 부
             except Exception as e:
                 print(f"❌ 응답 파싱 오류: {e}")
 
-        # Playwright로 페이지 방문하여 API 응답 가로채기
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=True,
-                args=[
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-dev-shm-usage',
-                    '--no-sandbox',
-                    '--disable-web-security',
-                    '--disable-features=IsolateOrigins,site-per-process'
-                ]
-            )
-
-            context = await browser.new_context(
-                user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                viewport={'width': 1920, 'height': 1080},
-                locale='ko-KR',
-                timezone_id='Asia/Seoul'
-            )
-
-            # JavaScript로 webdriver 감지 차단
-            await context.add_init_script('''
-                Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
-                Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]});
-                Object.defineProperty(navigator, 'languages', {get: () => ['ko-KR', 'ko']});
-            ''')
-
+        # 공용 브라우저 풀에서 컨텍스트를 대여하여 API 응답 가로채기
+        async with get_browser_pool().lease() as context:
             page = await context.new_page()
 
-            # 응답 리스너 등록
-            page.on("response", lambda response: asyncio.create_task(save_response(response)))
-
-            # 네이버 페이지 방문
-            print(f"🌐 페이지 접속 중: {url}")
-            await page.goto(url, timeout=30000)
-            await asyncio.sleep(5)  # API 응답 대기
+            # 컨텍스트는 풀로 반환되어 재사용되므로 실패해도 페이지는 반드시 닫음
+            try:
+                # 응답 리스너 등록
+                page.on("response", lambda response: asyncio.create_task(save_response(response)))
 
-            await browser.close()
+                # 네이버 페이지 방문
+                print(f"🌐 페이지 접속 중: {url}")
+                await page.goto(url, timeout=30000)
+                await asyncio.sleep(5)  # API 응답 대기
+            finally:
+                await page.close()
 
         print(f"📊 캡처된 API 응답 수: {len(api_responses)}")
         for resp in api_responses[:5]:  # 최대 5개만 로그
@@ -216,6 +193,7 @@ async def run_crawler(complex_id: str, create_snapshot: bool = True, collect_add
     import traceback
     from ..core.database import SessionLocal
     from ..services.crawler_service import NaverRealEstateCrawler
+    from ..services.complex_summary import refresh_complex_summary
 
     print(f"   [SCRAPER] Starting run_crawler for complex {complex_id}")
     print(f"   [SCRAPER] Snapshot tracking: {'Enabled' if create_snapshot else 'Disabled'}")
@@ -238,14 +216,8 @@ async def run_crawler(complex_id: str, create_snapshot: bool = True, collect_add
             try:
                 tracker = ArticleTracker(db)
 
-                # 현재 매물 조회
-                articles = db.query(Article).filter(
-                    Article.complex_id == complex_id,
-                    Article.is_active == True
-                ).all()
-
-                # 스냅샷 생성
-                tracker.create_snapshot(complex_id, articles)
+                # 스냅샷 생성 (현재 활성 매물 기준)
+                tracker.create_snapshot(complex_id)
 
                 # 변동사항 감지
                 tracker.detect_changes(complex_id)
@@ -253,6 +225,13 @@ async def run_crawler(complex_id: str, create_snapshot: bool = True, collect_add
             finally:
                 db.close()
 
+        # 단지 요약 갱신
+        db = SessionLocal()
+        try:
+            refresh_complex_summary(db, complex_id)
+        finally:
+            db.close()
+
         print(f"✅ 크롤링 완료: {complex_id}")
     except Exception as e:
         print(f"❌ 크롤링 실패: {complex_id} - {e}")
@@ -1,15 +1,20 @@
 """
 실거래가 관련 API 엔드포인트
 """
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Dict, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 from sqlalchemy import func, and_
 
 from app.core.database import get_db
-from app.models.complex import Transaction, Complex
-from app.schemas.complex import TransactionResponse
+from app.core.dependencies import get_current_user
+from app.core.pagination import keyset_paginate, resolve_page_limit, set_pagination_headers
+from app.models.complex import Transaction, RentTransaction, Complex, User
+from app.schemas.complex import TransactionResponse, RentTransactionResponse
+from app.services.molit_cache import get_page_cache
 from app.services.transaction_service import TransactionService
+from app.services.transaction_ingest import RegionTransactionIngestor
+from app.services.search_filters import transaction_conditions, rent_transaction_conditions
 
 router = APIRouter(prefix="/transactions", tags=["transactions"])
 
@@ -69,6 +74,7 @@ def get_overview_stats(db: Session = Depends(get_db)):
 
 @router.get("/", response_model=List[TransactionResponse])
 def search_transactions(
+    response: Response,
     complex_id: Optional[str] = Query(None, description="단지 ID"),
     start_date: Optional[str] = Query(None, description="시작일 (YYYYMMDD)"),
     end_date: Optional[str] = Query(None, description="종료일 (YYYYMMDD)"),
@@ -76,44 +82,37 @@ def search_transactions(
     max_price: Optional[int] = Query(None, description="최대 거래가 (만원)"),
     min_floor: Optional[int] = Query(None, description="최소 층"),
     max_floor: Optional[int] = Query(None, description="최대 층"),
-    skip: int = Query(0, ge=0),
-    limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 X-Next-Cursor)"),
+    order: str = Query("desc", pattern="^(asc|desc)$", description="거래일 정렬 방향"),
+    include_total: bool = Query(False, description="X-Total-Count 헤더 포함 (PostgreSQL은 추정치)"),
+    skip: int = Query(0, ge=0, description="건너뛸 개수 (하위호환용 - cursor 사용 권장)"),
+    limit: int = Query(50, ge=1, description="페이지 크기 (비로그인 최대 100, 로그인 최대 1000)"),
+    current_user: Optional[User] = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
     실거래가 검색
 
     다양한 조건으로 실거래가를 검색합니다.
+    (trade_date, id) 키셋 페이지네이션 - 다음 페이지는 X-Next-Cursor 헤더 값을 cursor로 전달합니다.
     """
-    query = db.query(Transaction)
-
-    # 필터 적용
-    if complex_id:
-        query = query.filter(Transaction.complex_id == complex_id)
-
-    if start_date:
-        query = query.filter(Transaction.trade_date >= start_date)
-
-    if end_date:
-        query = query.filter(Transaction.trade_date <= end_date)
-
-    if min_price:
-        query = query.filter(Transaction.deal_price >= min_price)
-
-    if max_price:
-        query = query.filter(Transaction.deal_price <= max_price)
-
-    if min_floor:
-        query = query.filter(Transaction.floor >= min_floor)
-
-    if max_floor:
-        query = query.filter(Transaction.floor <= max_floor)
-
-    # 최신순 정렬
-    query = query.order_by(Transaction.trade_date.desc())
-
-    # 페이지네이션
-    transactions = query.offset(skip).limit(limit).all()
+    limit = resolve_page_limit(limit, current_user)
+    query = db.query(Transaction).filter(*transaction_conditions(
+        complex_id=complex_id,
+        start_date=start_date,
+        end_date=end_date,
+        min_price=min_price,
+        max_price=max_price,
+        min_floor=min_floor,
+        max_floor=max_floor
+    ))
+
+    # 최신순 정렬 + 키셋 페이지네이션
+    transactions, next_cursor = keyset_paginate(
+        query, (Transaction.trade_date, Transaction.id), cursor, limit,
+        descending=order == "desc", offset=skip
+    )
+    set_pagination_headers(response, next_cursor, query if include_total else None)
 
     return transactions
 
@@ -188,6 +187,139 @@ def get_price_trend(
     }
 
 
+@router.get("/rents", response_model=List[RentTransactionResponse])
+def search_rent_transactions(
+    response: Response,
+    complex_id: Optional[str] = Query(None, description="단지 ID"),
+    rent_type: Optional[str] = Query(None, pattern="^(전세|월세)$", description="전세/월세"),
+    contract_type: Optional[str] = Query(None, pattern="^(신규|갱신)$", description="계약 구분"),
+    start_date: Optional[str] = Query(None, description="시작일 (YYYYMMDD)"),
+    end_date: Optional[str] = Query(None, description="종료일 (YYYYMMDD)"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 X-Next-Cursor)"),
+    order: str = Query("desc", pattern="^(asc|desc)$", description="계약일 정렬 방향"),
+    include_total: bool = Query(False, description="X-Total-Count 헤더 포함 (PostgreSQL은 추정치)"),
+    limit: int = Query(50, ge=1, description="페이지 크기 (비로그인 최대 100, 로그인 최대 1000)"),
+    current_user: Optional[User] = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    전월세 실거래가 검색
+
+    (trade_date, id) 키셋 페이지네이션 - 다음 페이지는 X-Next-Cursor 헤더 값을 cursor로 전달합니다.
+    """
+    limit = resolve_page_limit(limit, current_user)
+    query = db.query(RentTransaction).filter(*rent_transaction_conditions(
+        complex_id=complex_id,
+        rent_type=rent_type,
+        contract_type=contract_type,
+        start_date=start_date,
+        end_date=end_date
+    ))
+
+    rents, next_cursor = keyset_paginate(
+        query, (RentTransaction.trade_date, RentTransaction.id), cursor, limit,
+        descending=order == "desc"
+    )
+    set_pagination_headers(response, next_cursor, query if include_total else None)
+
+    return rents
+
+
+def _rent_trend(db: Session, complex_id: str, months: int, rent_type: str, contract_type: Optional[str]) -> Dict:
+    """전세/월세 월별 추이 (price-trend와 같은 형식)"""
+    complex_obj = db.query(Complex).filter(Complex.complex_id == complex_id).first()
+    if not complex_obj:
+        raise HTTPException(status_code=404, detail="단지를 찾을 수 없습니다")
+
+    month = func.substr(RentTransaction.trade_date, 1, 6)
+    conditions = rent_transaction_conditions(complex_id=complex_id, rent_type=rent_type, contract_type=contract_type)
+
+    results = db.query(
+        month.label('month'),
+        func.avg(RentTransaction.deposit).label('avg_deposit'),
+        func.min(RentTransaction.deposit).label('min_deposit'),
+        func.max(RentTransaction.deposit).label('max_deposit'),
+        func.avg(RentTransaction.monthly_rent).label('avg_monthly_rent'),
+        func.min(RentTransaction.monthly_rent).label('min_monthly_rent'),
+        func.max(RentTransaction.monthly_rent).label('max_monthly_rent'),
+        func.count(RentTransaction.id).label('count'),
+        func.count(RentTransaction.id).filter(RentTransaction.contract_type == "신규").label('new_count'),
+        func.count(RentTransaction.id).filter(RentTransaction.contract_type == "갱신").label('renewal_count')
+    ).filter(
+        *conditions
+    ).group_by(
+        month
+    ).order_by(
+        month.desc()
+    ).limit(months).all()
+
+    trend_data = []
+    for r in results:
+        row = {
+            "month": r.month,
+            "avg_deposit": int(r.avg_deposit) if r.avg_deposit else 0,
+            "min_deposit": r.min_deposit,
+            "max_deposit": r.max_deposit,
+            "count": r.count,
+            "new_count": r.new_count,
+            "renewal_count": r.renewal_count
+        }
+        if rent_type == "월세":
+            row.update({
+                "avg_monthly_rent": int(r.avg_monthly_rent) if r.avg_monthly_rent else 0,
+                "min_monthly_rent": r.min_monthly_rent,
+                "max_monthly_rent": r.max_monthly_rent
+            })
+        trend_data.append(row)
+
+    return {
+        "complex_id": complex_id,
+        "complex_name": complex_obj.complex_name,
+        "rent_type": rent_type,
+        "contract_type": contract_type,
+        "period_months": months,
+        "trend": trend_data
+    }
+
+
+@router.get("/stats/lease-trend")
+def get_lease_trend(
+    complex_id: str = Query(..., description="단지 ID"),
+    months: int = Query(6, ge=1, le=24, description="조회 기간 (개월)"),
+    contract_type: Optional[str] = Query(None, pattern="^(신규|갱신)$", description="계약 구분 (기본: 전체)"),
+    db: Session = Depends(get_db)
+):
+    """
+    전세 보증금 추이 통계
+
+    최근 N개월간의 월별 평균/최저/최고 전세 보증금(만원)과 신규/갱신 계약 수를 조회합니다.
+
+    - **complex_id**: 단지 ID
+    - **months**: 조회 기간 (1~24개월)
+    - **contract_type**: 신규/갱신만 집계 (갱신 계약은 인상률 상한이 있어 시세보다 낮을 수 있음)
+    """
+    return _rent_trend(db, complex_id, months, "전세", contract_type)
+
+
+@router.get("/stats/monthly-rent-trend")
+def get_monthly_rent_trend(
+    complex_id: str = Query(..., description="단지 ID"),
+    months: int = Query(6, ge=1, le=24, description="조회 기간 (개월)"),
+    contract_type: Optional[str] = Query(None, pattern="^(신규|갱신)$", description="계약 구분 (기본: 전체)"),
+    db: Session = Depends(get_db)
+):
+    """
+    월세 추이 통계
+
+    최근 N개월간의 월별 보증금/월세(만원) 평균·최저·최고와 신규/갱신 계약 수를 조회합니다.
+
+    - **complex_id**: 단지 ID
+    - **months**: 조회 기간 (1~24개월)
+    - **contract_type**: 신규/갱신만 집계
+    """
+    return _rent_trend(db, complex_id, months, "월세", contract_type)
+
+
 @router.get("/stats/area-price")
 def get_area_price_stats(
     complex_id: str = Query(..., description="단지 ID"),
@@ -308,6 +440,7 @@ def get_floor_premium_stats(
 def fetch_transactions_from_molit(
     complex_id: str,
     months: int = Query(6, ge=1, le=24, description="조회 기간 (개월)"),
+    include_rent: bool = Query(True, description="전월세 실거래 포함"),
     db: Session = Depends(get_db)
 ):
     """
@@ -315,9 +448,10 @@ def fetch_transactions_from_molit(
 
     - **complex_id**: 단지 ID
     - **months**: 조회 기간 (1~24개월)
+    - **include_rent**: 전월세 실거래도 함께 저장
     """
     service = TransactionService(db)
-    result = service.fetch_and_save_transactions(complex_id, months)
+    result = service.fetch_and_save_transactions(complex_id, months, include_rent=include_rent)
 
     if not result["success"]:
         raise HTTPException(status_code=400, detail=result["message"])
@@ -328,51 +462,77 @@ def fetch_transactions_from_molit(
 @router.post("/fetch-all")
 def fetch_all_transactions_from_molit(
     months: int = Query(6, ge=1, le=24, description="조회 기간 (개월)"),
+    include_rent: bool = Query(True, description="전월세 실거래 포함"),
     db: Session = Depends(get_db)
 ):
     """
     모든 단지의 실거래가를 국토부 API에서 조회하여 DB에 저장
 
+    단지를 시군구별로 묶어 (시군구, 년월)마다 API를 한 번만 호출하고
+    받은 거래를 지역 내 모든 등록 단지에 배분합니다.
+
     - **months**: 조회 기간 (1~24개월)
+    - **include_rent**: 전월세 실거래도 같은 지역-월 경로로 수집
     """
-    # 모든 단지 조회
-    complexes = db.query(Complex).all()
-
-    if not complexes:
+    if not db.query(Complex.id).first():
         return {
             "success": False,
             "message": "등록된 단지가 없습니다"
         }
 
-    service = TransactionService(db)
-    results = []
-    success_count = 0
-    fail_count = 0
-
-    for complex_obj in complexes:
-        result = service.fetch_and_save_transactions(complex_obj.complex_id, months)
-        results.append({
-            "complex_id": complex_obj.complex_id,
-            "complex_name": complex_obj.complex_name,
-            "success": result["success"],
-            "new_count": result.get("new_count", 0),
-            "message": result.get("message", "")
-        })
-
-        if result["success"]:
-            success_count += 1
-        else:
-            fail_count += 1
+    result = RegionTransactionIngestor(db).ingest(months=months, include_rent=include_rent)
+    unresolved = set(result["unresolved_complexes"])
+
+    results = [
+        {
+            "complex_id": complex_id,
+            "complex_name": complex_result["complex_name"],
+            "success": complex_id not in unresolved,
+            "new_count": complex_result["saved_count"],
+            "skipped_count": complex_result["skipped_count"],
+            "rent_new_count": complex_result["rent_saved_count"],
+            "message": "시군구 코드를 추출할 수 없습니다" if complex_id in unresolved else ""
+        }
+        for complex_id, complex_result in result["complexes"].items()
+    ]
 
     return {
-        "success": True,
-        "total_complexes": len(complexes),
-        "success_count": success_count,
-        "fail_count": fail_count,
+        "success": result["complete"],
+        "total_complexes": len(results),
+        "success_count": len(results) - len(unresolved),
+        "fail_count": len(unresolved),
+        "quota_exceeded": result["quota_exceeded"],
+        "failed_region_months": result["failed_region_months"],
+        "regions": result["regions"],
+        "api_calls": result["api_calls"],
+        "http_requests": result["http_requests"],
+        "cache_hits": result["cache_hits"],
+        "trades_fetched": result["trades_fetched"],
+        "saved_count": result["saved_count"],
+        "rent_saved_count": result["rent_saved_count"],
         "results": results
     }
 
 
+@router.get("/molit-cache/stats")
+def get_molit_cache_stats():
+    """
+    국토부 API 페이지 캐시 통계
+
+    적중/미스/저장 횟수, 적중률, 저장 항목 수를 반환합니다.
+    (disk 백엔드의 카운터는 현재 프로세스 기준, redis 백엔드는 워커 공유)
+    """
+    return get_page_cache().stats()
+
+
+@router.delete("/molit-cache")
+def clear_molit_cache():
+    """
+    국토부 API 페이지 캐시 전체 삭제
+    """
+    return {"success": True, "deleted": get_page_cache().clear()}
+
+
 @router.get("/stats/area-summary/{complex_id}")
 def get_area_summary_stats(
     complex_id: str,
@@ -0,0 +1,62 @@
+"""
+동기 코드(Celery 태스크 등)에서 코루틴 실행
+
+asyncio.run()은 호출할 때마다 이벤트 루프를 새로 만들기 때문에 루프에 묶인
+공용 브라우저 풀을 매번 다시 띄우게 됩니다. 프로세스별 이벤트 루프 하나를
+계속 재사용하여 태스크 간에 브라우저를 유지합니다.
+"""
+import asyncio
+
+_loop = None
+
+
+def run_async(coro):
+    """
+    프로세스 공용 이벤트 루프에서 코루틴 실행
+
+    Args:
+        coro: 실행할 코루틴
+
+    Returns:
+        코루틴 반환값
+    """
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_loop)
+    return _loop.run_until_complete(coro)
+
+
+def _run_in_new_loop(coro):
+    # asyncio.run()은 종료 시 현재 스레드의 이벤트 루프 설정을 지우므로 직접 관리
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
+
+def run_coroutine_sync(coro):
+    """
+    동기 함수에서 독립된 이벤트 루프로 코루틴 실행
+
+    공용 루프와 무관한 단발성 작업(HTTP 일괄 조회 등)용입니다.
+    이미 이벤트 루프가 실행 중인 스레드(비동기 크롤러 내부 등)에서 호출되면
+    별도 스레드에서 실행하여 실행 중인 루프를 막거나 재진입하지 않습니다.
+
+    Args:
+        coro: 실행할 코루틴
+
+    Returns:
+        코루틴 반환값
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return _run_in_new_loop(coro)
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(_run_in_new_loop, coro).result()
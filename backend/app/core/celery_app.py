@@ -5,6 +5,7 @@ import os
 from pathlib import Path
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import worker_process_shutdown
 from dotenv import load_dotenv
 
 # .env 파일 자동 로드 (프로젝트 루트에서 찾음)
@@ -23,7 +24,7 @@ celery_app = Celery(
     "naver_realestate",
     broker=REDIS_URL,
     backend=REDIS_URL,
-    include=["app.tasks.scheduler", "app.tasks.briefing_tasks"]
+    include=["app.tasks.scheduler", "app.tasks.briefing_tasks", "app.tasks.analytics_tasks"]
 )
 
 # Celery 설정
@@ -56,3 +57,14 @@ celery_app.conf.redbeat_redis_url = REDIS_URL
 celery_app.conf.redbeat_key_prefix = "redbeat:"
 # Lock timeout을 12시간으로 증가 (Mac 잠자기 대응)
 celery_app.conf.redbeat_lock_timeout = 43200  # 12시간 (43200초)
+
+
+@worker_process_shutdown.connect
+def close_browser_pool_on_shutdown(**kwargs):
+    """워커 프로세스 종료 시 공용 브라우저 풀 정리"""
+    try:
+        from app.core.async_runner import run_async
+        from app.services.browser_pool import close_browser_pool
+        run_async(close_browser_pool())
+    except Exception as e:
+        print(f"⚠️  브라우저 풀 정리 실패: {e}")
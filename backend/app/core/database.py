@@ -31,6 +31,18 @@ def get_db():
         db.close()
 
 
+def get_conflict_insert(db):
+    """방언별 ON CONFLICT 지원 insert 함수 (미지원 DB는 None)"""
+    dialect = db.get_bind().dialect.name
+    if dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+        return insert
+    if dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert
+        return insert
+    return None
+
+
 def init_db():
     """데이터베이스 초기화 (테이블 생성)"""
     from app.models.complex import Base
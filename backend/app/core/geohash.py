@@ -0,0 +1,153 @@
+"""
+Geohash 인코딩 및 영역 커버 (단지 위치 검색용)
+
+geohash는 위도/경도를 base32 문자열로 바꾼 값으로, 앞부분이 같을수록 가까운 위치입니다.
+문자열 정렬 순서가 공간 순서를 따르므로 일반 B-tree 인덱스의 범위 조건
+(geohash >= 'wydm6' AND geohash < 'wydm7')으로 한 격자 안의 단지를 찾을 수 있습니다.
+
+- 저장 정밀도 GEOHASH_PRECISION = 9 (약 4.8m × 4.8m)
+- cover_ranges: 영역(bbox)을 덮는 격자들을 인접한 것끼리 합친 [하한, 상한) 범위 목록
+"""
+import math
+from typing import List, Optional, Tuple
+
+BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+_BASE32_INDEX = {char: index for index, char in enumerate(BASE32)}
+
+GEOHASH_PRECISION = 9
+
+# 한 번의 검색에서 조회할 최대 격자 수 (넘으면 한 단계 큰 격자 사용)
+GEOHASH_MAX_CELLS = 24
+
+EARTH_RADIUS_M = 6_371_008.8
+METERS_PER_DEGREE = EARTH_RADIUS_M * math.pi / 180
+
+
+def encode(latitude: float, longitude: float, precision: int = GEOHASH_PRECISION) -> str:
+    """
+    위도/경도 → geohash
+
+    Args:
+        latitude: 위도 (-90 ~ 90)
+        longitude: 경도 (-180 ~ 180)
+        precision: 문자 수
+
+    Returns:
+        geohash 문자열
+    """
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    value = 0
+    even = True  # 짝수 번째 비트는 경도
+
+    while len(chars) < precision:
+        target, bounds = (longitude, lng_range) if even else (latitude, lat_range)
+        middle = (bounds[0] + bounds[1]) / 2
+        if target >= middle:
+            value = value * 2 + 1
+            bounds[0] = middle
+        else:
+            value = value * 2
+            bounds[1] = middle
+        even = not even
+
+        bits += 1
+        if bits == 5:
+            chars.append(BASE32[value])
+            bits = 0
+            value = 0
+
+    return "".join(chars)
+
+
+def encode_or_none(latitude: Optional[float], longitude: Optional[float]) -> Optional[str]:
+    """좌표가 없으면 None (0/0 등 잘못된 좌표 포함)"""
+    if latitude is None or longitude is None:
+        return None
+    if not (-90 <= latitude <= 90 and -180 <= longitude <= 180) or (latitude == 0 and longitude == 0):
+        return None
+    return encode(latitude, longitude)
+
+
+def cell_size(precision: int) -> Tuple[float, float]:
+    """격자 크기 (위도 높이, 경도 너비) - 도 단위"""
+    lng_bits = (5 * precision + 1) // 2
+    lat_bits = 5 * precision // 2
+    return 180.0 / (1 << lat_bits), 360.0 / (1 << lng_bits)
+
+
+def next_prefix(prefix: str) -> Optional[str]:
+    """같은 길이에서 바로 다음 geohash (범위 상한용, 마지막이면 None)"""
+    chars = list(prefix)
+    for index in range(len(chars) - 1, -1, -1):
+        position = _BASE32_INDEX[chars[index]]
+        if position < len(BASE32) - 1:
+            chars[index] = BASE32[position + 1]
+            return "".join(chars)
+        chars[index] = BASE32[0]
+    return None
+
+
+def cover_ranges(
+    south: float, west: float, north: float, east: float,
+    max_cells: int = GEOHASH_MAX_CELLS
+) -> List[Tuple[str, Optional[str]]]:
+    """
+    영역을 덮는 geohash 범위 목록
+
+    격자 수가 max_cells 이하인 가장 작은 격자 크기를 골라 영역과 겹치는 격자를 모두 구하고,
+    정렬 순서상 이어지는 격자는 하나의 범위로 합칩니다.
+
+    Returns:
+        [(하한, 상한)] - geohash >= 하한 AND geohash < 상한 (상한 None이면 끝까지)
+    """
+    south, north = max(south, -90.0), min(north, 90.0)
+    west, east = max(west, -180.0), min(east, 180.0)
+
+    precision = GEOHASH_PRECISION
+    while precision > 1:
+        lat_step, lng_step = cell_size(precision)
+        rows = math.floor((north + 90) / lat_step) - math.floor((south + 90) / lat_step) + 1
+        cols = math.floor((east + 180) / lng_step) - math.floor((west + 180) / lng_step) + 1
+        if rows * cols <= max_cells:
+            break
+        precision -= 1
+
+    lat_step, lng_step = cell_size(precision)
+    first_row, last_row = math.floor((south + 90) / lat_step), math.floor((north + 90) / lat_step)
+    first_col, last_col = math.floor((west + 180) / lng_step), math.floor((east + 180) / lng_step)
+    last_row = min(last_row, round(180 / lat_step) - 1)
+    last_col = min(last_col, round(360 / lng_step) - 1)
+
+    cells = sorted({
+        encode(-90 + (row + 0.5) * lat_step, -180 + (col + 0.5) * lng_step, precision)
+        for row in range(first_row, last_row + 1)
+        for col in range(first_col, last_col + 1)
+    })
+
+    ranges: List[Tuple[str, Optional[str]]] = []
+    for cell in cells:
+        upper = next_prefix(cell)
+        if ranges and ranges[-1][1] == cell:
+            ranges[-1] = (ranges[-1][0], upper)
+        else:
+            ranges.append((cell, upper))
+    return ranges
+
+
+def radius_bbox(latitude: float, longitude: float, radius_m: float) -> Tuple[float, float, float, float]:
+    """반경을 덮는 영역 (south, west, north, east)"""
+    lat_delta = radius_m / METERS_PER_DEGREE
+    lng_delta = radius_m / (METERS_PER_DEGREE * max(math.cos(math.radians(latitude)), 1e-6))
+    return latitude - lat_delta, longitude - lng_delta, latitude + lat_delta, longitude + lng_delta
+
+
+def haversine_m(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """두 좌표 사이 거리(m)"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lng2 - lng1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(min(a, 1.0)))
@@ -0,0 +1,174 @@
+"""
+키셋(커서) 페이지네이션
+
+OFFSET은 건너뛴 행까지 모두 읽으므로 뒤 페이지일수록 느려집니다.
+정렬 키 + id 기준으로 "마지막으로 본 행 다음"부터 조회하여 페이지 깊이와 무관하게 일정한 비용으로 조회합니다.
+
+    GET /api/articles/?limit=100                    → X-Next-Cursor: eyJ2Ijog...
+    GET /api/articles/?limit=100&cursor=eyJ2Ijog...  → 다음 페이지
+
+커서는 정렬 키 값을 담은 불투명(opaque) 문자열이며 클라이언트는 해석하지 않고 그대로 돌려보냅니다.
+전체 건수(X-Total-Count)는 include_total=true 일 때만 계산하며, PostgreSQL은 EXPLAIN 추정치를 사용합니다.
+"""
+import base64
+import json
+import logging
+import os
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, Response
+from sqlalchemy import DateTime, bindparam, tuple_
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Query
+
+from app.models.complex import User
+
+logger = logging.getLogger(__name__)
+
+# 페이지 크기 상한 (비로그인 / 로그인 사용자)
+PAGE_LIMIT_ANONYMOUS = int(os.getenv("PAGE_LIMIT_ANONYMOUS", "100"))
+PAGE_LIMIT_AUTHENTICATED = int(os.getenv("PAGE_LIMIT_AUTHENTICATED", "1000"))
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+TOTAL_COUNT_HEADER = "X-Total-Count"
+TOTAL_ESTIMATED_HEADER = "X-Total-Count-Estimated"
+
+
+def resolve_page_limit(limit: int, user: Optional[User]) -> int:
+    """
+    사용자별 페이지 크기 상한 검사
+
+    Args:
+        limit: 요청한 페이지 크기
+        user: 로그인 사용자 (없으면 비로그인)
+
+    Returns:
+        검사를 통과한 페이지 크기
+    """
+    max_limit = PAGE_LIMIT_AUTHENTICATED if user and user.is_active else PAGE_LIMIT_ANONYMOUS
+    if limit > max_limit:
+        detail = f"한 번에 최대 {max_limit}건까지 조회할 수 있습니다"
+        if max_limit < PAGE_LIMIT_AUTHENTICATED:
+            detail += f" (로그인 시 최대 {PAGE_LIMIT_AUTHENTICATED}건)"
+        raise HTTPException(status_code=400, detail=detail)
+    return limit
+
+
+def encode_cursor(values: Sequence) -> str:
+    """정렬 키 값 → 불투명 커서 문자열"""
+    payload = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    raw = json.dumps({"v": payload}, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: Sequence) -> List:
+    """
+    커서 문자열 → 정렬 키 값 (컬럼 타입에 맞게 복원)
+
+    Raises:
+        HTTPException(400): 형식이 잘못된 커서
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)["v"]
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError("정렬 키 개수 불일치")
+        return [
+            datetime.fromisoformat(value) if value is not None and isinstance(column.type, DateTime) else value
+            for column, value in zip(columns, values)
+        ]
+    except (ValueError, KeyError, TypeError) as e:
+        raise HTTPException(status_code=400, detail=f"잘못된 커서입니다: {e}")
+
+
+def keyset_paginate(
+    query: Query,
+    columns: Sequence,
+    cursor: Optional[str],
+    limit: int,
+    descending: bool = True,
+    offset: int = 0
+) -> Tuple[List, Optional[str]]:
+    """
+    키셋 페이지네이션 적용 후 한 페이지 조회
+
+    Args:
+        query: 필터만 적용된 쿼리 (정렬은 이 함수가 적용)
+        columns: 정렬 키 컬럼 (마지막은 유일한 컬럼, 예: (last_seen_at, id))
+        cursor: 이전 페이지의 X-Next-Cursor (없으면 첫 페이지)
+        limit: 페이지 크기
+        descending: 내림차순 여부
+        offset: 건너뛸 행 수 (skip 파라미터 하위호환용 - 커서 사용 권장)
+
+    Returns:
+        (행 리스트, 다음 페이지 커서 - 마지막 페이지면 None)
+    """
+    if cursor:
+        values = decode_cursor(cursor, columns)
+        key = tuple_(*columns)
+        bound = tuple_(*[bindparam(None, value, type_=column.type) for column, value in zip(columns, values)])
+        query = query.filter(key < bound if descending else key > bound)
+
+    order = [column.desc() if descending else column.asc() for column in columns]
+    rows = query.order_by(*order).offset(offset).limit(limit + 1).all()
+
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    # 여러 엔티티를 조회한 경우 (예: Complex, ComplexSummary) 첫 엔티티가 정렬 키를 가짐
+    last = rows[-1][0] if isinstance(rows[-1], Row) else rows[-1]
+    return rows, encode_cursor([getattr(last, column.key) for column in columns])
+
+
+def estimate_count(query: Query) -> Tuple[int, bool]:
+    """
+    필터 조건에 맞는 전체 건수
+
+    PostgreSQL은 EXPLAIN의 예상 행 수(Plan Rows)를 사용하여 전체 스캔 없이 반환하고,
+    그 외 DB(SQLite 등)는 COUNT(*)로 정확한 값을 계산합니다.
+
+    Returns:
+        (건수, 추정치 여부)
+    """
+    query = query.order_by(None)
+    session = query.session
+
+    if session.get_bind().dialect.name == "postgresql":
+        try:
+            compiled = query.statement.compile(dialect=session.get_bind().dialect)
+            # 실패해도 바깥 트랜잭션이 중단되지 않도록 SAVEPOINT 안에서 실행
+            with session.begin_nested():
+                plan = session.connection().exec_driver_sql(
+                    f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params
+                ).scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return int(plan[0]["Plan"]["Plan Rows"]), True
+        except Exception as e:
+            logger.warning(f"⚠️ 건수 추정 실패, COUNT(*) 사용: {e}")
+
+    return query.count(), False
+
+
+def set_pagination_headers(
+    response: Response,
+    next_cursor: Optional[str],
+    query: Optional[Query] = None
+):
+    """
+    다음 페이지 커서 + (요청 시) 전체 건수 헤더 설정
+
+    Args:
+        response: FastAPI 응답 객체
+        next_cursor: 다음 페이지 커서 (마지막 페이지면 헤더 생략)
+        query: 전체 건수를 계산할 필터 쿼리 (None이면 건수 생략)
+    """
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+
+    if query is not None:
+        total, estimated = estimate_count(query)
+        response.headers[TOTAL_COUNT_HEADER] = str(total)
+        response.headers[TOTAL_ESTIMATED_HEADER] = "true" if estimated else "false"
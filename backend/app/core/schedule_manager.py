@@ -3,8 +3,9 @@
 """
 import json
 import os
+from datetime import timedelta
 from pathlib import Path
-from celery.schedules import crontab
+from celery.schedules import crontab, schedule
 from typing import Dict, Any
 
 # 설정 파일 경로
@@ -23,6 +24,8 @@ def load_schedules_from_file() -> Dict[str, Any]:
         day_of_week 값:
         - Celery crontab: 0=일요일, 1=월요일, 2=화요일, 3=수요일, 4=목요일, 5=금요일, 6=토요일
         - schedules.json에서도 동일한 값 사용 (0-6)
+
+        "schedule": {"every_minutes": 15} 처럼 지정하면 시각 대신 N분 간격으로 반복 실행
     """
     if not SCHEDULE_FILE.exists():
         # 파일이 없으면 빈 딕셔너리 반환
@@ -40,6 +43,16 @@ def load_schedules_from_file() -> Dict[str, Any]:
                 continue
 
             schedule_config = config['schedule']
+
+            # N분 간격 반복 (우선순위 크롤링 등)
+            if schedule_config.get('every_minutes'):
+                beat_schedule[name] = {
+                    'task': config['task'],
+                    'schedule': schedule(timedelta(minutes=int(schedule_config['every_minutes']))),
+                    'options': {'expires': int(schedule_config['every_minutes']) * 60}
+                }
+                continue
+
             day_of_week = schedule_config.get('day_of_week', '*')
 
             # 문자열을 정수로 변환 (필요시)
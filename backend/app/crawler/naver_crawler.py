@@ -6,9 +6,12 @@ import asyncio
 import json
 import re
 from typing import Dict, List, Optional, Any
-from playwright.async_api import async_playwright, Page, BrowserContext
+from playwright.async_api import Page, BrowserContext
 from datetime import datetime
 
+from app.services.browser_pool import get_browser_pool
+from app.services.price_parser import parse_price as parse_price_manwon
+
 
 class NaverRealEstateCrawler:
     """네이버 부동산 크롤러 클래스"""
@@ -16,10 +19,11 @@ class NaverRealEstateCrawler:
     def __init__(self, headless: bool = True):
         """
         Args:
-            headless: 브라우저를 백그라운드에서 실행할지 여부
+            headless: (미사용) 공용 브라우저 풀 설정(BROWSER_HEADLESS)을 따름
         """
         self.headless = headless
         self.browser = None
+        self._pooled = None
         self.context = None
         self.page = None
         self.authorization_token = None
@@ -37,11 +41,9 @@ class NaverRealEstateCrawler:
     async def initialize(self):
         """브라우저 초기화 및 토큰 획득"""
         print("🚀 브라우저 초기화 중...")
-        playwright = await async_playwright().start()
-        self.browser = await playwright.chromium.launch(headless=self.headless)
-        self.context = await self.browser.new_context(
-            user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-        )
+        # 공용 브라우저 풀에서 컨텍스트 대여 (close()에서 반납)
+        self._pooled = await get_browser_pool().acquire()
+        self.context = self._pooled.context
         self.page = await self.context.new_page()
 
         # Authorization 토큰 캡처
@@ -272,41 +274,26 @@ class NaverRealEstateCrawler:
             print(f"📸 스크린샷 저장: {filename}")
 
     async def close(self):
-        """브라우저 종료"""
-        if self.browser:
-            await self.browser.close()
-            print("\n✅ 브라우저 종료")
+        """브라우저 컨텍스트 반납"""
+        if self._pooled:
+            await get_browser_pool().release(self._pooled)
+            self._pooled = None
+            self.context = None
+            self.page = None
+            print("\n✅ 브라우저 컨텍스트 반납")
 
 
 # ========== 유틸리티 함수 ==========
 
 def parse_price(price_str: str) -> Optional[int]:
     """
-    가격 문자열을 숫자로 변환
+    가격 문자열을 숫자(원)로 변환
     예: "3억 2,000" -> 320000000
-    """
-    if not price_str:
-        return None
 
-    # "억" 단위 처리
-    price_str = price_str.replace(",", "").replace(" ", "")
-
-    match = re.search(r'(\\d+)억', price_str)
-    if match:
-        eok = int(match.group(1)) * 100000000
-        # 만 단위 추가
-        match_man = re.search(r'억(\\d+)', price_str)
-        if match_man:
-            man = int(match_man.group(1)) * 10000
-            return eok + man
-        return eok
-
-    # 순수 숫자만
-    match = re.search(r'(\\d+)', price_str)
-    if match:
-        return int(match.group(1))
-
-    return None
+    만원 단위 파싱은 app.services.price_parser.parse_price 사용
+    """
+    value = parse_price_manwon(price_str)
+    return value * 10000 if value is not None else None
 
 
 def parse_area(area_str: str) -> Optional[float]:
@@ -5,15 +5,19 @@
 import asyncio
 import json
 from typing import Dict, List, Optional
-from playwright.async_api import async_playwright, Page
+from playwright.async_api import Page
+
+from app.services.browser_pool import get_browser_pool
 
 
 class NaverLandCrawler:
     """네이버 부동산 크롤러"""
 
     def __init__(self, headless: bool = True):
+        # headless는 공용 브라우저 풀 설정(BROWSER_HEADLESS)을 따름
         self.headless = headless
         self.browser = None
+        self._pooled = None
         self.context = None
         self.page = None
 
@@ -25,21 +29,16 @@ class NaverLandCrawler:
         await self.close()
 
     async def start(self):
-        """브라우저 시작"""
-        playwright = await async_playwright().start()
-        self.browser = await playwright.chromium.launch(
-            headless=self.headless,
-            args=['--disable-blink-features=AutomationControlled']
-        )
-        self.context = await self.browser.new_context(
-            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        )
+        """공용 브라우저 풀에서 컨텍스트 대여"""
+        self._pooled = await get_browser_pool().acquire()
+        self.context = self._pooled.context
         self.page = await self.context.new_page()
 
     async def close(self):
-        """브라우저 종료"""
-        if self.browser:
-            await self.browser.close()
+        """브라우저 컨텍스트 반납"""
+        if self._pooled:
+            await get_browser_pool().release(self._pooled)
+            self._pooled = None
 
     async def crawl_complex(self, complex_id: str) -> Dict:
         """
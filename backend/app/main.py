@@ -1,10 +1,21 @@
 """
 FastAPI 메인 애플리케이션
 """
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.api import complexes, articles, scraper, transactions, scheduler, briefing, auth, favorites
+from app.api import complexes, articles, scraper, transactions, scheduler, briefing, auth, favorites, export
+from app.services.browser_pool import close_browser_pool
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 수명주기 - 종료 시 공용 브라우저 풀 정리"""
+    yield
+    await close_browser_pool()
+
 
 # FastAPI 앱 생성
 app = FastAPI(
@@ -12,7 +23,8 @@ app = FastAPI(
     description="네이버 부동산 매물 및 실거래가 관리 API",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # CORS 설정
@@ -22,6 +34,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Total-Count", "X-Total-Count-Estimated"],  # 커서 페이지네이션
 )
 
 # 라우터 등록
@@ -29,6 +42,7 @@ app.include_router(complexes.router, prefix="/api")
 app.include_router(articles.router, prefix="/api")
 app.include_router(scraper.router, prefix="/api")
 app.include_router(transactions.router, prefix="/api")
+app.include_router(export.router, prefix="/api")
 app.include_router(scheduler.router)
 app.include_router(briefing.router)
 app.include_router(auth.router, prefix="/api/auth", tags=["인증"])
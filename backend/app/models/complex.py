@@ -1,11 +1,13 @@
 """
 단지 관련 데이터베이스 모델
 """
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, Text, BigInteger, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, Text, BigInteger, ForeignKey, Index, event
 from sqlalchemy.sql import func
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
+from app.core.geohash import GEOHASH_PRECISION, encode_or_none
+
 Base = declarative_base()
 
 
@@ -39,15 +41,27 @@ class Complex(Base):
     # 위치 정보
     latitude = Column(Float, comment="위도")
     longitude = Column(Float, comment="경도")
+    geohash = Column(String(GEOHASH_PRECISION), comment="위치 geohash (위도/경도 저장 시 자동 계산)")
 
     # 메타 데이터
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    __table_args__ = (
+        Index('ix_complexes_geohash', 'geohash'),
+    )
+
     def __repr__(self):
         return f"<Complex(id={self.complex_id}, name={self.complex_name})>"
 
 
+@event.listens_for(Complex, "before_insert")
+@event.listens_for(Complex, "before_update")
+def _sync_complex_geohash(mapper, connection, target):
+    """위도/경도가 바뀌면 geohash도 함께 갱신 (반경/영역 검색 인덱스)"""
+    target.geohash = encode_or_none(target.latitude, target.longitude)
+
+
 class Article(Base):
     """매물 모델"""
     __tablename__ = "articles"
@@ -62,6 +76,11 @@ class Article(Base):
     monthly_rent = Column(String(50), comment="월세 금액 (월세 거래 시)")
     price_change_state = Column(String(20), comment="가격 변동 상태 (SAME/UP/DOWN)")
 
+    # 숫자 가격 (만원 단위, 정렬/범위 검색용)
+    price_value = Column(Integer, comment="가격 (만원) - price 컬럼의 숫자값")
+    deposit_value = Column(Integer, comment="보증금 (만원) - 전세금/월세 보증금")
+    monthly_rent_value = Column(Integer, comment="월세 (만원)")
+
     # 면적 정보
     area_name = Column(String(50), comment="면적 타입명")
     area1 = Column(Float, comment="공급면적(㎡)")
@@ -93,6 +112,12 @@ class Article(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    # 단지/거래유형별 가격 범위 조회, 거래유형별 가격 검색
+    __table_args__ = (
+        Index('ix_articles_complex_trade_price', 'complex_id', 'trade_type', 'price_value'),
+        Index('ix_articles_trade_price', 'trade_type', 'price_value'),
+    )
+
     def __repr__(self):
         return f"<Article(no={self.article_no}, price={self.price})>"
 
@@ -115,12 +140,52 @@ class Transaction(Base):
     area = Column(Float, comment="대표 면적(㎡)")
     exclusive_area = Column(Float, comment="전용 면적(㎡)")
 
+    # 중복 방지 키: sha256(단지, 거래유형, 거래일, 전용면적, 층, 거래가) - transaction_row_hash
+    row_hash = Column(String(64), comment="중복 방지 해시")
+
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    __table_args__ = (
+        Index('uq_transactions_row_hash', 'row_hash', unique=True),
+    )
+
     def __repr__(self):
         return f"<Transaction(complex={self.complex_id}, price={self.deal_price}, date={self.trade_date})>"
 
 
+class RentTransaction(Base):
+    """전월세 실거래가 모델 (국토부 아파트 전월세 실거래 API)"""
+    __tablename__ = "rent_transactions"
+
+    id = Column(BigInteger, primary_key=True, index=True)
+    complex_id = Column(String(50), ForeignKey('complexes.complex_id', ondelete='CASCADE'), nullable=False, comment="단지 ID")
+
+    # 거래 정보
+    rent_type = Column(String(20), comment="전세/월세 (월세금액이 있으면 월세)")
+    contract_type = Column(String(20), comment="계약 구분 (신규/갱신, 미제공 시 NULL)")
+    contract_term = Column(String(20), comment="계약 기간 (예: 25.03~27.03)")
+    trade_date = Column(String(20), comment="계약일 (YYYYMMDD)")
+    deposit = Column(BigInteger, comment="보증금 (만원)")
+    monthly_rent = Column(Integer, comment="월세 (만원, 전세는 0)")
+
+    # 물건 정보
+    floor = Column(Integer, comment="층")
+    exclusive_area = Column(Float, comment="전용 면적(㎡)")
+
+    # 중복 방지 키 - rent_transaction_row_hash
+    row_hash = Column(String(64), comment="중복 방지 해시")
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index('ix_rent_transactions_complex_date', 'complex_id', 'trade_date'),
+        Index('uq_rent_transactions_row_hash', 'row_hash', unique=True),
+    )
+
+    def __repr__(self):
+        return f"<RentTransaction(complex={self.complex_id}, deposit={self.deposit}, monthly={self.monthly_rent}, date={self.trade_date})>"
+
+
 class ArticleHistory(Base):
     """매물 변동 이력"""
     __tablename__ = "article_history"
@@ -149,6 +214,7 @@ class ArticleSnapshot(Base):
     # 매물 정보 (스냅샷 시점)
     trade_type = Column(String(20), comment="거래 유형")
     price = Column(String(100), comment="가격")
+    price_value = Column(Integer, comment="가격 (만원)")
     area_name = Column(String(50), comment="면적 타입명")
     area1 = Column(Float, comment="공급면적(㎡)")
     floor_info = Column(String(50), comment="층 정보")
@@ -163,6 +229,11 @@ class ArticleSnapshot(Base):
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    # 변동 감지/작업 상세 조회용 (단지 + 세션)
+    __table_args__ = (
+        Index('ix_article_snapshots_complex_session', 'complex_id', 'crawl_session_id'),
+    )
+
     def __repr__(self):
         return f"<ArticleSnapshot(article={self.article_no}, date={self.snapshot_date})>"
 
@@ -181,6 +252,8 @@ class ArticleChange(Base):
     # 변동 상세 정보
     old_price = Column(String(100), comment="이전 가격")
     new_price = Column(String(100), comment="변경 가격")
+    old_price_value = Column(Integer, comment="이전 가격 (만원)")
+    new_price_value = Column(Integer, comment="변경 가격 (만원)")
     price_change_amount = Column(BigInteger, comment="가격 변동액 (만원)")
     price_change_percent = Column(Float, comment="가격 변동률 (%)")
 
@@ -200,16 +273,97 @@ class ArticleChange(Base):
     # 읽음 여부 (주간 브리핑에서 사용)
     is_read = Column(Boolean, default=False, comment="확인 여부")
 
+    # 단지별 최근 변동 조회 / 브리핑용 미확인 변동 조회
+    __table_args__ = (
+        Index('ix_article_changes_complex_detected', 'complex_id', 'detected_at'),
+        Index('ix_article_changes_read_detected', 'is_read', 'detected_at'),
+    )
+
     def __repr__(self):
         return f"<ArticleChange(type={self.change_type}, article={self.article_no})>"
 
+
+class CrawlSession(Base):
+    """크롤링 세션 - 단지별 스냅샷 1회분"""
+    __tablename__ = "crawl_sessions"
+
+    session_id = Column(String(100), primary_key=True, comment="크롤링 세션 ID (article_snapshots.crawl_session_id)")
+    complex_id = Column(String(50), ForeignKey('complexes.complex_id', ondelete='CASCADE'), nullable=False, comment="단지 ID")
+    crawl_job_id = Column(String(100), ForeignKey('crawl_jobs.job_id', ondelete='SET NULL'), index=True, comment="크롤링 작업 ID")
+
+    started_at = Column(DateTime(timezone=True), nullable=False, comment="크롤링 시작 시각")
+    finished_at = Column(DateTime(timezone=True), comment="스냅샷 생성 시각")
+    article_count = Column(Integer, default=0, comment="스냅샷 매물 수")
+
+    # 단지별 최근 세션 조회용
+    __table_args__ = (
+        Index('ix_crawl_sessions_complex_started', 'complex_id', 'started_at'),
+    )
+
+    def __repr__(self):
+        return f"<CrawlSession(id={self.session_id}, complex={self.complex_id})>"
+
+
+class ComplexSummary(Base):
+    """
+    단지 요약 (크롤링/실거래 수집 시점에 갱신되는 집계 테이블)
+
+    단지 목록/통계/스케줄러/브리핑이 매 요청마다 articles, article_changes,
+    transactions를 집계하지 않도록 단지별 결과를 미리 저장합니다.
+    """
+    __tablename__ = "complex_summary"
+
+    complex_id = Column(String(50), ForeignKey('complexes.complex_id', ondelete='CASCADE'), primary_key=True, comment="단지 ID")
+
+    # 활성 매물 수
+    active_total = Column(Integer, default=0, comment="활성 매물 수")
+    active_sale = Column(Integer, default=0, comment="매매 매물 수")
+    active_lease = Column(Integer, default=0, comment="전세 매물 수")
+    active_monthly = Column(Integer, default=0, comment="월세 매물 수")
+
+    # 가격 범위 (만원 단위)
+    sale_min = Column(Integer, comment="최저 매매가")
+    sale_max = Column(Integer, comment="최고 매매가")
+    lease_min = Column(Integer, comment="최저 전세가")
+    lease_max = Column(Integer, comment="최고 전세가")
+    monthly_deposit_min = Column(Integer, comment="최저 월세 보증금")
+    monthly_deposit_max = Column(Integer, comment="최고 월세 보증금")
+    monthly_rent_min = Column(Integer, comment="최저 월세")
+    monthly_rent_max = Column(Integer, comment="최고 월세")
+    area_price_ranges = Column(Text, comment="거래유형/면적별 가격 범위 (JSON: {거래유형: {면적: [최저, 최고]}})")
+
+    # 변동 건수 (갱신 시점 기준)
+    new_24h = Column(Integer, default=0, comment="24시간 신규 매물 수")
+    removed_24h = Column(Integer, default=0, comment="24시간 삭제 매물 수")
+    price_up_24h = Column(Integer, default=0, comment="24시간 가격 상승 수")
+    price_down_24h = Column(Integer, default=0, comment="24시간 가격 하락 수")
+    changes_7d = Column(Integer, default=0, comment="7일 변동 건수")
+
+    # 실거래
+    transaction_count = Column(Integer, default=0, comment="실거래 건수")
+    last_transaction_date = Column(String(20), comment="최근 실거래일 (YYYYMMDD)")
+    last_transaction_price = Column(BigInteger, comment="최근 실거래가 (만원)")
+    last_transaction_area = Column(Float, comment="최근 실거래 전용면적(㎡)")
+
+    last_crawled_at = Column(DateTime(timezone=True), comment="마지막 크롤링 시각")
+    refreshed_at = Column(DateTime(timezone=True), server_default=func.now(), comment="요약 갱신 시각")
+
+    # 크롤링 오래된 순 단지 선택용
+    __table_args__ = (
+        Index('ix_complex_summary_last_crawled', 'last_crawled_at'),
+    )
+
+    def __repr__(self):
+        return f"<ComplexSummary(complex={self.complex_id}, active={self.active_total})>"
+
+
 class CrawlJob(Base):
     """크롤링 작업 이력"""
     __tablename__ = "crawl_jobs"
 
     id = Column(BigInteger, primary_key=True, index=True)
     job_id = Column(String(100), unique=True, index=True, nullable=False, comment="작업 ID (UUID)")
-    job_type = Column(String(20), index=True, nullable=False, comment="작업 유형: manual, scheduled, all")
+    job_type = Column(String(20), index=True, nullable=False, comment="작업 유형: manual, scheduled, priority, all")
     
     # 작업 대상
     complex_id = Column(String(50), ForeignKey('complexes.complex_id', ondelete='SET NULL'), comment="단지 ID")
@@ -1,7 +1,7 @@
 """
 Pydantic 스키마 - API 요청/응답 모델
 """
-from typing import Optional, List
+from typing import Optional, List, Dict
 from datetime import datetime
 from pydantic import BaseModel
 
@@ -63,6 +63,9 @@ class ArticleBase(BaseModel):
 class ArticleResponse(ArticleBase):
     """매물 응답"""
     id: int
+    price_value: Optional[int] = None
+    deposit_value: Optional[int] = None
+    monthly_rent_value: Optional[int] = None
     is_active: Optional[bool] = True
     first_found_at: Optional[datetime] = None
     last_seen_at: Optional[datetime] = None
@@ -94,12 +97,68 @@ class TransactionResponse(TransactionBase):
         from_attributes = True
 
 
+class RentTransactionResponse(BaseModel):
+    """전월세 실거래가 응답 (금액은 만원 단위)"""
+    id: int
+    complex_id: str
+    rent_type: Optional[str] = None
+    contract_type: Optional[str] = None
+    contract_term: Optional[str] = None
+    trade_date: Optional[str] = None
+    deposit: Optional[int] = None
+    monthly_rent: Optional[int] = None
+    floor: Optional[int] = None
+    exclusive_area: Optional[float] = None
+    created_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
 class ComplexDetailResponse(ComplexResponse):
     """단지 상세 정보 (매물 포함)"""
     articles: List[ArticleResponse] = []
     transactions: List[TransactionResponse] = []
 
 
+class ComplexSummaryResponse(BaseModel):
+    """단지 요약 (complex_summary 테이블, 가격은 만원 단위)"""
+    active_total: int = 0
+    active_sale: int = 0
+    active_lease: int = 0
+    active_monthly: int = 0
+    sale_min: Optional[int] = None
+    sale_max: Optional[int] = None
+    lease_min: Optional[int] = None
+    lease_max: Optional[int] = None
+    monthly_deposit_min: Optional[int] = None
+    monthly_deposit_max: Optional[int] = None
+    monthly_rent_min: Optional[int] = None
+    monthly_rent_max: Optional[int] = None
+    area_price_ranges: Dict[str, Dict[str, List[int]]] = {}  # {거래유형: {면적: [최저, 최고]}}
+    new_24h: int = 0
+    removed_24h: int = 0
+    price_up_24h: int = 0
+    price_down_24h: int = 0
+    changes_7d: int = 0
+    transaction_count: int = 0
+    last_transaction_date: Optional[str] = None
+    last_transaction_price: Optional[int] = None
+    last_transaction_area: Optional[float] = None
+    last_crawled_at: Optional[datetime] = None
+    refreshed_at: Optional[datetime] = None
+
+
+class ComplexListItemResponse(ComplexResponse):
+    """단지 목록 항목 (include_summary=true 이면 요약 포함)"""
+    summary: Optional[ComplexSummaryResponse] = None
+
+
+class ComplexGeoResponse(ComplexResponse):
+    """위치 검색 결과 단지 (기준점까지 거리 포함)"""
+    distance_m: float
+
+
 class ArticleSearchParams(BaseModel):
     """매물 검색 파라미터"""
     complex_id: Optional[str] = None
@@ -0,0 +1,304 @@
+"""
+주소 → 법정동 코드 해석 엔진
+
+LocationParser가 주소마다 시군구/법정동 이름 20,000여 개를 `name in address`로
+훑던 방식 대신, 법정동 코드 표에서 미리 만든 색인으로 주소를 한 번만 읽어 해석합니다.
+
+- 단위 코드: 시도(2자리) / 시군구(5자리) / 읍면동(8자리) / 리(10자리) 접두어
+- 이름 토큰(강남구, 분당구, 대치동, 서울 ...) → 단위 코드 해시맵
+- Aho–Corasick 오토마톤으로 주소를 한 번 훑어 모든 이름 토큰 위치를 찾음
+  (띄어쓰기 없는 "강남구대치동"도 매칭)
+- 상위 단위 토큰과 어긋나는 후보는 제외하고, 남은 후보 중 주소의 다른 토큰과 가장 많이 일치하는(상위 단위가 맞는) 가장 구체적인 단위 선택
+- 동점이 여러 곳이면 공통 상위 단위로 올라감 (dict 순서에 따라 결과가 바뀌지 않음)
+"""
+import bisect
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# 단위 코드 길이 → 단위 이름
+LEVELS = {2: "sido", 5: "sigungu", 8: "dong", 10: "ri"}
+LEVEL_LENGTHS = (10, 8, 5, 2)
+
+# 시도 약칭 (법정동 코드 표에는 정식 명칭만 있음)
+SIDO_ALIASES = {
+    "11": ("서울", "서울시"),
+    "26": ("부산", "부산시"),
+    "27": ("대구", "대구시"),
+    "28": ("인천", "인천시"),
+    "29": ("광주", "광주시"),
+    "30": ("대전", "대전시"),
+    "31": ("울산", "울산시"),
+    "36": ("세종", "세종시"),
+    "41": ("경기",),
+    "43": ("충북", "충청북도"),
+    "44": ("충남", "충청남도"),
+    "46": ("전남", "전라남도"),
+    "47": ("경북", "경상북도"),
+    "48": ("경남", "경상남도"),
+    "50": ("제주", "제주도"),
+    "51": ("강원", "강원도"),
+    "52": ("전북", "전라북도"),
+}
+
+# 경기도 광주시와 겹치는 약칭은 시군구 이름이 우선
+_SIGUNGU_FIRST = {"광주시"}
+
+
+def _is_hangul(char: str) -> bool:
+    return "가" <= char <= "힣"
+
+
+class AhoCorasick:
+    """
+    다중 문자열 동시 검색 오토마톤
+
+    각 노드의 출력은 그 위치에서 끝나는 패턴 길이 튜플 (실패 링크로 이어진 출력 포함)
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.output: List[Tuple[int, ...]] = [()]
+
+        for pattern in patterns:
+            node = 0
+            for char in pattern:
+                next_node = self.goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self.goto)
+                    self.goto[node][char] = next_node
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append(())
+                node = next_node
+            self.output[node] = (len(pattern),)
+
+        # 너비 우선으로 실패 링크 계산
+        queue = list(self.goto[0].values())
+        for node in queue:
+            for char, child in self.goto[node].items():
+                queue.append(child)
+                state = self.fail[node]
+                while state and char not in self.goto[state]:
+                    state = self.fail[state]
+                fallback = self.goto[state].get(char, 0)
+                self.fail[child] = fallback if fallback != child else 0
+                self.output[child] = self.output[child] + self.output[self.fail[child]]
+
+    def find_all(self, text: str) -> List[Tuple[int, int]]:
+        """
+        텍스트에서 모든 패턴 위치 찾기
+
+        Returns:
+            (시작, 끝) 리스트 (겹치는 매칭 포함)
+        """
+        goto, fail, output = self.goto, self.fail, self.output
+        matches = []
+        node = 0
+
+        for end, char in enumerate(text, 1):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for length in output[node]:
+                matches.append((end - length, end))
+
+        return matches
+
+
+class AddressResolver:
+    """
+    법정동 코드 표 기반 주소 해석기
+
+    사용 예:
+        resolver = AddressResolver(rows)  # rows: (법정동 코드, 법정동명)
+        resolver.resolve("서울 강남구 대치동 316")
+        # {"code": "11680106", "level": "dong", "sigungu_code": "11680", ...}
+    """
+
+    def __init__(self, rows: Iterable[Tuple[str, str]]):
+        """
+        Args:
+            rows: (10자리 법정동 코드, "시도 시군구 읍면동 리" 이름) 목록
+        """
+        terms: Dict[str, Set[str]] = defaultdict(set)
+        self.names: Dict[str, str] = {}
+
+        for code, name in rows:
+            tokens = name.split()
+            if len(code) != 10 or not tokens:
+                continue
+
+            # 코드 구조로 토큰의 단위 구분: 리(끝 2자리) / 읍면동(6~8자리) / 나머지는 시군구
+            ri = tokens.pop() if code[8:] != "00" and len(tokens) > 1 else None
+            dong = tokens.pop() if code[5:8] != "000" and len(tokens) > 1 else None
+            sido, sigungu = tokens[0], tokens[1:]
+
+            self.names.setdefault(code[:2], sido)
+            terms[sido].add(code[:2])
+
+            sigungu_name = " ".join(tokens)
+            self.names.setdefault(code[:5], sigungu_name)
+            for token in sigungu:
+                terms[token].add(code[:5])
+
+            if dong:
+                self.names.setdefault(code[:8], f"{sigungu_name} {dong}")
+                terms[dong].add(code[:8])
+            if ri:
+                self.names.setdefault(code, f"{sigungu_name} {dong} {ri}")
+                terms[ri].add(code)
+
+        for sido_code, aliases in SIDO_ALIASES.items():
+            if sido_code not in self.names:
+                continue
+            for alias in aliases:
+                if alias not in _SIGUNGU_FIRST or alias not in terms:
+                    terms[alias].add(sido_code)
+
+        self.terms: Dict[str, Tuple[str, ...]] = {term: tuple(sorted(codes)) for term, codes in terms.items()}
+        self.automaton = AhoCorasick(sorted(self.terms))
+
+        # 시군구가 하나뿐인 시도 (세종특별자치시: 시도 이름만으로 시군구 확정)
+        sigungu_by_sido: Dict[str, List[str]] = defaultdict(list)
+        for code in self.names:
+            if len(code) == 5:
+                sigungu_by_sido[code[:2]].append(code)
+        self.single_sigungu = {sido: codes[0] for sido, codes in sigungu_by_sido.items() if len(codes) == 1}
+
+        # 시군구 검색용 (토큰, 시군구 코드) 정렬 목록
+        self.sigungu_tokens: List[Tuple[str, str]] = sorted(
+            (token, code)
+            for code, name in self.names.items() if len(code) == 5
+            for token in name.split()
+        )
+
+    def match_terms(self, address: str) -> List[str]:
+        """
+        주소에서 찾은 이름 토큰 (앞에서부터, 겹치면 긴 것 우선)
+
+        토큰 앞뒤에 다른 한글이 붙어 있으면 더 긴 이름의 일부로 보고 버림
+        (예: "경남아너스빌"의 "경남", "나성동"의 "성동").
+        붙어 있는 글자가 다른 토큰의 끝/시작인 경우는 허용 ("강남구대치동").
+        """
+        raw = self.automaton.find_all(address)
+        starts = {start for start, _ in raw}
+        ends = {end for _, end in raw}
+
+        valid = [
+            (start, end) for start, end in raw
+            if (end == len(address) or not _is_hangul(address[end]) or end in starts)
+            and (start == 0 or not _is_hangul(address[start - 1]) or start in ends)
+        ]
+        valid.sort(key=lambda span: (span[0], span[0] - span[1]))
+
+        terms = []
+        position = 0
+        for start, end in valid:
+            if start < position:
+                continue
+            term = address[start:end]
+            if term not in terms:
+                terms.append(term)
+            position = end
+        return terms
+
+    def resolve(self, address: str) -> Optional[Dict]:
+        """
+        주소 해석
+
+        Args:
+            address: 지번/도로명 주소 (예: "경기도 성남시 분당구 정자동 178-1")
+
+        Returns:
+            가장 구체적으로 확정된 단위 (찾지 못하면 None)
+            - code: 단위 코드 (2/5/8/10자리)
+            - level: sido / sigungu / dong / ri
+            - sigungu_code: 시군구 코드 (5자리, 시도까지만 확정되면 None)
+            - name: 단위 전체 이름
+        """
+        if not address:
+            return None
+
+        matched = [self.terms[term] for term in self.match_terms(address)]
+
+        # 상위 단위 토큰(예: 시도)과 어긋나는 하위 후보 제거 ("세종특별자치시 ..."에서 대구 수성구 등)
+        candidate_sets = []
+        for candidates in matched:
+            kept = {
+                code for code in candidates
+                if not any(self._conflicts(code, anchor) for anchor in matched if anchor is not candidates)
+            }
+            if kept:
+                candidate_sets.append(kept)
+        if not candidate_sets:
+            return None
+
+        # 후보 점수: 후보 자신 또는 상위 단위가 포함된 토큰 수
+        scored: Dict[str, int] = {}
+        for candidates in candidate_sets:
+            for code in candidates:
+                if code not in scored:
+                    prefixes = [code[:length] for length in LEVEL_LENGTHS if length <= len(code)]
+                    scored[code] = sum(
+                        1 for other in candidate_sets if any(prefix in other for prefix in prefixes)
+                    )
+
+        best_score = max(scored.values())
+        best = [code for code, score in scored.items() if score == best_score]
+        depth = max(len(code) for code in best)
+        best = [code for code in best if len(code) == depth]
+
+        code = best[0] if len(best) == 1 else self._common_unit(best)
+        if code is None:
+            return None
+        return self._match(self.single_sigungu.get(code, code))
+
+    @staticmethod
+    def _conflicts(code: str, anchor: Tuple[str, ...]) -> bool:
+        """anchor가 모두 code보다 상위 단위인데 그중 어느 것도 code의 상위 단위가 아닌지"""
+        return all(len(other) < len(code) for other in anchor) and not any(
+            code.startswith(other) for other in anchor
+        )
+
+    def _common_unit(self, codes: List[str]) -> Optional[str]:
+        """여러 후보의 공통 상위 단위 코드"""
+        first, last = min(codes), max(codes)
+        common = 0
+        while common < len(first) and first[common] == last[common]:
+            common += 1
+        for length in LEVEL_LENGTHS:
+            if length <= common:
+                return first[:length]
+        return None
+
+    def _match(self, code: str) -> Dict:
+        return {
+            "code": code,
+            "level": LEVELS[len(code)],
+            "sigungu_code": code[:5] if len(code) >= 5 else None,
+            "name": self.names[code],
+        }
+
+    def sigungu_name(self, sigungu_code: str) -> Optional[str]:
+        """시군구 코드 → "시도 시군구" 이름"""
+        return self.names.get(sigungu_code)
+
+    def search_sigungu(self, query: str, limit: int = 10) -> List[Dict]:
+        """
+        시군구 이름 토큰 앞부분 검색 (예: "분당" → 경기도 성남시 분당구)
+
+        Returns:
+            [{"name", "code"}] (시군구 코드 순)
+        """
+        query = query.strip()
+        if not query:
+            return []
+
+        codes = set()
+        index = bisect.bisect_left(self.sigungu_tokens, (query, ""))
+        while index < len(self.sigungu_tokens) and self.sigungu_tokens[index][0].startswith(query):
+            codes.add(self.sigungu_tokens[index][1])
+            index += 1
+
+        return [{"name": self.names[code], "code": code} for code in sorted(codes)[:limit]]
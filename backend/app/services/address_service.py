@@ -5,7 +5,9 @@
 import asyncio
 import re
 from typing import Optional
-from playwright.async_api import async_playwright
+
+from app.core.async_runner import run_async
+from app.services.browser_pool import get_browser_pool
 
 
 class AddressService:
@@ -21,7 +23,7 @@ class AddressService:
         Returns:
             주소 문자열 또는 None
         """
-        return asyncio.run(self._get_complex_address_async(complex_name))
+        return run_async(self._get_complex_address_async(complex_name))
 
     async def _get_complex_address_async(self, complex_name: str) -> Optional[str]:
         """
@@ -36,17 +38,8 @@ class AddressService:
         try:
             print(f"   🔍 네이버 검색으로 주소 찾는 중: {complex_name}")
 
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(
-                    headless=False,  # 디버깅용 headless=False
-                    args=['--disable-blink-features=AutomationControlled'],
-                    slow_mo=100
-                )
-
-                context = await browser.new_context(
-                    user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-                )
-
+            # 공용 브라우저 풀에서 컨텍스트 대여
+            async with get_browser_pool().lease() as context:
                 page = await context.new_page()
 
                 # 네이버 통합검색
@@ -141,7 +134,7 @@ class AddressService:
                     }
                 """)
 
-                await browser.close()
+                await page.close()
 
                 if result and result.get('address'):
                     address = result['address']
@@ -0,0 +1,272 @@
+"""
+네이버 부동산 매물 API 직접 조회 (direct fetch 모드)
+
+브라우저로 Authorization 토큰과 쿠키를 한 번만 캡처한 뒤,
+httpx 비동기 클라이언트로 매물 목록 API를 페이지 번호로 직접 조회합니다.
+DOM 스크롤(최대 100회 x 1.5초) 없이 필요한 페이지 수만큼만 요청합니다.
+
+오프라인 테스트: tests/stubs/naver_land_stub.py 를 띄우고
+NAVER_LAND_API_BASE=http://127.0.0.1:8765/api 로 지정하면 녹화된 픽스처로 동작합니다.
+"""
+import asyncio
+import base64
+import json
+import logging
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+NAVER_LAND_URL = "https://new.land.naver.com"
+NAVER_LAND_API_BASE = os.getenv("NAVER_LAND_API_BASE", f"{NAVER_LAND_URL}/api")
+
+# 매물 수집 방식: direct(API 직접 조회, 실패 시 스크롤로 대체) 또는 scroll(기존 방식)
+CRAWL_FETCH_MODE = os.getenv("CRAWL_FETCH_MODE", "direct")
+
+# 단지 1개 안에서 페이지 요청 간 대기(초) - 연속 요청은 피함
+# (워커 전체의 호스트 요청 빈도는 crawl_engine.CRAWL_HOST_MIN_INTERVAL 요청 간격 제한이 결정)
+DIRECT_FETCH_PAGE_DELAY = float(os.getenv("DIRECT_FETCH_PAGE_DELAY", "0.5"))
+
+# 단지당 최대 페이지 수 (스크롤 방식의 최대 100회와 동일)
+DIRECT_FETCH_MAX_PAGES = 100
+
+# 토큰 만료 전 여유 시간(초)
+TOKEN_EXPIRY_MARGIN = 60
+
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# 웹 페이지가 매물 목록을 요청할 때 사용하는 기본 파라미터 (동일매물묶기 ON)
+ARTICLE_LIST_PARAMS = {
+    'realEstateType': 'APT:PRE:ABYG:JGC',
+    'tradeType': '',
+    'tag': '::::::::',
+    'rentPriceMin': 0,
+    'rentPriceMax': 900000000,
+    'priceMin': 0,
+    'priceMax': 900000000,
+    'areaMin': 0,
+    'areaMax': 900000000,
+    'showArticle': 'false',
+    'sameAddressGroup': 'true',
+    'priceType': 'RETAIL',
+    'type': 'list',
+    'order': 'rank',
+}
+
+
+class NaverAuth:
+    """네이버 부동산 API 인증 정보 (Bearer 토큰 + 쿠키)"""
+
+    def __init__(self, token: str, cookies: Dict[str, str]):
+        self.token = token
+        self.cookies = cookies
+        self.created_at = time.time()
+        self.expires_at = self._parse_expiry(token)
+
+    @staticmethod
+    def _parse_expiry(token: str) -> Optional[float]:
+        """JWT payload의 exp 값 추출 (파싱 실패 시 None)"""
+        try:
+            payload = token.split(" ", 1)[-1].split(".")[1]
+            payload += "=" * (-len(payload) % 4)
+            return float(json.loads(base64.urlsafe_b64decode(payload))["exp"])
+        except Exception:
+            return None
+
+    def is_valid(self) -> bool:
+        """만료 전인지 확인 (만료 시각을 알 수 없으면 30분간 유효로 간주)"""
+        if self.expires_at is None:
+            return time.time() - self.created_at < 30 * 60
+        return time.time() < self.expires_at - TOKEN_EXPIRY_MARGIN
+
+
+_cached_auth: Optional[NaverAuth] = None
+
+
+async def capture_naver_auth(context, complex_id: str, rate_limiter=None) -> Optional[NaverAuth]:
+    """
+    브라우저 컨텍스트로 단지 페이지를 열어 Authorization 토큰과 쿠키 캡처
+
+    (crawler/naver_crawler._capture_auth_token 과 같은 방식)
+
+    Args:
+        context: 브라우저 컨텍스트
+        complex_id: 토큰 캡처용으로 열 단지 ID
+        rate_limiter: 페이지 로드 전에 슬롯을 예약할 호스트별 요청 간격 제한기 (선택)
+
+    Returns:
+        NaverAuth 또는 None (토큰 캡처 실패)
+    """
+    token_captured = asyncio.Event()
+    token = None
+
+    def handle_request(request):
+        nonlocal token
+        auth = request.headers.get("authorization")
+        if auth and auth.startswith("Bearer ") and token is None:
+            token = auth
+            token_captured.set()
+
+    page = await context.new_page()
+    try:
+        page.on("request", handle_request)
+        url = f"{NAVER_LAND_URL}/complexes/{complex_id}"
+        if rate_limiter is not None:
+            await rate_limiter.acquire(url)
+        await page.goto(url, wait_until="domcontentloaded")
+
+        try:
+            await asyncio.wait_for(token_captured.wait(), timeout=10.0)
+        except asyncio.TimeoutError:
+            logger.warning("Authorization 토큰 캡처 실패")
+            return None
+
+        cookies = {c['name']: c['value'] for c in await context.cookies()}
+    finally:
+        await page.close()
+
+    logger.info(f"🔑 토큰 캡처 완료 (쿠키 {len(cookies)}개)")
+    return NaverAuth(token, cookies)
+
+
+async def get_naver_auth(complex_id: str, context=None, rate_limiter=None) -> Optional[NaverAuth]:
+    """
+    캐시된 인증 정보 반환, 없거나 만료되었으면 브라우저로 새로 캡처
+
+    Args:
+        complex_id: 토큰 캡처용으로 열 단지 ID
+        context: 사용할 브라우저 컨텍스트 (없으면 공용 브라우저 풀에서 대여)
+        rate_limiter: 호스트별 요청 간격 제한기 (새로 캡처할 때만 사용)
+    """
+    global _cached_auth
+
+    if _cached_auth is not None and _cached_auth.is_valid():
+        return _cached_auth
+
+    if context is not None:
+        auth = await capture_naver_auth(context, complex_id, rate_limiter)
+    else:
+        from app.services.browser_pool import get_browser_pool
+        async with get_browser_pool().lease() as leased_context:
+            auth = await capture_naver_auth(leased_context, complex_id, rate_limiter)
+
+    if auth is not None:
+        _cached_auth = auth
+    return auth
+
+
+def invalidate_naver_auth():
+    """캐시된 인증 정보 폐기 (401/403 응답 시)"""
+    global _cached_auth
+    _cached_auth = None
+
+
+class DirectArticleFetcher:
+    """매물 목록 API를 페이지 번호로 직접 조회"""
+
+    def __init__(
+        self,
+        auth: NaverAuth,
+        base_url: str = NAVER_LAND_API_BASE,
+        page_delay: float = DIRECT_FETCH_PAGE_DELAY,
+        max_pages: int = DIRECT_FETCH_MAX_PAGES,
+        rate_limiter=None
+    ):
+        """
+        Args:
+            auth: 캡처한 토큰/쿠키
+            base_url: 매물 API 주소 (기본: NAVER_LAND_API_BASE)
+            page_delay: 페이지 요청 간 대기(초)
+            max_pages: 단지당 최대 페이지 수
+            rate_limiter: 호스트별 요청 간격 제한기 - 모든 API 요청 전에 슬롯 예약 (선택)
+        """
+        self.auth = auth
+        self.base_url = base_url.rstrip("/")
+        self.page_delay = page_delay
+        self.max_pages = max_pages
+        self.rate_limiter = rate_limiter
+
+    def _client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            headers={
+                'Authorization': self.auth.token,
+                'User-Agent': USER_AGENT,
+                'Referer': f"{NAVER_LAND_URL}/complexes",
+                'Accept': 'application/json',
+            },
+            cookies=self.auth.cookies,
+            timeout=httpx.Timeout(15.0, connect=5.0),
+        )
+
+    async def fetch_complex(self, complex_id: str) -> Dict:
+        """
+        단지 정보와 전체 매물 목록 조회
+
+        Returns:
+            {'complex': 단지 overview 데이터, 'articles': {'articleList': [...], 'totalCount': N, 'isMoreData': bool}}
+            - isMoreData가 True면 최대 페이지 수에서 멈춘 불완전한 목록
+
+        Raises:
+            httpx.HTTPError: API 호출 실패
+        """
+        async with self._client() as client:
+            complex_data = await self._get_json(
+                client,
+                f"{self.base_url}/complexes/overview/{complex_id}",
+                {'complexNo': complex_id}
+            )
+            articles, complete = await self._fetch_article_pages(client, complex_id)
+
+        return {
+            'complex': complex_data,
+            'articles': {'articleList': articles, 'totalCount': len(articles), 'isMoreData': not complete}
+        }
+
+    async def _fetch_article_pages(self, client: httpx.AsyncClient, complex_id: str) -> Tuple[List[Dict], bool]:
+        """
+        isMoreData가 false가 될 때까지 페이지 순회 (articleNo 기준 중복 제거)
+
+        Returns:
+            (매물 목록, 마지막 페이지(isMoreData == false)까지 조회했는지 여부)
+        """
+        articles: List[Dict] = []
+        seen = set()
+        complete = False
+
+        for page_no in range(1, self.max_pages + 1):
+            params = {**ARTICLE_LIST_PARAMS, 'complexNo': complex_id, 'page': page_no}
+            data = await self._get_json(client, f"{self.base_url}/articles/complex/{complex_id}", params)
+
+            page_articles = data.get('articleList') or []
+            for article in page_articles:
+                article_no = article.get('articleNo')
+                if article_no not in seen:
+                    seen.add(article_no)
+                    articles.append(article)
+
+            logger.info(f"   📄 {page_no}페이지: +{len(page_articles)}건 (누적 {len(articles)}건)")
+
+            if data.get('isMoreData') is False:
+                complete = True
+                break
+            if not page_articles:
+                break
+
+            await asyncio.sleep(self.page_delay)
+
+        if not complete:
+            logger.warning(f"⚠️  매물 목록이 끝까지 조회되지 않음 ({complex_id}, {len(articles)}건에서 중단)")
+
+        return articles, complete
+
+    async def _get_json(self, client: httpx.AsyncClient, url: str, params: Dict) -> Dict:
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire(url)
+        response = await client.get(url, params=params)
+        if response.status_code in (401, 403):
+            invalidate_naver_auth()
+        response.raise_for_status()
+        return response.json()
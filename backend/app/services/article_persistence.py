@@ -0,0 +1,205 @@
+"""
+매물 일괄 저장 (bulk upsert)
+
+크롤링한 매물 목록을 매물마다 SELECT 하지 않고 한 번에 저장합니다.
+
+1. 단지의 기존 매물(article_no, 가격)을 쿼리 1회로 조회
+2. 메모리에서 신규/가격변동/변동없음 분류
+3. 신규 + 가격변동 매물은 INSERT ... ON CONFLICT DO UPDATE 로 배치 저장
+4. 변동없음 매물은 UPDATE 1회로 last_seen_at 갱신
+5. 이번 크롤링에서 사라진 매물은 UPDATE 1회로 비활성화 (다시 나타나면 재활성화)
+
+PostgreSQL과 SQLite(테스트용)는 방언별 ON CONFLICT 구문을 사용하고,
+그 외 DB는 ORM 방식으로 저장합니다.
+"""
+import json
+from typing import Dict, List
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.database import get_conflict_insert
+from app.models.complex import Article
+from app.services.price_parser import parse_price, split_rent_price
+
+# INSERT 1회에 담을 최대 행 수 (바인드 파라미터 수 제한 대응)
+UPSERT_BATCH_SIZE = 500
+
+# 가격 변동 시 갱신하는 컬럼
+PRICE_COLUMNS = (
+    'price', 'monthly_rent', 'price_change_state',
+    'price_value', 'deposit_value', 'monthly_rent_value'
+)
+
+
+def build_article_row(article: Dict, complex_id: str) -> Dict:
+    """
+    네이버 매물 응답을 articles 테이블 행으로 변환
+
+    Args:
+        article: 매물 목록 API의 articleList 항목
+        complex_id: 단지 ID
+
+    Returns:
+        articles 컬럼명 → 값 dict
+    """
+    trade_type = article.get('tradeTypeName')
+    price_str = article.get('dealOrWarrantPrc')
+    monthly_rent = None
+
+    if trade_type == '월세':
+        # "5,000/140" 형식에서 보증금과 월세 분리
+        price_str, monthly_rent = split_rent_price(price_str)
+
+    price_value = parse_price(price_str)
+
+    return {
+        'article_no': article['articleNo'],
+        'complex_id': complex_id,
+        'trade_type': trade_type,
+        'price': price_str,
+        'monthly_rent': monthly_rent,
+        'price_value': price_value,
+        'deposit_value': price_value if trade_type in ('전세', '월세') else None,
+        'monthly_rent_value': parse_price(monthly_rent),
+        'price_change_state': article.get('priceChangeState'),
+        'area_name': article.get('areaName'),
+        'area1': article.get('area1'),
+        'area2': article.get('area2'),
+        'floor_info': article.get('floorInfo'),
+        'direction': article.get('direction'),
+        'building_name': article.get('buildingName'),
+        'feature_desc': article.get('articleFeatureDesc'),
+        'tags': json.dumps(article.get('tagList', []), ensure_ascii=False),
+        'realtor_name': article.get('realtorName'),
+        'confirm_date': article.get('articleConfirmYmd'),
+        # 동일 매물 정보
+        'same_addr_cnt': article.get('sameAddrCnt', 1),
+        'same_addr_max_prc': article.get('sameAddrMaxPrc'),
+        'same_addr_min_prc': article.get('sameAddrMinPrc'),
+        'is_active': True,
+    }
+
+
+def _is_price_changed(existing: tuple, row: Dict) -> bool:
+    """기존 (price, monthly_rent)와 비교하여 가격 변동 여부 판단"""
+    old_price, old_monthly_rent = existing
+    return old_price != row['price'] or bool(row['monthly_rent'] and old_monthly_rent != row['monthly_rent'])
+
+
+def _upsert_rows(db: Session, rows: List[Dict]):
+    """INSERT ... ON CONFLICT (article_no) DO UPDATE 배치 실행"""
+    insert = get_conflict_insert(db)
+
+    if insert is None:
+        # ON CONFLICT 미지원 DB: ORM merge 방식
+        existing = {
+            a.article_no: a for a in
+            db.query(Article).filter(Article.article_no.in_([r['article_no'] for r in rows])).all()
+        }
+        for row in rows:
+            article = existing.get(row['article_no'])
+            if article is None:
+                db.add(Article(**row))
+            else:
+                for key in PRICE_COLUMNS:
+                    setattr(article, key, row[key])
+                article.is_active = True
+        return
+
+    for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+        batch = rows[start:start + UPSERT_BATCH_SIZE]
+        stmt = insert(Article).values(batch)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Article.article_no],
+            set_={
+                **{key: stmt.excluded[key] for key in PRICE_COLUMNS},
+                'is_active': True,
+                'last_seen_at': func.now(),
+                'updated_at': func.now(),
+            }
+        )
+        db.execute(stmt)
+
+
+def upsert_articles(db: Session, complex_id: str, article_list: List[Dict]) -> Dict[str, int]:
+    """
+    단지 매물 목록 일괄 저장 (커밋은 호출자가 수행)
+
+    Args:
+        db: SQLAlchemy 세션
+        complex_id: 단지 ID
+        article_list: 매물 목록 API의 articleList
+
+    Returns:
+        dict: new(신규), updated(가격변동), unchanged(변동없음), duplicates(배치 내 중복), collected(저장된 매물 수)
+    """
+    # 배치 내 중복 제거 (첫 항목 유지)
+    rows: Dict[str, Dict] = {}
+    duplicates = 0
+    for article in article_list:
+        if article['articleNo'] in rows:
+            duplicates += 1
+            continue
+        rows[article['articleNo']] = build_article_row(article, complex_id)
+
+    # 기존 매물 가격을 쿼리 1회로 조회
+    existing = {
+        article_no: (price, monthly_rent)
+        for article_no, price, monthly_rent in db.query(
+            Article.article_no, Article.price, Article.monthly_rent
+        ).filter(Article.complex_id == complex_id)
+    }
+
+    changed_rows = []
+    unchanged_nos = []
+    new_count = 0
+    for article_no, row in rows.items():
+        if article_no not in existing:
+            new_count += 1
+            changed_rows.append(row)
+        elif _is_price_changed(existing[article_no], row):
+            changed_rows.append(row)
+        else:
+            unchanged_nos.append(article_no)
+
+    if changed_rows:
+        _upsert_rows(db, changed_rows)
+
+    # 변동없는 매물도 이번 크롤링에서 확인되었으므로 last_seen_at 갱신 (비활성 매물은 재활성화)
+    for start in range(0, len(unchanged_nos), UPSERT_BATCH_SIZE):
+        db.query(Article).filter(
+            Article.article_no.in_(unchanged_nos[start:start + UPSERT_BATCH_SIZE])
+        ).update({Article.last_seen_at: func.now(), Article.is_active: True}, synchronize_session=False)
+
+    return {
+        "new": new_count,
+        "updated": len(changed_rows) - new_count,
+        "unchanged": len(unchanged_nos),
+        "duplicates": duplicates,
+        "collected": len(rows),
+    }
+
+
+def deactivate_missing_articles(db: Session, complex_id: str, seen_article_nos: List[str]) -> int:
+    """
+    이번 크롤링에서 보이지 않은 단지 매물을 비활성화 (커밋은 호출자가 수행)
+
+    크롤링 결과가 비어 있으면 크롤링 실패일 가능성이 높으므로 아무것도 하지 않습니다.
+
+    Args:
+        db: SQLAlchemy 세션
+        complex_id: 단지 ID
+        seen_article_nos: 이번 크롤링에서 수집된 매물 번호 목록
+
+    Returns:
+        비활성화된 매물 수
+    """
+    if not seen_article_nos:
+        return 0
+
+    return db.query(Article).filter(
+        Article.complex_id == complex_id,
+        Article.is_active == True,
+        Article.article_no.notin_(seen_article_nos)
+    ).update({Article.is_active: False}, synchronize_session=False)
@@ -4,11 +4,17 @@
 from datetime import datetime
 from typing import List, Dict, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import DateTime, String, and_, case, desc, func, insert, literal, literal_column, or_, select
 import uuid
-import re
 
-from app.models.complex import Article, ArticleSnapshot, ArticleChange
+from app.models.complex import Article, ArticleSnapshot, ArticleChange, CrawlSession
+
+# INSERT ... SELECT 로 복사하는 스냅샷 컬럼 (select 컬럼 순서와 동일)
+SNAPSHOT_COLUMNS = [
+    'complex_id', 'article_no', 'trade_type', 'price', 'price_value', 'area_name', 'area1',
+    'floor_info', 'direction', 'building_name', 'realtor_name', 'same_addr_cnt',
+    'snapshot_date', 'crawl_session_id'
+]
 
 
 class ArticleTracker:
@@ -17,13 +23,24 @@ class ArticleTracker:
     def __init__(self, db: Session):
         self.db = db
 
-    def create_snapshot(self, complex_id: str, articles: List[Article]) -> str:
+    def create_snapshot(
+        self,
+        complex_id: str,
+        articles: Optional[List[Article]] = None,
+        crawl_job_id: Optional[str] = None,
+        started_at: Optional[datetime] = None
+    ) -> str:
         """
         현재 매물 상태의 스냅샷 생성
 
+        매물을 파이썬으로 불러오지 않고 articles 테이블에서
+        INSERT ... SELECT 한 번으로 활성 매물을 복사합니다.
+
         Args:
             complex_id: 단지 ID
-            articles: 현재 매물 리스트
+            articles: 스냅샷으로 저장할 매물 리스트 (생략 시 DB의 활성 매물 전체)
+            crawl_job_id: 이 세션을 만든 크롤링 작업 ID
+            started_at: 크롤링 시작 시각 (생략 시 스냅샷 시각)
 
         Returns:
             crawl_session_id: 크롤링 세션 ID
@@ -31,44 +48,87 @@ class ArticleTracker:
         crawl_session_id = str(uuid.uuid4())
         snapshot_date = datetime.now()
 
-        for article in articles:
-            snapshot = ArticleSnapshot(
-                complex_id=complex_id,
-                article_no=article.article_no,
-                trade_type=article.trade_type,
-                price=article.price,
-                area_name=article.area_name,
-                area1=article.area1,
-                floor_info=article.floor_info,
-                direction=article.direction,
-                building_name=article.building_name,
-                realtor_name=article.realtor_name,
-                same_addr_cnt=article.same_addr_cnt,
-                snapshot_date=snapshot_date,
-                crawl_session_id=crawl_session_id
+        if articles is None:
+            source = select(
+                Article.complex_id,
+                Article.article_no,
+                Article.trade_type,
+                Article.price,
+                Article.price_value,
+                Article.area_name,
+                Article.area1,
+                Article.floor_info,
+                Article.direction,
+                Article.building_name,
+                Article.realtor_name,
+                Article.same_addr_cnt,
+                literal(snapshot_date, DateTime(timezone=True)),
+                literal(crawl_session_id, String(100))
+            ).where(
+                Article.complex_id == complex_id,
+                Article.is_active == True
             )
-            self.db.add(snapshot)
-
+            result = self.db.execute(
+                insert(ArticleSnapshot).from_select(SNAPSHOT_COLUMNS, source)
+            )
+            count = result.rowcount
+        else:
+            rows = [
+                {
+                    'complex_id': complex_id,
+                    'article_no': article.article_no,
+                    'trade_type': article.trade_type,
+                    'price': article.price,
+                    'price_value': article.price_value,
+                    'area_name': article.area_name,
+                    'area1': article.area1,
+                    'floor_info': article.floor_info,
+                    'direction': article.direction,
+                    'building_name': article.building_name,
+                    'realtor_name': article.realtor_name,
+                    'same_addr_cnt': article.same_addr_cnt,
+                    'snapshot_date': snapshot_date,
+                    'crawl_session_id': crawl_session_id
+                }
+                for article in articles
+            ]
+            if rows:
+                self.db.execute(insert(ArticleSnapshot), rows)
+            count = len(rows)
+
+        self.db.add(CrawlSession(
+            session_id=crawl_session_id,
+            complex_id=complex_id,
+            crawl_job_id=crawl_job_id,
+            started_at=started_at or snapshot_date,
+            finished_at=snapshot_date,
+            article_count=count
+        ))
         self.db.commit()
-        print(f"✅ 스냅샷 생성 완료: {len(articles)}건 (세션: {crawl_session_id[:8]}...)")
+        print(f"✅ 스냅샷 생성 완료: {count}건 (세션: {crawl_session_id[:8]}...)")
         return crawl_session_id
 
-    def detect_changes(self, complex_id: str) -> List[ArticleChange]:
+    def _get_recent_session_ids(self, complex_id: str) -> List[str]:
         """
-        최근 2개 스냅샷을 비교하여 변동사항 감지
-
-        Args:
-            complex_id: 단지 ID
+        최근 2개 크롤링 세션 ID (최신순)
 
-        Returns:
-            감지된 변동사항 리스트
+        crawl_sessions 테이블에서 (complex_id, started_at) 인덱스로 조회하고,
+        세션 테이블 도입 전 스냅샷만 있는 단지는 스냅샷 GROUP BY로 대체합니다.
         """
-        # 최근 2개의 스냅샷 세션 가져오기
-        from sqlalchemy import func as sqlfunc
+        session_ids = [
+            row[0] for row in
+            self.db.query(CrawlSession.session_id)
+            .filter(CrawlSession.complex_id == complex_id)
+            .order_by(desc(CrawlSession.started_at))
+            .limit(2)
+        ]
+        if len(session_ids) == 2:
+            return session_ids
+
         recent_sessions = (
             self.db.query(
                 ArticleSnapshot.crawl_session_id,
-                sqlfunc.max(ArticleSnapshot.snapshot_date).label('snapshot_date')
+                func.max(ArticleSnapshot.snapshot_date).label('snapshot_date')
             )
             .filter(ArticleSnapshot.complex_id == complex_id)
             .group_by(ArticleSnapshot.crawl_session_id)
@@ -76,126 +136,111 @@ class ArticleTracker:
             .limit(2)
             .all()
         )
+        return [row[0] for row in recent_sessions]
 
-        if len(recent_sessions) < 2:
-            print("ℹ️  이전 스냅샷이 없어 변동사항을 감지할 수 없습니다.")
-            return []
+    def detect_changes(self, complex_id: str) -> Dict[str, int]:
+        """
+        최근 2개 스냅샷을 비교하여 변동사항 감지
 
-        prev_session_id = recent_sessions[1][0]
-        curr_session_id = recent_sessions[0][0]
+        두 세션의 스냅샷을 article_no 기준 FULL OUTER JOIN 하여 DB 안에서
+        신규/삭제/가격상승/가격하락을 분류하고 INSERT ... SELECT 한 번으로 기록합니다.
+        가격 비교는 만원 단위 price_value 기준입니다.
+        (FULL OUTER JOIN은 PostgreSQL, SQLite 3.39.0 이상에서 동작합니다)
 
-        # 이전 스냅샷
-        prev_snapshots = (
-            self.db.query(ArticleSnapshot)
-            .filter(
-                ArticleSnapshot.complex_id == complex_id,
-                ArticleSnapshot.crawl_session_id == prev_session_id
-            )
-            .all()
-        )
+        Args:
+            complex_id: 단지 ID
 
-        # 현재 스냅샷
-        curr_snapshots = (
-            self.db.query(ArticleSnapshot)
-            .filter(
-                ArticleSnapshot.complex_id == complex_id,
-                ArticleSnapshot.crawl_session_id == curr_session_id
-            )
-            .all()
+        Returns:
+            유형별 감지 건수 (new, removed, price_up, price_down)
+        """
+        counts = {'new': 0, 'removed': 0, 'price_up': 0, 'price_down': 0}
+
+        session_ids = self._get_recent_session_ids(complex_id)
+        if len(session_ids) < 2:
+            print("ℹ️  이전 스냅샷이 없어 변동사항을 감지할 수 없습니다.")
+            return counts
+
+        curr_session_id, prev_session_id = session_ids
+
+        prev = select(ArticleSnapshot).where(
+            ArticleSnapshot.complex_id == complex_id,
+            ArticleSnapshot.crawl_session_id == prev_session_id
+        ).subquery('prev')
+        curr = select(ArticleSnapshot).where(
+            ArticleSnapshot.complex_id == complex_id,
+            ArticleSnapshot.crawl_session_id == curr_session_id
+        ).subquery('curr')
+        joined = prev.join(curr, prev.c.article_no == curr.c.article_no, full=True)
+
+        # 신규: 이전 세션에 없음 / 삭제: 현재 세션에 없음 / 가격변동: 양쪽 가격값이 다름
+        price_diff = curr.c.price_value - prev.c.price_value
+        change_type = case(
+            (prev.c.article_no.is_(None), 'NEW'),
+            (curr.c.article_no.is_(None), 'REMOVED'),
+            (price_diff > 0, 'PRICE_UP'),
+            else_='PRICE_DOWN'
+        )
+        is_price_changed = and_(
+            prev.c.price_value.isnot(None),
+            curr.c.price_value.isnot(None),
+            prev.c.price_value != curr.c.price_value
+        )
+        is_changed = or_(prev.c.article_no.is_(None), curr.c.article_no.is_(None), is_price_changed)
+        has_price_diff = and_(
+            prev.c.article_no.isnot(None),
+            curr.c.article_no.isnot(None),
+            prev.c.price_value != 0
         )
 
-        # 매물 번호별로 매핑
-        prev_map = {s.article_no: s for s in prev_snapshots}
-        curr_map = {s.article_no: s for s in curr_snapshots}
-
-        changes = []
-
-        # 1. 신규 매물 감지
-        new_articles = set(curr_map.keys()) - set(prev_map.keys())
-        for article_no in new_articles:
-            snapshot = curr_map[article_no]
-            change = ArticleChange(
-                complex_id=complex_id,
-                article_no=article_no,
-                change_type='NEW',
-                new_price=snapshot.price,
-                trade_type=snapshot.trade_type,
-                area_name=snapshot.area_name,
-                building_name=snapshot.building_name,
-                floor_info=snapshot.floor_info,
-                to_snapshot_id=snapshot.id
+        changes = (
+            select(
+                literal(complex_id, String(50)),
+                func.coalesce(curr.c.article_no, prev.c.article_no),
+                change_type,
+                prev.c.price,
+                curr.c.price,
+                prev.c.price_value,
+                curr.c.price_value,
+                case((has_price_diff, price_diff)),
+                case((has_price_diff, func.round(price_diff * literal_column('100.0') / prev.c.price_value, 2))),
+                func.coalesce(curr.c.trade_type, prev.c.trade_type),
+                func.coalesce(curr.c.area_name, prev.c.area_name),
+                func.coalesce(curr.c.building_name, prev.c.building_name),
+                func.coalesce(curr.c.floor_info, prev.c.floor_info),
+                prev.c.id,
+                curr.c.id
             )
-            changes.append(change)
-            self.db.add(change)
-
-        # 2. 삭제된 매물 감지
-        removed_articles = set(prev_map.keys()) - set(curr_map.keys())
-        for article_no in removed_articles:
-            snapshot = prev_map[article_no]
-            change = ArticleChange(
-                complex_id=complex_id,
-                article_no=article_no,
-                change_type='REMOVED',
-                old_price=snapshot.price,
-                trade_type=snapshot.trade_type,
-                area_name=snapshot.area_name,
-                building_name=snapshot.building_name,
-                floor_info=snapshot.floor_info,
-                from_snapshot_id=snapshot.id
+            .select_from(joined)
+            .where(is_changed)
+        )
+        self.db.execute(
+            insert(ArticleChange).from_select(
+                ['complex_id', 'article_no', 'change_type', 'old_price', 'new_price',
+                 'old_price_value', 'new_price_value', 'price_change_amount', 'price_change_percent',
+                 'trade_type', 'area_name', 'building_name', 'floor_info',
+                 'from_snapshot_id', 'to_snapshot_id'],
+                changes
             )
-            changes.append(change)
-            self.db.add(change)
-
-        # 3. 가격 변동 감지
-        common_articles = set(prev_map.keys()) & set(curr_map.keys())
-        for article_no in common_articles:
-            prev_snap = prev_map[article_no]
-            curr_snap = curr_map[article_no]
-
-            if prev_snap.price != curr_snap.price:
-                # 가격에서 숫자만 추출
-                prev_price_num = self._extract_price_number(prev_snap.price)
-                curr_price_num = self._extract_price_number(curr_snap.price)
-
-                if prev_price_num and curr_price_num:
-                    price_diff = curr_price_num - prev_price_num
-
-                    # 실제 가격 차이가 없으면 스킵 (문자열만 다른 경우)
-                    if price_diff == 0:
-                        continue
-
-                    price_change_percent = (price_diff / prev_price_num) * 100
-
-                    change_type = 'PRICE_UP' if price_diff > 0 else 'PRICE_DOWN'
-
-                    change = ArticleChange(
-                        complex_id=complex_id,
-                        article_no=article_no,
-                        change_type=change_type,
-                        old_price=prev_snap.price,
-                        new_price=curr_snap.price,
-                        price_change_amount=price_diff,
-                        price_change_percent=round(price_change_percent, 2),
-                        trade_type=curr_snap.trade_type,
-                        area_name=curr_snap.area_name,
-                        building_name=curr_snap.building_name,
-                        floor_info=curr_snap.floor_info,
-                        from_snapshot_id=prev_snap.id,
-                        to_snapshot_id=curr_snap.id
-                    )
-                    changes.append(change)
-                    self.db.add(change)
+        )
+
+        for detected_type, count in self.db.execute(
+            select(change_type, func.count())
+            .select_from(joined)
+            .where(is_changed)
+            .group_by(change_type)
+        ):
+            counts[detected_type.lower()] = count
 
         self.db.commit()
 
         print(f"""
 📊 변동사항 감지 완료:
-   - 신규: {len(new_articles)}건
-   - 삭제: {len(removed_articles)}건
-   - 가격변동: {len([c for c in changes if c.change_type in ['PRICE_UP', 'PRICE_DOWN']])}건
+   - 신규: {counts['new']}건
+   - 삭제: {counts['removed']}건
+   - 가격변동: {counts['price_up'] + counts['price_down']}건
         """)
 
-        return changes
+        return counts
 
     def get_recent_changes(
         self,
@@ -267,18 +312,3 @@ class ArticleTracker:
             'total': len(changes),
             'most_significant_change': most_significant_change
         }
-
-    @staticmethod
-    def _extract_price_number(price_str: str) -> Optional[int]:
-        """가격 문자열에서 숫자 추출 (만원 단위)"""
-        if not price_str:
-            return None
-
-        # 모든 숫자와 쉼표만 추출
-        numbers = re.sub(r'[^0-9,]', '', price_str)
-        numbers = numbers.replace(',', '')
-
-        if numbers:
-            return int(numbers)
-
-        return None
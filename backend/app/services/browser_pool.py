@@ -0,0 +1,315 @@
+"""
+프로세스 공용 브라우저 풀
+
+짧은 크롤링에서는 Chromium 실행 시간이 대부분을 차지하므로, 프로세스마다 브라우저를
+하나만 띄워 두고 크롤러들이 브라우저 컨텍스트를 대여(lease)해서 사용합니다.
+
+- 워밍업: 컨텍스트를 미리 만들어 둠 (warm_up)
+- 헬스체크: 브라우저 연결이 끊겼거나 닫힌 컨텍스트는 자동으로 폐기/재생성
+- 재활용: 컨텍스트당 BROWSER_CONTEXT_MAX_PAGES회 대여 후 폐기하고 새로 생성
+- 컨텍스트별 상태: 동일매물묶기(sameAddrYn) localStorage 설정을 컨텍스트 생성 시 1회 수행
+"""
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional
+
+from playwright.async_api import async_playwright
+
+logger = logging.getLogger(__name__)
+
+NAVER_LAND_URL = "https://new.land.naver.com"
+
+# ⚠️ 봇 감지 회피: 기본값 headless=False (BROWSER_HEADLESS=true로 변경 가능)
+BROWSER_HEADLESS = os.getenv("BROWSER_HEADLESS", "false").lower() == "true"
+
+# 동시에 대여 가능한 컨텍스트 수
+BROWSER_POOL_SIZE = int(os.getenv("BROWSER_POOL_SIZE", "3"))
+
+# 컨텍스트 1개를 재사용할 최대 횟수 (초과 시 폐기 후 재생성)
+BROWSER_CONTEXT_MAX_PAGES = int(os.getenv("BROWSER_CONTEXT_MAX_PAGES", "50"))
+
+BROWSER_LAUNCH_ARGS = [
+    '--disable-blink-features=AutomationControlled',  # 필수: automation 감지 차단
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--no-sandbox'
+]
+
+CONTEXT_OPTIONS = {
+    'user_agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'viewport': {'width': 1920, 'height': 1080},
+    'locale': 'ko-KR',
+    'timezone_id': 'Asia/Seoul'
+}
+
+# JavaScript로 webdriver 감지 차단
+STEALTH_INIT_SCRIPT = '''
+    Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
+    Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]});
+    Object.defineProperty(navigator, 'languages', {get: () => ['ko-KR', 'ko']});
+'''
+
+# ⚠️ 필수: localStorage에 동일매물묶기 설정 저장
+SAME_ADDRESS_SCRIPT = """
+    () => {
+        // 네이버가 사용하는 localStorage 키 설정
+        localStorage.setItem('sameAddrYn', 'true');
+        localStorage.setItem('sameAddressGroup', 'true');
+    }
+"""
+
+
+class PooledContext:
+    """풀에서 관리하는 브라우저 컨텍스트"""
+
+    def __init__(self, context):
+        self.context = context
+        self.pages_served = 0
+
+
+class BrowserPool:
+    """브라우저 1개 + 컨텍스트 N개를 유지하는 대여 풀"""
+
+    def __init__(
+        self,
+        size: int = BROWSER_POOL_SIZE,
+        max_pages_per_context: int = BROWSER_CONTEXT_MAX_PAGES,
+        headless: bool = BROWSER_HEADLESS
+    ):
+        self.size = max(1, size)
+        self.max_pages_per_context = max(1, max_pages_per_context)
+        self.headless = headless
+
+        self._loop = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._playwright = None
+        self._browser = None
+        self._idle: List[PooledContext] = []
+
+        self.stats: Dict[str, int] = {
+            "browser_launches": 0,
+            "contexts_created": 0,
+            "contexts_recycled": 0,
+            "leases": 0
+        }
+
+    def _bind_loop(self):
+        """
+        현재 이벤트 루프에 풀을 연결
+
+        Playwright 객체는 생성된 이벤트 루프에서만 사용할 수 있으므로,
+        루프가 바뀌면 이전 루프의 브라우저는 버리고 새로 시작합니다.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+
+        if self._loop is not None:
+            logger.warning("이벤트 루프 변경 감지 - 브라우저 풀 재초기화")
+
+        self._loop = loop
+        self._lock = asyncio.Lock()
+        self._semaphore = asyncio.Semaphore(self.size)
+        self._playwright = None
+        self._browser = None
+        self._idle = []
+
+    async def _ensure_browser(self):
+        """브라우저 헬스체크 후 필요하면 (재)시작"""
+        async with self._lock:
+            if self._browser is not None and self._browser.is_connected():
+                return
+
+            if self._browser is not None:
+                logger.warning("브라우저 연결 끊김 감지 - 재시작합니다")
+                self._idle = []
+
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+
+            # ⚠️ 봇 감지 회피: AutomationControlled 비활성화, slow_mo=100
+            self._browser = await self._playwright.chromium.launch(
+                headless=self.headless,
+                args=BROWSER_LAUNCH_ARGS,
+                slow_mo=100
+            )
+            self.stats["browser_launches"] += 1
+            logger.info(f"🚀 공용 브라우저 시작 (headless={self.headless})")
+
+    async def _new_context(self) -> PooledContext:
+        """컨텍스트 생성 + 동일매물묶기 localStorage 1회 설정"""
+        context = await self._browser.new_context(**CONTEXT_OPTIONS)
+        await context.add_init_script(STEALTH_INIT_SCRIPT)
+
+        page = await context.new_page()
+        try:
+            await page.goto(NAVER_LAND_URL, wait_until="domcontentloaded")
+            await page.evaluate(SAME_ADDRESS_SCRIPT)
+        except Exception as e:
+            logger.warning(f"동일매물묶기 설정 실패 (계속 진행): {e}")
+        finally:
+            await page.close()
+
+        self.stats["contexts_created"] += 1
+        return PooledContext(context)
+
+    def _is_healthy(self, pooled: PooledContext) -> bool:
+        """브라우저가 살아 있고 컨텍스트가 닫히지 않았는지 확인"""
+        return (
+            self._browser is not None
+            and self._browser.is_connected()
+            and pooled.context in self._browser.contexts
+        )
+
+    async def _discard(self, pooled: PooledContext):
+        """컨텍스트 폐기"""
+        try:
+            await pooled.context.close()
+        except Exception:
+            pass
+
+    async def acquire(self) -> PooledContext:
+        """
+        컨텍스트 대여 (풀이 가득 차면 반납될 때까지 대기)
+
+        반드시 release()로 반납해야 합니다. 가능하면 lease()를 사용하세요.
+        """
+        self._bind_loop()
+        await self._semaphore.acquire()
+
+        try:
+            await self._ensure_browser()
+
+            pooled = None
+            while self._idle and pooled is None:
+                candidate = self._idle.pop()
+                if self._is_healthy(candidate):
+                    pooled = candidate
+                else:
+                    await self._discard(candidate)
+
+            if pooled is None:
+                pooled = await self._new_context()
+        except Exception:
+            self._semaphore.release()
+            raise
+
+        self.stats["leases"] += 1
+        return pooled
+
+    async def release(self, pooled: PooledContext, broken: bool = False):
+        """
+        컨텍스트 반납
+
+        Args:
+            pooled: acquire()로 받은 컨텍스트
+            broken: 사용 중 오류가 발생했는지 여부 (True면 재사용하지 않고 폐기)
+        """
+        pooled.pages_served += 1
+
+        try:
+            recycle = (
+                broken
+                or not self._is_healthy(pooled)
+                or pooled.pages_served >= self.max_pages_per_context
+            )
+
+            if recycle:
+                await self._discard(pooled)
+                self.stats["contexts_recycled"] += 1
+            else:
+                # 대여 중 열린 페이지 정리 후 반납
+                for page in list(pooled.context.pages):
+                    await page.close()
+                self._idle.append(pooled)
+        except Exception as e:
+            logger.warning(f"컨텍스트 반납 중 오류 (폐기): {e}")
+            await self._discard(pooled)
+        finally:
+            self._semaphore.release()
+
+    @asynccontextmanager
+    async def lease(self):
+        """
+        컨텍스트 대여 컨텍스트 매니저
+
+        사용 예:
+            async with get_browser_pool().lease() as context:
+                page = await context.new_page()
+        """
+        pooled = await self.acquire()
+        broken = False
+        try:
+            yield pooled.context
+        except Exception:
+            broken = True
+            raise
+        finally:
+            await self.release(pooled, broken=broken)
+
+    async def warm_up(self, count: Optional[int] = None):
+        """
+        브라우저를 미리 띄우고 컨텍스트를 생성해 둠
+
+        Args:
+            count: 미리 만들 컨텍스트 수 (기본: 풀 크기)
+        """
+        self._bind_loop()
+        await self._ensure_browser()
+
+        count = min(count or self.size, self.size)
+        while len(self._idle) < count:
+            self._idle.append(await self._new_context())
+
+        logger.info(f"🔥 브라우저 풀 워밍업 완료: 컨텍스트 {len(self._idle)}개")
+
+    async def close(self):
+        """모든 컨텍스트와 브라우저 종료"""
+        for pooled in self._idle:
+            await self._discard(pooled)
+        self._idle = []
+
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception:
+                pass
+            self._browser = None
+
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            except Exception:
+                pass
+            self._playwright = None
+
+    def get_stats(self) -> Dict:
+        """풀 상태 조회"""
+        return {
+            **self.stats,
+            "size": self.size,
+            "idle_contexts": len(self._idle),
+            "browser_connected": bool(self._browser and self._browser.is_connected())
+        }
+
+
+_browser_pool: Optional[BrowserPool] = None
+
+
+def get_browser_pool() -> BrowserPool:
+    """프로세스 공용 브라우저 풀 (싱글톤)"""
+    global _browser_pool
+    if _browser_pool is None:
+        _browser_pool = BrowserPool()
+    return _browser_pool
+
+
+async def close_browser_pool():
+    """프로세스 종료 시 공용 브라우저 풀 정리"""
+    global _browser_pool
+    if _browser_pool is not None:
+        pool, _browser_pool = _browser_pool, None
+        await pool.close()
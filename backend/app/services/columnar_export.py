@@ -0,0 +1,338 @@
+"""
+분석용 컬럼 파일(Parquet / Arrow IPC) 내보내기
+
+스냅샷, 변동 이력, 실거래가를 단지/월 단위로 나눈 파일로 저장하여
+분석 도구(pandas, DuckDB, Polars 등)가 DB를 거치지 않고 직접 읽을 수 있게 합니다.
+
+    {ANALYTICS_EXPORT_DIR}/
+        _watermarks.json
+        snapshots/complex_id=109208/month=2025-01/part-20250131T120000.parquet
+        changes/complex_id=109208/month=2025-01/part-....parquet
+        transactions/complex_id=109208/month=2024-12/part-....parquet
+
+- Hive 방식 디렉토리(complex_id=/month=)라 pyarrow.dataset 등에서 파티션 컬럼으로 인식됩니다.
+  (complex_id는 파일 안에 없고 디렉토리 이름으로만 저장 - open_dataset() 참고)
+- Arrow IPC(.arrow)는 memory-map으로 바로 열 수 있습니다.
+- 데이터셋별 워터마크(snapshot_date / detected_at / created_at) 이후 행만 내보내므로
+  매 실행마다 새 part 파일만 추가됩니다.
+- 워터마크 상한은 max(컬럼)이 아니라 "DB 현재 시각 - ANALYTICS_WATERMARK_LAG_SECONDS"입니다.
+  컬럼 값은 INSERT 시각이라 늦게 커밋된 트랜잭션의 행이 이미 지난 워터마크 뒤에 나타날 수 있으므로,
+  가장 긴 쓰기 트랜잭션보다 긴 여유를 두고 그 이전 구간만 확정해서 내보냅니다.
+
+pyarrow는 선택 의존성입니다. (pip install pyarrow)
+"""
+import json
+import logging
+import os
+import shutil
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import BigInteger, Boolean, DateTime, Float, Integer, func, select
+from sqlalchemy.orm import Session
+
+from app.models.complex import ArticleSnapshot, ArticleChange, Transaction
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # 선택 의존성
+    pa = None
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+# 출력 디렉토리 / 기본 형식 (parquet, arrow)
+ANALYTICS_EXPORT_DIR = os.getenv("ANALYTICS_EXPORT_DIR", str(PROJECT_ROOT / "data" / "analytics"))
+ANALYTICS_EXPORT_FORMAT = os.getenv("ANALYTICS_EXPORT_FORMAT", "parquet")
+
+# 서버 측 커서 배치 크기 = 파일에 쓰는 레코드 배치 최대 크기
+ANALYTICS_BATCH_SIZE = int(os.getenv("ANALYTICS_BATCH_SIZE", "50000"))
+
+# 워터마크 상한 여유 (초) - 이보다 오래 열려 있던 트랜잭션이 쓴 행은 누락될 수 있음
+ANALYTICS_WATERMARK_LAG_SECONDS = int(os.getenv("ANALYTICS_WATERMARK_LAG_SECONDS", "300"))
+
+WATERMARK_FILE = "_watermarks.json"
+FILE_EXTENSIONS = {"parquet": "parquet", "arrow": "arrow"}
+
+
+# 데이터셋 → (모델, 워터마크 컬럼, 월 파티션 컬럼)
+# 워터마크 컬럼 값이 지난 실행보다 큰 행만 내보냄
+DATASETS = {
+    "snapshots": (ArticleSnapshot, "snapshot_date", "snapshot_date"),
+    "changes": (ArticleChange, "detected_at", "detected_at"),
+    "transactions": (Transaction, "created_at", "trade_date"),
+}
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise RuntimeError("pyarrow가 설치되어 있지 않습니다. (pip install pyarrow)")
+
+
+def _arrow_type(column):
+    """SQLAlchemy 컬럼 타입 → Arrow 타입"""
+    if isinstance(column.type, BigInteger):
+        return pa.int64()
+    if isinstance(column.type, Integer):
+        return pa.int32()
+    if isinstance(column.type, Float):
+        return pa.float64()
+    if isinstance(column.type, Boolean):
+        return pa.bool_()
+    if isinstance(column.type, DateTime):
+        return pa.timestamp("us", tz="UTC")
+    return pa.string()
+
+
+def _month_key(value) -> str:
+    """파티션 월 (YYYY-MM) - datetime 또는 YYYYMMDD 문자열"""
+    if value is None:
+        return "unknown"
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m")
+    value = str(value)
+    return f"{value[:4]}-{value[4:6]}" if len(value) >= 6 else "unknown"
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def load_watermarks(output_dir: str) -> Dict[str, str]:
+    """데이터셋별 마지막 내보내기 워터마크 (ISO 문자열)"""
+    path = Path(output_dir) / WATERMARK_FILE
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _save_watermarks(output_dir: str, watermarks: Dict[str, str]):
+    path = Path(output_dir) / WATERMARK_FILE
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(watermarks, ensure_ascii=False, indent=2), encoding="utf-8")
+    tmp_path.replace(path)
+
+
+class _PartitionWriter:
+    """파티션(단지/월)별 파일 1개에 레코드 배치를 이어 쓰는 writer"""
+
+    def __init__(self, path: Path, schema, fmt: str):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.tmp_path = path.with_name(path.name + ".tmp")
+        if fmt == "arrow":
+            self._sink = pa.OSFile(str(self.tmp_path), "wb")
+            self._writer = pa.ipc.new_file(self._sink, schema)
+        else:
+            self._sink = None
+            self._writer = pq.ParquetWriter(str(self.tmp_path), schema, compression="zstd")
+
+    def write(self, table):
+        self._writer.write_table(table)
+
+    def close(self):
+        self._writer.close()
+        if self._sink is not None:
+            self._sink.close()
+        # 다 쓴 파일만 최종 이름으로 (읽는 쪽이 쓰다 만 파일을 보지 않도록)
+        self.tmp_path.replace(self.path)
+
+    def abort(self):
+        """오류 시 쓰던 임시 파일 삭제"""
+        try:
+            self._writer.close()
+            if self._sink is not None:
+                self._sink.close()
+        finally:
+            self.tmp_path.unlink(missing_ok=True)
+
+
+def _export_dataset(
+    db: Session,
+    name: str,
+    output_dir: str,
+    fmt: str,
+    since: Optional[datetime],
+    batch_size: int
+) -> Dict:
+    """
+    데이터셋 1개 증분 내보내기
+
+    워터마크 구간 (since, until]의 행을 (complex_id, 월 컬럼, id) 순으로 읽으므로
+    같은 파티션의 행이 연속으로 나와 한 번에 파일 1개만 열어 둡니다.
+
+    Returns:
+        dict: rows, files, watermark(이번 실행 상한, 없으면 None)
+    """
+    model, watermark_column, month_column = DATASETS[name]
+    table = model.__table__
+    watermark_col = table.c[watermark_column]
+    month_col = table.c[month_column]
+
+    # 상한은 DB 시각 기준 여유를 둔 과거 시점으로 고정 - 아직 커밋되지 않은 트랜잭션의 행은
+    # max(컬럼)보다 작은 값으로 나중에 나타날 수 있어 max(컬럼)을 워터마크로 쓰면 영영 건너뜀
+    until = db.execute(select(func.now())).scalar() - timedelta(seconds=ANALYTICS_WATERMARK_LAG_SECONDS)
+    if since is not None and _as_utc(until) <= _as_utc(since):
+        return {"rows": 0, "files": 0, "watermark": None}
+
+    pending_query = select(watermark_col).where(watermark_col <= until).limit(1)
+    if since is not None:
+        pending_query = pending_query.where(watermark_col > since)
+    if db.execute(pending_query).first() is None:
+        return {"rows": 0, "files": 0, "watermark": None}
+
+    # complex_id는 디렉토리(complex_id=...)로 표현되므로 파일에는 쓰지 않음
+    columns = [column for column in table.columns if column.name != "complex_id"]
+    names = [column.name for column in columns]
+    schema = pa.schema([pa.field(column.name, _arrow_type(column)) for column in columns])
+    month_idx = names.index(month_column)
+
+    statement = (
+        select(table.c.complex_id, *columns)
+        .where(watermark_col <= until)
+        .order_by(table.c.complex_id, month_col, table.c.id)
+        .execution_options(yield_per=batch_size)
+    )
+    if since is not None:
+        statement = statement.where(watermark_col > since)
+
+    part_name = f"part-{_as_utc(until).strftime('%Y%m%dT%H%M%S')}.{FILE_EXTENSIONS[fmt]}"
+    root = Path(output_dir) / name
+    writer: Optional[_PartitionWriter] = None
+    current_key = None
+    rows_written = 0
+    files = 0
+
+    def flush(rows: List):
+        if rows:
+            writer.write(pa.Table.from_arrays(
+                [pa.array(values, type=field.type) for values, field in zip(zip(*rows), schema)],
+                schema=schema
+            ))
+
+    try:
+        for partition in db.execute(statement).partitions():
+            pending: List = []
+            for complex_id, *row in partition:
+                key = (complex_id, _month_key(row[month_idx]))
+                if key != current_key:
+                    flush(pending)
+                    pending = []
+                    if writer is not None:
+                        writer.close()
+                    writer = _PartitionWriter(
+                        root / f"complex_id={key[0]}" / f"month={key[1]}" / part_name, schema, fmt
+                    )
+                    current_key = key
+                    files += 1
+                pending.append(row)
+            flush(pending)
+            rows_written += len(partition)
+    except BaseException:
+        if writer is not None:
+            writer.abort()
+        raise
+
+    if writer is not None:
+        writer.close()
+
+    return {"rows": rows_written, "files": files, "watermark": _as_utc(until).isoformat()}
+
+
+def export_analytics(
+    db: Session,
+    datasets: Optional[Iterable[str]] = None,
+    output_dir: Optional[str] = None,
+    fmt: Optional[str] = None,
+    full: bool = False,
+    batch_size: int = ANALYTICS_BATCH_SIZE
+) -> Dict[str, Dict]:
+    """
+    스냅샷/변동 이력/실거래가를 Parquet 또는 Arrow IPC 파일로 증분 내보내기
+
+    Args:
+        db: SQLAlchemy 세션
+        datasets: 내보낼 데이터셋 (snapshots, changes, transactions - 기본: 전체)
+        output_dir: 출력 디렉토리 (기본: ANALYTICS_EXPORT_DIR)
+        fmt: parquet / arrow (기본: ANALYTICS_EXPORT_FORMAT)
+        full: True면 워터마크를 무시하고 전체 다시 내보내기 (기존 파일 삭제)
+        batch_size: 서버 측 커서 배치 크기
+
+    Returns:
+        데이터셋별 {rows, files, watermark, seconds, rows_per_sec}
+    """
+    _require_pyarrow()
+
+    output_dir = output_dir or ANALYTICS_EXPORT_DIR
+    fmt = fmt or ANALYTICS_EXPORT_FORMAT
+    if fmt not in FILE_EXTENSIONS:
+        raise ValueError(f"지원하지 않는 형식입니다: {fmt} (parquet, arrow)")
+
+    names = list(datasets or DATASETS)
+    unknown = [name for name in names if name not in DATASETS]
+    if unknown:
+        raise ValueError(f"알 수 없는 데이터셋: {', '.join(unknown)}")
+
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    watermarks = load_watermarks(output_dir)
+    results = {}
+
+    for name in names:
+        since = None if full else watermarks.get(name)
+        since = datetime.fromisoformat(since) if since else None
+
+        started = time.perf_counter()
+        if full:
+            # 전체 내보내기는 기존 part 파일과 중복되지 않도록 데이터셋 디렉토리를 비우고 시작
+            shutil.rmtree(Path(output_dir) / name, ignore_errors=True)
+
+        result = _export_dataset(db, name, output_dir, fmt, since, batch_size)
+        elapsed = time.perf_counter() - started
+
+        result["seconds"] = round(elapsed, 3)
+        result["rows_per_sec"] = int(result["rows"] / elapsed) if elapsed > 0 and result["rows"] else 0
+        results[name] = result
+
+        # 파일을 모두 쓴 뒤에만 워터마크 전진
+        if result["watermark"]:
+            watermarks[name] = result["watermark"]
+            _save_watermarks(output_dir, watermarks)
+
+        logger.info(
+            f"📦 {name}: {result['rows']:,}행 → 파일 {result['files']}개 "
+            f"({result['seconds']}초, {result['rows_per_sec']:,}행/초)"
+        )
+
+    return results
+
+
+def open_dataset(name: str, output_dir: Optional[str] = None, fmt: Optional[str] = None):
+    """
+    내보낸 데이터셋을 pyarrow.dataset으로 열기 (complex_id/month 파티션 컬럼 포함)
+
+    Args:
+        name: snapshots / changes / transactions
+        output_dir: 출력 디렉토리 (기본: ANALYTICS_EXPORT_DIR)
+        fmt: parquet / arrow (기본: ANALYTICS_EXPORT_FORMAT)
+
+    Returns:
+        pyarrow.dataset.Dataset
+    """
+    _require_pyarrow()
+    import pyarrow.dataset as ds
+
+    fmt = fmt or ANALYTICS_EXPORT_FORMAT
+    partitioning = ds.partitioning(
+        pa.schema([("complex_id", pa.string()), ("month", pa.string())]), flavor="hive"
+    )
+    return ds.dataset(
+        str(Path(output_dir or ANALYTICS_EXPORT_DIR) / name),
+        format="ipc" if fmt == "arrow" else "parquet",
+        partitioning=partitioning
+    )
@@ -0,0 +1,108 @@
+"""
+단지 위치 검색 (반경 / 지도 영역)
+
+complexes.geohash 인덱스로 후보 격자만 범위 조회한 뒤, 위도/경도 영역 조건과
+평면 근사 거리(m²)로 SQL에서 거리순 정렬/LIMIT 합니다. 응답 거리는 haversine(m)로 계산하며,
+반경 검색은 근사 오차만큼 넉넉히 조회한 뒤 haversine 거리로 반경을 다시 확인합니다.
+PostgreSQL/SQLite 모두 같은 SQL로 동작합니다 (PostGIS 불필요).
+"""
+import math
+from typing import List, Tuple
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+
+from app.core.geohash import METERS_PER_DEGREE, cover_ranges, haversine_m, radius_bbox
+from app.models.complex import Complex
+
+MAX_NEARBY_RADIUS_M = 50_000
+MAX_GEO_RESULTS = 1000
+
+# 평면 근사 거리의 상대 오차 여유 (50km 이내에서 0.1% 미만)
+_APPROX_MARGIN = 1.002
+
+
+def _geohash_condition(south: float, west: float, north: float, east: float):
+    """영역을 덮는 geohash 범위 조건 (인덱스 범위 스캔) + 정확한 위도/경도 조건"""
+    ranges = [
+        and_(Complex.geohash >= lower, Complex.geohash < upper) if upper else Complex.geohash >= lower
+        for lower, upper in cover_ranges(south, west, north, east)
+    ]
+    return and_(
+        or_(*ranges),
+        Complex.latitude.between(south, north),
+        Complex.longitude.between(west, east),
+    )
+
+
+def _squared_distance(latitude: float, longitude: float):
+    """중심점까지 평면 근사 거리(m²) SQL 식 (수십 km 이내에서 haversine과 0.1% 이내)"""
+    lng_scale = METERS_PER_DEGREE * math.cos(math.radians(latitude))
+    d_lat = (Complex.latitude - latitude) * METERS_PER_DEGREE
+    d_lng = (Complex.longitude - longitude) * lng_scale
+    return d_lat * d_lat + d_lng * d_lng
+
+
+def _with_distance(complexes: List[Complex], latitude: float, longitude: float) -> List[Tuple[Complex, float]]:
+    """haversine 거리(m)를 붙여 가까운 순 정렬 (같은 거리는 단지 ID 순)"""
+    results = [
+        (complex_obj, haversine_m(latitude, longitude, complex_obj.latitude, complex_obj.longitude))
+        for complex_obj in complexes
+    ]
+    results.sort(key=lambda item: (item[1], item[0].complex_id))
+    return [(complex_obj, round(distance, 1)) for complex_obj, distance in results]
+
+
+def find_nearby_complexes(
+    db: Session, latitude: float, longitude: float, radius_m: float, limit: int = 100
+) -> List[Tuple[Complex, float]]:
+    """
+    반경 내 단지 (가까운 순)
+
+    Args:
+        latitude: 중심 위도
+        longitude: 중심 경도
+        radius_m: 반경(m)
+        limit: 최대 결과 수
+
+    Returns:
+        [(단지, 거리(m))]
+    """
+    search_radius = radius_m * _APPROX_MARGIN
+    south, west, north, east = radius_bbox(latitude, longitude, search_radius)
+    distance = _squared_distance(latitude, longitude)
+
+    complexes = (
+        db.query(Complex)
+        .filter(_geohash_condition(south, west, north, east), distance <= search_radius * search_radius)
+        .order_by(distance, Complex.complex_id)
+        .limit(limit)
+        .all()
+    )
+    return [
+        (complex_obj, distance_m)
+        for complex_obj, distance_m in _with_distance(complexes, latitude, longitude)
+        if distance_m <= radius_m
+    ]
+
+
+def find_complexes_in_bbox(
+    db: Session, south: float, west: float, north: float, east: float, limit: int = 500
+) -> List[Tuple[Complex, float]]:
+    """
+    지도 영역 내 단지 (영역 중심에서 가까운 순 - 확대 수준이 낮아 많을 때 중심부 우선)
+
+    Returns:
+        [(단지, 영역 중심까지 거리(m))]
+    """
+    center_lat, center_lng = (south + north) / 2, (west + east) / 2
+    distance = _squared_distance(center_lat, center_lng)
+
+    complexes = (
+        db.query(Complex)
+        .filter(_geohash_condition(south, west, north, east))
+        .order_by(distance, Complex.complex_id)
+        .limit(limit)
+        .all()
+    )
+    return _with_distance(complexes, center_lat, center_lng)
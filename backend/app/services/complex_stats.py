@@ -0,0 +1,171 @@
+"""
+단지 통계 집계 서비스
+
+단지 카드에 표시되는 통계(매물 수, 가격 범위, 실거래, 24시간 변동)를
+조건부 집계(COUNT(*) FILTER (WHERE ...))로 계산합니다.
+단지 수와 관계없이 쿼리 3회로 끝납니다.
+
+1. 단지 + 매물 집계 + 24시간 변동 집계 (LEFT JOIN)
+2. 단지별 실거래 건수 + 최근 실거래 (윈도우 함수)
+3. 월세 보증금/월세 최소·최대 매물의 원문 가격 문자열 (기존 응답처럼 "5,000", "150" 그대로 반환)
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List
+
+from sqlalchemy import func, or_, select
+from sqlalchemy.orm import Session
+
+from app.models.complex import Complex, Article, ArticleChange, Transaction
+from app.schemas.complex import TransactionResponse
+
+# 배치 조회 최대 단지 수
+MAX_BATCH_COMPLEXES = 100
+
+
+def _count_if(condition):
+    """COUNT(*) FILTER (WHERE condition)"""
+    return func.count().filter(condition)
+
+
+def get_complex_stats_batch(db: Session, complex_ids: List[str]) -> Dict[str, Dict]:
+    """
+    여러 단지의 통계를 한 번에 조회
+
+    Args:
+        db: SQLAlchemy 세션
+        complex_ids: 단지 ID 리스트
+
+    Returns:
+        단지 ID → 통계 dict (존재하지 않는 단지는 제외)
+    """
+    complex_ids = list(dict.fromkeys(complex_ids))
+    if not complex_ids:
+        return {}
+
+    # 1. 활성 매물 집계 (거래유형별 건수 + 월세 가격 범위)
+    is_monthly = Article.trade_type == "월세"
+    article_stats = (
+        select(
+            Article.complex_id,
+            func.count().label("total"),
+            _count_if(Article.trade_type == "매매").label("sale"),
+            _count_if(Article.trade_type == "전세").label("lease"),
+            _count_if(is_monthly).label("monthly"),
+            func.min(Article.deposit_value).filter(is_monthly).label("deposit_min"),
+            func.max(Article.deposit_value).filter(is_monthly).label("deposit_max"),
+            func.min(Article.monthly_rent_value).filter(is_monthly).label("rent_min"),
+            func.max(Article.monthly_rent_value).filter(is_monthly).label("rent_max"),
+        )
+        .where(Article.complex_id.in_(complex_ids), Article.is_active == True)
+        .group_by(Article.complex_id)
+        .subquery("article_stats")
+    )
+
+    # 24시간 변동 집계
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=24)
+    change_stats = (
+        select(
+            ArticleChange.complex_id,
+            _count_if(ArticleChange.change_type == "NEW").label("new"),
+            _count_if(ArticleChange.change_type == "REMOVED").label("removed"),
+            _count_if(ArticleChange.change_type == "PRICE_UP").label("price_up"),
+            _count_if(ArticleChange.change_type == "PRICE_DOWN").label("price_down"),
+        )
+        .where(ArticleChange.complex_id.in_(complex_ids), ArticleChange.detected_at >= cutoff)
+        .group_by(ArticleChange.complex_id)
+        .subquery("change_stats")
+    )
+
+    rows = db.execute(
+        select(Complex, article_stats, change_stats)
+        .outerjoin(article_stats, article_stats.c.complex_id == Complex.complex_id)
+        .outerjoin(change_stats, change_stats.c.complex_id == Complex.complex_id)
+        .where(Complex.complex_id.in_(complex_ids))
+    ).mappings().all()
+
+    # 2. 실거래 건수 + 최근 실거래 1건 (단지별)
+    ranked = (
+        select(
+            Transaction,
+            func.count().over(partition_by=Transaction.complex_id).label("total"),
+            func.row_number().over(
+                partition_by=Transaction.complex_id,
+                order_by=(Transaction.trade_date.desc(), Transaction.id.desc())
+            ).label("rn")
+        )
+        .where(Transaction.complex_id.in_(complex_ids))
+        .subquery("ranked")
+    )
+    transaction_stats = {
+        row.complex_id: row
+        for row in db.execute(select(ranked).where(ranked.c.rn == 1))
+    }
+
+    # 3. 월세 가격 범위 표시 문자열 - 최소/최대 값을 가진 매물의 원문 (보증금: price, 월세: monthly_rent)
+    monthly_labels = {}
+    for label_row in db.execute(
+        select(
+            Article.complex_id, Article.deposit_value, Article.price,
+            Article.monthly_rent_value, Article.monthly_rent
+        )
+        .join(article_stats, article_stats.c.complex_id == Article.complex_id)
+        .where(
+            Article.is_active == True,
+            is_monthly,
+            or_(
+                Article.deposit_value == article_stats.c.deposit_min,
+                Article.deposit_value == article_stats.c.deposit_max,
+                Article.monthly_rent_value == article_stats.c.rent_min,
+                Article.monthly_rent_value == article_stats.c.rent_max,
+            )
+        )
+        .order_by(Article.id)
+    ):
+        if label_row.price:
+            monthly_labels.setdefault((label_row.complex_id, "deposit", label_row.deposit_value), label_row.price)
+        if label_row.monthly_rent:
+            monthly_labels.setdefault((label_row.complex_id, "rent", label_row.monthly_rent_value), label_row.monthly_rent)
+
+    def monthly_label(complex_id, kind, value):
+        return monthly_labels.get((complex_id, kind, value)) if value is not None else None
+
+    results = {}
+    for row in rows:
+        complex_obj = row[Complex]
+        complex_id = complex_obj.complex_id
+        transaction = transaction_stats.get(complex_id)
+
+        results[complex_id] = {
+            "complex_id": complex_id,
+            "complex_name": complex_obj.complex_name,
+            "total_households": complex_obj.total_households,
+            "address": complex_obj.address,
+            "articles": {
+                "total": row["total"] or 0,
+                "sale": row["sale"] or 0,
+                "lease": row["lease"] or 0,
+                "monthly": row["monthly"] or 0,
+            },
+            "price_range": {
+                "sale_min": complex_obj.max_price,  # 비싼가격을 앞에
+                "sale_max": complex_obj.min_price,  # 낮은가격을 뒤에
+                "lease_min": complex_obj.max_lease_price,  # 비싼가격을 앞에
+                "lease_max": complex_obj.min_lease_price,  # 낮은가격을 뒤에
+                "monthly_deposit_min": monthly_label(complex_id, "deposit", row["deposit_max"]),  # 비싼가격을 앞에
+                "monthly_deposit_max": monthly_label(complex_id, "deposit", row["deposit_min"]),  # 낮은가격을 뒤에
+                "monthly_rent_min": monthly_label(complex_id, "rent", row["rent_max"]),  # 비싼가격을 앞에
+                "monthly_rent_max": monthly_label(complex_id, "rent", row["rent_min"]),  # 낮은가격을 뒤에
+            },
+            "transactions": {
+                "total": transaction.total if transaction else 0,
+                "recent": TransactionResponse.model_validate(transaction) if transaction else None
+            },
+            "changes_24h": {
+                "new": row["new"] or 0,
+                "removed": row["removed"] or 0,
+                "price_up": row["price_up"] or 0,
+                "price_down": row["price_down"] or 0,
+            }
+        }
+
+    return results
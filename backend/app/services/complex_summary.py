@@ -0,0 +1,259 @@
+"""
+단지 요약 테이블(complex_summary) 갱신 서비스
+
+크롤링 종료 시, 실거래 수집 시 해당 단지의 요약 행만 다시 계산합니다.
+단지 목록/통계 화면은 complexes JOIN complex_summary 한 번으로 조회할 수 있습니다.
+
+집계 쿼리 (단지 수와 관계없이 5회)
+1. 활성 매물 거래유형별 건수 + 가격 범위 (조건부 집계)
+2. 거래유형/면적별 가격 범위
+3. 24시간/7일 변동 건수
+4. 실거래 건수 + 최근 실거래 (윈도우 함수)
+5. 마지막 크롤링 시각 (crawl_sessions)
+
+24시간/7일 변동 건수는 갱신 시점 기준 값입니다.
+"""
+import json
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.models.complex import (
+    Complex, Article, ArticleChange, Transaction, CrawlSession, ComplexSummary
+)
+
+logger = logging.getLogger(__name__)
+
+# 갱신 1회에 처리할 최대 단지 수 (IN 절 크기 제한)
+SUMMARY_BATCH_SIZE = 500
+
+# 요약 행 → 응답 필드 (area_price_ranges는 JSON 파싱)
+SUMMARY_FIELDS = [
+    column.name for column in ComplexSummary.__table__.columns
+    if column.name not in ('complex_id', 'area_price_ranges')
+]
+
+
+def _count_if(condition):
+    """COUNT(*) FILTER (WHERE condition)"""
+    return func.count().filter(condition)
+
+
+def _empty_summary(complex_id: str, now: datetime) -> Dict:
+    return {
+        'complex_id': complex_id,
+        'active_total': 0,
+        'active_sale': 0,
+        'active_lease': 0,
+        'active_monthly': 0,
+        'sale_min': None,
+        'sale_max': None,
+        'lease_min': None,
+        'lease_max': None,
+        'monthly_deposit_min': None,
+        'monthly_deposit_max': None,
+        'monthly_rent_min': None,
+        'monthly_rent_max': None,
+        'area_price_ranges': None,
+        'new_24h': 0,
+        'removed_24h': 0,
+        'price_up_24h': 0,
+        'price_down_24h': 0,
+        'changes_7d': 0,
+        'transaction_count': 0,
+        'last_transaction_date': None,
+        'last_transaction_price': None,
+        'last_transaction_area': None,
+        'last_crawled_at': None,
+        'refreshed_at': now,
+    }
+
+
+def _build_summaries(db: Session, complex_ids: List[str]) -> List[Dict]:
+    """단지별 요약 행 계산 (존재하는 단지만)"""
+    now = datetime.now(timezone.utc)
+    existing_ids = db.execute(
+        select(Complex.complex_id).where(Complex.complex_id.in_(complex_ids))
+    ).scalars().all()
+    summaries = {complex_id: _empty_summary(complex_id, now) for complex_id in existing_ids}
+    if not summaries:
+        return []
+
+    # 1. 활성 매물 거래유형별 건수 + 가격 범위
+    is_sale = Article.trade_type == "매매"
+    is_lease = Article.trade_type == "전세"
+    is_monthly = Article.trade_type == "월세"
+    article_rows = db.execute(
+        select(
+            Article.complex_id,
+            func.count().label("active_total"),
+            _count_if(is_sale).label("active_sale"),
+            _count_if(is_lease).label("active_lease"),
+            _count_if(is_monthly).label("active_monthly"),
+            func.min(Article.price_value).filter(is_sale).label("sale_min"),
+            func.max(Article.price_value).filter(is_sale).label("sale_max"),
+            func.min(Article.price_value).filter(is_lease).label("lease_min"),
+            func.max(Article.price_value).filter(is_lease).label("lease_max"),
+            func.min(Article.deposit_value).filter(is_monthly).label("monthly_deposit_min"),
+            func.max(Article.deposit_value).filter(is_monthly).label("monthly_deposit_max"),
+            func.min(Article.monthly_rent_value).filter(is_monthly).label("monthly_rent_min"),
+            func.max(Article.monthly_rent_value).filter(is_monthly).label("monthly_rent_max"),
+        )
+        .where(Article.complex_id.in_(existing_ids), Article.is_active == True)
+        .group_by(Article.complex_id)
+    ).mappings()
+    for row in article_rows:
+        summaries[row["complex_id"]].update({k: v for k, v in row.items() if k != "complex_id"})
+
+    # 2. 거래유형/면적별 가격 범위
+    area_ranges: Dict[str, Dict[str, Dict[str, List[int]]]] = {}
+    area_rows = db.execute(
+        select(
+            Article.complex_id,
+            Article.trade_type,
+            Article.area_name,
+            func.min(Article.price_value),
+            func.max(Article.price_value),
+        )
+        .where(
+            Article.complex_id.in_(existing_ids),
+            Article.is_active == True,
+            Article.trade_type.isnot(None),
+            Article.area_name.isnot(None),
+            Article.price_value.isnot(None),
+        )
+        .group_by(Article.complex_id, Article.trade_type, Article.area_name)
+    )
+    for complex_id, trade_type, area_name, min_value, max_value in area_rows:
+        area_ranges.setdefault(complex_id, {}).setdefault(trade_type, {})[area_name] = [min_value, max_value]
+    for complex_id, ranges in area_ranges.items():
+        summaries[complex_id]["area_price_ranges"] = json.dumps(ranges, ensure_ascii=False, sort_keys=True)
+
+    # 3. 24시간/7일 변동 건수
+    cutoff_24h = now - timedelta(hours=24)
+    in_24h = ArticleChange.detected_at >= cutoff_24h
+    change_rows = db.execute(
+        select(
+            ArticleChange.complex_id,
+            _count_if(in_24h & (ArticleChange.change_type == "NEW")).label("new_24h"),
+            _count_if(in_24h & (ArticleChange.change_type == "REMOVED")).label("removed_24h"),
+            _count_if(in_24h & (ArticleChange.change_type == "PRICE_UP")).label("price_up_24h"),
+            _count_if(in_24h & (ArticleChange.change_type == "PRICE_DOWN")).label("price_down_24h"),
+            func.count().label("changes_7d"),
+        )
+        .where(
+            ArticleChange.complex_id.in_(existing_ids),
+            ArticleChange.detected_at >= now - timedelta(days=7)
+        )
+        .group_by(ArticleChange.complex_id)
+    ).mappings()
+    for row in change_rows:
+        summaries[row["complex_id"]].update({k: v for k, v in row.items() if k != "complex_id"})
+
+    # 4. 실거래 건수 + 최근 실거래 1건
+    ranked = (
+        select(
+            Transaction.complex_id,
+            Transaction.trade_date,
+            Transaction.deal_price,
+            Transaction.exclusive_area,
+            func.count().over(partition_by=Transaction.complex_id).label("total"),
+            func.row_number().over(
+                partition_by=Transaction.complex_id,
+                order_by=(Transaction.trade_date.desc(), Transaction.id.desc())
+            ).label("rn")
+        )
+        .where(Transaction.complex_id.in_(existing_ids))
+        .subquery("ranked")
+    )
+    for row in db.execute(select(ranked).where(ranked.c.rn == 1)):
+        summaries[row.complex_id].update({
+            'transaction_count': row.total,
+            'last_transaction_date': row.trade_date,
+            'last_transaction_price': row.deal_price,
+            'last_transaction_area': row.exclusive_area,
+        })
+
+    # 5. 마지막 크롤링 시각
+    session_rows = db.execute(
+        select(
+            CrawlSession.complex_id,
+            func.max(func.coalesce(CrawlSession.finished_at, CrawlSession.started_at))
+        )
+        .where(CrawlSession.complex_id.in_(existing_ids))
+        .group_by(CrawlSession.complex_id)
+    )
+    for complex_id, last_crawled_at in session_rows:
+        summaries[complex_id]["last_crawled_at"] = last_crawled_at
+
+    return list(summaries.values())
+
+
+def refresh_complex_summaries(db: Session, complex_ids: Iterable[str]) -> int:
+    """
+    지정한 단지의 요약 행 재계산
+
+    해당 단지의 요약 행만 지우고 다시 넣으므로 크롤링/실거래 수집 직후 호출합니다.
+
+    Args:
+        db: SQLAlchemy 세션
+        complex_ids: 단지 ID 목록
+
+    Returns:
+        갱신된 요약 행 수
+    """
+    complex_ids = list(dict.fromkeys(complex_ids))
+    refreshed = 0
+
+    for start in range(0, len(complex_ids), SUMMARY_BATCH_SIZE):
+        batch = complex_ids[start:start + SUMMARY_BATCH_SIZE]
+        rows = _build_summaries(db, batch)
+
+        db.execute(delete(ComplexSummary).where(ComplexSummary.complex_id.in_(batch)))
+        if rows:
+            db.execute(insert(ComplexSummary), rows)
+        db.commit()
+        refreshed += len(rows)
+
+    return refreshed
+
+
+def refresh_complex_summary(db: Session, complex_id: str) -> bool:
+    """
+    단지 1개의 요약 행 재계산 (실패해도 예외를 올리지 않음)
+
+    크롤링/실거래 저장은 이미 커밋된 뒤이므로 요약 갱신 실패가 수집 결과를 되돌리지 않습니다.
+
+    Returns:
+        갱신 성공 여부
+    """
+    try:
+        return refresh_complex_summaries(db, [complex_id]) > 0
+    except Exception as e:
+        db.rollback()
+        logger.warning(f"⚠️ 단지 요약 갱신 실패 ({complex_id}): {e}")
+        return False
+
+
+def refresh_all_complex_summaries(db: Session) -> int:
+    """전체 단지 요약 재계산 (초기 생성/백필용)"""
+    complex_ids = db.execute(select(Complex.complex_id).order_by(Complex.complex_id)).scalars().all()
+    return refresh_complex_summaries(db, complex_ids)
+
+
+def summary_to_dict(summary: Optional[ComplexSummary]) -> Optional[Dict]:
+    """
+    요약 행을 응답용 dict로 변환
+
+    Returns:
+        요약 dict (area_price_ranges는 {거래유형: {면적: [최저, 최고]}}), 요약이 없으면 None
+    """
+    if summary is None:
+        return None
+
+    result = {name: getattr(summary, name) for name in SUMMARY_FIELDS}
+    result["area_price_ranges"] = json.loads(summary.area_price_ranges) if summary.area_price_ranges else {}
+    return result
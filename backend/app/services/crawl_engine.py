@@ -0,0 +1,251 @@
+"""
+다중 단지 동시 크롤링 엔진
+
+하나의 이벤트 루프 안에서 워커들이 공용 브라우저 풀(browser_pool)의 컨텍스트를
+대여하여 여러 단지를 동시에 크롤링합니다.
+단지 간 고정 5초 대기 대신 호스트별 요청 간격 제한(HostRateLimiter)을 워커들이 공유하고,
+API 호출 / 페이지 로드 / 스크롤 등 네이버로 나가는 모든 요청 직전에 슬롯을 예약합니다.
+따라서 워커 수와 관계없이 호스트 요청 빈도는 1 / CRAWL_HOST_MIN_INTERVAL 을 넘지 않고,
+동시 처리로 줄어드는 것은 DB 저장/대기 시간뿐입니다.
+"""
+import asyncio
+import logging
+import os
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlparse
+
+from app.core.database import SessionLocal
+from app.services.article_fetcher import CRAWL_FETCH_MODE
+from app.services.article_tracker import ArticleTracker
+from app.services.browser_pool import get_browser_pool
+from app.services.complex_summary import refresh_complex_summary
+from app.services.crawler_service import NaverRealEstateCrawler
+
+logger = logging.getLogger(__name__)
+
+# 동시에 크롤링할 단지 수 (브라우저 풀 크기를 넘으면 풀에서 대기)
+CRAWL_CONCURRENCY = int(os.getenv("CRAWL_CONCURRENCY", "3"))
+
+# 같은 호스트로 보내는 요청 사이 최소 간격(초) - 모든 워커 합산 기준
+# 기본 1.5초 = 기존 순차 크롤러의 스크롤(매물 페이지 요청) 간격과 같은 최대 요청 빈도
+CRAWL_HOST_MIN_INTERVAL = float(os.getenv("CRAWL_HOST_MIN_INTERVAL", "1.5"))
+
+
+class HostRateLimiter:
+    """호스트별 요청 간격 제한 (워커 간 공유)"""
+
+    def __init__(self, min_interval: float = CRAWL_HOST_MIN_INTERVAL):
+        self.min_interval = min_interval
+        self._next_slot: Dict[str, float] = {}
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, host_or_url: str):
+        """
+        다음 요청 슬롯을 예약하고 해당 시각까지 대기
+
+        Args:
+            host_or_url: 호스트명 또는 URL
+        """
+        host = urlparse(host_or_url).netloc or host_or_url
+
+        async with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, 0.0))
+            self._next_slot[host] = slot + self.min_interval
+
+        delay = slot - now
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class SharedHostRateLimiter(HostRateLimiter):
+    """
+    Redis로 여러 워커 프로세스/서버가 공유하는 호스트별 요청 간격 제한
+
+    단지별 Celery 태스크로 나눠 크롤링할 때 프로세스마다 따로 제한하면
+    워커 수만큼 요청 빈도가 늘어나므로, 다음 슬롯 시각을 Redis에서 원자적으로 예약합니다.
+    Redis에 연결할 수 없으면 프로세스 내 제한으로 대체합니다.
+    """
+
+    # 다음 슬롯 = max(현재, 저장된 슬롯), 저장값 = 다음 슬롯 + 간격
+    _RESERVE_SCRIPT = """
+local now = tonumber(ARGV[1])
+local slot = math.max(now, tonumber(redis.call('GET', KEYS[1]) or '0'))
+redis.call('SET', KEYS[1], tostring(slot + tonumber(ARGV[2])), 'EX', 3600)
+return tostring(slot)
+"""
+
+    KEY_PREFIX = "crawl:host_slot:"
+
+    def __init__(self, min_interval: float = CRAWL_HOST_MIN_INTERVAL, redis_url: Optional[str] = None):
+        super().__init__(min_interval)
+        import redis
+
+        if redis_url is None:
+            from app.core.celery_app import REDIS_URL
+            redis_url = REDIS_URL
+        self.redis = redis.from_url(redis_url)
+
+    async def acquire(self, host_or_url: str):
+        host = urlparse(host_or_url).netloc or host_or_url
+
+        try:
+            now = time.time()
+            slot = float(await asyncio.to_thread(
+                self.redis.eval, self._RESERVE_SCRIPT, 1, self.KEY_PREFIX + host, now, self.min_interval
+            ))
+        except Exception as e:
+            logger.warning(f"⚠️  공유 요청 간격 제한 사용 불가, 프로세스 내 제한 사용: {e}")
+            await super().acquire(host)
+            return
+
+        delay = slot - now
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def _persist_crawl_result(
+    crawler: NaverRealEstateCrawler,
+    complex_id: str,
+    crawl_job_id: Optional[str] = None,
+    started_at: Optional[datetime] = None
+) -> Dict:
+    """
+    크롤링 결과 저장 + 스냅샷 생성 + 변동 감지 + 단지 요약 갱신 (워커 스레드에서 실행)
+
+    Returns:
+        dict: articles_collected, articles_new, articles_updated, articles_unchanged, articles_removed
+    """
+    db = SessionLocal()
+    try:
+        counts = crawler.save_to_database(complex_id, db)
+
+        tracker = ArticleTracker(db)
+        tracker.create_snapshot(complex_id, crawl_job_id=crawl_job_id, started_at=started_at)
+        tracker.detect_changes(complex_id)
+
+        refresh_complex_summary(db, complex_id)
+
+        return counts
+    finally:
+        db.close()
+
+
+async def crawl_and_persist(
+    complex_id: str,
+    context=None,
+    crawl_job_id: Optional[str] = None,
+    rate_limiter: Optional[HostRateLimiter] = None
+) -> Dict:
+    """
+    단일 단지 크롤링 후 DB 반영
+
+    Args:
+        complex_id: 단지 ID
+        context: 사용할 브라우저 컨텍스트 (없으면 공용 브라우저 풀에서 대여)
+        crawl_job_id: 크롤링 세션에 연결할 CrawlJob ID
+        rate_limiter: 모든 네이버 요청 전에 슬롯을 예약할 호스트별 요청 간격 제한기 (선택)
+
+    Returns:
+        dict: 크롤링 결과 (articles_collected, articles_new, articles_updated)
+    """
+    started_at = datetime.now()
+    crawler = NaverRealEstateCrawler(rate_limiter=rate_limiter)
+    await crawler.crawl_complex(complex_id, context=context)
+
+    # DB 작업은 동기 방식이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+    return await asyncio.to_thread(_persist_crawl_result, crawler, complex_id, crawl_job_id, started_at)
+
+
+class CrawlEngine:
+    """여러 단지를 제한된 워커 풀로 동시에 크롤링하는 엔진"""
+
+    def __init__(
+        self,
+        concurrency: Optional[int] = None,
+        rate_limiter: Optional[HostRateLimiter] = None,
+        on_result: Optional[Callable[[Dict], None]] = None,
+        crawl_job_id: Optional[str] = None
+    ):
+        """
+        Args:
+            concurrency: 동시 워커 수 (기본: CRAWL_CONCURRENCY)
+            rate_limiter: 호스트별 요청 간격 제한기 (기본: CRAWL_HOST_MIN_INTERVAL)
+            on_result: 단지별 결과가 나올 때마다 호출되는 콜백 (이벤트 루프 스레드에서 호출)
+            crawl_job_id: 단지별 크롤링 세션에 연결할 CrawlJob ID
+        """
+        self.concurrency = max(1, concurrency or CRAWL_CONCURRENCY)
+        self.rate_limiter = rate_limiter or HostRateLimiter()
+        self.on_result = on_result
+        self.crawl_job_id = crawl_job_id
+
+    async def run(self, complex_ids: List[str]) -> List[Dict]:
+        """
+        단지 목록 크롤링
+
+        Args:
+            complex_ids: 크롤링할 단지 ID 리스트
+
+        Returns:
+            단지별 결과 리스트 (완료 순서)
+        """
+        if not complex_ids:
+            return []
+
+        queue: asyncio.Queue = asyncio.Queue()
+        for idx, complex_id in enumerate(complex_ids, 1):
+            queue.put_nowait((idx, complex_id))
+
+        results: List[Dict] = []
+        worker_count = min(self.concurrency, len(complex_ids))
+
+        logger.info(
+            f"🚀 크롤링 엔진 시작: {len(complex_ids)}개 단지, 워커 {worker_count}개, "
+            f"호스트 요청 간격 {self.rate_limiter.min_interval}초"
+        )
+
+        # 브라우저와 컨텍스트를 미리 띄워 첫 단지부터 콜드 스타트 없이 시작
+        # (direct 모드는 토큰 캡처/대체 경로용 컨텍스트 1개면 충분)
+        await get_browser_pool().warm_up(1 if CRAWL_FETCH_MODE == "direct" else worker_count)
+
+        workers = [
+            asyncio.create_task(self._worker(queue, len(complex_ids), results))
+            for _ in range(worker_count)
+        ]
+        await asyncio.gather(*workers)
+
+        return results
+
+    async def _worker(self, queue: asyncio.Queue, total: int, results: List[Dict]):
+        """큐에서 단지를 하나씩 꺼내 크롤링 (컨텍스트는 단지마다 풀에서 대여)"""
+        while True:
+            try:
+                idx, complex_id = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+
+            logger.info(f"[{idx}/{total}] 크롤링 시작: {complex_id}")
+            started = time.monotonic()
+            result = {"complex_id": complex_id}
+
+            try:
+                result.update(await crawl_and_persist(
+                    complex_id, crawl_job_id=self.crawl_job_id, rate_limiter=self.rate_limiter
+                ))
+                result["success"] = True
+                logger.info(f"✅ [{idx}/{total}] 완료: {complex_id}")
+            except Exception as e:
+                result["success"] = False
+                result["error"] = str(e)
+                logger.error(f"❌ [{idx}/{total}] 실패: {complex_id} - {str(e)}")
+
+            result["duration_seconds"] = round(time.monotonic() - started, 1)
+            results.append(result)
+
+            if self.on_result:
+                try:
+                    self.on_result(result)
+                except Exception as e:
+                    logger.error(f"결과 콜백 처리 중 오류: {str(e)}")
@@ -0,0 +1,224 @@
+"""
+변동 빈도 기반 크롤링 우선순위 큐
+
+고정 시각에 모든 단지를 다시 크롤링하는 대신, 단지마다 "지금 크롤링하면 새로 발견할 변동 수"를
+추정하여 브라우저 사용 시간(분)당 기대 변동이 큰 단지부터 시간당 예산 안에서 크롤링합니다.
+
+- 변동률: 최근 CRAWL_PRIORITY_WINDOW_DAYS 동안 ArticleChange 수 / 시간 (변동이 없던 단지도 사전값으로 0이 되지 않음)
+- 기대 변동 = 변동률 × 마지막 크롤링(CrawlSession) 이후 경과 시간 × 관심 단지 가중치(FavoriteComplex 수)
+- 비용 = 최근 크롤링 세션 평균 소요 시간(분, 기록이 없으면 CRAWL_PRIORITY_DEFAULT_COST_MINUTES)
+- 점수 = 기대 변동 / 비용
+- CRAWL_PRIORITY_MIN_INTERVAL_MINUTES 안에 크롤링한 단지는 제외,
+  CRAWL_PRIORITY_MAX_STALENESS_HOURS 이상 지난(또는 한 번도 안 한) 단지는 점수와 무관하게 우선
+- 예산: 최근 1시간 동안 모든 크롤링 세션이 쓴 시간을 빼고 남은 CRAWL_BUDGET_MINUTES_PER_HOUR
+- 실행 중인 CrawlJob: 단지 작업이면 그 단지 제외, 여러 단지 작업(전체/분산/이전 우선순위 실행)이면
+  이번 실행은 건너뜀 (세션은 스냅샷 저장 후에 생기므로 크롤링 중인 단지를 오래된 단지로 보고 다시 고르지 않도록)
+"""
+import os
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.models.complex import ArticleChange, Complex, CrawlJob, CrawlSession, FavoriteComplex
+
+# 시간당 크롤링 예산 (브라우저 사용 시간, 분)
+CRAWL_BUDGET_MINUTES_PER_HOUR = float(os.getenv("CRAWL_BUDGET_MINUTES_PER_HOUR", "20"))
+
+# 우선순위 크롤링 태스크 실행 간격(분) - 회당 예산 = 시간당 예산 × 간격 / 60
+CRAWL_PRIORITY_INTERVAL_MINUTES = int(os.getenv("CRAWL_PRIORITY_INTERVAL_MINUTES", "15"))
+
+CRAWL_PRIORITY_WINDOW_DAYS = int(os.getenv("CRAWL_PRIORITY_WINDOW_DAYS", "14"))
+CRAWL_PRIORITY_MIN_INTERVAL_MINUTES = int(os.getenv("CRAWL_PRIORITY_MIN_INTERVAL_MINUTES", "60"))
+CRAWL_PRIORITY_MAX_STALENESS_HOURS = int(os.getenv("CRAWL_PRIORITY_MAX_STALENESS_HOURS", "72"))
+CRAWL_PRIORITY_DEFAULT_COST_MINUTES = float(os.getenv("CRAWL_PRIORITY_DEFAULT_COST_MINUTES", "1.0"))
+
+# 이 시간보다 오래 running 상태인 CrawlJob은 비정상 종료된 것으로 보고 무시 (시간)
+CRAWL_PRIORITY_RUNNING_JOB_MAX_HOURS = int(os.getenv("CRAWL_PRIORITY_RUNNING_JOB_MAX_HOURS", "6"))
+
+# 관심 등록 1건당 가중치 (1 + 0.5 × 관심 수)
+FAVORITE_WEIGHT = 0.5
+
+# 변동률 사전값 (기간 중 변동 0건인 단지도 오래 두면 점수가 올라가도록)
+CHANGE_PRIOR = 0.5
+
+
+def _local_naive(value: Optional[datetime]) -> Optional[datetime]:
+    """DB 시각을 로컬 naive 시각으로 (크롤링 세션은 datetime.now() 기준으로 저장됨)"""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone().replace(tzinfo=None)
+
+
+class CrawlPriorityPlanner:
+    """단지별 크롤링 우선순위 계산 및 예산 내 선택"""
+
+    def __init__(
+        self,
+        db: Session,
+        budget_minutes_per_hour: float = CRAWL_BUDGET_MINUTES_PER_HOUR,
+        interval_minutes: int = CRAWL_PRIORITY_INTERVAL_MINUTES,
+        now: Optional[datetime] = None
+    ):
+        self.db = db
+        self.budget_minutes_per_hour = budget_minutes_per_hour
+        self.interval_minutes = interval_minutes
+        self.now = now or datetime.now()
+        self.window_hours = CRAWL_PRIORITY_WINDOW_DAYS * 24
+
+    def _change_counts(self) -> Dict[str, int]:
+        since = self.now - timedelta(hours=self.window_hours)
+        rows = self.db.query(ArticleChange.complex_id, func.count(ArticleChange.id)).filter(
+            ArticleChange.detected_at >= since
+        ).group_by(ArticleChange.complex_id).all()
+        return dict(rows)
+
+    def _favorite_counts(self) -> Dict[str, int]:
+        rows = self.db.query(FavoriteComplex.complex_id, func.count(FavoriteComplex.id)).group_by(
+            FavoriteComplex.complex_id
+        ).all()
+        return dict(rows)
+
+    def _last_crawled(self) -> Dict[str, datetime]:
+        rows = self.db.query(CrawlSession.complex_id, func.max(CrawlSession.started_at)).group_by(
+            CrawlSession.complex_id
+        ).all()
+        return {complex_id: _local_naive(started_at) for complex_id, started_at in rows}
+
+    def _recent_sessions(self):
+        """기간 내 완료된 세션 (complex_id, 시작, 종료)"""
+        since = self.now - timedelta(hours=self.window_hours)
+        return [
+            (complex_id, _local_naive(started_at), _local_naive(finished_at))
+            for complex_id, started_at, finished_at in self.db.query(
+                CrawlSession.complex_id, CrawlSession.started_at, CrawlSession.finished_at
+            ).filter(CrawlSession.started_at >= since, CrawlSession.finished_at.isnot(None)).all()
+        ]
+
+    def _running_jobs(self) -> Tuple[Set[str], Optional[str]]:
+        """
+        실행 중인 크롤링 작업
+
+        Returns:
+            (크롤링 중인 단일 단지 ID 집합, 실행 중인 여러 단지 작업 ID (없으면 None))
+        """
+        since = _local_naive(self.now).astimezone(timezone.utc) - timedelta(hours=CRAWL_PRIORITY_RUNNING_JOB_MAX_HOURS)
+        jobs = self.db.query(CrawlJob.job_id, CrawlJob.complex_id).filter(
+            CrawlJob.status.in_(('pending', 'running')),
+            CrawlJob.started_at >= since
+        ).all()
+
+        busy = {complex_id for _, complex_id in jobs if complex_id}
+        batch_job = next((job_id for job_id, complex_id in jobs if not complex_id), None)
+        return busy, batch_job
+
+    def rank(self) -> List[Dict]:
+        """
+        전체 단지 우선순위 (크롤링 가능 여부와 관계없이 점수 높은 순)
+
+        Returns:
+            단지별 dict: complex_id, complex_name, score, expected_changes, change_rate_per_day,
+            favorites, last_crawled_at, staleness_hours, cost_minutes, running, eligible, forced
+        """
+        complexes = self.db.query(Complex.complex_id, Complex.complex_name).all()
+        changes = self._change_counts()
+        favorites = self._favorite_counts()
+        last_crawled = self._last_crawled()
+        busy, _ = self._running_jobs()
+
+        durations = defaultdict(list)
+        for complex_id, started_at, finished_at in self._recent_sessions():
+            durations[complex_id].append(max((finished_at - started_at).total_seconds(), 0) / 60)
+
+        ranked = []
+        for complex_id, complex_name in complexes:
+            last = last_crawled.get(complex_id)
+            staleness_hours = (self.now - last).total_seconds() / 3600 if last else None
+            accumulated_hours = min(staleness_hours, self.window_hours) if staleness_hours is not None else self.window_hours
+
+            rate_per_hour = (changes.get(complex_id, 0) + CHANGE_PRIOR) / self.window_hours
+            favorite_count = favorites.get(complex_id, 0)
+            expected = rate_per_hour * accumulated_hours * (1 + FAVORITE_WEIGHT * favorite_count)
+
+            samples = durations.get(complex_id)
+            cost = max(sum(samples) / len(samples), 0.1) if samples else CRAWL_PRIORITY_DEFAULT_COST_MINUTES
+
+            ranked.append({
+                "complex_id": complex_id,
+                "complex_name": complex_name,
+                "score": round(expected / cost, 4),
+                "expected_changes": round(expected, 2),
+                "change_rate_per_day": round(rate_per_hour * 24, 3),
+                "favorites": favorite_count,
+                "last_crawled_at": last.isoformat() if last else None,
+                "staleness_hours": round(staleness_hours, 1) if staleness_hours is not None else None,
+                "cost_minutes": round(cost, 2),
+                "running": complex_id in busy,
+                "eligible": complex_id not in busy and (
+                    staleness_hours is None or staleness_hours * 60 >= CRAWL_PRIORITY_MIN_INTERVAL_MINUTES
+                ),
+                "forced": staleness_hours is None or staleness_hours >= CRAWL_PRIORITY_MAX_STALENESS_HOURS,
+            })
+
+        ranked.sort(key=lambda item: (not item["forced"], -item["score"], item["complex_id"]))
+        return ranked
+
+    def spent_minutes_last_hour(self) -> float:
+        """최근 1시간 동안 시작된 크롤링 세션의 사용 시간 합 (전체 크롤링/수동 크롤링 포함)"""
+        since = self.now - timedelta(hours=1)
+        sessions = self.db.query(CrawlSession.started_at, CrawlSession.finished_at).filter(
+            CrawlSession.started_at >= since
+        ).all()
+        return sum(
+            max(((_local_naive(finished_at) or self.now) - _local_naive(started_at)).total_seconds(), 0) / 60
+            for started_at, finished_at in sessions
+        )
+
+    def tick_budget(self) -> Dict:
+        """이번 실행에서 쓸 수 있는 예산 (분)"""
+        spent = self.spent_minutes_last_hour()
+        remaining = max(self.budget_minutes_per_hour - spent, 0.0)
+        per_tick = self.budget_minutes_per_hour * self.interval_minutes / 60
+        return {
+            "budget_minutes_per_hour": self.budget_minutes_per_hour,
+            "spent_minutes_last_hour": round(spent, 2),
+            "remaining_minutes": round(remaining, 2),
+            "tick_minutes": round(min(remaining, per_tick), 2),
+        }
+
+    def plan(self) -> Dict:
+        """
+        이번 실행에서 크롤링할 단지 선택
+
+        강제 대상(오래된 단지) → 점수 순으로 예산이 허락하는 만큼 담습니다.
+        남은 예산이 있으면 단지 비용이 예산보다 커도 최소 1개는 선택합니다.
+        여러 단지 크롤링 작업이 실행 중이면 아무것도 선택하지 않습니다. (budget.blocked_by_job)
+
+        Returns:
+            dict: budget, selected (선택된 단지), queue (전체 우선순위)
+        """
+        budget = self.tick_budget()
+        queue = self.rank()
+        _, batch_job = self._running_jobs()
+        budget["blocked_by_job"] = batch_job
+
+        selected = []
+        used = 0.0
+        if budget["tick_minutes"] > 0 and batch_job is None:
+            for item in queue:
+                if not item["eligible"]:
+                    continue
+                if selected and used + item["cost_minutes"] > budget["tick_minutes"]:
+                    continue
+                selected.append(item)
+                used += item["cost_minutes"]
+
+        budget["planned_minutes"] = round(used, 2)
+        # 선택된 단지들의 브라우저 1분당 기대 변동 수
+        budget["expected_changes_per_minute"] = round(
+            sum(item["expected_changes"] for item in selected) / used, 3
+        ) if used else 0.0
+        return {"budget": budget, "selected": selected, "queue": queue}
+
@@ -3,19 +3,26 @@
 봇 감지 회피 기술을 포함한 안전한 크롤러
 """
 import asyncio
-import json
-from playwright.async_api import async_playwright
 from datetime import datetime
 from sqlalchemy.orm import Session
 
 from ..core.database import SessionLocal
 from ..models.complex import Complex, Article, Transaction
+from .browser_pool import get_browser_pool
+from .article_persistence import deactivate_missing_articles, upsert_articles
+from .article_fetcher import CRAWL_FETCH_MODE, DirectArticleFetcher, get_naver_auth
 
 
 class NaverRealEstateCrawler:
     """네이버 부동산 크롤러 - 봇 감지 회피 기능 포함"""
 
-    def __init__(self):
+    def __init__(self, rate_limiter=None):
+        """
+        Args:
+            rate_limiter: 호스트별 요청 간격 제한기 (crawl_engine.HostRateLimiter)
+                          API 요청, 페이지 로드, 스크롤마다 슬롯을 예약합니다.
+        """
+        self.rate_limiter = rate_limiter
         self.api_responses = []
         self.complex_data = None
         self.articles_data = None
@@ -67,6 +74,8 @@ class NaverRealEstateCrawler:
                             # 기존 articleList에 새로운 항목 추가 (중복 제거)
                             existing_articles = self.articles_data.get('articleList', [])
                             new_articles = data.get('articleList', [])
+                            # 마지막으로 받은 페이지 기준 (false면 목록 끝까지 수집)
+                            self.articles_data['isMoreData'] = data.get('isMoreData')
                             if len(new_articles) > 0:
                                 # 기존 article_id 세트
                                 existing_ids = {article.get('articleNo') for article in existing_articles}
@@ -92,19 +101,34 @@ class NaverRealEstateCrawler:
             # JSON 파싱 실패는 무시
             pass
 
-    async def crawl_complex(self, complex_id: str, collect_address: bool = False):
+    async def _throttle(self, url: str):
+        """요청 간격 제한기가 있으면 다음 요청 슬롯까지 대기"""
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire(url)
+
+    async def crawl_complex(
+        self,
+        complex_id: str,
+        collect_address: bool = False,
+        context=None,
+        fetch_mode: str = None
+    ):
         """
         특정 단지 크롤링
 
         Args:
             complex_id: 단지 ID
             collect_address: 주소 수집 여부 (기본값: False)
+            context: 사용할 브라우저 컨텍스트 (없으면 공용 브라우저 풀에서 대여)
+            fetch_mode: 'direct'(API 직접 조회) 또는 'scroll'(DOM 스크롤) (기본: CRAWL_FETCH_MODE)
+                        direct 모드가 실패하면 scroll 방식으로 대체합니다.
+                        주소 수집은 DOM 클릭이 필요하므로 항상 scroll 방식을 사용합니다.
 
         [중요] 봇 감지 회피 기술:
         - headless=False: 실제 브라우저 사용
         - AutomationControlled 비활성화
         - slow_mo=100: 느린 동작으로 자연스러움 연출
-        - localStorage 기반 동일매물묶기 설정
+        - localStorage 기반 동일매물묶기 설정 (브라우저 풀이 컨텍스트당 1회 수행)
         - 스크롤 속도 제어 (1.5초 대기)
         """
         print(f"\n{'='*80}")
@@ -117,390 +141,413 @@ class NaverRealEstateCrawler:
         self.complex_data = None
         self.articles_data = None
 
-        async with async_playwright() as p:
-            # ⚠️ 봇 감지 회피: headless=False, AutomationControlled 비활성화
-            browser = await p.chromium.launch(
-                headless=False,  # 필수: 봇 감지 회피
-                args=[
-                    '--disable-blink-features=AutomationControlled',  # 필수: automation 감지 차단
-                    '--disable-dev-shm-usage',
-                    '--disable-gpu',
-                    '--no-sandbox'
-                ],
-                slow_mo=100  # 필수: 느린 동작으로 안정성 향상
-            )
-
-            context = await browser.new_context(
-                user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-            )
-
-            page = await context.new_page()
-
-            # 응답 리스너 등록
-            page.on("response", lambda response: asyncio.create_task(self.save_response(response)))
-
-            # ⚠️ 봇 감지 회피: 먼저 메인 페이지에서 localStorage 설정
-            print("   🔧 동일매물묶기 설정 준비 중...")
-            await page.goto("https://new.land.naver.com", wait_until="domcontentloaded")
-
-            # ⚠️ 필수: localStorage에 동일매물묶기 설정 저장
-            await page.evaluate("""
-                () => {
-                    // 네이버가 사용하는 localStorage 키 설정
-                    localStorage.setItem('sameAddrYn', 'true');
-                    localStorage.setItem('sameAddressGroup', 'true');
-                    console.log('[LocalStorage] 동일매물묶기 설정 완료');
+        fetch_mode = fetch_mode or CRAWL_FETCH_MODE
+        if fetch_mode == "direct" and not collect_address:
+            if await self._crawl_direct(complex_id, context):
+                return {
+                    'complex': self.complex_data,
+                    'articles': self.articles_data
                 }
-            """)
 
-            print("   ✅ localStorage 설정 완료")
+        if context is not None:
+            await self._crawl_in_context(context, complex_id, collect_address)
+        else:
+            # 공용 브라우저 풀에서 컨텍스트 대여 (Chromium 콜드 스타트 없음)
+            async with get_browser_pool().lease() as context:
+                await self._crawl_in_context(context, complex_id, collect_address)
+
+        return {
+            'complex': self.complex_data,
+            'articles': self.articles_data
+        }
+
+    async def _crawl_direct(self, complex_id: str, context=None) -> bool:
+        """
+        매물 목록 API를 직접 호출하여 수집 (DOM 스크롤 없음)
+
+        Returns:
+            성공 여부 (False면 scroll 방식으로 대체)
+        """
+        try:
+            auth = await get_naver_auth(complex_id, context, self.rate_limiter)
+            if auth is None:
+                print(f"⚠️  토큰 캡처 실패 - 스크롤 방식으로 대체")
+                return False
+
+            print(f"⚡ API 직접 조회 모드")
+            result = await DirectArticleFetcher(auth, rate_limiter=self.rate_limiter).fetch_complex(complex_id)
+        except Exception as e:
+            print(f"⚠️  API 직접 조회 실패 - 스크롤 방식으로 대체: {e}")
+            self.complex_data = None
+            self.articles_data = None
+            return False
+
+        if not result['complex'] or not result['complex'].get('complexNo'):
+            print(f"⚠️  단지 정보 없음 - 스크롤 방식으로 대체")
+            return False
+
+        self.complex_data = result['complex']
+        self.articles_data = result['articles']
+        print(f"✅ 단지 정보 수집: {self.complex_data.get('complexName', 'N/A')}")
+        print(f"✅ 매물 정보 수집: {len(self.articles_data['articleList'])}건 (동일매물묶기: ✅ ON)")
+        return True
+
+    async def _crawl_in_context(self, context, complex_id: str, collect_address: bool):
+        """주어진 브라우저 컨텍스트에서 새 페이지를 열어 단지 크롤링"""
+        page = await context.new_page()
+        try:
+            await self._crawl_page(page, complex_id, collect_address)
+        finally:
+            await page.close()
 
-            # 이제 단지 페이지로 이동
-            url = f"https://new.land.naver.com/complexes/{complex_id}"
-            print(f"🌐 접속: {url}")
+    async def _crawl_page(self, page, complex_id: str, collect_address: bool):
+        """페이지 단위 크롤링 (동일매물묶기 확인, 주소 수집, 매물 스크롤)"""
+        # 응답 리스너 등록
+        page.on("response", lambda response: asyncio.create_task(self.save_response(response)))
 
-            await page.goto(url, wait_until="networkidle")
+        # 동일매물묶기 localStorage는 브라우저 풀이 컨텍스트 생성 시 설정해 둠
+        url = f"https://new.land.naver.com/complexes/{complex_id}"
+        print(f"🌐 접속: {url}")
 
-            # 페이지 로딩 대기
-            await asyncio.sleep(2)
+        await self._throttle(url)
+        await page.goto(url, wait_until="networkidle")
 
-            # 주소 수집이 필요한 경우에만 실행
-            if collect_address:
-                # 단지정보 버튼 클릭
-                try:
-                    print(f"   🔍 단지정보 버튼 클릭 중...")
+        # 페이지 로딩 대기
+        await asyncio.sleep(2)
 
-                    tab_clicked = await page.evaluate("""
-                        () => {
-                            // 모든 버튼/탭 탐색
-                            const allElements = document.querySelectorAll('button, [role="tab"], a');
-                            for (const el of allElements) {
-                                const text = el.textContent || '';
-                                if (text.includes('단지정보') || text.includes('단지 정보')) {
-                                    el.click();
-                                    return true;
-                                }
+        # 주소 수집이 필요한 경우에만 실행
+        if collect_address:
+            # 단지정보 버튼 클릭
+            try:
+                print(f"   🔍 단지정보 버튼 클릭 중...")
+
+                tab_clicked = await page.evaluate("""
+                    () => {
+                        // 모든 버튼/탭 탐색
+                        const allElements = document.querySelectorAll('button, [role="tab"], a');
+                        for (const el of allElements) {
+                            const text = el.textContent || '';
+                            if (text.includes('단지정보') || text.includes('단지 정보')) {
+                                el.click();
+                                return true;
                             }
-                            return false;
                         }
-                    """)
+                        return false;
+                    }
+                """)
 
-                    if tab_clicked:
-                        print(f"   ✅ 단지정보 버튼 클릭 완료")
-                        await asyncio.sleep(2)  # 정보 로딩 대기
-                    else:
-                        print(f"   ⚠️ 단지정보 버튼을 찾지 못했습니다")
-
-                except Exception as e:
-                    print(f"   ⚠️ 단지정보 버튼 클릭 실패: {e}")
-
-                # 🛑 주소 필드 확인을 위한 일시정지
-                print(f"\n{'='*80}")
-                print(f"⏸️  주소 필드 확인 모드")
-                print(f"{'='*80}")
-                print(f"")
-                print(f"브라우저 창에서 주소가 표시된 텍스트를 드래그해주세요.")
-                print(f"드래그 후 화면 상단의 '계속 진행' 버튼을 클릭하세요.")
-                print(f"")
-                print(f"예시: '경기도 화성시 동탄반송길 25' 같은 주소 텍스트를 드래그")
-                print(f"      → 화면 상단 '계속 진행' 버튼 클릭")
-                print(f"{'='*80}\n")
-
-                # 페이지에 계속 진행 버튼 추가
-                await page.evaluate("""
-                () => {
-                    window.shouldContinue = false;
-
-                    // 오버레이 추가
-                    const overlay = document.createElement('div');
-                    overlay.id = 'continueOverlay';
-                    overlay.style.cssText = `
-                        position: fixed;
-                        top: 0;
-                        left: 0;
-                        width: 100%;
-                        z-index: 999999;
-                        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                        padding: 20px;
-                        box-shadow: 0 4px 6px rgba(0,0,0,0.3);
-                        font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", sans-serif;
-                    `;
-
-                    overlay.innerHTML = `
-                        <div style="max-width: 1200px; margin: 0 auto;">
-                            <div style="background: white; border-radius: 12px; padding: 20px; box-shadow: 0 2px 8px rgba(0,0,0,0.15);">
-                                <h2 style="margin: 0 0 15px 0; color: #333; font-size: 20px; font-weight: 600;">
-                                    ⏸️ 주소 필드 확인 모드
-                                </h2>
-                                <p style="margin: 0 0 15px 0; color: #666; font-size: 14px; line-height: 1.6;">
-                                    아래 페이지에서 <strong>주소 텍스트</strong>를 드래그하세요.<br>
-                                    예: "경기도 화성시 동탄반송길 25"<br>
-                                    드래그 후 이 버튼을 클릭하면 크롤링이 계속 진행됩니다.
-                                </p>
-                                <button id="continueBtn" style="
-                                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                                    color: white;
-                                    border: none;
-                                    padding: 12px 30px;
-                                    font-size: 16px;
-                                    font-weight: 600;
-                                    border-radius: 8px;
-                                    cursor: pointer;
-                                    box-shadow: 0 2px 4px rgba(0,0,0,0.2);
-                                    transition: all 0.3s ease;
-                                ">
-                                    ✅ 계속 진행
-                                </button>
-                            </div>
+                if tab_clicked:
+                    print(f"   ✅ 단지정보 버튼 클릭 완료")
+                    await asyncio.sleep(2)  # 정보 로딩 대기
+                else:
+                    print(f"   ⚠️ 단지정보 버튼을 찾지 못했습니다")
+
+            except Exception as e:
+                print(f"   ⚠️ 단지정보 버튼 클릭 실패: {e}")
+
+            # 🛑 주소 필드 확인을 위한 일시정지
+            print(f"\n{'='*80}")
+            print(f"⏸️  주소 필드 확인 모드")
+            print(f"{'='*80}")
+            print(f"")
+            print(f"브라우저 창에서 주소가 표시된 텍스트를 드래그해주세요.")
+            print(f"드래그 후 화면 상단의 '계속 진행' 버튼을 클릭하세요.")
+            print(f"")
+            print(f"예시: '경기도 화성시 동탄반송길 25' 같은 주소 텍스트를 드래그")
+            print(f"      → 화면 상단 '계속 진행' 버튼 클릭")
+            print(f"{'='*80}\n")
+
+            # 페이지에 계속 진행 버튼 추가
+            await page.evaluate("""
+            () => {
+                window.shouldContinue = false;
+
+                // 오버레이 추가
+                const overlay = document.createElement('div');
+                overlay.id = 'continueOverlay';
+                overlay.style.cssText = `
+                    position: fixed;
+                    top: 0;
+                    left: 0;
+                    width: 100%;
+                    z-index: 999999;
+                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+                    padding: 20px;
+                    box-shadow: 0 4px 6px rgba(0,0,0,0.3);
+                    font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", sans-serif;
+                `;
+
+                overlay.innerHTML = `
+                    <div style="max-width: 1200px; margin: 0 auto;">
+                        <div style="background: white; border-radius: 12px; padding: 20px; box-shadow: 0 2px 8px rgba(0,0,0,0.15);">
+                            <h2 style="margin: 0 0 15px 0; color: #333; font-size: 20px; font-weight: 600;">
+                                ⏸️ 주소 필드 확인 모드
+                            </h2>
+                            <p style="margin: 0 0 15px 0; color: #666; font-size: 14px; line-height: 1.6;">
+                                아래 페이지에서 <strong>주소 텍스트</strong>를 드래그하세요.<br>
+                                예: "경기도 화성시 동탄반송길 25"<br>
+                                드래그 후 이 버튼을 클릭하면 크롤링이 계속 진행됩니다.
+                            </p>
+                            <button id="continueBtn" style="
+                                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+                                color: white;
+                                border: none;
+                                padding: 12px 30px;
+                                font-size: 16px;
+                                font-weight: 600;
+                                border-radius: 8px;
+                                cursor: pointer;
+                                box-shadow: 0 2px 4px rgba(0,0,0,0.2);
+                                transition: all 0.3s ease;
+                            ">
+                                ✅ 계속 진행
+                            </button>
                         </div>
-                    `;
-
-                    document.body.appendChild(overlay);
-
-                    // 버튼 클릭 이벤트
-                    document.getElementById('continueBtn').addEventListener('click', () => {
-                        window.shouldContinue = true;
-                        overlay.style.display = 'none';
-                    });
-
-                    // 버튼 호버 효과
-                    document.getElementById('continueBtn').addEventListener('mouseenter', (e) => {
-                        e.target.style.transform = 'translateY(-2px)';
-                        e.target.style.boxShadow = '0 4px 8px rgba(0,0,0,0.3)';
-                    });
-                    document.getElementById('continueBtn').addEventListener('mouseleave', (e) => {
-                        e.target.style.transform = 'translateY(0)';
-                        e.target.style.boxShadow = '0 2px 4px rgba(0,0,0,0.2)';
-                    });
-                }
-                """)
+                    </div>
+                `;
+
+                document.body.appendChild(overlay);
+
+                // 버튼 클릭 이벤트
+                document.getElementById('continueBtn').addEventListener('click', () => {
+                    window.shouldContinue = true;
+                    overlay.style.display = 'none';
+                });
+
+                // 버튼 호버 효과
+                document.getElementById('continueBtn').addEventListener('mouseenter', (e) => {
+                    e.target.style.transform = 'translateY(-2px)';
+                    e.target.style.boxShadow = '0 4px 8px rgba(0,0,0,0.3)';
+                });
+                document.getElementById('continueBtn').addEventListener('mouseleave', (e) => {
+                    e.target.style.transform = 'translateY(0)';
+                    e.target.style.boxShadow = '0 2px 4px rgba(0,0,0,0.2)';
+                });
+            }
+            """)
 
-                # 사용자가 버튼 클릭할 때까지 대기 (최대 5분)
-                try:
-                    wait_count = 0
-                    max_wait = 300  # 5분 (300초)
-
-                    while wait_count < max_wait:
-                        should_continue = await page.evaluate("() => window.shouldContinue")
-                        if should_continue:
-                            print(f"   ✅ 계속 진행 신호 받음!")
-                            break
-                        await asyncio.sleep(1)
-                        wait_count += 1
-
-                        # 10초마다 상태 출력
-                        if wait_count % 10 == 0:
-                            print(f"   ⏳ 대기 중... ({wait_count}초 경과)")
-
-                    if wait_count >= max_wait:
-                        print(f"   ⚠️ 타임아웃 (5분 경과) - 계속 진행합니다")
-
-                except Exception as e:
-                    print(f"   ⚠️ 대기 중 오류: {e}")
-
-                # 주소 정보 수집 (도로명 주소와 법정동 주소)
-                try:
-                    print(f"\n   🔍 주소 정보 수집 중...")
-
-                    # 페이지에서 주소 정보 찾기
-                    address_info = await page.evaluate("""
-                        () => {
-                            // 도로명 주소와 지번 주소 찾기
-                            let roadAddress = '';
-                            let jibunAddress = '';
-
-                            // 방법 1: dt/dd 태그에서 찾기
-                            const dts = document.querySelectorAll('dt');
-                            for (const dt of dts) {
-                                const text = dt.textContent || '';
-                                const dd = dt.nextElementSibling;
-
-                                if (text.includes('도로명주소') && dd) {
-                                    roadAddress = dd.textContent.trim();
-                                }
-                                if ((text.includes('지번주소') || text.includes('법정동주소')) && dd) {
-                                    jibunAddress = dd.textContent.trim();
-                                }
+            # 사용자가 버튼 클릭할 때까지 대기 (최대 5분)
+            try:
+                wait_count = 0
+                max_wait = 300  # 5분 (300초)
+
+                while wait_count < max_wait:
+                    should_continue = await page.evaluate("() => window.shouldContinue")
+                    if should_continue:
+                        print(f"   ✅ 계속 진행 신호 받음!")
+                        break
+                    await asyncio.sleep(1)
+                    wait_count += 1
+
+                    # 10초마다 상태 출력
+                    if wait_count % 10 == 0:
+                        print(f"   ⏳ 대기 중... ({wait_count}초 경과)")
+
+                if wait_count >= max_wait:
+                    print(f"   ⚠️ 타임아웃 (5분 경과) - 계속 진행합니다")
+
+            except Exception as e:
+                print(f"   ⚠️ 대기 중 오류: {e}")
+
+            # 주소 정보 수집 (도로명 주소와 법정동 주소)
+            try:
+                print(f"\n   🔍 주소 정보 수집 중...")
+
+                # 페이지에서 주소 정보 찾기
+                address_info = await page.evaluate("""
+                    () => {
+                        // 도로명 주소와 지번 주소 찾기
+                        let roadAddress = '';
+                        let jibunAddress = '';
+
+                        // 방법 1: dt/dd 태그에서 찾기
+                        const dts = document.querySelectorAll('dt');
+                        for (const dt of dts) {
+                            const text = dt.textContent || '';
+                            const dd = dt.nextElementSibling;
+
+                            if (text.includes('도로명주소') && dd) {
+                                roadAddress = dd.textContent.trim();
                             }
+                            if ((text.includes('지번주소') || text.includes('법정동주소')) && dd) {
+                                jibunAddress = dd.textContent.trim();
+                            }
+                        }
 
-                            // 방법 2: 모든 텍스트에서 패턴 매칭
-                            if (!roadAddress || !jibunAddress) {
-                                const allText = document.body.innerText;
-                                const lines = allText.split('\\n');
-
-                                for (const line of lines) {
-                                    const trimmed = line.trim();
-                                    // 도로명 주소 패턴 (시/도로/길 포함)
-                                    if (!roadAddress && (trimmed.includes('로 ') || trimmed.includes('길 ')) &&
-                                        /[가-힣]+[시도]/.test(trimmed)) {
-                                        roadAddress = trimmed;
-                                    }
-                                    // 지번 주소 패턴 (동 + 번지)
-                                    if (!jibunAddress && /[가-힣]+동\s+\d+/.test(trimmed) &&
-                                        /[가-힣]+[시도]/.test(trimmed)) {
-                                        jibunAddress = trimmed;
-                                    }
+                        // 방법 2: 모든 텍스트에서 패턴 매칭
+                        if (!roadAddress || !jibunAddress) {
+                            const allText = document.body.innerText;
+                            const lines = allText.split('\\n');
+
+                            for (const line of lines) {
+                                const trimmed = line.trim();
+                                // 도로명 주소 패턴 (시/도로/길 포함)
+                                if (!roadAddress && (trimmed.includes('로 ') || trimmed.includes('길 ')) &&
+                                    /[가-힣]+[시도]/.test(trimmed)) {
+                                    roadAddress = trimmed;
+                                }
+                                // 지번 주소 패턴 (동 + 번지)
+                                if (!jibunAddress && /[가-힣]+동\s+\d+/.test(trimmed) &&
+                                    /[가-힣]+[시도]/.test(trimmed)) {
+                                    jibunAddress = trimmed;
                                 }
                             }
-
-                            return {
-                                roadAddress: roadAddress,
-                                jibunAddress: jibunAddress
-                            };
                         }
-                    """)
-
-                    if address_info:
-                        if not self.complex_data:
-                            self.complex_data = {}
-
-                        if address_info.get('roadAddress'):
-                            self.complex_data['road_address'] = address_info['roadAddress']
-                            print(f"   ✅ 도로명 주소: {address_info['roadAddress']}")
 
-                        if address_info.get('jibunAddress'):
-                            self.complex_data['jibun_address'] = address_info['jibunAddress']
-                            print(f"   ✅ 지번(법정동) 주소: {address_info['jibunAddress']}")
+                        return {
+                            roadAddress: roadAddress,
+                            jibunAddress: jibunAddress
+                        };
+                    }
+                """)
 
-                        # address 필드에는 도로명 주소 우선, 없으면 지번 주소
-                        if address_info.get('roadAddress'):
-                            self.complex_data['address'] = address_info['roadAddress']
-                        elif address_info.get('jibunAddress'):
-                            self.complex_data['address'] = address_info['jibunAddress']
+                if address_info:
+                    if not self.complex_data:
+                        self.complex_data = {}
+
+                    if address_info.get('roadAddress'):
+                        self.complex_data['road_address'] = address_info['roadAddress']
+                        print(f"   ✅ 도로명 주소: {address_info['roadAddress']}")
+
+                    if address_info.get('jibunAddress'):
+                        self.complex_data['jibun_address'] = address_info['jibunAddress']
+                        print(f"   ✅ 지번(법정동) 주소: {address_info['jibunAddress']}")
+
+                    # address 필드에는 도로명 주소 우선, 없으면 지번 주소
+                    if address_info.get('roadAddress'):
+                        self.complex_data['address'] = address_info['roadAddress']
+                    elif address_info.get('jibunAddress'):
+                        self.complex_data['address'] = address_info['jibunAddress']
+
+                    if not address_info.get('roadAddress') and not address_info.get('jibunAddress'):
+                        print(f"   ⚠️ 자동으로 주소를 찾지 못했습니다")
+                        print(f"   💡 단지정보 탭에서 주소를 수동으로 드래그해주세요")
+
+            except Exception as e:
+                print(f"   ⚠️ 주소 수집 실패: {e}")
+
+        # localStorage 확인 및 체크박스 상태 검증
+        storage_check = await page.evaluate("""
+            () => {
+                const sameAddrYn = localStorage.getItem('sameAddrYn');
+                const sameAddressGroup = localStorage.getItem('sameAddressGroup');
+
+                // 체크박스 상태 확인
+                const checkboxes = document.querySelectorAll('input[type="checkbox"]');
+                let checkboxState = null;
+
+                for (const checkbox of checkboxes) {
+                    const label = checkbox.closest('label') || checkbox.nextElementSibling;
+                    const text = label ? (label.textContent || label.innerText || '') : '';
+                    if (text.includes('동일매물')) {
+                        checkboxState = {
+                            checked: checkbox.checked,
+                            labelText: text
+                        };
+                        break;
+                    }
+                }
 
-                        if not address_info.get('roadAddress') and not address_info.get('jibunAddress'):
-                            print(f"   ⚠️ 자동으로 주소를 찾지 못했습니다")
-                            print(f"   💡 단지정보 탭에서 주소를 수동으로 드래그해주세요")
+                return {
+                    sameAddrYn,
+                    sameAddressGroup,
+                    checkboxState
+                };
+            }
+        """)
 
-                except Exception as e:
-                    print(f"   ⚠️ 주소 수집 실패: {e}")
+        print(f"   [DEBUG] localStorage 확인: {storage_check}")
 
-            # localStorage 확인 및 체크박스 상태 검증
-            storage_check = await page.evaluate("""
+        # 체크박스가 체크되지 않았으면 클릭
+        if storage_check.get('checkboxState') and not storage_check['checkboxState'].get('checked'):
+            print("   🔘 체크박스 클릭 중...")
+            await page.evaluate("""
                 () => {
-                    const sameAddrYn = localStorage.getItem('sameAddrYn');
-                    const sameAddressGroup = localStorage.getItem('sameAddressGroup');
-
-                    // 체크박스 상태 확인
                     const checkboxes = document.querySelectorAll('input[type="checkbox"]');
-                    let checkboxState = null;
-
                     for (const checkbox of checkboxes) {
                         const label = checkbox.closest('label') || checkbox.nextElementSibling;
                         const text = label ? (label.textContent || label.innerText || '') : '';
                         if (text.includes('동일매물')) {
-                            checkboxState = {
-                                checked: checkbox.checked,
-                                labelText: text
-                            };
-                            break;
+                            checkbox.click();
+                            console.log('[Checkbox] 클릭 완료');
+                            return true;
                         }
                     }
-
-                    return {
-                        sameAddrYn,
-                        sameAddressGroup,
-                        checkboxState
-                    };
+                    return false;
                 }
             """)
 
-            print(f"   [DEBUG] localStorage 확인: {storage_check}")
+            # 데이터 초기화 후 재로딩 대기
+            print("   [DEBUG] 체크박스 클릭 완료, 데이터 초기화...")
+            self.articles_data = None
+            self.complex_data = None
+            await asyncio.sleep(3)
+            print("   ✅ 동일매물묶기 활성화 완료")
+        else:
+            print("   ✅ 동일매물묶기 이미 활성화됨")
 
-            # 체크박스가 체크되지 않았으면 클릭
-            if storage_check.get('checkboxState') and not storage_check['checkboxState'].get('checked'):
-                print("   🔘 체크박스 클릭 중...")
-                await page.evaluate("""
-                    () => {
-                        const checkboxes = document.querySelectorAll('input[type="checkbox"]');
-                        for (const checkbox of checkboxes) {
-                            const label = checkbox.closest('label') || checkbox.nextElementSibling;
-                            const text = label ? (label.textContent || label.innerText || '') : '';
-                            if (text.includes('동일매물')) {
-                                checkbox.click();
-                                console.log('[Checkbox] 클릭 완료');
-                                return true;
-                            }
-                        }
-                        return false;
-                    }
-                """)
+        # 매물 리스트 컨테이너 내부 스크롤로 모든 매물 로딩
+        print("   📜 매물 리스트 스크롤 중...")
 
-                # 데이터 초기화 후 재로딩 대기
-                print("   [DEBUG] 체크박스 클릭 완료, 데이터 초기화...")
-                self.articles_data = None
-                self.complex_data = None
-                await asyncio.sleep(3)
-                print("   ✅ 동일매물묶기 활성화 완료")
-            else:
-                print("   ✅ 동일매물묶기 이미 활성화됨")
-
-            # 매물 리스트 컨테이너 내부 스크롤로 모든 매물 로딩
-            print("   📜 매물 리스트 스크롤 중...")
+        previous_api_count = len(self.articles_data.get('articleList', [])) if self.articles_data else 0
+        scroll_end_count = 0
 
-            previous_api_count = len(self.articles_data.get('articleList', [])) if self.articles_data else 0
-            scroll_end_count = 0
+        for i in range(100):
+            # 스크롤마다 다음 페이지 매물 API가 호출되므로 요청 슬롯 예약
+            await self._throttle(url)
 
-            for i in range(100):
-                # 컨테이너 스크롤 - .item_list가 실제 스크롤 가능한 컨테이너
-                scrolled = await page.evaluate("""
-                    () => {
-                        const container = document.querySelector('.item_list');
-                        if (container) {
-                            const before = container.scrollTop;
-                            // 스크롤 다운
-                            container.scrollTop += 500;
-                            const after = container.scrollTop;
-
-                            // 현재 DOM에 있는 매물 개수도 확인
-                            const items = document.querySelectorAll('.item_link, .item_inner, [class*="item"]');
-
-                            return {
-                                found: true,
-                                moved: after > before,
-                                scrollTop: after,
-                                scrollHeight: container.scrollHeight,
-                                clientHeight: container.clientHeight,
-                                domItemCount: items.length
-                            };
-                        }
-                        return {found: false};
+            # 컨테이너 스크롤 - .item_list가 실제 스크롤 가능한 컨테이너
+            scrolled = await page.evaluate("""
+                () => {
+                    const container = document.querySelector('.item_list');
+                    if (container) {
+                        const before = container.scrollTop;
+                        // 스크롤 다운
+                        container.scrollTop += 500;
+                        const after = container.scrollTop;
+
+                        // 현재 DOM에 있는 매물 개수도 확인
+                        const items = document.querySelectorAll('.item_link, .item_inner, [class*="item"]');
+
+                        return {
+                            found: true,
+                            moved: after > before,
+                            scrollTop: after,
+                            scrollHeight: container.scrollHeight,
+                            clientHeight: container.clientHeight,
+                            domItemCount: items.length
+                        };
                     }
-                """)
-
-                # 진행상황 출력 (10회마다)
-                if i % 10 == 0 and i > 0:
-                    print(f"   🔄 스크롤 진행 중... (#{i+1})")
-
-                # ⚠️ 봇 감지 회피: 1.5초 대기로 자연스러운 스크롤 연출
-                await asyncio.sleep(1.5)
+                    return {found: false};
+                }
+            """)
 
-                # 현재 수집된 매물 수
-                current_api_count = len(self.articles_data.get('articleList', [])) if self.articles_data else 0
+            # 진행상황 출력 (10회마다)
+            if i % 10 == 0 and i > 0:
+                print(f"   🔄 스크롤 진행 중... (#{i+1})")
 
-                if current_api_count > previous_api_count:
-                    print(f"   📊 API 응답: {current_api_count}건 수집됨 (+{current_api_count - previous_api_count})")
-                    previous_api_count = current_api_count
-                    scroll_end_count = 0  # 새 데이터가 들어오면 카운터 리셋
+            # ⚠️ 봇 감지 회피: 1.5초 대기로 자연스러운 스크롤 연출
+            await asyncio.sleep(1.5)
 
-                # 스크롤이 끝에 도달했는지 체크
-                if scrolled.get('found') and not scrolled.get('moved'):
-                    scroll_end_count += 1
-                    # 스크롤 끝에서 5회 연속 데이터 없으면 종료
-                    if scroll_end_count >= 5:
-                        print(f"   ⏹️  스크롤 끝 도달 - 수집 완료")
-                        break
-                else:
-                    scroll_end_count = 0  # 스크롤이 움직이면 리셋
+            # 현재 수집된 매물 수
+            current_api_count = len(self.articles_data.get('articleList', [])) if self.articles_data else 0
 
-            print(f"   ✅ 최종 수집: {previous_api_count}건")
+            if current_api_count > previous_api_count:
+                print(f"   📊 API 응답: {current_api_count}건 수집됨 (+{current_api_count - previous_api_count})")
+                previous_api_count = current_api_count
+                scroll_end_count = 0  # 새 데이터가 들어오면 카운터 리셋
 
-            await browser.close()
+            # 스크롤이 끝에 도달했는지 체크
+            if scrolled.get('found') and not scrolled.get('moved'):
+                scroll_end_count += 1
+                # 스크롤 끝에서 5회 연속 데이터 없으면 종료
+                if scroll_end_count >= 5:
+                    print(f"   ⏹️  스크롤 끝 도달 - 수집 완료")
+                    break
+            else:
+                scroll_end_count = 0  # 스크롤이 움직이면 리셋
 
-        return {
-            'complex': self.complex_data,
-            'articles': self.articles_data
-        }
+        print(f"   ✅ 최종 수집: {previous_api_count}건")
 
     def save_to_database(self, complex_id: str, db: Session = None):
         """
@@ -509,7 +556,18 @@ class NaverRealEstateCrawler:
         Args:
             complex_id: 단지 ID
             db: SQLAlchemy 세션 (없으면 새로 생성)
+
+        Returns:
+            dict: articles_collected, articles_new, articles_updated, articles_unchanged, articles_removed
         """
+        result = {
+            'articles_collected': 0,
+            'articles_new': 0,
+            'articles_updated': 0,
+            'articles_unchanged': 0,
+            'articles_removed': 0,
+        }
+
         close_session = False
         if db is None:
             db = SessionLocal()
@@ -608,72 +666,29 @@ class NaverRealEstateCrawler:
                 print("\n💰 매물 정보 저장 중...")
 
                 article_list = self.articles_data.get('articleList', [])
-                saved_count = 0
-                updated_count = 0
-                skipped_count = 0
-
-                # 배치 내 중복 제거
-                seen_article_nos = set()
-
-                for article in article_list:
-                    article_no = article['articleNo']
-
-                    # 배치 내 중복 체크
-                    if article_no in seen_article_nos:
-                        skipped_count += 1
-                        continue
-                    seen_article_nos.add(article_no)
-
-                    # DB 중복 확인
-                    existing = db.query(Article).filter(
-                        Article.article_no == article_no
-                    ).first()
-
-                    # 월세 가격 파싱 (보증금/월세 분리)
-                    trade_type = article.get('tradeTypeName')
-                    price_str = article.get('dealOrWarrantPrc')
-                    monthly_rent = None
-
-                    if trade_type == '월세' and price_str and '/' in price_str:
-                        # "5,000/140" 형식에서 보증금과 월세 분리
-                        parts = price_str.split('/')
-                        price_str = parts[0].strip()
-                        monthly_rent = parts[1].strip() if len(parts) > 1 else None
-
-                    if existing:
-                        # 가격 변동 확인
-                        if existing.price != price_str or (monthly_rent and existing.monthly_rent != monthly_rent):
-                            existing.price = price_str
-                            existing.monthly_rent = monthly_rent
-                            existing.price_change_state = article.get('priceChangeState')
-                            updated_count += 1
-                        else:
-                            skipped_count += 1
-                        continue
-
-                    article_obj = Article(
-                        article_no=article_no,
-                        complex_id=complex_id,
-                        trade_type=trade_type,
-                        price=price_str,
-                        monthly_rent=monthly_rent,
-                        area_name=article.get('areaName'),
-                        area1=article.get('area1'),
-                        area2=article.get('area2'),
-                        floor_info=article.get('floorInfo'),
-                        direction=article.get('direction'),
-                        building_name=article.get('buildingName'),
-                        feature_desc=article.get('articleFeatureDesc'),
-                        tags=json.dumps(article.get('tagList', []), ensure_ascii=False),
-                        realtor_name=article.get('realtorName'),
-                        confirm_date=article.get('articleConfirmYmd'),
-                        # 동일 매물 정보 추가
-                        same_addr_cnt=article.get('sameAddrCnt', 1),
-                        same_addr_max_prc=article.get('sameAddrMaxPrc'),
-                        same_addr_min_prc=article.get('sameAddrMinPrc')
+                counts = upsert_articles(db, complex_id, article_list)
+
+                # 목록 끝(isMoreData == false)까지 수집한 경우에만 사라진 매물 비활성화
+                # (최대 페이지 도달/중간 페이지 실패로 잘린 목록이면 보이지 않은 매물이 사라진 것이 아님)
+                articles_complete = self.articles_data.get('isMoreData') is False
+                if articles_complete:
+                    removed_count = deactivate_missing_articles(
+                        db, complex_id, [article['articleNo'] for article in article_list]
                     )
-                    db.add(article_obj)
-                    saved_count += 1
+                else:
+                    removed_count = 0
+                    print("   ⚠️  매물 목록을 끝까지 수집하지 못해 사라진 매물 비활성화를 건너뜁니다")
+                saved_count = counts['new']
+                updated_count = counts['updated']
+                skipped_count = counts['unchanged'] + counts['duplicates']
+                result.update({
+                    'articles_collected': counts['collected'],
+                    'articles_new': counts['new'],
+                    'articles_updated': counts['updated'],
+                    'articles_unchanged': counts['unchanged'],
+                    'articles_removed': removed_count,
+                    'articles_complete': articles_complete,
+                })
 
                 db.commit()
 
@@ -681,6 +696,8 @@ class NaverRealEstateCrawler:
                 if updated_count > 0:
                     print(f"   🔄 가격변동: {updated_count}건")
                 print(f"   ⏭️  변동없음: {skipped_count}건")
+                if removed_count > 0:
+                    print(f"   🗑️  사라진 매물 비활성화: {removed_count}건")
 
             # 3. 최종 통계
             print(f"\n{'='*80}")
@@ -695,6 +712,8 @@ class NaverRealEstateCrawler:
 
             print("\n✅ 저장 완료!\n")
 
+            return result
+
         except Exception as e:
             db.rollback()
             print(f"\n❌ 에러 발생: {e}")
@@ -0,0 +1,141 @@
+"""
+법정동 코드 색인 (프로세스 공용)
+
+dong_code_active.txt(20,000여 줄)를 LocationParser 생성 때마다 다시 읽고 나누던 대신,
+AddressResolver 색인까지 만든 결과를 pickle 파일로 한 번 컴파일해 두고
+프로세스마다 처음 필요할 때 한 번만 읽어 모든 LocationParser/MOLITService가 공유합니다.
+
+- 색인 파일: DONG_CODE_INDEX_PATH (기본: <프로젝트>/data/dong_code_index.pickle)
+- 버전 해시: sha256(원본 파일 내용 + INDEX_FORMAT) - 원본이나 색인 구조가 바뀌면 자동 재컴파일
+- 미리 만들기: python backend/build_dong_code_index.py
+"""
+import hashlib
+import logging
+import os
+import pickle
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .address_resolver import AddressResolver
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+DONG_CODE_FILE = Path(__file__).resolve().parent.parent / "data" / "dong_code_active.txt"
+DONG_CODE_INDEX_PATH = os.getenv("DONG_CODE_INDEX_PATH", str(PROJECT_ROOT / "data" / "dong_code_index.pickle"))
+
+# 색인 구조(AddressResolver 필드 등)가 바뀌면 올려서 기존 파일 무효화
+INDEX_FORMAT = 1
+
+
+def read_dong_code_rows(path: Path = DONG_CODE_FILE) -> List[Tuple[str, str]]:
+    """
+    법정동 코드 파일 읽기
+
+    Returns:
+        (10자리 법정동 코드, 법정동명) 리스트 (헤더/빈 줄/형식 오류 줄 제외)
+    """
+    rows = []
+    with open(path, 'r', encoding='utf-8') as f:
+        # 첫 줄 헤더 건너뛰기
+        next(f)
+
+        for line in f:
+            parts = line.strip().split('\t')
+            if len(parts) != 2:
+                continue
+            rows.append((parts[0].strip(), parts[1].strip()))
+    return rows
+
+
+def source_version(path: Path = DONG_CODE_FILE) -> str:
+    """원본 파일 내용 + 색인 형식 해시"""
+    digest = hashlib.sha256(path.read_bytes())
+    digest.update(f"|format={INDEX_FORMAT}".encode())
+    return digest.hexdigest()
+
+
+class DongCodeIndex:
+    """컴파일된 법정동 코드 색인 (pickle 대상)"""
+
+    def __init__(self, rows: List[Tuple[str, str]], version: str):
+        self.version = version
+        # 전체 주소 → 법정동 코드
+        self.dong_code_map: Dict[str, str] = {name: code for code, name in rows}
+        # 시군구 단위 행 (코드가 00000으로 끝남) → 시군구 코드
+        self.sigungu_code_map: Dict[str, str] = {name: code[:5] for code, name in rows if code.endswith("00000")}
+        self.resolver = AddressResolver(rows)
+
+    @classmethod
+    def compile(cls, source: Path = DONG_CODE_FILE) -> "DongCodeIndex":
+        """원본 파일에서 색인 생성"""
+        return cls(read_dong_code_rows(source), source_version(source))
+
+    def save(self, path: str):
+        """색인 저장 (임시 파일에 쓴 뒤 교체)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(pickle.dumps(self, protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def load(path: str, version: str) -> Optional["DongCodeIndex"]:
+        """저장된 색인 읽기 (없거나 버전이 다르면 None)"""
+        try:
+            with open(path, 'rb') as f:
+                index = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"⚠️ 법정동 색인 파일 읽기 실패 ({path}): {e}")
+            return None
+
+        if not isinstance(index, DongCodeIndex) or index.version != version:
+            logger.info(f"🔄 법정동 색인 버전 변경 → 재컴파일 ({path})")
+            return None
+        return index
+
+
+def load_or_compile(path: str = DONG_CODE_INDEX_PATH, source: Path = DONG_CODE_FILE) -> DongCodeIndex:
+    """
+    색인 파일을 읽고, 없거나 원본과 버전이 다르면 컴파일 후 저장
+
+    저장에 실패해도(읽기 전용 배포 등) 메모리의 색인은 그대로 사용
+    """
+    started = time.perf_counter()
+    if not os.path.exists(source):
+        logger.warning(f"법정동 코드 파일을 찾을 수 없습니다: {source}")
+        return DongCodeIndex([], "")
+    version = source_version(source)
+
+    index = DongCodeIndex.load(path, version)
+    if index is not None:
+        logger.info(f"법정동 색인 로드: {len(index.dong_code_map)}개 ({(time.perf_counter() - started) * 1000:.0f}ms)")
+        return index
+
+    index = DongCodeIndex(read_dong_code_rows(source), version)
+    try:
+        index.save(path)
+    except OSError as e:
+        logger.warning(f"⚠️ 법정동 색인 저장 실패 ({path}): {e}")
+
+    logger.info(f"법정동 색인 컴파일: {len(index.dong_code_map)}개 ({(time.perf_counter() - started) * 1000:.0f}ms)")
+    return index
+
+
+_dong_code_index: Optional[DongCodeIndex] = None
+_dong_code_index_lock = threading.Lock()
+
+
+def get_dong_code_index() -> DongCodeIndex:
+    """프로세스 공용 법정동 색인 (처음 호출할 때 로드)"""
+    global _dong_code_index
+    if _dong_code_index is None:
+        with _dong_code_index_lock:
+            if _dong_code_index is None:
+                _dong_code_index = load_or_compile()
+    return _dong_code_index
@@ -1,64 +1,38 @@
 """
 법정동 코드 파싱 및 주소 매칭 서비스
+
+주소 매칭은 AddressResolver(법정동 이름 색인 + Aho–Corasick)가 담당합니다.
 """
-import os
 from typing import Optional, Dict, List
 import logging
 
+from .address_resolver import AddressResolver
+from .dong_code_index import get_dong_code_index
+
 logger = logging.getLogger(__name__)
 
 
 class LocationParser:
-    """법정동 코드 파싱 및 주소 매칭"""
-
-    def __init__(self):
-        self.dong_code_map: Dict[str, str] = {}
-        self.sigungu_code_map: Dict[str, str] = {}
-        self._load_dong_codes()
-
-    def _load_dong_codes(self):
-        """법정동 코드 파일 로드"""
-        # 파일 경로
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        data_file = os.path.join(current_dir, "..", "data", "dong_code_active.txt")
-
-        if not os.path.exists(data_file):
-            logger.warning(f"법정동 코드 파일을 찾을 수 없습니다: {data_file}")
-            return
-
-        try:
-            with open(data_file, 'r', encoding='utf-8') as f:
-                # 첫 줄 헤더 건너뛰기
-                next(f)
-
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    parts = line.split('\t')
-                    if len(parts) != 2:
-                        continue
+    """
+    법정동 코드 파싱 및 주소 매칭
 
-                    code = parts[0].strip()
-                    name = parts[1].strip()
+    법정동 색인은 프로세스 공용(get_dong_code_index)이며 처음 주소를 해석할 때 로드되므로
+    LocationParser 생성 자체는 비용이 거의 없습니다.
+    """
 
-                    # 전체 주소 → 법정동 코드 매핑
-                    self.dong_code_map[name] = code
+    @property
+    def resolver(self) -> AddressResolver:
+        return get_dong_code_index().resolver
 
-                    # 시군구 코드 추출 (앞 5자리)
-                    sigungu_code = code[:5]
+    @property
+    def dong_code_map(self) -> Dict[str, str]:
+        """전체 주소 → 법정동 코드"""
+        return get_dong_code_index().dong_code_map
 
-                    # 시군구 이름 추출 (예: "경기도 성남시 분당구")
-                    # 동 단위가 아닌 경우 (코드가 00으로 끝나는 경우)
-                    if code.endswith("00000"):
-                        # 시군구 레벨
-                        self.sigungu_code_map[name] = sigungu_code
-
-            logger.info(f"법정동 코드 로드 완료: {len(self.dong_code_map)}개 주소, {len(self.sigungu_code_map)}개 시군구")
-
-        except Exception as e:
-            logger.error(f"법정동 코드 파일 로드 실패: {e}")
+    @property
+    def sigungu_code_map(self) -> Dict[str, str]:
+        """시군구 단위 주소 → 시군구 코드"""
+        return get_dong_code_index().sigungu_code_map
 
     def extract_sigungu_code(self, address: str) -> Optional[str]:
         """
@@ -73,54 +47,9 @@ class LocationParser:
         if not address:
             return None
 
-        # 정확한 매칭 시도
-        for location_name, sigungu_code in self.sigungu_code_map.items():
-            if location_name in address:
-                return sigungu_code
-
-        # 부분 매칭 시도 (동 포함)
-        for location_name, full_code in self.dong_code_map.items():
-            if location_name in address:
-                return full_code[:5]
-
-        # 수동 매핑 (하드코딩된 주요 지역)
-        manual_map = {
-            # 서울
-            "강남구": "11680",
-            "서초구": "11650",
-            "송파구": "11710",
-            "강동구": "11740",
-            "서대문구": "11410",
-            "마포구": "11440",
-
-            # 경기
-            "분당구": "41135",
-            "수지구": "41465",
-            "화성시": "41590",
-            "안양시 동안구": "41173",
-            "동안구": "41173",
-            "안양시 만안구": "41171",
-            "만안구": "41171",
-            "용인시 수지구": "41465",
-            "용인시 기흥구": "41463",
-            "기흥구": "41463",
-            "성남시 분당구": "41135",
-            "성남시 중원구": "41133",
-            "중원구": "41133",
-
-            # 경상북도
-            "경주시": "47130",
-
-            # 전북 (전라북도)
-            "전주시 완산구": "52111",
-            "완산구": "52111",
-            "전주시 덕진구": "52113",
-            "덕진구": "52113",
-        }
-
-        for key, code in manual_map.items():
-            if key in address:
-                return code
+        match = self.resolver.resolve(address)
+        if match and match["sigungu_code"]:
+            return match["sigungu_code"]
 
         logger.warning(f"시군구 코드를 찾을 수 없습니다: {address}")
         return None
@@ -133,20 +62,17 @@ class LocationParser:
             address: 주소 문자열
 
         Returns:
-            위치 정보 딕셔너리 (시군구 코드, 이름 등)
+            위치 정보 딕셔너리 (시군구 코드, 이름, 가장 구체적으로 찾은 법정동 단위 등)
         """
-        sigungu_code = self.extract_sigungu_code(address)
-
-        # 매칭된 위치 이름 찾기
-        matched_location = None
-        for location_name, code in self.sigungu_code_map.items():
-            if code == sigungu_code:
-                matched_location = location_name
-                break
+        match = self.resolver.resolve(address) if address else None
+        sigungu_code = match["sigungu_code"] if match else None
 
         return {
             "sigungu_code": sigungu_code,
-            "location_name": matched_location,
+            "location_name": self.resolver.sigungu_name(sigungu_code) if sigungu_code else None,
+            "matched_code": match["code"] if match else None,
+            "matched_level": match["level"] if match else None,
+            "matched_name": match["name"] if match else None,
             "original_address": address
         }
 
@@ -155,22 +81,10 @@ class LocationParser:
         위치 검색
 
         Args:
-            query: 검색어
+            query: 검색어 (시군구 이름 앞부분, 예: "분당")
             limit: 최대 결과 수
 
         Returns:
             검색 결과 리스트
         """
-        results = []
-
-        for location_name, sigungu_code in self.sigungu_code_map.items():
-            if query in location_name:
-                results.append({
-                    "name": location_name,
-                    "code": sigungu_code
-                })
-
-                if len(results) >= limit:
-                    break
-
-        return results
+        return self.resolver.search_sigungu(query, limit)
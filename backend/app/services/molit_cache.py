@@ -0,0 +1,249 @@
+"""
+국토부 실거래가 API 페이지 캐시
+
+신고 기한(계약일로부터 30일)이 지난 과거 월의 거래는 거의 바뀌지 않으므로
+응답 XML을 (엔드포인트, LAWD_CD, DEAL_YMD, 페이지, 페이지 크기) 키로 압축 저장하고 재사용합니다.
+
+- 이번 달/지난달: MOLIT_CACHE_TTL_RECENT (기본 6시간, 신고가 계속 추가됨)
+- 그 이전 월: MOLIT_CACHE_TTL_PAST (기본 30일)
+
+저장소 (MOLIT_CACHE_BACKEND):
+- disk (기본): MOLIT_CACHE_DIR/<키 해시 앞 2자리>/<키 해시>.bin
+- redis: molit:page:<키 해시> (SETEX), 적중/미스 카운터도 Redis에 공유
+- none: 캐시 사용 안 함
+
+정상 응답(resultCode 00/000)만 저장합니다.
+"""
+import hashlib
+import logging
+import os
+import struct
+import threading
+import time
+import zlib
+from datetime import date
+from pathlib import Path
+from typing import Dict, Optional
+
+from app.services.molit_service import recent_year_months
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+MOLIT_CACHE_BACKEND = os.getenv("MOLIT_CACHE_BACKEND", "disk")
+MOLIT_CACHE_DIR = os.getenv("MOLIT_CACHE_DIR", str(PROJECT_ROOT / "data" / "molit_cache"))
+
+# 캐시 유효 기간(초)
+MOLIT_CACHE_TTL_PAST = int(os.getenv("MOLIT_CACHE_TTL_PAST", str(30 * 24 * 3600)))
+MOLIT_CACHE_TTL_RECENT = int(os.getenv("MOLIT_CACHE_TTL_RECENT", str(6 * 3600)))
+
+REDIS_KEY_PREFIX = "molit:page:"
+REDIS_STATS_KEY = "molit:cache:stats"
+
+# 디스크 항목 헤더: 만료 시각 (unix time, double)
+_EXPIRES = struct.Struct(">d")
+
+
+def cache_key(endpoint: str, lawd_cd: str, deal_ymd: str, page_no: int, num_rows: int) -> str:
+    """요청 파라미터로 만든 캐시 키 (sha256)"""
+    raw = f"{endpoint}|{lawd_cd}|{deal_ymd}|{page_no}|{num_rows}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def page_ttl(deal_ymd: str, today: Optional[date] = None) -> int:
+    """
+    년월별 캐시 유효 기간
+
+    Args:
+        deal_ymd: 조회 년월 (YYYYMM)
+        today: 기준일 (기본: 오늘)
+
+    Returns:
+        초 단위 TTL (이번 달/지난달/미래 월은 짧게, 그 이전 월은 길게)
+    """
+    previous = recent_year_months(2, today)[-1]
+    return MOLIT_CACHE_TTL_RECENT if deal_ymd >= previous else MOLIT_CACHE_TTL_PAST
+
+
+class PageCache:
+    """페이지 캐시 공통 (적중/미스 카운터)"""
+
+    backend = "none"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters = {"hits": 0, "misses": 0, "stores": 0, "errors": 0}
+
+    def _count(self, name: str):
+        with self._lock:
+            self.counters[name] += 1
+
+    def get(self, endpoint: str, lawd_cd: str, deal_ymd: str, page_no: int, num_rows: int) -> Optional[bytes]:
+        """
+        캐시된 응답 XML 조회
+
+        Returns:
+            XML 바이트 (없거나 만료되면 None)
+        """
+        key = cache_key(endpoint, lawd_cd, deal_ymd, page_no, num_rows)
+        try:
+            payload = self._load(key)
+        except Exception as e:
+            logger.warning(f"⚠️ 국토부 캐시 읽기 실패: {e}")
+            payload = None
+            self._count("errors")
+
+        if payload is None:
+            self._count("misses")
+            return None
+
+        self._count("hits")
+        return zlib.decompress(payload)
+
+    def set(self, endpoint: str, lawd_cd: str, deal_ymd: str, page_no: int, num_rows: int, xml_content: bytes):
+        """응답 XML 압축 저장 (년월에 따라 TTL 결정)"""
+        key = cache_key(endpoint, lawd_cd, deal_ymd, page_no, num_rows)
+        try:
+            self._store(key, zlib.compress(xml_content, 6), page_ttl(deal_ymd))
+            self._count("stores")
+        except Exception as e:
+            logger.warning(f"⚠️ 국토부 캐시 저장 실패: {e}")
+            self._count("errors")
+
+    def stats(self) -> Dict:
+        """적중/미스 카운터 + 저장소 정보"""
+        counters = dict(self.counters)
+        lookups = counters["hits"] + counters["misses"]
+        return {
+            "backend": self.backend,
+            **counters,
+            "hit_rate": round(counters["hits"] / lookups, 4) if lookups else None,
+            **self._storage_stats(),
+        }
+
+    def clear(self) -> int:
+        """캐시 전체 삭제 (삭제된 항목 수)"""
+        return 0
+
+    def _load(self, key: str) -> Optional[bytes]:
+        return None
+
+    def _store(self, key: str, payload: bytes, ttl: int):
+        pass
+
+    def _storage_stats(self) -> Dict:
+        return {}
+
+
+class DiskPageCache(PageCache):
+    """디스크 페이지 캐시"""
+
+    backend = "disk"
+
+    def __init__(self, directory: str = MOLIT_CACHE_DIR):
+        super().__init__()
+        self.directory = Path(directory)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.bin"
+
+    def _load(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+        (expires_at,) = _EXPIRES.unpack_from(data)
+        if expires_at < time.time():
+            path.unlink(missing_ok=True)
+            return None
+        return data[_EXPIRES.size:]
+
+    def _store(self, key: str, payload: bytes, ttl: int):
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # 임시 파일에 쓴 뒤 교체 (동시 읽기에서 잘린 파일 방지)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(_EXPIRES.pack(time.time() + ttl) + payload)
+        os.replace(tmp_path, path)
+
+    def _storage_stats(self) -> Dict:
+        files = list(self.directory.glob("*/*.bin")) if self.directory.exists() else []
+        return {
+            "entries": len(files),
+            "size_bytes": sum(path.stat().st_size for path in files),
+            "directory": str(self.directory),
+        }
+
+    def clear(self) -> int:
+        files = list(self.directory.glob("*/*.bin")) if self.directory.exists() else []
+        for path in files:
+            path.unlink(missing_ok=True)
+        return len(files)
+
+
+class RedisPageCache(PageCache):
+    """Redis 페이지 캐시 (여러 워커가 카운터 공유)"""
+
+    backend = "redis"
+
+    def __init__(self, redis_url: Optional[str] = None):
+        super().__init__()
+        import redis
+
+        if redis_url is None:
+            from app.core.celery_app import REDIS_URL
+            redis_url = REDIS_URL
+        self.redis = redis.from_url(redis_url)
+
+    def _count(self, name: str):
+        super()._count(name)
+        try:
+            self.redis.hincrby(REDIS_STATS_KEY, name, 1)
+        except Exception:
+            pass
+
+    def _load(self, key: str) -> Optional[bytes]:
+        return self.redis.get(REDIS_KEY_PREFIX + key)
+
+    def _store(self, key: str, payload: bytes, ttl: int):
+        self.redis.setex(REDIS_KEY_PREFIX + key, ttl, payload)
+
+    def stats(self) -> Dict:
+        stats = super().stats()
+        shared = {k.decode(): int(v) for k, v in self.redis.hgetall(REDIS_STATS_KEY).items()}
+        if shared:
+            lookups = shared.get("hits", 0) + shared.get("misses", 0)
+            stats.update(shared)
+            stats["hit_rate"] = round(shared.get("hits", 0) / lookups, 4) if lookups else None
+        return stats
+
+    def _storage_stats(self) -> Dict:
+        entries = sum(1 for _ in self.redis.scan_iter(f"{REDIS_KEY_PREFIX}*", count=1000))
+        return {"entries": entries}
+
+    def clear(self) -> int:
+        keys = list(self.redis.scan_iter(f"{REDIS_KEY_PREFIX}*", count=1000))
+        if keys:
+            self.redis.delete(*keys)
+        self.redis.delete(REDIS_STATS_KEY)
+        return len(keys)
+
+
+_page_cache: Optional[PageCache] = None
+
+
+def get_page_cache() -> PageCache:
+    """프로세스 공용 페이지 캐시 (MOLIT_CACHE_BACKEND)"""
+    global _page_cache
+    if _page_cache is None:
+        if MOLIT_CACHE_BACKEND == "redis":
+            _page_cache = RedisPageCache()
+        elif MOLIT_CACHE_BACKEND == "disk":
+            _page_cache = DiskPageCache()
+        else:
+            _page_cache = PageCache()
+    return _page_cache
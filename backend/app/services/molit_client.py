@@ -0,0 +1,306 @@
+"""
+국토교통부 실거래가 API 비동기 클라이언트 (httpx)
+
+- 연결 재사용 (httpx.AsyncClient 커넥션 풀)
+- 여러 년월/페이지를 동시에 조회 (MOLIT_CONCURRENCY 로 동시 요청 수 제한)
+- 1페이지의 totalCount로 나머지 페이지를 미리 계산하여 한꺼번에 요청 (페이지 프리페치)
+- 5xx/타임아웃/연결 오류는 지수 백오프 + 지터로 재시도
+- 페이지 응답 캐시 (molit_cache, 캐시 적중 시 API 호출/일일 한도 차감 없음)
+- 공공데이터포털 일일 호출 한도: 프로세스 내 카운터(MOLIT_DAILY_QUOTA) +
+  한도 초과 응답(LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS_ERROR) 시 MOLITQuotaExceeded
+- HTTP 200 안의 resultCode 오류(22 한도 초과, 30 미등록 키 등)도 예외로 처리
+  (03 데이터 없음만 빈 달로 취급)
+
+사용 예:
+    async with AsyncMOLITClient(api_key) as client:
+        pages = await client.fetch_region_months("trade", [("11680", "202501"), ("11680", "202412")])
+"""
+import asyncio
+import logging
+import math
+import os
+import random
+import threading
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import httpx
+
+from app.services.molit_cache import PageCache, get_page_cache
+from app.services.molit_parser import parse_trade_page
+
+logger = logging.getLogger(__name__)
+
+# API 주소 (스텁 서버 테스트 시 http://127.0.0.1:8766/1613000)
+MOLIT_API_BASE = os.getenv("MOLIT_API_BASE", "http://apis.data.go.kr/1613000")
+
+# 동시 요청 수 / 재시도 횟수 / 백오프 기본 간격(초) / 요청 타임아웃(초)
+MOLIT_CONCURRENCY = int(os.getenv("MOLIT_CONCURRENCY", "4"))
+MOLIT_MAX_RETRIES = int(os.getenv("MOLIT_MAX_RETRIES", "3"))
+MOLIT_RETRY_BASE_DELAY = float(os.getenv("MOLIT_RETRY_BASE_DELAY", "0.5"))
+MOLIT_TIMEOUT = float(os.getenv("MOLIT_TIMEOUT", "30"))
+
+# 공공데이터포털 일일 호출 한도 (개발계정 기본 10,000회, 0이면 제한 없음)
+MOLIT_DAILY_QUOTA = int(os.getenv("MOLIT_DAILY_QUOTA", "10000"))
+
+# 페이지당 행 수 (API 최대값)
+MOLIT_PAGE_SIZE = 1000
+
+ENDPOINTS = {
+    "trade": "RTMSDataSvcAptTradeDev/getRTMSDataSvcAptTradeDev",
+    "rent": "RTMSDataSvcAptRent/getRTMSDataSvcAptRent",
+}
+
+QUOTA_EXCEEDED_MARKER = b"LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS"
+
+# 응답 헤더 resultCode (신규 API는 3자리 "000", 기존 API는 2자리 "00")
+RESULT_OK_CODES = ("00", "000")
+RESULT_NO_DATA_CODES = ("03", "003")
+RESULT_QUOTA_EXCEEDED_CODES = ("22", "022")
+
+
+class MOLITQuotaExceeded(Exception):
+    """일일 호출 한도 초과"""
+
+
+class MOLITRequestError(Exception):
+    """재시도 후에도 실패한 요청"""
+
+
+class DailyQuota:
+    """프로세스 내 일일 호출 카운터 (날짜가 바뀌면 초기화)"""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.day = date.today()
+        self.used = 0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """호출 1회 차감 (한도 초과 시 MOLITQuotaExceeded)"""
+        with self._lock:
+            today = date.today()
+            if today != self.day:
+                self.day = today
+                self.used = 0
+            if self.limit and self.used >= self.limit:
+                raise MOLITQuotaExceeded(f"국토부 API 일일 호출 한도 도달 ({self.limit}회)")
+            self.used += 1
+
+    def exhaust(self):
+        """API가 한도 초과를 응답한 경우 오늘 남은 호출 차단"""
+        with self._lock:
+            self.used = max(self.used, self.limit)
+
+    @property
+    def remaining(self) -> Optional[int]:
+        return max(self.limit - self.used, 0) if self.limit else None
+
+
+_daily_quota = DailyQuota(MOLIT_DAILY_QUOTA)
+
+
+def get_daily_quota() -> DailyQuota:
+    """프로세스 공용 일일 호출 카운터"""
+    return _daily_quota
+
+
+async def _gather_or_cancel(coros: Iterable) -> List:
+    """asyncio.gather + 하나라도 실패하면 나머지 요청 취소 (클라이언트 종료 후 요청 방지)"""
+    tasks = [asyncio.ensure_future(coro) for coro in coros]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+class AsyncMOLITClient:
+    """국토부 아파트 매매/전월세 실거래가 비동기 클라이언트"""
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: Optional[str] = None,
+        concurrency: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        quota: Optional[DailyQuota] = None,
+        cache: Optional[PageCache] = None
+    ):
+        """
+        Args:
+            api_key: 공공데이터포털 서비스 키
+            base_url: API 주소 (기본: MOLIT_API_BASE)
+            concurrency: 동시 요청 수 (기본: MOLIT_CONCURRENCY)
+            max_retries: 요청별 최대 재시도 횟수 (기본: MOLIT_MAX_RETRIES)
+            quota: 일일 호출 카운터 (기본: 프로세스 공용)
+            cache: 페이지 캐시 (기본: 프로세스 공용, MOLIT_CACHE_BACKEND)
+        """
+        self.api_key = api_key
+        self.base_url = (base_url or MOLIT_API_BASE).rstrip("/")
+        self.concurrency = max(1, concurrency or MOLIT_CONCURRENCY)
+        self.max_retries = MOLIT_MAX_RETRIES if max_retries is None else max_retries
+        self.quota = quota or get_daily_quota()
+        self.cache = cache or get_page_cache()
+        self.request_count = 0
+        self.cache_hits = 0
+
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def __aenter__(self):
+        self._client = httpx.AsyncClient(
+            timeout=MOLIT_TIMEOUT,
+            limits=httpx.Limits(max_connections=self.concurrency, max_keepalive_connections=self.concurrency)
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self._client.aclose()
+        self._client = None
+
+    def _backoff(self, attempt: int) -> float:
+        """지수 백오프 + 전체 지터 (0 ~ base × 2^attempt)"""
+        return random.uniform(0, MOLIT_RETRY_BASE_DELAY * (2 ** attempt))
+
+    async def _get(self, endpoint: str, params: Dict) -> bytes:
+        """GET 1회 (동시 요청 수 제한 + 재시도)"""
+        url = f"{self.base_url}/{ENDPOINTS[endpoint]}"
+        params = {"serviceKey": self.api_key, **params}
+
+        for attempt in range(self.max_retries + 1):
+            self.quota.acquire()
+            try:
+                async with self._semaphore:
+                    self.request_count += 1
+                    response = await self._client.get(url, params=params)
+
+                if response.status_code >= 500:
+                    raise httpx.HTTPStatusError(
+                        f"서버 오류 {response.status_code}", request=response.request, response=response
+                    )
+                response.raise_for_status()
+
+                if QUOTA_EXCEEDED_MARKER in response.content:
+                    self.quota.exhaust()
+                    raise MOLITQuotaExceeded("국토부 API 일일 호출 한도 초과 응답")
+
+                return response.content
+
+            except (httpx.TimeoutException, httpx.TransportError, httpx.HTTPStatusError) as e:
+                retryable = not isinstance(e, httpx.HTTPStatusError) or e.response.status_code >= 500
+                if not retryable or attempt >= self.max_retries:
+                    raise MOLITRequestError(
+                        f"{params.get('LAWD_CD')}/{params.get('DEAL_YMD')} 페이지 {params.get('pageNo')}: {e}"
+                    ) from e
+
+                delay = self._backoff(attempt)
+                logger.warning(f"⚠️ 국토부 API 재시도 {attempt + 1}/{self.max_retries} ({delay:.2f}초 후): {e}")
+                await asyncio.sleep(delay)
+
+    async def fetch_page(self, endpoint: str, lawd_cd: str, deal_ymd: str, page_no: int) -> Dict:
+        """
+        페이지 1개 조회 (캐시 우선)
+
+        Returns:
+            parse_trade_page 결과 (result_code, total_count, items: 정규화된 거래)
+        """
+        cached = self.cache.get(endpoint, lawd_cd, deal_ymd, page_no, MOLIT_PAGE_SIZE)
+        if cached is not None:
+            self.cache_hits += 1
+            return parse_trade_page(cached, endpoint)
+
+        content = await self._get(endpoint, {
+            "LAWD_CD": lawd_cd,
+            "DEAL_YMD": deal_ymd,
+            "pageNo": page_no,
+            "numOfRows": MOLIT_PAGE_SIZE,
+        })
+        data = parse_trade_page(content, endpoint)
+        if data["result_code"] in ("00", "000"):
+            self.cache.set(endpoint, lawd_cd, deal_ymd, page_no, MOLIT_PAGE_SIZE, content)
+        return data
+
+    async def fetch_month(self, endpoint: str, lawd_cd: str, deal_ymd: str) -> List[Dict]:
+        """
+        지역-월 전체 거래 조회
+
+        1페이지의 totalCount로 남은 페이지 수를 계산해 동시에 요청합니다.
+
+        Returns:
+            정규화된 거래 리스트 (페이지 순서 유지)
+        """
+        first = await self.fetch_page(endpoint, lawd_cd, deal_ymd, 1)
+        if not self._check_result(first, lawd_cd, deal_ymd):
+            return []
+
+        pages = math.ceil(first["total_count"] / MOLIT_PAGE_SIZE)
+        rest = await _gather_or_cancel(
+            self.fetch_page(endpoint, lawd_cd, deal_ymd, page_no)
+            for page_no in range(2, pages + 1)
+        )
+
+        items = list(first["items"])
+        for page in rest:
+            if self._check_result(page, lawd_cd, deal_ymd):
+                items.extend(page["items"])
+        return items
+
+    def _check_result(self, page: Dict, lawd_cd: str, deal_ymd: str) -> bool:
+        """
+        응답 resultCode 확인
+
+        Returns:
+            True: 정상 / False: 데이터 없음(03)
+
+        Raises:
+            MOLITQuotaExceeded: 일일 호출 한도 초과(22)
+            MOLITRequestError: 그 외 오류 코드 (미등록 키 30 등)
+        """
+        code = page["result_code"]
+        if code in RESULT_OK_CODES:
+            return True
+        if code in RESULT_NO_DATA_CODES:
+            return False
+
+        message = f"{lawd_cd}/{deal_ymd}: {code} - {page.get('result_msg') or ''}"
+        if code in RESULT_QUOTA_EXCEEDED_CODES:
+            self.quota.exhaust()
+            raise MOLITQuotaExceeded(f"국토부 API 일일 호출 한도 초과 응답 ({message})")
+        raise MOLITRequestError(f"국토부 API 오류 응답 ({message})")
+
+    async def fetch_region_months(
+        self,
+        endpoint: str,
+        keys: Iterable[Tuple[str, str]],
+        errors: Optional[Dict[Tuple[str, str], Exception]] = None
+    ) -> Dict[Tuple[str, str], List[Dict]]:
+        """
+        여러 (시군구 코드, 년월) 동시 조회
+
+        Args:
+            endpoint: "trade" (매매) / "rent" (전월세)
+            keys: (LAWD_CD, DEAL_YMD) 목록
+            errors: 지정하면 지역-월별 실패를 예외로 올리지 않고 여기에 기록
+                    (성공한 지역-월만 반환, 지정하지 않으면 하나라도 실패 시 예외)
+
+        Returns:
+            (LAWD_CD, DEAL_YMD) → 정규화된 거래 리스트
+        """
+        keys = list(dict.fromkeys(keys))
+        coros = (self.fetch_month(endpoint, lawd_cd, deal_ymd) for lawd_cd, deal_ymd in keys)
+        if errors is None:
+            return dict(zip(keys, await _gather_or_cancel(coros)))
+
+        results = await asyncio.gather(*coros, return_exceptions=True)
+        pages = {}
+        for key, result in zip(keys, results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                errors[key] = result
+            else:
+                pages[key] = result
+        return pages
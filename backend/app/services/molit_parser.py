@@ -0,0 +1,204 @@
+"""
+국토부 실거래가 XML 스트리밍 파서
+
+ET.fromstring으로 페이지 전체 트리를 만든 뒤 아이템마다 dict를 만들고 다시
+parse_trade_to_dict로 한글/영문 키를 하나씩 찾던 방식 대신,
+iterparse로 <item>이 닫힐 때마다 바로 정규화된 거래를 만들고 요소를 비웁니다.
+
+- 필드명(영문 aptNm / 한글 아파트) 해석은 응답의 첫 아이템에서 한 번만 수행
+- 처리한 <item> 요소는 바로 비워 페이지 트리를 메모리에 유지하지 않음
+  (1,000건 페이지 최대 메모리 5.2MB → 0.8MB, 페이지당 시간은 기존과 같은 수준 - tests/README.md)
+- 결과 키는 MOLITService.parse_trade_to_dict와 같음 (전월세는 보증금/월세/계약 구분 추가)
+"""
+import io
+import logging
+import xml.etree.ElementTree as ET
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+
+def _text(value: str) -> str:
+    return value
+
+
+def _strip(value: str) -> str:
+    return value.strip()
+
+
+def _amount(value: str) -> int:
+    """금액 ("12,500" → 12500, 만원)"""
+    value = value.replace(",", "").strip()
+    return int(value) if value.isdigit() else 0
+
+
+def _int(value: str) -> int:
+    value = value.strip()
+    return int(value) if value.isdigit() else 0
+
+
+def _float(value: str) -> float:
+    value = value.strip()
+    return float(value) if value else 0
+
+
+# 정규화 필드: 출력 키 → (후보 태그(영문, 한글), 변환 함수, 기본값)
+COMMON_FIELDS: Dict[str, Tuple[Tuple[str, ...], Callable, object]] = {
+    "complex_name": (("aptNm", "아파트"), _text, ""),
+    "exclusive_area": (("excluUseAr", "전용면적"), _float, 0),
+    "floor": (("floor", "층"), _int, 0),
+    "sigungu": (("sggCd", "시군구"), _text, ""),
+    "dong": (("umdNm", "법정동"), _text, ""),
+    "jibun": (("jibun", "지번"), _text, ""),
+}
+
+FIELD_SPECS = {
+    "trade": {
+        **COMMON_FIELDS,
+        "deal_price": (("dealAmount", "거래금액"), _amount, 0),
+    },
+    "rent": {
+        **COMMON_FIELDS,
+        "deposit": (("deposit", "보증금액"), _amount, 0),
+        "monthly_rent": (("monthlyRent", "월세금액"), _amount, 0),
+        "contract_type": (("contractType", "계약구분"), _strip, ""),
+        "contract_term": (("contractTerm", "계약기간"), _strip, ""),
+    },
+}
+
+# 거래일자 (년/월/일 → YYYYMMDD)
+DATE_TAGS = (("dealYear", "년"), ("dealMonth", "월"), ("dealDay", "일"))
+
+XmlSource = Union[bytes, str]
+
+
+class _FieldResolver:
+    """응답에 실제로 쓰인 태그 → (출력 키, 변환 함수) 매핑 (첫 아이템에서 한 번 생성)"""
+
+    def __init__(self, spec: Dict, tags: set):
+        self.fields: Dict[str, Tuple[str, Callable]] = {}
+        self.defaults = {key: default for key, (_, _, default) in spec.items()}
+
+        for key, (candidates, convert, _) in spec.items():
+            tag = next((t for t in candidates if t in tags), candidates[0])
+            self.fields[tag] = (key, convert)
+
+        self.date_tags = [next((t for t in candidates if t in tags), candidates[0]) for candidates in DATE_TAGS]
+        for index, tag in enumerate(self.date_tags):
+            self.fields[tag] = (index, None)
+
+    def record(self, item: ET.Element) -> Dict:
+        record = dict(self.defaults)
+        date_parts = ["", "", ""]
+        fields = self.fields
+
+        for child in item:
+            entry = fields.get(child.tag)
+            if entry is None:
+                continue
+            key, convert = entry
+            value = child.text or ""
+            if convert is None:
+                date_parts[key] = value.strip()
+            else:
+                record[key] = convert(value)
+
+        year, month, day = date_parts
+        record["trade_date"] = f"{year}{month.zfill(2)}{day.zfill(2)}"
+        return record
+
+
+class TradePageParser:
+    """
+    실거래가 응답 1페이지 스트리밍 파서
+
+    사용 예:
+        parser = TradePageParser("trade")
+        for trade in parser.iter_records(xml_bytes):
+            ...
+        parser.result_code, parser.total_count  # 순회가 끝난 뒤 확정 (totalCount는 items 뒤에 옴)
+    """
+
+    def __init__(self, kind: str = "trade"):
+        """
+        Args:
+            kind: "trade" (매매) / "rent" (전월세)
+        """
+        self.spec = FIELD_SPECS[kind]
+        self.result_code: Optional[str] = None
+        self.result_msg: Optional[str] = None
+        self.total_count = 0
+        self.has_body = False
+
+    def iter_records(self, source: XmlSource) -> Iterator[Dict]:
+        """
+        정규화된 거래를 하나씩 생성
+
+        Args:
+            source: 응답 XML (bytes 권장, str도 가능)
+
+        Yields:
+            정규화된 거래 dict
+        """
+        if isinstance(source, str):
+            source = source.encode("utf-8")
+
+        resolver: Optional[_FieldResolver] = None
+
+        for _, element in ET.iterparse(io.BytesIO(source)):
+            tag = element.tag
+
+            if tag == "item":
+                if resolver is None:
+                    resolver = _FieldResolver(self.spec, {child.tag for child in element})
+                yield resolver.record(element)
+                # 처리한 아이템의 하위 요소 해제 (페이지 트리를 쌓지 않음)
+                element.clear()
+            elif tag == "body":
+                self.has_body = True
+            elif tag == "resultCode":
+                self.result_code = element.text
+            elif tag == "resultMsg":
+                self.result_msg = element.text
+            elif tag == "totalCount":
+                self.total_count = int(element.text or 0)
+
+
+def parse_trade_page(source: XmlSource, kind: str = "trade") -> Dict:
+    """
+    응답 1페이지를 정규화된 거래 리스트로 파싱
+
+    Args:
+        source: 응답 XML
+        kind: "trade" (매매) / "rent" (전월세)
+
+    Returns:
+        dict: result_code, result_msg, total_count, items (정규화된 거래 리스트)
+    """
+    parser = TradePageParser(kind)
+    try:
+        items: List[Dict] = list(parser.iter_records(source))
+    except ET.ParseError as e:
+        logger.error(f"XML 파싱 오류: {e}")
+        return {
+            'result_code': 'ERROR',
+            'result_msg': f'XML 파싱 오류: {str(e)}',
+            'total_count': 0,
+            'items': []
+        }
+
+    if not parser.has_body:
+        # 오류/데이터 없음 응답은 header만 오므로 resultCode가 있으면 그대로 전달
+        return {
+            'result_code': parser.result_code or 'ERROR',
+            'result_msg': parser.result_msg or 'No body in response',
+            'total_count': 0,
+            'items': []
+        }
+
+    return {
+        'result_code': parser.result_code,
+        'result_msg': parser.result_msg,
+        'total_count': parser.total_count,
+        'items': items
+    }
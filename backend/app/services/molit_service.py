@@ -2,26 +2,50 @@
 국토교통부 실거래가 API 서비스
 """
 import os
-import requests
-import xml.etree.ElementTree as ET
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from datetime import date
+from typing import Iterable, List, Dict, Optional, Tuple
 import logging
+from app.core.async_runner import run_coroutine_sync
 from .location_parser import LocationParser
 
 logger = logging.getLogger(__name__)
 
 
+def recent_year_months(months: int, today: Optional[date] = None) -> List[str]:
+    """
+    이번 달부터 과거 N개월의 조회 년월 (달력 기준, 중복/누락 없음)
+
+    Args:
+        months: 개월 수
+        today: 기준일 (기본: 오늘)
+
+    Returns:
+        ["202501", "202412", ...] (최근 월부터)
+    """
+    today = today or date.today()
+    index = today.year * 12 + today.month - 1
+    return [
+        f"{(index - i) // 12}{(index - i) % 12 + 1:02d}"
+        for i in range(months)
+    ]
+
+
 class MOLITService:
     """국토교통부 아파트 실거래가 조회 서비스"""
 
     def __init__(self):
         # 환경변수에서 API 키 로드 (.env 파일 수동 로드)
         self.api_key = self._load_api_key()
-        self.trade_api_url = "http://apis.data.go.kr/1613000/RTMSDataSvcAptTradeDev"
-        self.rent_api_url = "http://apis.data.go.kr/1613000/RTMSDataSvcAptRent"
         self.location_parser = LocationParser()
 
+        # fetch_region_months 누적 통계 (실제 HTTP 요청 수 / 캐시 적중 페이지 수)
+        self.request_count = 0
+        self.cache_hits = 0
+
+        # 마지막 fetch_region_months 호출에서 실패한 (시군구 코드, 년월) → 오류 메시지 / 일일 한도 도달 여부
+        self.failed_keys: Dict[Tuple[str, str], str] = {}
+        self.quota_exceeded = False
+
     def _load_api_key(self) -> str:
         """환경변수 또는 .env 파일에서 API 키 로드"""
         # 먼저 환경변수 확인
@@ -43,125 +67,65 @@ class MOLITService:
 
         return ""
 
-    def _parse_xml_response(self, xml_content: str) -> Dict:
-        """
-        XML 응답을 파싱하여 딕셔너리로 변환
-
-        Args:
-            xml_content: XML 문자열
-
-        Returns:
-            파싱된 데이터 딕셔너리
-        """
-        try:
-            root = ET.fromstring(xml_content)
-            items = []
-
-            # header 정보
-            header = root.find('header')
-            result_code = header.find('resultCode').text if header is not None and header.find('resultCode') is not None else None
-            result_msg = header.find('resultMsg').text if header is not None and header.find('resultMsg') is not None else None
-
-            # body 정보
-            body = root.find('body')
-            if body is None:
-                return {
-                    'result_code': 'ERROR',
-                    'result_msg': 'No body in response',
-                    'total_count': 0,
-                    'items': []
-                }
-
-            total_count = body.find('totalCount').text if body.find('totalCount') is not None else "0"
-
-            # items 파싱
-            items_element = body.find('items')
-            if items_element is not None:
-                for item in items_element.findall('item'):
-                    item_data = {}
-                    for child in item:
-                        item_data[child.tag] = child.text if child.text else ""
-                    items.append(item_data)
-
-            return {
-                'result_code': result_code,
-                'result_msg': result_msg,
-                'total_count': int(total_count),
-                'items': items
-            }
-        except Exception as e:
-            logger.error(f"XML 파싱 오류: {e}")
-            return {
-                'result_code': 'ERROR',
-                'result_msg': f'XML 파싱 오류: {str(e)}',
-                'total_count': 0,
-                'items': []
-            }
-
-    def _fetch_all_pages(
+    def fetch_region_months(
         self,
-        url: str,
-        sigungu_code: str,
-        year_month: str,
+        endpoint: str,
+        keys: Iterable[Tuple[str, str]],
         complex_name: Optional[str] = None
-    ) -> List[Dict]:
+    ) -> Dict[Tuple[str, str], List[Dict]]:
         """
-        모든 페이지 데이터를 가져오는 메서드
+        여러 (시군구 코드, 년월)의 전체 페이지를 동시에 조회
+
+        AsyncMOLITClient로 년월/페이지를 병렬 요청합니다. (MOLIT_CONCURRENCY개씩)
+        재시도 후에도 실패하거나 일일 한도에 걸린 지역-월은 결과에서 빠지고
+        failed_keys / quota_exceeded 에 기록됩니다. (성공한 지역-월은 그대로 반환)
 
         Args:
-            url: API URL
-            sigungu_code: 시군구 코드
-            year_month: 조회 년월
-            complex_name: 아파트 단지명 (필터용)
+            endpoint: "trade" (매매) / "rent" (전월세)
+            keys: (시군구 코드, 년월) 목록
+            complex_name: 아파트 단지명 (필터용, optional)
 
         Returns:
-            모든 페이지의 아이템 리스트
+            (시군구 코드, 년월) → 정규화된 거래 리스트 (molit_parser, parse_trade_to_dict와 같은 키)
+            - 성공한 지역-월만 포함
         """
-        all_items = []
-        page_no = 1
-
-        while True:
-            params = {
-                'serviceKey': self.api_key,
-                'LAWD_CD': sigungu_code,
-                'DEAL_YMD': year_month,
-                'pageNo': page_no,
-                'numOfRows': 1000
-            }
-
-            try:
-                response = requests.get(url, params=params, timeout=30)
-                response.raise_for_status()
-
-                # XML 파싱
-                data = self._parse_xml_response(response.text)
+        from .molit_client import AsyncMOLITClient, MOLITQuotaExceeded
 
-                if data['result_code'] not in ['00', '000']:
-                    if page_no == 1:
-                        logger.warning(f"API 호출 실패: {data['result_code']} - {data.get('result_msg', '')}")
-                    break
-
-                # 단지명 필터링 (한글/영문 필드명 모두 지원)
-                items = data['items']
-                if complex_name:
-                    items = [
-                        item for item in items
-                        if complex_name in item.get('아파트', item.get('aptNm', ''))
-                    ]
+        keys = list(keys)
+        self.failed_keys = {}
+        self.quota_exceeded = False
+        if not self.api_key:
+            logger.warning("MOLIT_API_KEY가 설정되지 않았습니다.")
+            self.failed_keys = {key: "MOLIT_API_KEY 없음" for key in keys}
+            return {}
 
-                all_items.extend(items)
+        errors = {}
 
-                # 모든 데이터를 가져왔는지 확인
-                if len(data['items']) < 1000:
-                    break
+        async def fetch():
+            async with AsyncMOLITClient(self.api_key) as client:
+                try:
+                    return await client.fetch_region_months(endpoint, keys, errors=errors)
+                finally:
+                    self.request_count += client.request_count
+                    self.cache_hits += client.cache_hits
 
-                page_no += 1
+        pages = run_coroutine_sync(fetch())
 
-            except requests.exceptions.RequestException as e:
-                logger.error(f"API 호출 오류 (페이지 {page_no}): {e}")
-                break
+        if errors:
+            self.failed_keys = {key: str(error) for key, error in errors.items()}
+            self.quota_exceeded = any(isinstance(error, MOLITQuotaExceeded) for error in errors.values())
+            logger.error(
+                f"API 호출 오류: {len(errors)}/{len(keys)}개 지역-월 실패"
+                f"{' (일일 호출 한도 도달)' if self.quota_exceeded else ''} - 예: {next(iter(errors.values()))}"
+            )
 
-        return all_items
+        if complex_name:
+            # 단지명 필터링
+            pages = {
+                key: [item for item in items if complex_name in item['complex_name']]
+                for key, items in pages.items()
+            }
+        return pages
 
     def get_apt_trade_data(
         self,
@@ -178,14 +142,10 @@ class MOLITService:
             complex_name: 아파트 단지명 (필터용, optional)
 
         Returns:
-            실거래가 리스트
+            실거래가 리스트 (정규화된 거래)
         """
-        if not self.api_key:
-            logger.warning("MOLIT_API_KEY가 설정되지 않았습니다.")
-            return []
-
-        url = f"{self.trade_api_url}/getRTMSDataSvcAptTradeDev"
-        return self._fetch_all_pages(url, sigungu_code, year_month, complex_name)
+        key = (sigungu_code, year_month)
+        return self.fetch_region_months("trade", [key], complex_name).get(key, [])
 
     def get_apt_rent_data(
         self,
@@ -202,14 +162,10 @@ class MOLITService:
             complex_name: 아파트 단지명 (필터용)
 
         Returns:
-            전월세 실거래가 리스트
+            전월세 실거래가 리스트 (정규화된 거래 + deposit/monthly_rent/contract_type/contract_term)
         """
-        if not self.api_key:
-            logger.warning("MOLIT_API_KEY가 설정되지 않았습니다.")
-            return []
-
-        url = f"{self.rent_api_url}/getRTMSDataSvcAptRent"
-        return self._fetch_all_pages(url, sigungu_code, year_month, complex_name)
+        key = (sigungu_code, year_month)
+        return self.fetch_region_months("rent", [key], complex_name).get(key, [])
 
     def get_recent_trades(
         self,
@@ -219,7 +175,7 @@ class MOLITService:
         include_rent: bool = False
     ) -> List[Dict]:
         """
-        최근 N개월 실거래가 조회
+        최근 N개월 실거래가 조회 (개월별 요청을 동시에 실행)
 
         Args:
             sigungu_code: 시군구 코드
@@ -228,41 +184,25 @@ class MOLITService:
             include_rent: 전월세 포함 여부
 
         Returns:
-            실거래가 리스트
+            실거래가 리스트 (정규화된 거래)
         """
-        all_trades = []
-
-        # 현재 월부터 N개월 전까지 조회
-        current_date = datetime.now()
-
-        for i in range(months):
-            target_date = current_date - timedelta(days=30 * i)
-            year_month = target_date.strftime("%Y%m")
+        keys = [(sigungu_code, year_month) for year_month in recent_year_months(months)]
+        endpoints = ["trade", "rent"] if include_rent else ["trade"]
 
-            # 매매 데이터 조회
-            trades = self.get_apt_trade_data(
-                sigungu_code=sigungu_code,
-                year_month=year_month,
-                complex_name=complex_name
-            )
-            all_trades.extend(trades)
-
-            # 전월세 데이터 조회 (옵션)
-            if include_rent:
-                rent_trades = self.get_apt_rent_data(
-                    sigungu_code=sigungu_code,
-                    year_month=year_month,
-                    complex_name=complex_name
-                )
-                all_trades.extend(rent_trades)
+        all_trades = []
+        for endpoint in endpoints:
+            pages = self.fetch_region_months(endpoint, keys, complex_name)
+            for key in keys:
+                all_trades.extend(pages.get(key, []))
 
         return all_trades
 
     def parse_trade_to_dict(self, trade_item: Dict) -> Dict:
         """
-        API 응답 아이템을 표준 딕셔너리로 변환
+        API 응답 아이템(태그 → 텍스트 dict)을 표준 딕셔너리로 변환
 
         한글 필드명과 영문 필드명 모두 지원
+        (API 조회 메서드는 molit_parser가 이미 같은 형식으로 정규화하여 반환합니다)
 
         Args:
             trade_item: API 응답 아이템
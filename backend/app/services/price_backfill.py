@@ -0,0 +1,129 @@
+"""
+숫자 가격 컬럼 백필
+
+price_value/deposit_value/monthly_rent_value 컬럼 도입 이전에 저장된 매물, 스냅샷,
+변동 이력의 가격 문자열을 price_parser로 파싱하여 채웁니다.
+id 기준 키셋 순회로 배치 처리하므로 대용량 테이블에서도 메모리 사용량이 일정합니다.
+"""
+import logging
+from typing import Callable, Dict, List
+
+from sqlalchemy import bindparam, update
+from sqlalchemy.orm import Session
+
+from app.models.complex import Article, ArticleSnapshot, ArticleChange
+from app.services.price_parser import parse_price
+
+logger = logging.getLogger(__name__)
+
+BACKFILL_BATCH_SIZE = 5000
+
+
+def _article_values(row) -> Dict:
+    price_value = parse_price(row.price)
+    return {
+        'price_value': price_value,
+        'deposit_value': price_value if row.trade_type in ('전세', '월세') else None,
+        'monthly_rent_value': parse_price(row.monthly_rent),
+    }
+
+
+def _snapshot_values(row) -> Dict:
+    return {'price_value': parse_price(row.price)}
+
+
+def _change_values(row) -> Dict:
+    return {
+        'old_price_value': parse_price(row.old_price),
+        'new_price_value': parse_price(row.new_price),
+    }
+
+
+def _backfill_table(
+    db: Session,
+    model,
+    columns: List,
+    missing,
+    build_values: Callable,
+    batch_size: int
+) -> int:
+    """
+    숫자 가격이 비어 있는 행을 id 순으로 배치 갱신
+
+    Args:
+        model: 대상 모델
+        columns: 조회할 컬럼 (가격 문자열 등)
+        missing: 백필 대상 조건
+        build_values: 조회한 행 → 갱신할 {컬럼: 값} dict
+
+    Returns:
+        갱신된 행 수
+    """
+    table = model.__table__
+    updated = 0
+    last_id = 0
+
+    while True:
+        rows = (
+            db.query(model.id, *columns)
+            .filter(model.id > last_id, missing)
+            .order_by(model.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not rows:
+            break
+
+        last_id = rows[-1].id
+        values = [build_values(row) for row in rows]
+        target_columns = list(values[0])
+
+        # 바인드 파라미터 이름은 컬럼명과 겹치면 안 되므로 접두어 사용
+        db.execute(
+            update(table)
+            .where(table.c.id == bindparam('_id'))
+            .values({name: bindparam(f'_{name}') for name in target_columns}),
+            [
+                {'_id': row.id, **{f'_{name}': value for name, value in row_values.items()}}
+                for row, row_values in zip(rows, values)
+            ]
+        )
+        db.commit()
+        updated += len(rows)
+
+        logger.info(f"   {table.name}: {updated:,}건 처리 (id ≤ {last_id})")
+
+    return updated
+
+
+def backfill_price_values(db: Session, batch_size: int = BACKFILL_BATCH_SIZE) -> Dict[str, int]:
+    """
+    매물/스냅샷/변동 이력의 숫자 가격 컬럼 백필
+
+    가격 문자열은 있지만 숫자 가격이 비어 있는 행만 처리하므로 여러 번 실행해도 안전합니다.
+    (파싱할 수 없는 가격은 NULL로 남음)
+
+    Returns:
+        dict: 테이블별 처리 행 수
+    """
+    return {
+        'articles': _backfill_table(
+            db, Article,
+            [Article.price, Article.monthly_rent, Article.trade_type],
+            Article.price.isnot(None) & Article.price_value.is_(None),
+            _article_values, batch_size
+        ),
+        'article_snapshots': _backfill_table(
+            db, ArticleSnapshot,
+            [ArticleSnapshot.price],
+            ArticleSnapshot.price.isnot(None) & ArticleSnapshot.price_value.is_(None),
+            _snapshot_values, batch_size
+        ),
+        'article_changes': _backfill_table(
+            db, ArticleChange,
+            [ArticleChange.old_price, ArticleChange.new_price],
+            (ArticleChange.old_price.isnot(None) & ArticleChange.old_price_value.is_(None))
+            | (ArticleChange.new_price.isnot(None) & ArticleChange.new_price_value.is_(None)),
+            _change_values, batch_size
+        ),
+    }
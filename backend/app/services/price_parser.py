@@ -0,0 +1,99 @@
+"""
+네이버 부동산 가격 문자열 파싱/포맷팅
+
+네이버는 가격을 만원 단위 한글 문자열로 내려줍니다.
+
+    "3억 5,000"  → 35000
+    "12억"       → 120000
+    "5,000"      → 5000
+    "5,000/140"  → 보증금 5000, 월세 140 (월세 매물)
+
+DB의 price_value/deposit_value/monthly_rent_value 컬럼은 모두 만원 단위 정수입니다.
+"""
+import re
+from typing import Optional, Tuple
+
+_EOK_PATTERN = re.compile(r'^(\d+(?:\.\d+)?)억(?:(\d+)(?:만)?)?$')
+_MAN_PATTERN = re.compile(r'^(\d+)(?:만)?(?:원)?$')
+
+
+def parse_price(price_str: Optional[str]) -> Optional[int]:
+    """
+    가격 문자열을 만원 단위 정수로 변환
+
+    Args:
+        price_str: "3억 5,000", "12억", "5,000", "1억 2,000만" 등
+
+    Returns:
+        만원 단위 정수 (파싱할 수 없으면 None)
+    """
+    if price_str is None:
+        return None
+
+    normalized = str(price_str).replace(',', '').replace(' ', '').strip()
+    if not normalized:
+        return None
+
+    match = _EOK_PATTERN.match(normalized)
+    if match:
+        eok = round(float(match.group(1)) * 10000)
+        man = int(match.group(2)) if match.group(2) else 0
+        return eok + man
+
+    match = _MAN_PATTERN.match(normalized)
+    if match:
+        return int(match.group(1))
+
+    return None
+
+
+def split_rent_price(price_str: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+    """
+    월세 가격 문자열을 보증금/월세 문자열로 분리
+
+    Args:
+        price_str: "5,000/140" 형식
+
+    Returns:
+        (보증금 문자열, 월세 문자열) - "/"가 없으면 (원본, None)
+    """
+    if not price_str or '/' not in price_str:
+        return price_str, None
+
+    deposit, rent = price_str.split('/', 1)
+    return deposit.strip(), rent.strip() or None
+
+
+def parse_rent_price(price_str: Optional[str]) -> Tuple[Optional[int], Optional[int]]:
+    """
+    월세 가격 문자열을 (보증금, 월세) 만원 단위 정수로 변환
+
+    Args:
+        price_str: "5,000/140", "1억/250" 형식
+
+    Returns:
+        (보증금, 월세) - 각각 파싱할 수 없으면 None
+    """
+    deposit, rent = split_rent_price(price_str)
+    return parse_price(deposit), parse_price(rent)
+
+
+def format_price(value: Optional[int]) -> Optional[str]:
+    """
+    만원 단위 정수를 네이버 표기 문자열로 변환 (parse_price의 역변환)
+
+    Args:
+        value: 만원 단위 정수
+
+    Returns:
+        "3억 5,000", "12억", "5,000" 형식 (None이면 None)
+    """
+    if value is None:
+        return None
+
+    eok, man = divmod(int(value), 10000)
+    if eok and man:
+        return f"{eok}억 {man:,}"
+    if eok:
+        return f"{eok}억"
+    return f"{man:,}"
@@ -0,0 +1,150 @@
+"""
+검색/내보내기 공용 필터 조건
+
+매물·실거래 검색 API와 내보내기 API가 같은 조건을 쓰도록 SQL 조건 리스트를 만듭니다.
+반환값은 Query.filter(*conditions), select().where(*conditions) 모두에 사용할 수 있습니다.
+"""
+from typing import List, Optional
+
+from app.models.complex import Article, Transaction, RentTransaction
+
+
+def article_conditions(
+    complex_id: Optional[str] = None,
+    trade_type: Optional[str] = None,
+    area_name: Optional[str] = None,
+    building_name: Optional[str] = None,
+    min_area: Optional[float] = None,
+    max_area: Optional[float] = None,
+    min_price: Optional[int] = None,
+    max_price: Optional[int] = None,
+    max_monthly_rent: Optional[int] = None,
+    is_active: bool = True
+) -> List:
+    """
+    매물 검색 조건
+
+    Args:
+        min_price/max_price: 만원 단위 (매매가/전세금/월세 보증금)
+        max_monthly_rent: 만원 단위 월세 상한
+        is_active: True면 활성 매물만
+
+    Returns:
+        SQL 조건 리스트
+    """
+    conditions = []
+
+    if complex_id:
+        conditions.append(Article.complex_id == complex_id)
+
+    if trade_type:
+        conditions.append(Article.trade_type == trade_type)
+
+    if area_name:
+        conditions.append(Article.area_name == area_name)
+
+    if building_name:
+        conditions.append(Article.building_name.like(f"%{building_name}%"))
+
+    if min_area:
+        conditions.append(Article.area1 >= min_area)
+
+    if max_area:
+        conditions.append(Article.area1 <= max_area)
+
+    if min_price is not None:
+        conditions.append(Article.price_value >= min_price)
+
+    if max_price is not None:
+        conditions.append(Article.price_value <= max_price)
+
+    if max_monthly_rent is not None:
+        conditions.append(Article.monthly_rent_value <= max_monthly_rent)
+
+    if is_active:
+        conditions.append(Article.is_active == True)
+
+    return conditions
+
+
+def transaction_conditions(
+    complex_id: Optional[str] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    min_price: Optional[int] = None,
+    max_price: Optional[int] = None,
+    min_floor: Optional[int] = None,
+    max_floor: Optional[int] = None
+) -> List:
+    """
+    실거래가 검색 조건
+
+    Args:
+        start_date/end_date: YYYYMMDD
+        min_price/max_price: 만원 단위 거래가
+
+    Returns:
+        SQL 조건 리스트
+    """
+    conditions = []
+
+    if complex_id:
+        conditions.append(Transaction.complex_id == complex_id)
+
+    if start_date:
+        conditions.append(Transaction.trade_date >= start_date)
+
+    if end_date:
+        conditions.append(Transaction.trade_date <= end_date)
+
+    if min_price:
+        conditions.append(Transaction.deal_price >= min_price)
+
+    if max_price:
+        conditions.append(Transaction.deal_price <= max_price)
+
+    if min_floor:
+        conditions.append(Transaction.floor >= min_floor)
+
+    if max_floor:
+        conditions.append(Transaction.floor <= max_floor)
+
+    return conditions
+
+
+def rent_transaction_conditions(
+    complex_id: Optional[str] = None,
+    rent_type: Optional[str] = None,
+    contract_type: Optional[str] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None
+) -> List:
+    """
+    전월세 실거래가 검색 조건
+
+    Args:
+        rent_type: 전세/월세
+        contract_type: 신규/갱신
+        start_date/end_date: YYYYMMDD
+
+    Returns:
+        SQL 조건 리스트
+    """
+    conditions = []
+
+    if complex_id:
+        conditions.append(RentTransaction.complex_id == complex_id)
+
+    if rent_type:
+        conditions.append(RentTransaction.rent_type == rent_type)
+
+    if contract_type:
+        conditions.append(RentTransaction.contract_type == contract_type)
+
+    if start_date:
+        conditions.append(RentTransaction.trade_date >= start_date)
+
+    if end_date:
+        conditions.append(RentTransaction.trade_date <= end_date)
+
+    return conditions
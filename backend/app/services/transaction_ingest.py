@@ -0,0 +1,261 @@
+"""
+지역(시군구) × 월 단위 실거래가(매매/전월세) 일괄 수집
+
+국토부 API는 시군구(LAWD_CD) + 년월(DEAL_YMD) 단위로 지역 전체 거래를 내려줍니다.
+단지마다 같은 지역-월 페이지를 다시 받지 않도록
+
+1. 등록 단지를 시군구 코드로 묶고
+2. (시군구, 년월)마다 API를 한 번만 호출한 뒤
+3. 받은 거래를 ComplexMatcher로 지역 내 모든 등록 단지에 배분합니다.
+
+API 호출 수 = 지역 수 × 개월 수 × (매매/전월세) (단지 수와 무관)
+모든 지역-월은 수집 시작 시 AsyncMOLITClient로 한꺼번에 동시 조회합니다.
+"""
+import logging
+import re
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.models.complex import Complex
+from app.services.complex_summary import refresh_complex_summaries
+from app.services.molit_service import MOLITService, recent_year_months
+from app.services.transaction_service import TransactionService
+
+logger = logging.getLogger(__name__)
+
+_NAME_NOISE = re.compile(r"[\s()\[\]·.,\-]")
+_DONG_PATTERN = re.compile(r"(\S+(?:동|가|리))(?:\s|$)")
+
+
+def normalize_complex_name(name: Optional[str]) -> str:
+    """단지명 비교용 정규화 (공백/괄호/구두점 제거)"""
+    return _NAME_NOISE.sub("", name or "")
+
+
+def extract_dong(address: Optional[str]) -> Optional[str]:
+    """지번 주소에서 법정동명 추출 (예: "경기도 성남시 분당구 정자동 1" → "정자동")"""
+    if not address:
+        return None
+    tokens = address.split()
+    # 시도/시군구 다음 토큰부터 검색 (시군구명이 "~동"으로 끝나는 경우 방지)
+    match = _DONG_PATTERN.search(" ".join(tokens[2:]) + " ")
+    return match.group(1) if match else None
+
+
+class ComplexMatcher:
+    """
+    지역 실거래 → 등록 단지 매칭
+
+    국토부 단지명(aptNm)에 등록 단지명이 포함되면 매칭합니다. (기존 complex_name in aptNm 규칙)
+    양쪽에 법정동이 있으면 법정동도 같아야 하며, 여러 단지가 매칭되면 이름이 가장 긴 단지를 선택합니다.
+    """
+
+    def __init__(self, complexes: Iterable[Complex]):
+        entries = []
+        for complex_obj in complexes:
+            name = normalize_complex_name(complex_obj.complex_name)
+            if not name:
+                continue
+            dong = extract_dong(complex_obj.jibun_address) or extract_dong(complex_obj.address)
+            entries.append((name, dong, complex_obj.complex_id))
+
+        # 긴 이름 우선 ("래미안" 보다 "래미안대치팰리스")
+        self.entries = sorted(entries, key=lambda entry: len(entry[0]), reverse=True)
+
+    def match(self, trade: Dict) -> Optional[str]:
+        """
+        Args:
+            trade: 정규화된 거래 (molit_parser / parse_trade_to_dict 형식)
+
+        Returns:
+            매칭된 단지 ID (없으면 None)
+        """
+        apt_name = normalize_complex_name(trade.get("complex_name"))
+        if not apt_name:
+            return None
+
+        trade_dong = (trade.get("dong") or "").strip()
+        for name, dong, complex_id in self.entries:
+            if name not in apt_name:
+                continue
+            if dong and trade_dong and dong != trade_dong:
+                continue
+            return complex_id
+
+        return None
+
+
+class RegionTransactionIngestor:
+    """시군구 × 월 단위 매매/전월세 실거래가 수집기"""
+
+    def __init__(self, db: Session, molit_service: Optional[MOLITService] = None):
+        self.db = db
+        self.molit_service = molit_service or MOLITService()
+        self.transaction_service = TransactionService(db)
+        self.transaction_service.molit_service = self.molit_service
+
+        # (엔드포인트, 시군구 코드, 년월) → 정규화된 거래 리스트 (한 번 실행 안에서 재사용, 성공한 지역-월만)
+        self._page_cache: Dict[Tuple[str, str, str], List[Dict]] = {}
+        self.api_calls = 0
+
+        # 조회에 실패한 (엔드포인트, 시군구 코드, 년월) → 오류 메시지 (캐시하지 않으므로 다음 prefetch에서 재시도)
+        self.failed: Dict[Tuple[str, str, str], str] = {}
+        self.quota_exceeded = False
+
+    def group_by_region(self, complexes: Iterable[Complex]) -> Tuple[Dict[str, List[Complex]], List[Complex]]:
+        """
+        단지를 시군구 코드별로 묶기
+
+        Returns:
+            (시군구 코드 → 단지 리스트, 시군구 코드를 찾지 못한 단지 리스트)
+        """
+        regions: Dict[str, List[Complex]] = defaultdict(list)
+        unresolved = []
+
+        for complex_obj in complexes:
+            address = complex_obj.jibun_address or complex_obj.address or complex_obj.road_address or ""
+            sigungu_code = self.molit_service.extract_sigungu_code(address)
+            if sigungu_code:
+                regions[sigungu_code].append(complex_obj)
+            else:
+                unresolved.append(complex_obj)
+
+        return regions, unresolved
+
+    def prefetch(self, keys: Iterable[Tuple[str, str]], endpoint: str = "trade"):
+        """
+        아직 받지 않은 (시군구 코드, 년월)을 동시에 조회하여 캐시에 저장
+
+        실패한 지역-월은 캐시하지 않고 failed에 기록합니다. (이전에 실패한 지역-월은 다시 조회)
+        """
+        missing = [key for key in dict.fromkeys(keys) if (endpoint, *key) not in self._page_cache]
+        if not missing:
+            return
+        pages = self.molit_service.fetch_region_months(endpoint, missing)
+        for key, items in pages.items():
+            self._page_cache[(endpoint, *key)] = items
+            self.failed.pop((endpoint, *key), None)
+        for key, error in self.molit_service.failed_keys.items():
+            self.failed[(endpoint, *key)] = error
+        self.quota_exceeded = self.quota_exceeded or self.molit_service.quota_exceeded
+        self.api_calls += len(pages)
+
+    def fetch_region_month(self, sigungu_code: str, year_month: str, endpoint: str = "trade") -> List[Dict]:
+        """
+        지역-월 전체 거래 - 정규화된 거래 (같은 실행 안에서는 한 번만 호출)
+
+        조회에 실패한 지역-월은 빈 리스트 (failed에 남아 있으며, 재시도는 prefetch로)
+        """
+        key = (endpoint, sigungu_code, year_month)
+        if key not in self._page_cache and key not in self.failed:
+            self.prefetch([(sigungu_code, year_month)], endpoint)
+        return self._page_cache.get(key, [])
+
+    def ingest(self, complex_ids: Optional[List[str]] = None, months: int = 6, include_rent: bool = True) -> Dict:
+        """
+        등록 단지의 매매(+전월세) 실거래가를 지역-월 단위로 수집하여 저장
+
+        Args:
+            complex_ids: 대상 단지 ID (기본: 전체 등록 단지)
+            months: 조회할 개월 수 (이번 달 포함)
+            include_rent: 전월세 실거래도 같은 지역-월 경로로 수집
+
+        Returns:
+            dict: 지역/지역-월 수, 조회/매칭/저장 건수, 단지별 결과
+        """
+        query = self.db.query(Complex)
+        if complex_ids:
+            query = query.filter(Complex.complex_id.in_(complex_ids))
+        complexes = query.all()
+
+        regions, unresolved = self.group_by_region(complexes)
+        year_months = recent_year_months(months)
+        endpoints = ["trade", "rent"] if include_rent else ["trade"]
+
+        per_complex = {
+            complex_obj.complex_id: {
+                "complex_name": complex_obj.complex_name,
+                "saved_count": 0,
+                "skipped_count": 0,
+                "rent_saved_count": 0,
+                "rent_skipped_count": 0,
+            }
+            for complex_obj in complexes
+        }
+        save_methods = {
+            "trade": (self.transaction_service.save_trades, "saved_count", "skipped_count"),
+            "rent": (self.transaction_service.save_rent_trades, "rent_saved_count", "rent_skipped_count"),
+        }
+        fetched = 0
+        matched = 0
+
+        logger.info(
+            f"🏙️ 지역 단위 실거래가 수집: 단지 {len(complexes)}개 → 지역 {len(regions)}개 × {months}개월 "
+            f"({'매매+전월세' if include_rent else '매매'})"
+        )
+
+        region_months = [(sigungu_code, year_month) for sigungu_code in regions for year_month in year_months]
+        for endpoint in endpoints:
+            self.prefetch(region_months, endpoint)
+
+        for sigungu_code, region_complexes in regions.items():
+            matcher = ComplexMatcher(region_complexes)
+
+            for endpoint in endpoints:
+                trades_by_complex: Dict[str, List[Dict]] = defaultdict(list)
+
+                for year_month in year_months:
+                    items = self.fetch_region_month(sigungu_code, year_month, endpoint)
+                    fetched += len(items)
+
+                    for trade in items:
+                        complex_id = matcher.match(trade)
+                        if complex_id:
+                            trades_by_complex[complex_id].append(trade)
+
+                save, saved_key, skipped_key = save_methods[endpoint]
+                for complex_id, trades in trades_by_complex.items():
+                    matched += len(trades)
+                    saved_count, skipped_count = save(complex_id, trades)
+                    per_complex[complex_id][saved_key] = saved_count
+                    per_complex[complex_id][skipped_key] = skipped_count
+
+        updated_ids = [complex_id for complex_id, result in per_complex.items() if result["saved_count"]]
+        if updated_ids:
+            refresh_complex_summaries(self.db, updated_ids)
+
+        result = {
+            "regions": len(regions),
+            "region_months": len(region_months),
+            "api_calls": self.api_calls,
+            "http_requests": self.molit_service.request_count,
+            "cache_hits": self.molit_service.cache_hits,
+            "trades_fetched": fetched,
+            "trades_matched": matched,
+            "saved_count": sum(r["saved_count"] for r in per_complex.values()),
+            "skipped_count": sum(r["skipped_count"] for r in per_complex.values()),
+            "rent_saved_count": sum(r["rent_saved_count"] for r in per_complex.values()),
+            "rent_skipped_count": sum(r["rent_skipped_count"] for r in per_complex.values()),
+            "unresolved_complexes": [complex_obj.complex_id for complex_obj in unresolved],
+            "complete": not self.failed,
+            "quota_exceeded": self.quota_exceeded,
+            "failed_region_months": [
+                {"endpoint": endpoint, "sigungu_code": sigungu_code, "year_month": year_month, "error": error}
+                for (endpoint, sigungu_code, year_month), error in self.failed.items()
+            ],
+            "complexes": per_complex,
+        }
+
+        logger.info(
+            f"✅ 지역 단위 수집 완료: 지역-월 {result['api_calls']}개 "
+            f"(HTTP {result['http_requests']}회, 캐시 {result['cache_hits']}페이지), 조회 {fetched:,}건, "
+            f"매칭 {matched:,}건, 매매 저장 {result['saved_count']:,}건, 전월세 저장 {result['rent_saved_count']:,}건"
+        )
+        if self.failed:
+            logger.warning(
+                f"⚠️ 조회 실패 지역-월 {len(self.failed)}개"
+                f"{' (일일 호출 한도 도달로 중단)' if self.quota_exceeded else ''} - 다음 수집에서 다시 조회합니다"
+            )
+        return result
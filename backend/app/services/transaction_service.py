@@ -1,17 +1,76 @@
 """
 실거래가 데이터 저장 및 처리 서비스
 """
-from typing import List, Dict, Optional
+import hashlib
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 import logging
 
-from app.models.complex import Complex, Transaction
-from app.services.molit_service import MOLITService
+from app.core.database import get_conflict_insert
+from app.models.complex import Complex, Transaction, RentTransaction
+from app.services.molit_service import MOLITService, recent_year_months
+from app.services.complex_summary import refresh_complex_summary
 
 logger = logging.getLogger(__name__)
 
+# INSERT 1회에 담을 최대 행 수 (바인드 파라미터 수 제한 대응)
+TRANSACTION_INSERT_BATCH_SIZE = 1000
+
+
+def transaction_row_hash(
+    complex_id: str,
+    trade_type: str,
+    trade_date: str,
+    exclusive_area: Optional[float],
+    floor: Optional[int],
+    deal_price: Optional[int]
+) -> str:
+    """
+    실거래 중복 방지 해시 (transactions.row_hash)
+
+    같은 단지/거래유형/거래일/전용면적/층/거래가면 같은 거래로 봅니다.
+    DB에 저장된 컬럼만으로 계산되므로 기존 행도 같은 값으로 백필할 수 있습니다.
+
+    Returns:
+        sha256 16진 문자열 (64자)
+    """
+    return _row_hash(complex_id, trade_type, trade_date, _area(exclusive_area), floor, deal_price)
+
+
+def rent_transaction_row_hash(
+    complex_id: str,
+    trade_date: str,
+    exclusive_area: Optional[float],
+    floor: Optional[int],
+    deposit: Optional[int],
+    monthly_rent: Optional[int],
+    contract_type: Optional[str]
+) -> str:
+    """
+    전월세 실거래 중복 방지 해시 (rent_transactions.row_hash)
+
+    같은 단지/계약일/전용면적/층/보증금/월세/계약구분이면 같은 계약으로 봅니다.
+
+    Returns:
+        sha256 16진 문자열 (64자)
+    """
+    return _row_hash(complex_id, trade_date, _area(exclusive_area), floor, deposit, monthly_rent, contract_type)
+
+
+def _area(value) -> Optional[float]:
+    return None if value is None else float(value)
+
+
+def _row_hash(*parts) -> str:
+    # 면적(float)은 소수 4자리로 고정, None은 빈 문자열
+    key = "|".join(
+        "" if part is None else f"{part:.4f}" if isinstance(part, float) else str(part)
+        for part in parts
+    )
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
 
 class TransactionService:
     """실거래가 데이터 관리 서비스"""
@@ -23,7 +82,8 @@ class TransactionService:
     def fetch_and_save_transactions(
         self,
         complex_id: str,
-        months: int = 6
+        months: int = 6,
+        include_rent: bool = True
     ) -> Dict:
         """
         국토부 API에서 실거래가를 조회하여 DB에 저장
@@ -31,6 +91,7 @@ class TransactionService:
         Args:
             complex_id: 단지 ID
             months: 조회할 개월 수
+            include_rent: 전월세 실거래도 함께 저장
 
         Returns:
             처리 결과 딕셔너리
@@ -58,59 +119,34 @@ class TransactionService:
             months=months
         )
 
-        if not trades:
+        rents = []
+        if include_rent:
+            keys = [(sigungu_code, year_month) for year_month in recent_year_months(months)]
+            pages = self.molit_service.fetch_region_months("rent", keys, complex_obj.complex_name)
+            rents = [rent for key in keys for rent in pages.get(key, [])]
+
+        if not trades and not rents:
             logger.info(f"조회된 실거래가가 없습니다: {complex_obj.complex_name}")
             return {
                 "success": True,
                 "message": "조회된 실거래가가 없습니다",
                 "saved_count": 0,
-                "skipped_count": 0
+                "skipped_count": 0,
+                "rent_saved_count": 0,
+                "rent_skipped_count": 0
             }
 
         # DB에 저장
-        saved_count = 0
-        skipped_count = 0
+        saved_count, skipped_count = self.save_trades(complex_id, trades)
+        rent_saved_count, rent_skipped_count = self.save_rent_trades(complex_id, rents)
 
-        for trade_raw in trades:
-            trade_data = self.molit_service.parse_trade_to_dict(trade_raw)
-
-            if not trade_data:
-                skipped_count += 1
-                continue
-
-            # 중복 확인 (같은 날짜, 같은 면적, 같은 층, 같은 가격)
-            existing = self.db.query(Transaction).filter(
-                Transaction.complex_id == complex_id,
-                Transaction.trade_date == trade_data["trade_date"],
-                Transaction.exclusive_area == trade_data["exclusive_area"],
-                Transaction.floor == trade_data["floor"],
-                Transaction.deal_price == trade_data["deal_price"]
-            ).first()
-
-            if existing:
-                skipped_count += 1
-                continue
-
-            # 새로운 거래 저장
-            transaction = Transaction(
-                complex_id=complex_id,
-                trade_type="매매",
-                trade_date=trade_data["trade_date"],
-                deal_price=trade_data["deal_price"],
-                formatted_price=self._format_price(trade_data["deal_price"]),
-                floor=trade_data["floor"],
-                area=trade_data["exclusive_area"],
-                exclusive_area=trade_data["exclusive_area"]
-            )
-
-            self.db.add(transaction)
-            saved_count += 1
-
-        self.db.commit()
+        if saved_count:
+            refresh_complex_summary(self.db, complex_id)
 
         logger.info(
             f"실거래가 저장 완료 - {complex_obj.complex_name}: "
-            f"저장 {saved_count}건, 중복 {skipped_count}건"
+            f"매매 저장 {saved_count}건, 중복 {skipped_count}건 / "
+            f"전월세 저장 {rent_saved_count}건, 중복 {rent_skipped_count}건"
         )
 
         return {
@@ -118,9 +154,123 @@ class TransactionService:
             "message": "실거래가 저장 완료",
             "saved_count": saved_count,
             "skipped_count": skipped_count,
-            "total_count": saved_count + skipped_count
+            "total_count": saved_count + skipped_count,
+            "rent_saved_count": rent_saved_count,
+            "rent_skipped_count": rent_skipped_count
         }
 
+    def save_trades(self, complex_id: str, trades: List[Dict]) -> Tuple[int, int]:
+        """
+        파싱된 매매 실거래를 단지에 저장 (중복 제외) 후 커밋
+
+        거래마다 SELECT 하지 않고 row_hash 유니크 인덱스에 대해
+        INSERT ... ON CONFLICT DO NOTHING RETURNING 을 배치로 실행하여
+        실제로 저장된 행 수를 셉니다.
+
+        Args:
+            complex_id: 단지 ID
+            trades: 정규화된 거래 리스트 (MOLITService 조회 결과 / parse_trade_to_dict 형식)
+
+        Returns:
+            (저장 건수, 건너뛴 건수 - 중복/파싱 실패)
+        """
+        rows: Dict[str, Dict] = {}
+        for trade_data in trades:
+            if not trade_data:
+                continue
+
+            row_hash = transaction_row_hash(
+                complex_id, "매매", trade_data["trade_date"],
+                trade_data["exclusive_area"], trade_data["floor"], trade_data["deal_price"]
+            )
+            # 같은 요청 안의 중복은 첫 거래만 유지
+            rows.setdefault(row_hash, {
+                "complex_id": complex_id,
+                "trade_type": "매매",
+                "trade_date": trade_data["trade_date"],
+                "deal_price": trade_data["deal_price"],
+                "formatted_price": self._format_price(trade_data["deal_price"]),
+                "floor": trade_data["floor"],
+                "area": trade_data["exclusive_area"],
+                "exclusive_area": trade_data["exclusive_area"],
+                "row_hash": row_hash,
+            })
+
+        saved_count = self._insert_new_rows(Transaction, list(rows.values())) if rows else 0
+        self.db.commit()
+
+        return saved_count, len(trades) - saved_count
+
+    def save_rent_trades(self, complex_id: str, rents: List[Dict]) -> Tuple[int, int]:
+        """
+        파싱된 전월세 실거래를 단지에 저장 (중복 제외) 후 커밋
+
+        Args:
+            complex_id: 단지 ID
+            rents: 정규화된 전월세 거래 리스트 (MOLITService.get_apt_rent_data 형식)
+
+        Returns:
+            (저장 건수, 건너뛴 건수 - 중복/파싱 실패)
+        """
+        rows: Dict[str, Dict] = {}
+        for rent in rents:
+            if not rent:
+                continue
+
+            contract_type = rent.get("contract_type") or None
+            row_hash = rent_transaction_row_hash(
+                complex_id, rent["trade_date"], rent["exclusive_area"], rent["floor"],
+                rent["deposit"], rent["monthly_rent"], contract_type
+            )
+            rows.setdefault(row_hash, {
+                "complex_id": complex_id,
+                "rent_type": "월세" if rent["monthly_rent"] else "전세",
+                "contract_type": contract_type,
+                "contract_term": rent.get("contract_term") or None,
+                "trade_date": rent["trade_date"],
+                "deposit": rent["deposit"],
+                "monthly_rent": rent["monthly_rent"],
+                "floor": rent["floor"],
+                "exclusive_area": rent["exclusive_area"],
+                "row_hash": row_hash,
+            })
+
+        saved_count = self._insert_new_rows(RentTransaction, list(rows.values())) if rows else 0
+        self.db.commit()
+
+        return saved_count, len(rents) - saved_count
+
+    def _insert_new_rows(self, model, rows: List[Dict]) -> int:
+        """row_hash가 없는 행만 배치 INSERT (저장된 행 수 반환, 커밋은 호출자가 수행)"""
+        insert = get_conflict_insert(self.db)
+
+        if insert is None:
+            # ON CONFLICT 미지원 DB: 기존 해시를 한 번에 조회한 뒤 없는 행만 추가
+            existing = set()
+            hashes = [row["row_hash"] for row in rows]
+            for start in range(0, len(hashes), TRANSACTION_INSERT_BATCH_SIZE):
+                existing.update(
+                    h for (h,) in self.db.query(model.row_hash).filter(
+                        model.row_hash.in_(hashes[start:start + TRANSACTION_INSERT_BATCH_SIZE])
+                    )
+                )
+            new_rows = [row for row in rows if row["row_hash"] not in existing]
+            self.db.bulk_insert_mappings(model, new_rows)
+            return len(new_rows)
+
+        saved_count = 0
+        for start in range(0, len(rows), TRANSACTION_INSERT_BATCH_SIZE):
+            batch = rows[start:start + TRANSACTION_INSERT_BATCH_SIZE]
+            stmt = (
+                insert(model)
+                .values(batch)
+                .on_conflict_do_nothing(index_elements=[model.row_hash])
+                .returning(model.id)
+            )
+            saved_count += len(self.db.execute(stmt).all())
+
+        return saved_count
+
     def get_area_stats(
         self,
         complex_id: str,
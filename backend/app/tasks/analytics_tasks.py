@@ -0,0 +1,42 @@
+"""
+분석용 컬럼 파일 내보내기 Celery 작업
+"""
+import logging
+from typing import List, Optional
+
+from app.core.celery_app import celery_app
+from app.core.database import SessionLocal
+from app.services.columnar_export import export_analytics
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(name="app.tasks.analytics_tasks.export_analytics_files")
+def export_analytics_files(datasets: Optional[List[str]] = None, fmt: Optional[str] = None, full: bool = False):
+    """
+    스냅샷/변동 이력/실거래가 Parquet(Arrow) 증분 내보내기 작업
+
+    Args:
+        datasets: 내보낼 데이터셋 (기본: snapshots, changes, transactions 전체)
+        fmt: parquet / arrow (기본: ANALYTICS_EXPORT_FORMAT)
+        full: 워터마크를 무시하고 전체 다시 내보내기
+
+    Returns:
+        데이터셋별 처리 결과 딕셔너리
+    """
+    logger.info(f"📦 분석용 파일 내보내기 시작 (datasets={datasets or '전체'}, full={full})")
+
+    db = SessionLocal()
+    try:
+        results = export_analytics(db, datasets=datasets, fmt=fmt, full=full)
+        logger.info(f"✅ 분석용 파일 내보내기 완료: {results}")
+        return {'success': True, 'results': results}
+
+    except Exception as e:
+        logger.error(f"❌ 분석용 파일 내보내기 중 오류 발생: {e}", exc_info=True)
+        return {
+            'success': False,
+            'error': str(e)
+        }
+    finally:
+        db.close()
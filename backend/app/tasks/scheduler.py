@@ -1,51 +1,354 @@
 """
 자동 크롤링 스케줄러 태스크
+
+전체 크롤링은 기본적으로 단지별 하위 태스크(crawl_complex_item)로 나눠 Celery chord로 실행합니다.
+단지 목록을 CRAWL_FANOUT_CONCURRENCY개 레인으로 나누고, 레인마다 단지별 태스크를 chain으로 이어
+동시에 실행되는 크롤링 수를 레인 수로 제한합니다. 레인은 서로 다른 워커 프로세스/서버에서 실행될 수 있고,
+모든 레인이 끝나면 finalize_crawl_fanout 콜백이 CrawlJob을 마무리하고 브리핑을 한 번 보냅니다.
 """
-import asyncio
 import logging
+import os
+import time
 import uuid
 import traceback
 from datetime import datetime, timedelta, timezone
-from sqlalchemy.orm import Session
+from celery import chain, chord
+from sqlalchemy import func
+from app.core.async_runner import run_async
 from app.core.celery_app import celery_app
 from app.core.database import SessionLocal
-from app.models.complex import Complex, ArticleSnapshot, CrawlJob
+from app.models.complex import Complex, ArticleSnapshot, CrawlJob, CrawlSession
 from app.services.crawler_service import NaverRealEstateCrawler
+from app.services.crawl_engine import CrawlEngine, SharedHostRateLimiter, crawl_and_persist
+from app.services.crawl_priority import CrawlPriorityPlanner
+from app.services.price_backfill import backfill_price_values as backfill_price_values_service
+from app.services.transaction_ingest import RegionTransactionIngestor
 
 logger = logging.getLogger(__name__)
 
+# 전체 크롤링을 단지별 태스크로 분산 실행 (false면 한 태스크 안에서 CrawlEngine으로 처리)
+CRAWL_FANOUT_ENABLED = os.getenv("CRAWL_FANOUT_ENABLED", "true").lower() == "true"
+
+# 동시에 실행되는 단지별 태스크 수 상한 (레인 수, 워커 수와 무관한 전체 상한)
+CRAWL_FANOUT_CONCURRENCY = int(os.getenv("CRAWL_FANOUT_CONCURRENCY", "3"))
+
+# 단지별 태스크를 보낼 큐 (비우면 기본 큐, 지정하면 해당 큐를 구독하는 워커 필요: worker -Q <큐>)
+CRAWL_FANOUT_QUEUE = os.getenv("CRAWL_FANOUT_QUEUE") or None
+
+# 진행 상황을 이미 반영한 단지 집합 키 (작업별) - acks_late 재전달 시 중복 합산 방지
+JOB_PROGRESS_KEY_PREFIX = "crawl:job_progress:"
+JOB_PROGRESS_TTL_SECONDS = 2 * 24 * 3600
+
+_shared_rate_limiter = None
+_progress_redis = None
+
+
+def _get_shared_rate_limiter() -> SharedHostRateLimiter:
+    """프로세스 공용 Redis 요청 간격 제한기 (단지별 태스크 간 재사용)"""
+    global _shared_rate_limiter
+    if _shared_rate_limiter is None:
+        _shared_rate_limiter = SharedHostRateLimiter()
+    return _shared_rate_limiter
+
+
+def _get_progress_redis():
+    """프로세스 공용 Redis 클라이언트 (단지별 진행 상황 중복 반영 방지)"""
+    global _progress_redis
+    if _progress_redis is None:
+        import redis
+        from app.core.celery_app import REDIS_URL
+        _progress_redis = redis.from_url(REDIS_URL)
+    return _progress_redis
+
 
 @celery_app.task(name="app.tasks.scheduler.crawl_all_complexes", bind=True)
 def crawl_all_complexes(self, job_type='scheduled'):
     """
     등록된 모든 단지를 크롤링하는 태스크
 
+    CRAWL_FANOUT_ENABLED(기본)이면 단지별 태스크로 나눠 보내고 바로 반환합니다.
+    진행 상황과 최종 결과는 CrawlJob(/api/scheduler/jobs)에 기록됩니다.
+
     Args:
         job_type: 작업 유형 ('scheduled' 또는 'manual')
 
+    Returns:
+        dict: 분산 실행 정보 (분산 비활성화 시 크롤링 결과 요약)
+    """
+    if not CRAWL_FANOUT_ENABLED:
+        return _run_crawl_job(self.request.id, job_type)
+    return _dispatch_crawl_fanout(self.request.id, job_type)
+
+
+@celery_app.task(name="app.tasks.scheduler.crawl_priority_queue", bind=True)
+def crawl_priority_queue(self):
+    """
+    변동 빈도/관심 수/경과 시간 우선순위로 고른 단지만 크롤링하는 태스크 (짧은 간격 반복 실행용)
+
+    시간당 크롤링 예산(CRAWL_BUDGET_MINUTES_PER_HOUR) 안에서 브라우저 1분당 기대 변동이 큰 단지부터
+    크롤링합니다. 전체 크롤링과 달리 브리핑은 보내지 않습니다.
+
+    Returns:
+        dict: 예산/선택 단지 + 크롤링 결과 요약 (선택된 단지가 없으면 크롤링 생략)
+    """
+    db = SessionLocal()
+    try:
+        plan = CrawlPriorityPlanner(db).plan()
+    finally:
+        db.close()
+
+    selected = [item["complex_id"] for item in plan["selected"]]
+    logger.info(
+        f"🎯 우선순위 크롤링: {len(selected)}개 단지 선택 "
+        f"(예산 {plan['budget']['tick_minutes']}분 중 {plan['budget']['planned_minutes']}분, "
+        f"최근 1시간 사용 {plan['budget']['spent_minutes_last_hour']}분)"
+    )
+
+    if plan["budget"]["blocked_by_job"]:
+        logger.info(f"⏭️  실행 중인 크롤링 작업이 있어 건너뜀 (Job ID: {plan['budget']['blocked_by_job']})")
+
+    if not selected:
+        return {"budget": plan["budget"], "selected": [], "skipped": True}
+
+    results = _run_crawl_job(self.request.id, 'priority', complex_ids=selected, send_briefing=False)
+    results["budget"] = plan["budget"]
+    results["selected"] = selected
+    return results
+
+
+@celery_app.task(name="app.tasks.scheduler.crawl_complex_item", acks_late=True)
+def crawl_complex_item(previous, complex_id: str, crawl_job_id: str):
+    """
+    분산 전체 크롤링의 단지 1개 크롤링 (레인 chain의 한 단계)
+
+    실패해도 예외를 올리지 않고 실패 결과를 넘겨 같은 레인의 다음 단지와 chord 집계가 계속되게 합니다.
+    요청 간격은 Redis로 모든 워커가 공유합니다 (SharedHostRateLimiter).
+    acks_late라 워커가 죽으면 같은 단지가 다시 전달될 수 있으므로,
+    CrawlJob 진행 상황은 (작업, 단지)마다 한 번만 더합니다. (_add_job_progress)
+
+    Args:
+        previous: 같은 레인에서 앞서 크롤링한 단지들의 결과 (chain으로 전달)
+        complex_id: 단지 ID
+        crawl_job_id: 상위 CrawlJob ID
+
+    Returns:
+        list: previous + [이번 단지 결과]
+    """
+    started = time.monotonic()
+    try:
+        engine = CrawlEngine(concurrency=1, rate_limiter=_get_shared_rate_limiter(), crawl_job_id=crawl_job_id)
+        result = run_async(engine.run([complex_id]))[0]
+    except Exception as e:
+        logger.error(f"❌ 단지 {complex_id} 크롤링 태스크 오류: {str(e)}")
+        result = {
+            "complex_id": complex_id,
+            "success": False,
+            "error": str(e),
+            "duration_seconds": round(time.monotonic() - started, 1)
+        }
+
+    _add_job_progress(crawl_job_id, result)
+    return list(previous) + [result]
+
+
+@celery_app.task(name="app.tasks.scheduler.finalize_crawl_fanout")
+def finalize_crawl_fanout(lane_results, crawl_job_id: str, send_briefing: bool = True):
+    """
+    분산 전체 크롤링 chord 콜백: 모든 단지 결과를 집계해 CrawlJob 마무리 + 브리핑 1회 전송
+
+    Args:
+        lane_results: 레인별 결과 리스트 (crawl_complex_item 반환값)
+        crawl_job_id: 상위 CrawlJob ID
+        send_briefing: 디스코드 브리핑 전송 여부
+
     Returns:
         dict: 크롤링 결과 요약
     """
-    job_id = str(uuid.uuid4())
+    crawl_results = [result for lane in lane_results for result in lane]
+
     db = SessionLocal()
+    try:
+        job = db.query(CrawlJob).filter(CrawlJob.job_id == crawl_job_id).one()
+        complex_names = dict(db.query(Complex.complex_id, Complex.complex_name).filter(
+            Complex.complex_id.in_([result["complex_id"] for result in crawl_results])
+        ).all()) if crawl_results else {}
+
+        results = _new_crawl_results(job)
+        results["total_complexes"] = len(crawl_results)
+        for crawl_result in crawl_results:
+            _aggregate_crawl_result(results, crawl_result, complex_names.get(crawl_result["complex_id"]))
+
+        _finish_crawl_job(db, job, results, send_briefing)
+        return results
+    finally:
+        db.close()
 
-    # CrawlJob 레코드 생성
+
+@celery_app.task(name="app.tasks.scheduler.crawl_fanout_failed")
+def crawl_fanout_failed(request, exc, traceback_, crawl_job_id: str):
+    """분산 전체 크롤링 chord 실패 시 CrawlJob을 실패로 기록 (errback)"""
+    logger.error(f"❌ 분산 크롤링 집계 실패 (Job ID: {crawl_job_id}): {exc}")
+
+    db = SessionLocal()
+    try:
+        job = db.query(CrawlJob).filter(CrawlJob.job_id == crawl_job_id).first()
+        if job and job.status == 'running':
+            job.status = 'failed'
+            job.finished_at = datetime.now(timezone.utc)
+            job.duration_seconds = _elapsed_seconds(job)
+            job.error_message = f"분산 크롤링 집계 실패: {exc}"
+            job.error_traceback = str(traceback_) if traceback_ else None
+            db.commit()
+    finally:
+        db.close()
+
+
+def _dispatch_crawl_fanout(celery_task_id, job_type, complex_ids=None, send_briefing=True):
+    """
+    단지별 태스크를 레인(chain)으로 묶어 chord로 보내기
+
+    Args:
+        celery_task_id: CrawlJob에 기록할 Celery 태스크 ID
+        job_type: 작업 유형
+        complex_ids: 크롤링할 단지 ID 목록 (None이면 전체 단지)
+        send_briefing: 완료 후 디스코드 브리핑 전송 여부
+
+    Returns:
+        dict: job_id, 단지 수, 레인 수, chord 결과 ID
+    """
+    db = SessionLocal()
+    job = _create_crawl_job(db, job_type, celery_task_id)
+    job_id = job.job_id
+
+    try:
+        query = db.query(Complex.complex_id)
+        if complex_ids is not None:
+            query = query.filter(Complex.complex_id.in_(complex_ids))
+        ids = [complex_id for complex_id, in query.order_by(Complex.complex_id).all()]
+        job.complex_name = f"{'전체' if complex_ids is None else '선택'} {len(ids)}개 단지"
+        db.commit()
+
+        if not ids:
+            results = _new_crawl_results(job)
+            _finish_crawl_job(db, job, results, send_briefing)
+            return results
+
+        # 레인마다 단지를 번갈아 배정 → 레인 수만큼만 동시에 실행
+        lane_count = max(1, min(CRAWL_FANOUT_CONCURRENCY, len(ids)))
+        options = {"queue": CRAWL_FANOUT_QUEUE} if CRAWL_FANOUT_QUEUE else {}
+        lanes = [
+            chain(*(
+                crawl_complex_item.signature(([], complex_id, job_id) if index == 0 else (complex_id, job_id), options=options)
+                for index, complex_id in enumerate(ids[lane::lane_count])
+            ))
+            for lane in range(lane_count)
+        ]
+        callback = finalize_crawl_fanout.signature((job_id, send_briefing), options=options)
+        callback.link_error(crawl_fanout_failed.signature((job_id,), options=options))
+        chord_result = chord(lanes)(callback)
+
+        logger.info(f"🤖 분산 크롤링 시작: {len(ids)}개 단지, 레인 {lane_count}개 (Job ID: {job_id})")
+        return {
+            "job_id": job_id,
+            "status": "dispatched",
+            "total_complexes": len(ids),
+            "lanes": lane_count,
+            "chord_id": chord_result.id
+        }
+
+    except Exception as e:
+        logger.error(f"분산 크롤링 시작 중 오류 발생: {str(e)}")
+        results = _new_crawl_results(job)
+        results["errors"].append(f"전체 작업 오류: {str(e)}")
+        _fail_crawl_job(db, job, e)
+        return results
+
+    finally:
+        db.close()
+
+
+def _claim_job_progress(crawl_job_id: str, complex_id: str) -> bool:
+    """
+    (작업, 단지) 진행 상황을 처음 반영하는 경우에만 True (Redis 집합 SADD)
+
+    Redis를 쓸 수 없으면 True - 재전달 시 중복 합산보다 진행 상황 누락을 피함
+    (최종 합계는 chord 콜백이 단지 결과로 다시 계산)
+    """
+    key = JOB_PROGRESS_KEY_PREFIX + crawl_job_id
+    try:
+        redis_client = _get_progress_redis()
+        added = redis_client.sadd(key, complex_id)
+        redis_client.expire(key, JOB_PROGRESS_TTL_SECONDS)
+        return bool(added)
+    except Exception as e:
+        logger.warning(f"⚠️  진행 상황 중복 확인 불가, 그대로 반영 (Job ID: {crawl_job_id}): {str(e)}")
+        return True
+
+
+def _release_job_progress(crawl_job_id: str, complex_id: str):
+    """진행 상황 반영 실패 시 단지 표시 해제 (재전달 시 다시 반영되도록)"""
+    try:
+        _get_progress_redis().srem(JOB_PROGRESS_KEY_PREFIX + crawl_job_id, complex_id)
+    except Exception:
+        pass
+
+
+def _add_job_progress(crawl_job_id: str, crawl_result: dict):
+    """
+    단지 결과를 상위 CrawlJob 수집 건수에 원자적으로 더하기 (여러 워커가 동시에 갱신)
+
+    같은 (작업, 단지)는 한 번만 더합니다. (acks_late 태스크 재전달 대비)
+    """
+    if not crawl_result.get("success"):
+        return
+    if not _claim_job_progress(crawl_job_id, crawl_result["complex_id"]):
+        logger.info(f"↩️  이미 반영된 단지 진행 상황 건너뜀: {crawl_result['complex_id']} (Job ID: {crawl_job_id})")
+        return
+
+    db = SessionLocal()
+    try:
+        db.query(CrawlJob).filter(CrawlJob.job_id == crawl_job_id).update({
+            column: func.coalesce(column, 0) + crawl_result.get(key, 0)
+            for column, key in (
+                (CrawlJob.articles_collected, "articles_collected"),
+                (CrawlJob.articles_new, "articles_new"),
+                (CrawlJob.articles_updated, "articles_updated"),
+                (CrawlJob.articles_removed, "articles_removed"),
+            )
+        }, synchronize_session=False)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        _release_job_progress(crawl_job_id, crawl_result["complex_id"])
+        logger.warning(f"⚠️  작업 진행 상황 갱신 실패 (Job ID: {crawl_job_id}): {str(e)}")
+    finally:
+        db.close()
+
+
+def _create_crawl_job(db, job_type, celery_task_id) -> CrawlJob:
+    """running 상태 CrawlJob 생성"""
     job = CrawlJob(
-        job_id=job_id,
+        job_id=str(uuid.uuid4()),
         job_type=job_type,
         status='running',
         started_at=datetime.now(timezone.utc),
-        celery_task_id=self.request.id
+        celery_task_id=celery_task_id
     )
     db.add(job)
     db.commit()
+    return job
 
-    logger.info("=" * 80)
-    logger.info(f"🤖 자동 크롤링 시작 (Job ID: {job_id})")
-    logger.info("=" * 80)
 
-    results = {
-        "job_id": job_id,
+def _elapsed_seconds(job: CrawlJob) -> int:
+    started_at = job.started_at
+    if started_at.tzinfo is None:
+        started_at = started_at.replace(tzinfo=timezone.utc)
+    return int((job.finished_at - started_at).total_seconds())
+
+
+def _new_crawl_results(job: CrawlJob) -> dict:
+    return {
+        "job_id": job.job_id,
         "started_at": job.started_at.isoformat(),
         "total_complexes": 0,
         "success": 0,
@@ -53,104 +356,147 @@ def crawl_all_complexes(self, job_type='scheduled'):
         "errors": [],
         "total_articles_collected": 0,
         "total_articles_new": 0,
-        "total_articles_updated": 0
+        "total_articles_updated": 0,
+        "total_articles_removed": 0
     }
 
-    try:
-        # 모든 단지 조회
-        complexes = db.query(Complex).all()
-        results["total_complexes"] = len(complexes)
-        job.complex_name = f"전체 {len(complexes)}개 단지"
-        db.commit()
 
-        logger.info(f"📋 크롤링 대상: {len(complexes)}개 단지")
+def _aggregate_crawl_result(results: dict, crawl_result: dict, complex_name=None):
+    """단지별 결과를 요약에 합산"""
+    if crawl_result["success"]:
+        results["success"] += 1
+        results["total_articles_collected"] += crawl_result.get("articles_collected", 0)
+        results["total_articles_new"] += crawl_result.get("articles_new", 0)
+        results["total_articles_updated"] += crawl_result.get("articles_updated", 0)
+        results["total_articles_removed"] += crawl_result.get("articles_removed", 0)
+    else:
+        results["failed"] += 1
+        error_msg = f"단지 {crawl_result['complex_id']} ({complex_name}) 크롤링 실패: {crawl_result.get('error')}"
+        results["errors"].append(error_msg)
 
-        # 각 단지별로 크롤링 실행
-        for idx, complex_obj in enumerate(complexes, 1):
-            complex_id = complex_obj.complex_id
-            complex_name = complex_obj.complex_name
 
-            try:
-                logger.info(f"[{idx}/{len(complexes)}] 크롤링 시작: {complex_name} (ID: {complex_id})")
+def _apply_results_to_job(job: CrawlJob, results: dict):
+    job.articles_collected = results["total_articles_collected"]
+    job.articles_new = results["total_articles_new"]
+    job.articles_updated = results["total_articles_updated"]
+    job.articles_removed = results["total_articles_removed"]
+    if results["errors"]:
+        job.error_message = "\n".join(results["errors"][:10])  # 최대 10개만
 
-                # 개별 단지 크롤링 (결과 포함)
-                crawl_result = asyncio.run(crawl_single_complex_with_result(complex_id, db))
 
-                results["success"] += 1
-                results["total_articles_collected"] += crawl_result.get("articles_collected", 0)
-                results["total_articles_new"] += crawl_result.get("articles_new", 0)
-                results["total_articles_updated"] += crawl_result.get("articles_updated", 0)
+def _finish_crawl_job(db, job: CrawlJob, results: dict, send_briefing: bool):
+    """CrawlJob 완료 처리 + (선택) 디스코드 브리핑 전송"""
+    _apply_results_to_job(job, results)
+    job.status = 'success' if results["failed"] == 0 else 'failed'
+    job.finished_at = datetime.now(timezone.utc)
+    job.duration_seconds = _elapsed_seconds(job)
+    db.commit()
 
-                logger.info(f"✅ [{idx}/{len(complexes)}] 완료: {complex_name}")
+    results["finished_at"] = job.finished_at.isoformat()
+    results["duration_seconds"] = job.duration_seconds
 
-            except Exception as e:
-                results["failed"] += 1
-                error_msg = f"단지 {complex_id} ({complex_name}) 크롤링 실패: {str(e)}"
-                results["errors"].append(error_msg)
-                logger.error(f"❌ [{idx}/{len(complexes)}] 실패: {complex_name} - {str(e)}")
+    logger.info("=" * 80)
+    logger.info(f"🏁 자동 크롤링 완료")
+    logger.info(f"   총 {results['total_complexes']}개 중 {results['success']}개 성공, {results['failed']}개 실패")
+    logger.info(
+        f"   수집: {results['total_articles_collected']}건, 신규: {results['total_articles_new']}건, "
+        f"비활성화: {results['total_articles_removed']}건"
+    )
+    logger.info("=" * 80)
 
-            # 단지 간 딜레이 (봇 차단 방지)
-            if idx < len(complexes):
-                import time
-                time.sleep(5)  # 5초 대기
+    # 크롤링 완료 후 디스코드 브리핑 전송
+    if not send_briefing:
+        return
 
-        # 작업 완료 처리
-        job.status = 'success' if results["failed"] == 0 else 'failed'
-        job.finished_at = datetime.now(timezone.utc)
-        job.duration_seconds = int((job.finished_at - job.started_at).total_seconds())
-        job.articles_collected = results["total_articles_collected"]
-        job.articles_new = results["total_articles_new"]
-        job.articles_updated = results["total_articles_updated"]
+    try:
+        from app.services.briefing_service import BriefingService
+        briefing_service = BriefingService(db)
+
+        logger.info("📊 브리핑 생성 및 전송 중...")
+        briefing_result = briefing_service.send_briefing(
+            days=7,
+            to_slack=False,  # Slack은 비활성화
+            to_discord=True,  # Discord만 전송
+            crawl_stats=results  # 크롤링 통계 전달
+        )
+
+        if briefing_result.get('success'):
+            logger.info("✅ 디스코드 브리핑 전송 완료")
+        elif briefing_result.get('skipped'):
+            logger.info(f"ℹ️  브리핑 건너뜀: {briefing_result.get('reason')}")
+        else:
+            logger.warning(f"⚠️  브리핑 전송 실패: {briefing_result.get('error')}")
+
+    except Exception as e:
+        logger.error(f"❌ 브리핑 생성/전송 중 오류: {str(e)}")
+        # 브리핑 실패는 크롤링 성공에 영향을 주지 않음
+
+
+def _fail_crawl_job(db, job: CrawlJob, error: Exception):
+    """CrawlJob 실패 처리"""
+    db.rollback()
+    job.status = 'failed'
+    job.finished_at = datetime.now(timezone.utc)
+    job.duration_seconds = _elapsed_seconds(job)
+    job.error_message = str(error)
+    job.error_traceback = traceback.format_exc()
+    db.commit()
 
-        if results["errors"]:
-            job.error_message = "\n".join(results["errors"][:10])  # 최대 10개만
 
+def _run_crawl_job(celery_task_id, job_type, complex_ids=None, send_briefing=True):
+    """
+    여러 단지를 한 태스크 안에서 크롤링 + CrawlJob 기록 (+ 완료 후 브리핑)
+
+    Args:
+        celery_task_id: CrawlJob에 기록할 Celery 태스크 ID
+        job_type: 작업 유형 ('scheduled', 'manual', 'priority')
+        complex_ids: 크롤링할 단지 ID 목록 (None이면 전체 단지)
+        send_briefing: 완료 후 디스코드 브리핑 전송 여부
+
+    Returns:
+        dict: 크롤링 결과 요약
+    """
+    db = SessionLocal()
+    job = _create_crawl_job(db, job_type, celery_task_id)
+
+    logger.info("=" * 80)
+    logger.info(f"🤖 자동 크롤링 시작 (Job ID: {job.job_id})")
+    logger.info("=" * 80)
+
+    results = _new_crawl_results(job)
+
+    try:
+        # 대상 단지 조회 (지정하지 않으면 전체)
+        query = db.query(Complex)
+        if complex_ids is not None:
+            query = query.filter(Complex.complex_id.in_(complex_ids))
+        complexes = query.all()
+        results["total_complexes"] = len(complexes)
+        job.complex_name = f"{'전체' if complex_ids is None else '우선순위'} {len(complexes)}개 단지"
         db.commit()
 
-        results["finished_at"] = job.finished_at.isoformat()
-        results["duration_seconds"] = job.duration_seconds
+        logger.info(f"📋 크롤링 대상: {len(complexes)}개 단지")
 
-        logger.info("=" * 80)
-        logger.info(f"🏁 자동 크롤링 완료")
-        logger.info(f"   총 {results['total_complexes']}개 중 {results['success']}개 성공, {results['failed']}개 실패")
-        logger.info(f"   수집: {results['total_articles_collected']}건, 신규: {results['total_articles_new']}건")
-        logger.info("=" * 80)
+        complex_names = {c.complex_id: c.complex_name for c in complexes}
 
-        # 크롤링 완료 후 디스코드 브리핑 전송
-        try:
-            from app.services.briefing_service import BriefingService
-            briefing_service = BriefingService(db)
-
-            logger.info("📊 브리핑 생성 및 전송 중...")
-            briefing_result = briefing_service.send_briefing(
-                days=7,
-                to_slack=False,  # Slack은 비활성화
-                to_discord=True,  # Discord만 전송
-                crawl_stats=results  # 크롤링 통계 전달
-            )
+        def record_result(crawl_result):
+            """단지별 결과를 집계하고 CrawlJob에 즉시 반영"""
+            _aggregate_crawl_result(results, crawl_result, complex_names.get(crawl_result["complex_id"]))
+            _apply_results_to_job(job, results)
+            db.commit()
 
-            if briefing_result.get('success'):
-                logger.info("✅ 디스코드 브리핑 전송 완료")
-            elif briefing_result.get('skipped'):
-                logger.info(f"ℹ️  브리핑 건너뜀: {briefing_result.get('reason')}")
-            else:
-                logger.warning(f"⚠️  브리핑 전송 실패: {briefing_result.get('error')}")
+        # 제한된 워커 풀로 동시 크롤링 (호스트별 요청 간격 제한 적용)
+        engine = CrawlEngine(on_result=record_result, crawl_job_id=job.job_id)
+        run_async(engine.run(list(complex_names.keys())))
 
-        except Exception as e:
-            logger.error(f"❌ 브리핑 생성/전송 중 오류: {str(e)}")
-            # 브리핑 실패는 크롤링 성공에 영향을 주지 않음
+        _finish_crawl_job(db, job, results, send_briefing)
 
     except Exception as e:
         logger.error(f"자동 크롤링 중 오류 발생: {str(e)}")
         results["errors"].append(f"전체 작업 오류: {str(e)}")
 
         # 작업 실패 처리
-        job.status = 'failed'
-        job.finished_at = datetime.now(timezone.utc)
-        job.duration_seconds = int((job.finished_at - job.started_at).total_seconds())
-        job.error_message = str(e)
-        job.error_traceback = traceback.format_exc()
-        db.commit()
+        _fail_crawl_job(db, job, e)
 
     finally:
         db.close()
@@ -158,48 +504,31 @@ def crawl_all_complexes(self, job_type='scheduled'):
     return results
 
 
-async def crawl_single_complex(complex_id: str, db: Session):
+async def crawl_single_complex(complex_id: str):
     """
     단일 단지 크롤링 (비동기)
 
     Args:
         complex_id: 단지 ID
-        db: 데이터베이스 세션
     """
     crawler = NaverRealEstateCrawler()
     await crawler.crawl_complex(complex_id)
 
 
-async def crawl_single_complex_with_result(complex_id: str, db: Session):
+async def crawl_single_complex_with_result(complex_id: str, crawl_job_id: str = None):
     """
     단일 단지 크롤링 (결과 포함)
 
+    크롤링 → DB 저장 → 스냅샷 생성 → 변동 감지까지 수행합니다.
+
     Args:
         complex_id: 단지 ID
-        db: 데이터베이스 세션
+        crawl_job_id: 크롤링 세션에 연결할 CrawlJob ID
 
     Returns:
         dict: 크롤링 결과 (articles_collected, articles_new, articles_updated)
     """
-    # 크롤링 전 매물 수
-    from app.models.complex import Article
-    before_count = db.query(Article).filter(Article.complex_id == complex_id).count()
-
-    # 크롤링 실행
-    crawler = NaverRealEstateCrawler()
-    await crawler.crawl_complex(complex_id)
-
-    # 크롤링 후 매물 수
-    after_count = db.query(Article).filter(Article.complex_id == complex_id).count()
-
-    # 간단한 통계 (정확한 신규/업데이트 구분은 복잡하므로 근사치)
-    articles_new = max(0, after_count - before_count)
-
-    return {
-        "articles_collected": after_count,
-        "articles_new": articles_new,
-        "articles_updated": min(before_count, after_count)
-    }
+    return await crawl_and_persist(complex_id, crawl_job_id=crawl_job_id)
 
 
 @celery_app.task(name="app.tasks.scheduler.cleanup_old_snapshots")
@@ -229,21 +558,21 @@ def cleanup_old_snapshots():
         # 90일 이전 날짜 계산 (분기별 1회 실행)
         cutoff_date = datetime.now(timezone.utc) - timedelta(days=90)
 
-        # 오래된 스냅샷 조회 (snapshot_date 기준)
-        old_snapshots = db.query(ArticleSnapshot).filter(
+        # 오래된 스냅샷 일괄 삭제 (snapshot_date 기준, 객체 로딩 없이)
+        deleted_count = db.query(ArticleSnapshot).filter(
             ArticleSnapshot.snapshot_date < cutoff_date
-        ).all()
+        ).delete(synchronize_session=False)
 
-        logger.info(f"📊 삭제 대상: {len(old_snapshots)}개 스냅샷 (90일 이전)")
+        # 스냅샷이 모두 삭제된 크롤링 세션 정리
+        db.query(CrawlSession).filter(
+            CrawlSession.finished_at < cutoff_date
+        ).delete(synchronize_session=False)
 
-        # 스냅샷 삭제
-        if len(old_snapshots) > 0:
-            for snapshot in old_snapshots:
-                db.delete(snapshot)
+        db.commit()
+        results["deleted_count"] = deleted_count
 
-            db.commit()
-            results["deleted_count"] = len(old_snapshots)
-            logger.info(f"✅ {len(old_snapshots)}개 스냅샷 삭제 완료")
+        if deleted_count > 0:
+            logger.info(f"✅ {deleted_count}개 스냅샷 삭제 완료 (90일 이전)")
         else:
             logger.info("ℹ️  삭제할 스냅샷이 없습니다")
 
@@ -262,6 +591,63 @@ def cleanup_old_snapshots():
     return results
 
 
+@celery_app.task(name="app.tasks.scheduler.backfill_price_values")
+def backfill_price_values():
+    """
+    숫자 가격 컬럼(price_value 등) 백필 태스크
+
+    컬럼 도입 이전에 저장된 매물/스냅샷/변동 이력의 가격 문자열을 파싱하여 채웁니다.
+    이미 채워진 행은 건너뛰므로 여러 번 실행해도 안전합니다.
+
+    Returns:
+        dict: 테이블별 처리 행 수
+    """
+    logger.info("🔄 숫자 가격 컬럼 백필 시작")
+
+    db = SessionLocal()
+    try:
+        counts = backfill_price_values_service(db)
+        logger.info(f"✅ 숫자 가격 컬럼 백필 완료: {counts}")
+        return counts
+    except Exception as e:
+        db.rollback()
+        logger.error(f"❌ 숫자 가격 컬럼 백필 실패: {str(e)}")
+        logger.error(traceback.format_exc())
+        raise
+    finally:
+        db.close()
+
+
+@celery_app.task(name="app.tasks.scheduler.ingest_region_transactions")
+def ingest_region_transactions(months: int = 6, include_rent: bool = True):
+    """
+    등록 단지 전체의 매매/전월세 실거래가를 지역(시군구) × 월 단위로 수집하는 태스크
+
+    (시군구, 년월)마다 국토부 API를 한 번만 호출하므로 비용은 단지 수가 아닌 지역 수에 비례합니다.
+
+    Args:
+        months: 조회할 개월 수 (이번 달 포함)
+        include_rent: 전월세 실거래 포함
+
+    Returns:
+        dict: 지역/API 호출/저장 건수 요약
+    """
+    logger.info(f"🏙️ 지역 단위 실거래가 수집 시작 ({months}개월)")
+
+    db = SessionLocal()
+    try:
+        result = RegionTransactionIngestor(db).ingest(months=months, include_rent=include_rent)
+        result.pop("complexes", None)
+        return result
+    except Exception as e:
+        db.rollback()
+        logger.error(f"❌ 지역 단위 실거래가 수집 실패: {str(e)}")
+        logger.error(traceback.format_exc())
+        raise
+    finally:
+        db.close()
+
+
 @celery_app.task(name="app.tasks.scheduler.crawl_complex_async", bind=True)
 def crawl_complex_async(self, complex_id: str):
     """
@@ -306,7 +692,7 @@ def crawl_complex_async(self, complex_id: str):
 
     try:
         # 크롤링 실행 (결과 포함)
-        crawl_result = asyncio.run(crawl_single_complex_with_result(complex_id, db))
+        crawl_result = run_async(crawl_single_complex_with_result(complex_id, crawl_job_id=job_id))
 
         # 작업 성공 처리
         job.status = 'success'
@@ -315,6 +701,7 @@ def crawl_complex_async(self, complex_id: str):
         job.articles_collected = crawl_result["articles_collected"]
         job.articles_new = crawl_result["articles_new"]
         job.articles_updated = crawl_result["articles_updated"]
+        job.articles_removed = crawl_result.get("articles_removed", 0)
         db.commit()
 
         result["success"] = True
@@ -322,6 +709,7 @@ def crawl_complex_async(self, complex_id: str):
         result["duration_seconds"] = job.duration_seconds
         result["articles_collected"] = job.articles_collected
         result["articles_new"] = job.articles_new
+        result["articles_removed"] = job.articles_removed
 
         logger.info(f"✅ 백그라운드 크롤링 완료: {complex_name} (수집: {job.articles_collected}건)")
 
@@ -0,0 +1,47 @@
+"""
+법정동 코드 색인 컴파일 스크립트
+
+app/data/dong_code_active.txt → DONG_CODE_INDEX_PATH (기본: data/dong_code_index.pickle)
+
+색인은 처음 주소를 해석할 때 자동으로 만들어지지만, 배포/워커 시작 전에 미리 만들어 두면
+첫 요청에서 컴파일 시간(수백 ms)이 들지 않습니다. 원본 파일이 바뀌면 다시 실행하세요.
+
+사용 방법:
+    python build_dong_code_index.py
+"""
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from app.services.dong_code_index import DONG_CODE_FILE, DONG_CODE_INDEX_PATH, DongCodeIndex, load_or_compile
+
+
+def build():
+    """색인 컴파일 후 저장, 다시 읽어 로드 시간 확인"""
+    print("=" * 60)
+    print("📚 법정동 코드 색인 컴파일")
+    print("=" * 60)
+
+    started = time.perf_counter()
+    index = DongCodeIndex.compile(DONG_CODE_FILE)
+    index.save(DONG_CODE_INDEX_PATH)
+    compile_ms = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    loaded = load_or_compile(DONG_CODE_INDEX_PATH)
+    load_ms = (time.perf_counter() - started) * 1000
+
+    if loaded.version != index.version:
+        print("❌ 저장한 색인을 다시 읽지 못했습니다")
+        return False
+
+    print(f"   원본: {DONG_CODE_FILE} ({len(index.dong_code_map):,}개 법정동)")
+    print(f"   색인: {DONG_CODE_INDEX_PATH} ({os.path.getsize(DONG_CODE_INDEX_PATH) / 1024:.0f}KB, 버전 {index.version[:12]})")
+    print(f"✅ 컴파일 {compile_ms:.0f}ms → 로드 {load_ms:.0f}ms")
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if build() else 1)
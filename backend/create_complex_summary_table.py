@@ -0,0 +1,44 @@
+"""
+complex_summary 테이블 생성 스크립트
+
+테이블 생성 후 전체 단지의 요약을 한 번 계산합니다.
+이후에는 크롤링/실거래 수집 시 해당 단지만 갱신됩니다.
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from app.core.database import engine, SessionLocal
+from app.models.complex import ComplexSummary
+from app.services.complex_summary import refresh_all_complex_summaries
+
+def create_complex_summary_table():
+    """complex_summary 테이블 생성 + 백필"""
+    print("=" * 60)
+    print("📊 complex_summary 테이블 생성")
+    print("=" * 60)
+
+    try:
+        # ComplexSummary 테이블만 생성 (다른 테이블은 이미 존재)
+        ComplexSummary.__table__.create(engine, checkfirst=True)
+        print("✅ complex_summary 테이블이 생성되었습니다!")
+
+        db = SessionLocal()
+        try:
+            refreshed = refresh_all_complex_summaries(db)
+        finally:
+            db.close()
+        print(f"✅ 단지 요약 백필: {refreshed}건")
+
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+    return True
+
+
+if __name__ == "__main__":
+    create_complex_summary_table()
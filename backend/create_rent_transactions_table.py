@@ -0,0 +1,37 @@
+"""
+rent_transactions 테이블 생성 스크립트
+
+국토부 아파트 전월세 실거래가를 저장하는 테이블을 만듭니다.
+이후 /api/transactions/fetch-all 또는 Celery 태스크
+app.tasks.scheduler.ingest_region_transactions 실행 시 매매와 함께 수집됩니다.
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from app.core.database import engine
+from app.models.complex import RentTransaction
+
+def create_rent_transactions_table():
+    """rent_transactions 테이블 생성"""
+    print("=" * 60)
+    print("📊 rent_transactions 테이블 생성")
+    print("=" * 60)
+
+    try:
+        # RentTransaction 테이블만 생성 (다른 테이블은 이미 존재)
+        RentTransaction.__table__.create(engine, checkfirst=True)
+        print("✅ rent_transactions 테이블이 생성되었습니다!")
+
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+    return True
+
+
+if __name__ == "__main__":
+    create_rent_transactions_table()
@@ -0,0 +1,71 @@
+"""
+분석용 컬럼 파일(Parquet / Arrow IPC) 내보내기 CLI
+
+스냅샷/변동 이력/실거래가를 단지·월 파티션 파일로 증분 내보냅니다.
+(pyarrow 필요: pip install pyarrow)
+
+사용 방법:
+    # 지난 실행 이후 추가된 행만 내보내기 (기본: data/analytics, parquet)
+    python export_analytics.py
+
+    # Arrow IPC 형식 / 스냅샷만 / 전체 다시 내보내기
+    python export_analytics.py --format arrow --datasets snapshots --full
+
+    # 읽기 예시 (complex_id, month 파티션 컬럼 포함)
+    from app.services.columnar_export import open_dataset
+    open_dataset("snapshots").to_table(filter=pyarrow.dataset.field("complex_id") == "109208")
+"""
+import argparse
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from app.core.database import SessionLocal
+from app.services.columnar_export import ANALYTICS_EXPORT_DIR, DATASETS, export_analytics
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="분석용 Parquet/Arrow 내보내기")
+    parser.add_argument("--datasets", nargs="+", choices=list(DATASETS), default=None, help="기본: 전체")
+    parser.add_argument("--format", choices=["parquet", "arrow"], default=None, help="기본: ANALYTICS_EXPORT_FORMAT")
+    parser.add_argument("--output-dir", default=None, help=f"기본: {ANALYTICS_EXPORT_DIR}")
+    parser.add_argument("--full", action="store_true", help="워터마크 무시하고 전체 다시 내보내기")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    print("=" * 60)
+    print("📦 분석용 파일 내보내기")
+    print("=" * 60)
+
+    db = SessionLocal()
+    try:
+        results = export_analytics(
+            db,
+            datasets=args.datasets,
+            output_dir=args.output_dir,
+            fmt=args.format,
+            full=args.full
+        )
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+    finally:
+        db.close()
+
+    for name, result in results.items():
+        print(
+            f"   ✅ {name}: {result['rows']:,}행, 파일 {result['files']}개, "
+            f"{result['seconds']}초 ({result['rows_per_sec']:,}행/초)"
+        )
+    print("✅ 내보내기 완료!")
+    return True
+
+
+if __name__ == "__main__":
+    main()
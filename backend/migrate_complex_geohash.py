@@ -0,0 +1,115 @@
+"""
+단지 위치 geohash 마이그레이션 스크립트
+
+- complexes.geohash 컬럼 추가
+- 기존 단지 위도/경도로 geohash 백필 (app.core.geohash.encode_or_none)
+- 인덱스 생성: ix_complexes_geohash
+
+이후 단지 저장 시 geohash는 모델 이벤트(before_insert/before_update)로 자동 계산되며,
+GET /api/complexes/nearby, /api/complexes/bbox 가 이 인덱스를 사용합니다.
+여러 번 실행해도 안전합니다.
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from sqlalchemy import bindparam, inspect, select, text, update
+from sqlalchemy.schema import CreateIndex
+
+from app.core.database import engine
+from app.core.geohash import encode_or_none
+from app.models.complex import Complex
+
+BACKFILL_BATCH_SIZE = 5000
+
+
+def add_geohash_column(conn):
+    """geohash 컬럼 추가 (없을 때만)"""
+    table = Complex.__table__
+    existing = {c['name'] for c in inspect(conn).get_columns(table.name)}
+    if 'geohash' in existing:
+        return
+
+    column_type = table.c.geohash.type.compile(dialect=conn.dialect)
+    conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN geohash {column_type}"))
+    print(f"   ✅ {table.name}.geohash 컬럼 추가")
+
+
+def backfill_geohashes(conn) -> int:
+    """좌표가 있는 단지 geohash 계산 (id 순 배치 UPDATE)"""
+    t = Complex.__table__
+    stmt = update(t).where(t.c.id == bindparam('_id')).values(geohash=bindparam('_geohash'))
+    total = 0
+    last_id = 0
+
+    while True:
+        rows = conn.execute(
+            select(t.c.id, t.c.latitude, t.c.longitude)
+            .where(t.c.id > last_id, t.c.latitude.is_not(None), t.c.longitude.is_not(None))
+            .order_by(t.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            return total
+
+        conn.execute(stmt, [
+            {'_id': row.id, '_geohash': encode_or_none(row.latitude, row.longitude)}
+            for row in rows
+        ])
+        total += len(rows)
+        last_id = rows[-1].id
+        print(f"   ⏳ {total:,}건 백필")
+
+
+def create_geohash_index(conn):
+    """
+    geohash 인덱스 생성 (없을 때만)
+
+    PostgreSQL은 크롤링 중에도 쓰기가 막히지 않도록 CREATE INDEX CONCURRENTLY 사용
+    """
+    table = Complex.__table__
+    existing = {i['name'] for i in inspect(conn).get_indexes(table.name)}
+
+    for index in table.indexes:
+        if index.name in existing or 'geohash' not in index.columns:
+            continue
+        print(f"   ⏳ 인덱스 생성: {index.name}")
+        ddl = str(CreateIndex(index).compile(dialect=conn.dialect))
+        if conn.dialect.name == 'postgresql':
+            ddl = ddl.replace("CREATE INDEX", "CREATE INDEX CONCURRENTLY", 1)
+        conn.execute(text(ddl))
+        print(f"   ✅ {index.name}")
+
+
+def migrate():
+    """마이그레이션 실행"""
+    print("=" * 60)
+    print("📍 단지 위치 geohash 마이그레이션")
+    print("=" * 60)
+
+    try:
+        with engine.begin() as conn:
+            add_geohash_column(conn)
+
+        print("\n🔄 기존 단지 geohash 백필 중...")
+        with engine.begin() as conn:
+            backfilled = backfill_geohashes(conn)
+        print(f"   ✅ 백필 {backfilled:,}건")
+
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            create_geohash_index(conn)
+
+        print("✅ 마이그레이션 완료!")
+
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+    return True
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,136 @@
+"""
+크롤링 세션 / 스냅샷 이력 인덱스 마이그레이션 스크립트
+
+- crawl_sessions 테이블 생성 (없으면)
+- crawl_sessions 컬럼 추가: crawl_job_id, finished_at, article_count
+- 복합 인덱스 생성
+    article_snapshots (complex_id, crawl_session_id)
+    article_changes (complex_id, detected_at)
+    article_changes (is_read, detected_at)
+- 기존 스냅샷으로 crawl_sessions 백필 (+ 단일 단지 작업 연결)
+
+여러 번 실행해도 안전합니다.
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from sqlalchemy import inspect, text
+from sqlalchemy.schema import CreateIndex
+
+from app.core.database import engine
+from app.models.complex import ArticleSnapshot, ArticleChange, CrawlSession
+
+NEW_SESSION_COLUMNS = ['crawl_job_id', 'finished_at', 'article_count']
+
+
+def add_missing_columns(conn):
+    """crawl_sessions에 없는 컬럼 추가"""
+    existing = {c['name'] for c in inspect(conn).get_columns('crawl_sessions')}
+
+    for name in NEW_SESSION_COLUMNS:
+        if name in existing:
+            continue
+        column = CrawlSession.__table__.c[name]
+        column_type = column.type.compile(dialect=conn.dialect)
+        conn.execute(text(f"ALTER TABLE crawl_sessions ADD COLUMN {name} {column_type}"))
+        print(f"   ✅ crawl_sessions.{name} 컬럼 추가")
+
+    if 'crawl_job_id' not in existing:
+        if conn.dialect.name == 'postgresql':
+            conn.execute(text(
+                "ALTER TABLE crawl_sessions ADD CONSTRAINT crawl_sessions_crawl_job_id_fkey "
+                "FOREIGN KEY (crawl_job_id) REFERENCES crawl_jobs (job_id) ON DELETE SET NULL"
+            ))
+
+
+def create_indexes(conn):
+    """
+    모델에 선언된 인덱스 중 없는 것만 생성
+
+    PostgreSQL은 크롤링 중에도 쓰기가 막히지 않도록 CREATE INDEX CONCURRENTLY 사용
+    (트랜잭션 밖에서 실행해야 하므로 AUTOCOMMIT 연결 필요)
+    """
+    concurrently = conn.dialect.name == 'postgresql'
+
+    for table in (CrawlSession.__table__, ArticleSnapshot.__table__, ArticleChange.__table__):
+        existing = {i['name'] for i in inspect(conn).get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name in existing:
+                continue
+            print(f"   ⏳ 인덱스 생성: {index.name} ({', '.join(c.name for c in index.columns)})")
+            ddl = str(CreateIndex(index).compile(dialect=conn.dialect))
+            if concurrently:
+                ddl = ddl.replace("CREATE INDEX", "CREATE INDEX CONCURRENTLY", 1)
+            conn.execute(text(ddl))
+            print(f"   ✅ {index.name}")
+
+
+def backfill_sessions(conn):
+    """스냅샷은 있지만 crawl_sessions에 없는 세션 백필"""
+    result = conn.execute(text("""
+        INSERT INTO crawl_sessions (session_id, complex_id, started_at, finished_at, article_count)
+        SELECT s.crawl_session_id, s.complex_id, MIN(s.snapshot_date), MAX(s.snapshot_date), COUNT(*)
+        FROM article_snapshots s
+        WHERE s.crawl_session_id IS NOT NULL
+          AND NOT EXISTS (
+              SELECT 1 FROM crawl_sessions cs WHERE cs.session_id = s.crawl_session_id
+          )
+        GROUP BY s.crawl_session_id, s.complex_id
+    """))
+    print(f"   ✅ 세션 백필: {result.rowcount}건")
+
+    # 단일 단지 작업은 작업 시간 범위 안의 세션과 연결
+    result = conn.execute(text("""
+        UPDATE crawl_sessions
+        SET crawl_job_id = (
+            SELECT j.job_id FROM crawl_jobs j
+            WHERE j.complex_id = crawl_sessions.complex_id
+              AND j.started_at <= crawl_sessions.finished_at
+              AND j.finished_at >= crawl_sessions.finished_at
+            ORDER BY j.started_at DESC
+            LIMIT 1
+        )
+        WHERE crawl_job_id IS NULL
+          AND EXISTS (
+              SELECT 1 FROM crawl_jobs j
+              WHERE j.complex_id = crawl_sessions.complex_id
+                AND j.started_at <= crawl_sessions.finished_at
+                AND j.finished_at >= crawl_sessions.finished_at
+          )
+    """))
+    print(f"   ✅ 작업 연결: {result.rowcount}건")
+
+
+def migrate():
+    """마이그레이션 실행"""
+    print("=" * 60)
+    print("📊 crawl_sessions / 스냅샷 이력 인덱스 마이그레이션")
+    print("=" * 60)
+
+    try:
+        CrawlSession.__table__.create(engine, checkfirst=True)
+
+        with engine.begin() as conn:
+            add_missing_columns(conn)
+
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            create_indexes(conn)
+
+        with engine.begin() as conn:
+            backfill_sessions(conn)
+
+        print("✅ 마이그레이션 완료!")
+
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+    return True
+
+
+if __name__ == "__main__":
+    migrate()
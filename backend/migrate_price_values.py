@@ -0,0 +1,105 @@
+"""
+숫자 가격 컬럼 마이그레이션 스크립트
+
+- 컬럼 추가 (만원 단위 정수)
+    articles: price_value, deposit_value, monthly_rent_value
+    article_snapshots: price_value
+    article_changes: old_price_value, new_price_value
+- 가격 인덱스 생성
+    articles (complex_id, trade_type, price_value)
+    articles (trade_type, price_value)
+- 기존 가격 문자열 백필 (app.services.price_backfill)
+
+여러 번 실행해도 안전합니다.
+백필만 다시 실행하려면 Celery 태스크 app.tasks.scheduler.backfill_price_values 사용
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from sqlalchemy import inspect, text
+from sqlalchemy.schema import CreateIndex
+
+from app.core.database import engine, SessionLocal
+from app.models.complex import Article, ArticleSnapshot, ArticleChange
+from app.services.price_backfill import backfill_price_values
+
+NEW_COLUMNS = {
+    Article: ['price_value', 'deposit_value', 'monthly_rent_value'],
+    ArticleSnapshot: ['price_value'],
+    ArticleChange: ['old_price_value', 'new_price_value'],
+}
+
+
+def add_missing_columns(conn):
+    """숫자 가격 컬럼 추가"""
+    for model, names in NEW_COLUMNS.items():
+        table = model.__table__
+        existing = {c['name'] for c in inspect(conn).get_columns(table.name)}
+
+        for name in names:
+            if name in existing:
+                continue
+            column_type = table.c[name].type.compile(dialect=conn.dialect)
+            conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {name} {column_type}"))
+            print(f"   ✅ {table.name}.{name} 컬럼 추가")
+
+
+def create_indexes(conn):
+    """
+    가격 인덱스 생성 (없는 것만)
+
+    PostgreSQL은 크롤링 중에도 쓰기가 막히지 않도록 CREATE INDEX CONCURRENTLY 사용
+    """
+    concurrently = conn.dialect.name == 'postgresql'
+    table = Article.__table__
+    existing = {i['name'] for i in inspect(conn).get_indexes(table.name)}
+
+    for index in table.indexes:
+        if index.name in existing or 'price_value' not in index.columns:
+            continue
+        print(f"   ⏳ 인덱스 생성: {index.name} ({', '.join(c.name for c in index.columns)})")
+        ddl = str(CreateIndex(index).compile(dialect=conn.dialect))
+        if concurrently:
+            ddl = ddl.replace("CREATE INDEX", "CREATE INDEX CONCURRENTLY", 1)
+        conn.execute(text(ddl))
+        print(f"   ✅ {index.name}")
+
+
+def migrate():
+    """마이그레이션 실행"""
+    print("=" * 60)
+    print("📊 숫자 가격 컬럼 마이그레이션")
+    print("=" * 60)
+
+    try:
+        with engine.begin() as conn:
+            add_missing_columns(conn)
+
+        print("\n🔄 가격 문자열 백필 중...")
+        db = SessionLocal()
+        try:
+            counts = backfill_price_values(db)
+        finally:
+            db.close()
+        for table_name, count in counts.items():
+            print(f"   ✅ {table_name}: {count:,}건")
+
+        # 백필 후 인덱스를 만들어야 인덱스 갱신 비용 없이 한 번에 생성됨
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            create_indexes(conn)
+
+        print("✅ 마이그레이션 완료!")
+
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+    return True
+
+
+if __name__ == "__main__":
+    migrate()
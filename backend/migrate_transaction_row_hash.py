@@ -0,0 +1,129 @@
+"""
+실거래가 중복 방지 해시 마이그레이션 스크립트
+
+- transactions.row_hash 컬럼 추가
+- 기존 행 해시 백필 (app.services.transaction_service.transaction_row_hash)
+- 같은 해시의 중복 행 정리 (가장 먼저 저장된 행 유지)
+- 유니크 인덱스 생성: uq_transactions_row_hash
+
+이후 실거래 저장은 INSERT ... ON CONFLICT (row_hash) DO NOTHING 으로 중복을 건너뜁니다.
+여러 번 실행해도 안전합니다.
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from sqlalchemy import bindparam, func, inspect, select, text, update
+from sqlalchemy.schema import CreateIndex
+
+from app.core.database import engine
+from app.models.complex import Transaction
+from app.services.transaction_service import transaction_row_hash
+
+BACKFILL_BATCH_SIZE = 5000
+
+
+def add_row_hash_column(conn):
+    """row_hash 컬럼 추가 (없을 때만)"""
+    table = Transaction.__table__
+    existing = {c['name'] for c in inspect(conn).get_columns(table.name)}
+    if 'row_hash' in existing:
+        return
+
+    column_type = table.c.row_hash.type.compile(dialect=conn.dialect)
+    conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN row_hash {column_type}"))
+    print(f"   ✅ {table.name}.row_hash 컬럼 추가")
+
+
+def backfill_row_hashes(conn) -> int:
+    """row_hash가 비어 있는 행 해시 계산 (배치 UPDATE)"""
+    t = Transaction.__table__
+    stmt = update(t).where(t.c.id == bindparam('_id')).values(row_hash=bindparam('_hash'))
+    total = 0
+
+    while True:
+        rows = conn.execute(
+            select(t.c.id, t.c.complex_id, t.c.trade_type, t.c.trade_date, t.c.exclusive_area, t.c.floor, t.c.deal_price)
+            .where(t.c.row_hash.is_(None))
+            .order_by(t.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            return total
+
+        conn.execute(stmt, [
+            {
+                '_id': row.id,
+                '_hash': transaction_row_hash(
+                    row.complex_id, row.trade_type, row.trade_date,
+                    row.exclusive_area, row.floor, row.deal_price
+                ),
+            }
+            for row in rows
+        ])
+        total += len(rows)
+        print(f"   ⏳ {total:,}건 백필")
+
+
+def delete_duplicates(conn) -> int:
+    """같은 row_hash 중 가장 작은 id만 남기고 삭제"""
+    t = Transaction.__table__
+    keep = select(func.min(t.c.id)).group_by(t.c.row_hash).scalar_subquery()
+    result = conn.execute(t.delete().where(t.c.id.not_in(keep)))
+    return result.rowcount
+
+
+def create_unique_index(conn):
+    """
+    유니크 인덱스 생성 (없을 때만)
+
+    PostgreSQL은 수집 중에도 쓰기가 막히지 않도록 CREATE INDEX CONCURRENTLY 사용
+    """
+    table = Transaction.__table__
+    existing = {i['name'] for i in inspect(conn).get_indexes(table.name)}
+
+    for index in table.indexes:
+        if index.name in existing or 'row_hash' not in index.columns:
+            continue
+        print(f"   ⏳ 인덱스 생성: {index.name}")
+        ddl = str(CreateIndex(index).compile(dialect=conn.dialect))
+        if conn.dialect.name == 'postgresql':
+            ddl = ddl.replace("CREATE UNIQUE INDEX", "CREATE UNIQUE INDEX CONCURRENTLY", 1)
+        conn.execute(text(ddl))
+        print(f"   ✅ {index.name}")
+
+
+def migrate():
+    """마이그레이션 실행"""
+    print("=" * 60)
+    print("📊 실거래가 중복 방지 해시 마이그레이션")
+    print("=" * 60)
+
+    try:
+        with engine.begin() as conn:
+            add_row_hash_column(conn)
+
+        print("\n🔄 기존 실거래 해시 백필 중...")
+        with engine.begin() as conn:
+            backfilled = backfill_row_hashes(conn)
+            deleted = delete_duplicates(conn)
+        print(f"   ✅ 백필 {backfilled:,}건, 중복 삭제 {deleted:,}건")
+
+        # 백필/중복 정리 후 인덱스를 만들어야 유니크 위반 없이 한 번에 생성됨
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            create_unique_index(conn)
+
+        print("✅ 마이그레이션 완료!")
+
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+    return True
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,126 @@
+"""
+주소 해석(AddressResolver) 테스트 스크립트
+
+app/data/dong_code_active.txt 로 만든 색인(프로세스 공용, pickle 캐시)으로 여러 형태의 주소가
+가장 구체적인 법정동 단위로 해석되는지 확인합니다. 네트워크와 DB 없이 실행됩니다.
+"""
+import os
+import sys
+import tempfile
+
+# 프로젝트 루트를 파이썬 경로에 추가
+sys.path.insert(0, os.path.dirname(__file__))
+
+from app.services import dong_code_index
+from app.services.dong_code_index import DongCodeIndex, get_dong_code_index, load_or_compile
+from app.services.location_parser import LocationParser
+
+parser = LocationParser()
+resolver = parser.resolver
+
+
+def test_address_forms():
+    """정식 명칭 / 약칭 / 시도 생략 / 띄어쓰기 없음"""
+    cases = {
+        "서울특별시 강남구 대치동 316": "11680106",
+        "서울 강남구 대치동": "11680106",
+        "서울시강남구대치동 316": "11680106",
+        "경기 성남시 분당구 정자동 178-1": "41135103",
+        "성남시 분당구 정자동": "41135103",
+        "세종특별자치시 조치원읍 원리 12": "3611025021",
+        "서울특별시 강남구 테헤란로 123": "11680",
+    }
+    for address, expected in cases.items():
+        match = resolver.resolve(address)
+        assert match and match["code"] == expected, f"{address}: {match}"
+    print(f"✅ 주소 형태 {len(cases)}가지")
+
+
+def test_most_specific_match():
+    """상위 단위와 맞는 후보 우선, 동점이면 공통 상위 단위"""
+    # 신당동은 서울 중구/대구 달서구/천안 서북구에 있지만 중구와 맞는 곳은 하나
+    assert resolver.resolve("중구 신당동")["code"] == "11140162"
+    # 후보가 하나뿐인 법정동은 시군구 없이도 해석
+    assert parser.extract_sigungu_code("대치동 316") == "11680"
+    # 성남시 아래 구가 셋 → 경기도까지만 확정
+    assert resolver.resolve("성남시")["level"] == "sido"
+    assert parser.extract_sigungu_code("성남시") is None
+    assert parser.extract_sigungu_code("신당동") is None
+    print("✅ 가장 구체적인 단위 / 모호한 주소")
+
+
+def test_boundaries():
+    """긴 이름 우선, 단지 이름 속 글자는 무시"""
+    assert parser.extract_sigungu_code("서울특별시 강동구 천호동") == "11740"  # "동구"가 아닌 "강동구"
+    assert parser.extract_sigungu_code("경기도 광주시 오포읍") == "41610"  # 광주광역시 아님
+    assert parser.extract_sigungu_code("광주 북구 오치동") == "29170"
+    assert resolver.match_terms("대치동 경남아파트") == ["대치동"]
+    # 앞에 한글이 붙은 토큰도 무시 ("나성동"의 "성동"), 토큰끼리 붙은 경우는 허용
+    assert resolver.match_terms("세종특별자치시 나성동") == ["세종특별자치시"]
+    assert resolver.match_terms("서울시강남구대치동") == ["서울시", "강남구", "대치동"]
+    print("✅ 토큰 경계")
+
+
+def test_conflicting_province():
+    """시도와 어긋나는 다른 지역 후보는 선택하지 않음"""
+    assert parser.extract_sigungu_code("세종특별자치시 나성동") == "36110"  # 대구 수성구(27260) 아님
+    assert parser.extract_sigungu_code("세종특별자치시 반곡동") == "36110"  # 원주 반곡동(51130) 아님
+    assert parser.extract_sigungu_code("반곡동") == "51130"  # 시도가 없으면 유일한 후보 사용
+    assert parser.extract_sigungu_code("서울 중구 신당동") == "11140"
+    print("✅ 시도와 어긋나는 후보 제외")
+
+
+def test_location_info_and_search():
+    """get_location_info / search_locations"""
+    info = parser.get_location_info("경기도 용인시 수지구 죽전동")
+    assert info["sigungu_code"] == "41465"
+    assert info["location_name"] == "경기도 용인시 수지구"
+    assert info["matched_level"] == "dong"
+
+    results = parser.search_locations("분당")
+    assert results == [{"name": "경기도 성남시 분당구", "code": "41135"}]
+    print("✅ 위치 정보 / 검색")
+
+
+def test_compiled_index():
+    """색인 파일 컴파일/재사용/버전 변경 시 재컴파일, 프로세스 공용 인스턴스"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "dong_code_index.pickle")
+
+        compiled = load_or_compile(path)
+        assert os.path.exists(path)
+        loaded = load_or_compile(path)
+        assert loaded.version == compiled.version
+        assert loaded.resolver.resolve("서울 강남구 대치동")["code"] == "11680106"
+
+        # 색인 형식이 바뀌면 기존 파일 무시
+        original = dong_code_index.INDEX_FORMAT
+        dong_code_index.INDEX_FORMAT = original + 1
+        try:
+            assert DongCodeIndex.load(path, dong_code_index.source_version()) is None
+        finally:
+            dong_code_index.INDEX_FORMAT = original
+
+    assert LocationParser().resolver is LocationParser().resolver is get_dong_code_index().resolver
+    print("✅ 컴파일된 색인 / 공용 인스턴스")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🧪 주소 해석 테스트")
+    print("=" * 60)
+
+    try:
+        test_address_forms()
+        test_most_specific_match()
+        test_boundaries()
+        test_conflicting_province()
+        test_location_info_and_search()
+        test_compiled_index()
+        print("\n✅ 모든 테스트 완료!")
+
+    except Exception as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
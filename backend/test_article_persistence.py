@@ -0,0 +1,170 @@
+"""
+매물 일괄 저장(bulk upsert) 테스트 스크립트
+
+SQLite 메모리 DB에 매물 목록을 저장하면서 신규/가격변동/변동없음 분류, 배치 내 중복 제거,
+비활성 매물 재활성화, last_seen_at 갱신, 사라진 매물 비활성화(빈 크롤링 보호 포함)를 확인합니다.
+ON CONFLICT를 지원하지 않는 DB용 ORM 저장 경로도 같은 결과를 내는지 확인합니다.
+"""
+import sys
+import os
+
+# 프로젝트 루트를 파이썬 경로에 추가
+sys.path.insert(0, os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "tests", "stubs"))
+
+from datetime import datetime
+
+from sqlite_db import create_test_session
+
+import app.services.article_persistence as article_persistence
+from app.models.complex import Article, Complex
+from app.services.article_persistence import deactivate_missing_articles, upsert_articles
+
+TestSession = create_test_session()
+
+LONG_AGO = datetime(2020, 1, 1)
+
+
+def make_article(article_no, price, trade_type="매매"):
+    """매물 목록 API의 articleList 항목"""
+    return {
+        "articleNo": article_no,
+        "tradeTypeName": trade_type,
+        "dealOrWarrantPrc": price,
+        "areaName": "84A",
+        "floorInfo": "10/20",
+        "tagList": ["역세권"],
+    }
+
+
+def articles_of(db, complex_id):
+    return {a.article_no: a for a in db.query(Article).filter(Article.complex_id == complex_id)}
+
+
+def run_upsert_scenario(complex_id):
+    """신규 → 가격변동/변동없음/중복 → 재활성화/last_seen_at → 비활성화 순으로 저장 결과 확인"""
+    db = TestSession()
+    db.add(Complex(complex_id=complex_id, complex_name=f"단지 {complex_id}"))
+    db.commit()
+
+    no = lambda n: f"{complex_id}-{n}"
+
+    # 1) 처음 크롤링: 모두 신규
+    first = [
+        make_article(no(1), "10억"),
+        make_article(no(2), "8억"),
+        make_article(no(3), "5,000/140", trade_type="월세"),
+    ]
+    counts = upsert_articles(db, complex_id, first)
+    db.commit()
+    assert counts == {"new": 3, "updated": 0, "unchanged": 0, "duplicates": 0, "collected": 3}, counts
+
+    saved = articles_of(db, complex_id)
+    assert saved[no(1)].price_value == 100000 and saved[no(1)].is_active
+    assert saved[no(3)].price == "5,000" and saved[no(3)].monthly_rent == "140"
+    assert saved[no(3)].deposit_value == 5000 and saved[no(3)].monthly_rent_value == 140
+
+    # 2) 매매가 변동, 월세만 변동, 변동없음, 배치 내 중복(첫 항목 유지)
+    second = [
+        make_article(no(1), "10억 5,000"),
+        make_article(no(2), "8억"),
+        make_article(no(2), "7억"),
+        make_article(no(3), "5,000/150", trade_type="월세"),
+    ]
+    counts = upsert_articles(db, complex_id, second)
+    db.commit()
+    assert counts == {"new": 0, "updated": 2, "unchanged": 1, "duplicates": 1, "collected": 3}, counts
+
+    db.expire_all()
+    saved = articles_of(db, complex_id)
+    assert len(saved) == 3
+    assert saved[no(1)].price == "10억 5,000" and saved[no(1)].price_value == 105000
+    assert saved[no(2)].price == "8억" and saved[no(2)].price_value == 80000
+    assert saved[no(3)].monthly_rent == "150" and saved[no(3)].monthly_rent_value == 150
+
+    # 3) 비활성 매물이 다시 나타나면 재활성화 (가격변동/변동없음 모두), last_seen_at 갱신
+    for article in saved.values():
+        article.is_active = False
+        article.last_seen_at = LONG_AGO
+    db.commit()
+
+    third = [
+        make_article(no(1), "11억"),
+        make_article(no(2), "8억"),
+        make_article(no(3), "5,000/150", trade_type="월세"),
+    ]
+    counts = upsert_articles(db, complex_id, third)
+    db.commit()
+    assert counts["updated"] == 1 and counts["unchanged"] == 2, counts
+
+    db.expire_all()
+    saved = articles_of(db, complex_id)
+    for article in saved.values():
+        assert article.is_active, article
+        assert article.last_seen_at.replace(tzinfo=None) > LONG_AGO, article.last_seen_at
+
+    # 4) 이번 크롤링에 없는 매물만 비활성화, 빈 크롤링 결과는 무시
+    assert deactivate_missing_articles(db, complex_id, []) == 0
+    db.commit()
+    assert all(a.is_active for a in articles_of(db, complex_id).values())
+
+    assert deactivate_missing_articles(db, complex_id, [no(1), no(2)]) == 1
+    db.commit()
+    db.expire_all()
+    saved = articles_of(db, complex_id)
+    assert saved[no(1)].is_active and saved[no(2)].is_active and not saved[no(3)].is_active
+
+    # 이미 비활성인 매물은 다시 세지 않음
+    assert deactivate_missing_articles(db, complex_id, [no(1), no(2)]) == 0
+    db.commit()
+    db.close()
+
+
+def test_upsert_on_conflict():
+    """INSERT ... ON CONFLICT 경로 (SQLite 방언)"""
+    run_upsert_scenario("A")
+    print("✅ ON CONFLICT 일괄 저장")
+
+
+def test_upsert_orm_fallback():
+    """ON CONFLICT 미지원 DB용 ORM 저장 경로"""
+    original = article_persistence.get_conflict_insert
+    article_persistence.get_conflict_insert = lambda db: None
+    try:
+        run_upsert_scenario("B")
+    finally:
+        article_persistence.get_conflict_insert = original
+    print("✅ ORM 일괄 저장 (ON CONFLICT 미지원 DB)")
+
+
+def test_other_complex_untouched():
+    """다른 단지 매물은 비활성화 대상이 아님"""
+    db = TestSession()
+    db.add(Complex(complex_id="C", complex_name="단지 C"))
+    db.commit()
+    upsert_articles(db, "C", [make_article("C-1", "9억")])
+    db.commit()
+
+    assert deactivate_missing_articles(db, "D", ["D-1"]) == 0
+    db.commit()
+    assert articles_of(db, "C")["C-1"].is_active
+    db.close()
+    print("✅ 다른 단지 매물 유지")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🧪 매물 일괄 저장 테스트")
+    print("=" * 60)
+
+    try:
+        test_upsert_on_conflict()
+        test_upsert_orm_fallback()
+        test_other_complex_untouched()
+        print("\n✅ 모든 테스트 완료!")
+
+    except Exception as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
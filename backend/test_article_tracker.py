@@ -0,0 +1,202 @@
+"""
+매물 변동 감지 테스트 스크립트
+
+SQLite 메모리 DB에서 두 번 스냅샷을 만들고 detect_changes가 FULL OUTER JOIN + INSERT ... SELECT로
+신규/삭제/가격상승/가격하락을 기록하는지, 반환 건수가 기록된 행과 같은지 확인합니다.
+crawl_sessions 행이 없는 (세션 테이블 도입 전) 단지는 스냅샷 GROUP BY로 최근 세션을 찾는지도 확인합니다.
+
+주의: SQLite는 3.39.0부터 FULL OUTER JOIN을 지원합니다. 그보다 오래된 SQLite에서는 변동 감지 테스트를 건너뜁니다.
+"""
+import sys
+import os
+
+# 프로젝트 루트를 파이썬 경로에 추가
+sys.path.insert(0, os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "tests", "stubs"))
+
+import sqlite3
+from datetime import datetime, timedelta
+
+from sqlite_db import create_test_session
+
+from app.models.complex import Article, ArticleChange, ArticleSnapshot, Complex, CrawlSession
+from app.services.article_tracker import ArticleTracker
+
+TestSession = create_test_session()
+
+# FULL OUTER JOIN 지원 여부
+SUPPORTS_FULL_JOIN = sqlite3.sqlite_version_info >= (3, 39, 0)
+
+NOW = datetime.now().replace(microsecond=0)
+
+# 이전 크롤링 매물 (매물 번호, 가격 문자열, 가격값)
+BEFORE = [
+    ("keep", "8억", 80000),
+    ("up", "10억", 100000),
+    ("down", "9억", 90000),
+    ("gone", "7억", 70000),
+]
+# 이번 크롤링 매물
+AFTER = [
+    ("keep", "8억", 80000),
+    ("up", "11억", 110000),
+    ("down", "8억 1,000", 81000),
+    ("fresh", "6억", 60000),
+]
+
+
+def seed_two_sessions(complex_id):
+    """이전/이번 크롤링 스냅샷 2개 생성 (articles → create_snapshot)"""
+    db = TestSession()
+    db.add(Complex(complex_id=complex_id, complex_name=f"단지 {complex_id}"))
+    for article_no, price, price_value in BEFORE:
+        db.add(Article(
+            article_no=f"{complex_id}-{article_no}", complex_id=complex_id, trade_type="매매",
+            price=price, price_value=price_value, area_name="84A", building_name="101동", floor_info="5/20"
+        ))
+    db.commit()
+
+    tracker = ArticleTracker(db)
+    prev_session = tracker.create_snapshot(complex_id, started_at=NOW - timedelta(hours=1))
+
+    articles = {a.article_no: a for a in db.query(Article).filter(Article.complex_id == complex_id)}
+    articles[f"{complex_id}-gone"].is_active = False
+    for article_no, price, price_value in AFTER:
+        article = articles.get(f"{complex_id}-{article_no}")
+        if article is None:
+            db.add(Article(
+                article_no=f"{complex_id}-{article_no}", complex_id=complex_id, trade_type="매매",
+                price=price, price_value=price_value, area_name="59B"
+            ))
+        else:
+            article.price, article.price_value = price, price_value
+    db.commit()
+
+    curr_session = tracker.create_snapshot(complex_id, started_at=NOW)
+    db.close()
+    return prev_session, curr_session
+
+
+def check_changes(complex_id, counts):
+    """기록된 변동 행과 반환 건수 확인"""
+    assert counts == {"new": 1, "removed": 1, "price_up": 1, "price_down": 1}, counts
+
+    db = TestSession()
+    changes = {
+        c.article_no: c for c in
+        db.query(ArticleChange).filter(ArticleChange.complex_id == complex_id)
+    }
+    assert sorted(changes) == sorted(f"{complex_id}-{n}" for n in ("up", "down", "gone", "fresh")), sorted(changes)
+
+    fresh = changes[f"{complex_id}-fresh"]
+    assert fresh.change_type == "NEW" and fresh.old_price is None and fresh.new_price_value == 60000
+    assert fresh.area_name == "59B" and fresh.from_snapshot_id is None and fresh.to_snapshot_id is not None
+    assert fresh.price_change_amount is None and fresh.price_change_percent is None
+
+    gone = changes[f"{complex_id}-gone"]
+    assert gone.change_type == "REMOVED" and gone.old_price == "7억" and gone.new_price is None
+    assert gone.building_name == "101동" and gone.to_snapshot_id is None
+
+    up = changes[f"{complex_id}-up"]
+    assert up.change_type == "PRICE_UP" and (up.old_price, up.new_price) == ("10억", "11억")
+    assert up.price_change_amount == 10000 and up.price_change_percent == 10.0
+
+    down = changes[f"{complex_id}-down"]
+    assert down.change_type == "PRICE_DOWN" and down.price_change_amount == -9000
+    assert down.price_change_percent == -10.0
+
+    # 스냅샷 ID가 각 세션의 같은 매물 행을 가리킴
+    from_snapshot = db.get(ArticleSnapshot, up.from_snapshot_id)
+    to_snapshot = db.get(ArticleSnapshot, up.to_snapshot_id)
+    assert from_snapshot.price_value == 100000 and to_snapshot.price_value == 110000
+    db.close()
+
+
+def test_recent_session_ids():
+    """crawl_sessions 기준 최근 2개 세션 (최신순), 세션 행이 없으면 스냅샷 GROUP BY로 대체"""
+    prev_session, curr_session = seed_two_sessions("S")
+
+    db = TestSession()
+    tracker = ArticleTracker(db)
+    assert tracker._get_recent_session_ids("S") == [curr_session, prev_session]
+
+    # 세션 테이블 도입 전 데이터: crawl_sessions 없이 스냅샷만 존재
+    db.query(CrawlSession).filter(CrawlSession.complex_id == "S").delete()
+    db.query(ArticleSnapshot).filter(ArticleSnapshot.crawl_session_id == prev_session).update(
+        {ArticleSnapshot.snapshot_date: NOW - timedelta(hours=1)}
+    )
+    db.commit()
+    assert tracker._get_recent_session_ids("S") == [curr_session, prev_session]
+    assert tracker._get_recent_session_ids("unknown") == []
+    db.close()
+    print("✅ 최근 세션 조회 (crawl_sessions / 스냅샷 대체)")
+
+
+def test_detect_changes():
+    """두 세션 비교: 신규/삭제/가격상승/가격하락 기록 및 건수"""
+    if not SUPPORTS_FULL_JOIN:
+        print(f"⚠️  SQLite {sqlite3.sqlite_version}는 FULL OUTER JOIN 미지원 (3.39.0 이상 필요) - 건너뜀")
+        return
+
+    seed_two_sessions("D")
+    db = TestSession()
+    counts = ArticleTracker(db).detect_changes("D")
+    db.close()
+
+    check_changes("D", counts)
+    print(f"✅ 변동 감지: {counts}")
+
+
+def test_detect_changes_snapshot_fallback():
+    """crawl_sessions가 비어 있어도 스냅샷 기준으로 같은 변동 감지"""
+    if not SUPPORTS_FULL_JOIN:
+        print(f"⚠️  SQLite {sqlite3.sqlite_version}는 FULL OUTER JOIN 미지원 (3.39.0 이상 필요) - 건너뜀")
+        return
+
+    prev_session, _ = seed_two_sessions("F")
+    db = TestSession()
+    db.query(CrawlSession).filter(CrawlSession.complex_id == "F").delete()
+    db.query(ArticleSnapshot).filter(ArticleSnapshot.crawl_session_id == prev_session).update(
+        {ArticleSnapshot.snapshot_date: NOW - timedelta(hours=1)}
+    )
+    db.commit()
+
+    counts = ArticleTracker(db).detect_changes("F")
+    db.close()
+
+    check_changes("F", counts)
+    print("✅ 변동 감지 (crawl_sessions 없음)")
+
+
+def test_single_session():
+    """스냅샷이 하나뿐이면 변동 없음"""
+    db = TestSession()
+    db.add(Complex(complex_id="O", complex_name="단지 O"))
+    db.add(Article(article_no="O-1", complex_id="O", price="5억", price_value=50000))
+    db.commit()
+
+    tracker = ArticleTracker(db)
+    tracker.create_snapshot("O")
+    assert tracker.detect_changes("O") == {"new": 0, "removed": 0, "price_up": 0, "price_down": 0}
+    assert db.query(ArticleChange).filter(ArticleChange.complex_id == "O").count() == 0
+    db.close()
+    print("✅ 이전 스냅샷 없음")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🧪 매물 변동 감지 테스트")
+    print("=" * 60)
+
+    try:
+        test_recent_session_ids()
+        test_detect_changes()
+        test_detect_changes_snapshot_fallback()
+        test_single_session()
+        print("\n✅ 모든 테스트 완료!")
+
+    except Exception as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,120 @@
+"""
+단지 위치 검색 테스트 스크립트 (geohash / 반경 / 지도 영역)
+
+SQLite 메모리 DB에 단지를 만들어 모델 이벤트로 geohash가 채워지는지,
+/api/complexes/nearby, /api/complexes/bbox 가 거리순으로 반환하는지 확인합니다.
+"""
+import sys
+import os
+
+# 프로젝트 루트를 파이썬 경로에 추가
+sys.path.insert(0, os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "tests", "stubs"))
+
+from sqlite_db import create_test_session
+
+from app.core.geohash import cover_ranges, encode, haversine_m, next_prefix
+from app.models.complex import Complex
+
+TestSession = create_test_session()
+
+# 강남역 기준
+GANGNAM = (37.4979, 127.0276)
+COMPLEXES = [
+    ("1", "역삼 래미안", 37.4995, 127.0300),     # 약 280m
+    ("2", "대치 은마", 37.4990, 127.0630),       # 약 3.1km
+    ("3", "서초 아크로", 37.4920, 127.0150),     # 약 1.3km
+    ("4", "분당 파크뷰", 37.3660, 127.1080),     # 약 16.4km
+    ("5", "좌표 없음", None, None),
+]
+
+
+def test_geohash():
+    """인코딩 / 다음 격자 / 영역 커버"""
+    assert encode(57.64911, 10.40744) == "u4pruydqq"
+    assert next_prefix("wydm9") == "wydmb" and next_prefix("wydmz") == "wydn0" and next_prefix("zz") is None
+
+    ranges = cover_ranges(37.49, 127.02, 37.51, 127.04)
+    assert 1 <= len(ranges) <= 24
+    inside = encode(37.50, 127.03)
+    assert any(lower <= inside and (upper is None or inside < upper) for lower, upper in ranges)
+    print(f"✅ geohash (영역 커버 범위 {len(ranges)}개)")
+
+
+def test_geohash_synced_on_save():
+    """단지 저장/좌표 변경 시 geohash 자동 계산"""
+    db = TestSession()
+    for complex_id, name, latitude, longitude in COMPLEXES:
+        db.add(Complex(complex_id=complex_id, complex_name=name, latitude=latitude, longitude=longitude))
+    db.commit()
+
+    complex_obj = db.query(Complex).filter(Complex.complex_id == "1").one()
+    assert complex_obj.geohash == encode(37.4995, 127.0300)
+    assert db.query(Complex).filter(Complex.complex_id == "5").one().geohash is None
+
+    complex_obj.latitude = 37.5
+    db.commit()
+    assert complex_obj.geohash == encode(37.5, 127.0300)
+    complex_obj.latitude = 37.4995
+    db.commit()
+    db.close()
+    print("✅ 저장 시 geohash 갱신")
+
+
+def test_endpoints():
+    """반경 / 영역 검색 API (거리순)"""
+    from fastapi.testclient import TestClient
+    from app.core.database import get_db
+    from app.main import app
+
+    def override_get_db():
+        db = TestSession()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    client = TestClient(app)
+
+    lat, lng = GANGNAM
+    response = client.get("/api/complexes/nearby", params={"lat": lat, "lng": lng, "radius": 2000})
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert [item["complex_id"] for item in body] == ["1", "3"]
+    assert body[0]["distance_m"] < body[1]["distance_m"] < 2000
+    assert abs(body[0]["distance_m"] - haversine_m(lat, lng, 37.4995, 127.0300)) < 1
+
+    response = client.get("/api/complexes/nearby", params={"lat": lat, "lng": lng, "radius": 20000, "limit": 3})
+    assert [item["complex_id"] for item in response.json()] == ["1", "3", "2"]
+
+    response = client.get("/api/complexes/bbox", params={"south": 37.48, "west": 127.0, "north": 37.52, "east": 127.07})
+    assert response.status_code == 200, response.text
+    assert {item["complex_id"] for item in response.json()} == {"1", "2", "3"}
+
+    response = client.get("/api/complexes/bbox", params={"south": 37.52, "west": 127.0, "north": 37.48, "east": 127.07})
+    assert response.status_code == 400
+
+    # /{complex_id} 보다 먼저 선언되어 있어야 함
+    assert client.get("/api/complexes/1").json()["complex_id"] == "1"
+
+    app.dependency_overrides.clear()
+    print("✅ /nearby, /bbox API")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🧪 단지 위치 검색 테스트")
+    print("=" * 60)
+
+    try:
+        test_geohash()
+        test_geohash_synced_on_save()
+        test_endpoints()
+        print("\n✅ 모든 테스트 완료!")
+
+    except Exception as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
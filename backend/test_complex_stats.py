@@ -0,0 +1,236 @@
+"""
+단지 통계 일괄 조회 테스트 스크립트
+
+SQLite 메모리 DB에 단지/매물/실거래/변동 이력을 만들어
+조건부 집계 기반 get_complex_stats_batch 결과가 기존 단지별 쿼리 방식과 같은지,
+GET /api/complexes/stats?ids= 와 /api/complexes/{id}/stats 가 같은 값을 반환하는지,
+한 번에 100개를 넘는 단지 요청은 400을 반환하는지 확인합니다.
+"""
+import sys
+import os
+import re
+
+# 프로젝트 루트를 파이썬 경로에 추가
+sys.path.insert(0, os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "tests", "stubs"))
+
+from datetime import datetime, timedelta, timezone
+
+from fastapi.encoders import jsonable_encoder
+
+from sqlite_db import create_test_session
+
+from app.models.complex import Article, ArticleChange, Complex, Transaction
+from app.schemas.complex import TransactionResponse
+from app.services.complex_stats import MAX_BATCH_COMPLEXES, get_complex_stats_batch
+from app.services.price_parser import format_price
+
+TestSession = create_test_session()
+
+# SQLite는 시간대 없이 저장하므로 UTC 기준 naive 시각으로 기록
+NOW_UTC = datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _seed():
+    """매물/실거래/변동이 골고루 있는 단지, 월세만 있는 단지, 아무 데이터 없는 단지"""
+    db = TestSession()
+    db.add(Complex(
+        complex_id="full", complex_name="데이터 많은 단지", address="서울 강남구", total_households=1200,
+        min_price=90000, max_price=150000, min_lease_price=60000, max_lease_price=80000
+    ))
+    db.add(Complex(complex_id="rent", complex_name="월세 단지", address="서울 마포구"))
+    db.add(Complex(complex_id="empty", complex_name="빈 단지"))
+    db.flush()
+
+    articles = [
+        ("full", "매매", "10억", 100000, None, None, True),
+        ("full", "매매", "12억", 120000, None, None, True),
+        ("full", "매매", "9억", 90000, None, None, False),  # 비활성
+        ("full", "전세", "6억", 60000, 60000, None, True),
+        ("full", "월세", "5,000", 5000, 5000, 150, True),
+        ("full", "월세", "1억", 10000, 10000, 90, True),
+        ("rent", "월세", "3,000", 3000, 3000, 120, True),
+        ("rent", "월세", "2,000", 2000, 2000, 130, False),  # 비활성 - 가격 범위에서 제외
+    ]
+    for i, (complex_id, trade_type, price, price_value, deposit, rent, active) in enumerate(articles):
+        db.add(Article(
+            article_no=f"a{i}", complex_id=complex_id, trade_type=trade_type, price=price,
+            price_value=price_value, deposit_value=deposit, is_active=active,
+            monthly_rent=str(rent) if rent is not None else None, monthly_rent_value=rent
+        ))
+
+    for trade_date, price in [("20240105", 105000), ("20240320", 118000), ("20240211", 99000)]:
+        db.add(Transaction(
+            complex_id="full", trade_type="매매", trade_date=trade_date, deal_price=price,
+            formatted_price=format_price(price), floor=10, area=84.97, exclusive_area=84.97
+        ))
+    db.add(Transaction(complex_id="rent", trade_type="매매", trade_date="20231201", deal_price=50000, floor=2))
+
+    for complex_id, change_type, hours_ago in [
+        ("full", "NEW", 1), ("full", "NEW", 5), ("full", "PRICE_UP", 2), ("full", "PRICE_DOWN", 3),
+        ("full", "REMOVED", 30),  # 24시간 이전 - 제외
+        ("rent", "REMOVED", 4),
+    ]:
+        db.add(ArticleChange(
+            complex_id=complex_id, article_no="x", change_type=change_type,
+            detected_at=NOW_UTC - timedelta(hours=hours_ago)
+        ))
+    db.commit()
+    db.close()
+
+
+_seed()
+
+
+def _extract_price_number(price_str):
+    """기존 구현의 가격 문자열 → 숫자 ("1억" → 10000, "5,000" → 5000)"""
+    if not price_str:
+        return 0
+    price_str = price_str.replace(',', '')
+    if '억' in price_str:
+        parts = price_str.split('억')
+        eok = int(re.sub(r'\D', '', parts[0])) if parts[0].strip() else 0
+        man = int(re.sub(r'\D', '', parts[1])) if len(parts) > 1 and parts[1].strip() else 0
+        return eok * 10000 + man
+    digits = re.sub(r'\D', '', price_str)
+    return int(digits) if digits else 0
+
+
+def legacy_complex_stats(db, complex_id):
+    """기존 /{complex_id}/stats 구현 (단지마다 쿼리 8회 + 월세/24시간 변동 전체 로드) - 비교 기준"""
+    complex_obj = db.query(Complex).filter(Complex.complex_id == complex_id).first()
+    active = db.query(Article).filter(Article.complex_id == complex_id, Article.is_active == True)
+
+    recent_transaction = db.query(Transaction).filter(
+        Transaction.complex_id == complex_id
+    ).order_by(Transaction.trade_date.desc()).first()
+
+    # 월세 가격 범위: 원문 문자열을 숫자로 바꿔 정렬한 뒤 양 끝 매물의 문자열 그대로 반환
+    monthly_articles = db.query(Article.price, Article.monthly_rent).filter(
+        Article.complex_id == complex_id,
+        Article.is_active == True,
+        Article.trade_type == "월세",
+        Article.price.isnot(None)
+    ).all()
+    deposits = sorted((p[0] for p in monthly_articles if p[0]), key=_extract_price_number)
+    rents = sorted((p[1] for p in monthly_articles if p[1]), key=_extract_price_number)
+
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=24)
+    changes_24h = db.query(ArticleChange).filter(
+        ArticleChange.complex_id == complex_id,
+        ArticleChange.detected_at >= cutoff
+    ).all()
+
+    return {
+        "complex_id": complex_id,
+        "complex_name": complex_obj.complex_name,
+        "total_households": complex_obj.total_households,
+        "address": complex_obj.address,
+        "articles": {
+            "total": active.count(),
+            "sale": active.filter(Article.trade_type == "매매").count(),
+            "lease": active.filter(Article.trade_type == "전세").count(),
+            "monthly": active.filter(Article.trade_type == "월세").count(),
+        },
+        "price_range": {
+            "sale_min": complex_obj.max_price,
+            "sale_max": complex_obj.min_price,
+            "lease_min": complex_obj.max_lease_price,
+            "lease_max": complex_obj.min_lease_price,
+            "monthly_deposit_min": deposits[-1] if deposits else None,
+            "monthly_deposit_max": deposits[0] if deposits else None,
+            "monthly_rent_min": rents[-1] if rents else None,
+            "monthly_rent_max": rents[0] if rents else None,
+        },
+        "transactions": {
+            "total": db.query(Transaction).filter(Transaction.complex_id == complex_id).count(),
+            "recent": TransactionResponse.model_validate(recent_transaction) if recent_transaction else None
+        },
+        "changes_24h": {
+            "new": sum(1 for c in changes_24h if c.change_type == 'NEW'),
+            "removed": sum(1 for c in changes_24h if c.change_type == 'REMOVED'),
+            "price_up": sum(1 for c in changes_24h if c.change_type == 'PRICE_UP'),
+            "price_down": sum(1 for c in changes_24h if c.change_type == 'PRICE_DOWN')
+        }
+    }
+
+
+def test_batch_matches_legacy():
+    """일괄 집계 결과 = 기존 단지별 결과 (없는 단지/중복 ID 제외)"""
+    db = TestSession()
+    batch = get_complex_stats_batch(db, ["full", "rent", "empty", "missing", "full"])
+    assert sorted(batch) == ["empty", "full", "rent"], sorted(batch)
+
+    for complex_id, stats in batch.items():
+        expected = legacy_complex_stats(db, complex_id)
+        assert jsonable_encoder(stats) == jsonable_encoder(expected), (complex_id, stats, expected)
+
+    full = batch["full"]
+    assert full["articles"] == {"total": 5, "sale": 2, "lease": 1, "monthly": 2}
+    assert full["changes_24h"] == {"new": 2, "removed": 0, "price_up": 1, "price_down": 1}
+    assert full["transactions"]["total"] == 3 and full["transactions"]["recent"].trade_date == "20240320"
+    assert full["price_range"]["monthly_deposit_min"] == "1억" and full["price_range"]["monthly_deposit_max"] == "5,000"
+    assert full["price_range"]["monthly_rent_min"] == "150" and full["price_range"]["monthly_rent_max"] == "90"
+    assert batch["rent"]["price_range"]["monthly_rent_min"] == "120"  # 비활성 매물(130) 제외
+    assert batch["empty"]["price_range"]["monthly_deposit_min"] is None
+    assert batch["empty"]["transactions"] == {"total": 0, "recent": None}
+
+    assert get_complex_stats_batch(db, []) == {}
+    db.close()
+    print("✅ 일괄 집계 = 기존 단지별 결과")
+
+
+def test_endpoints():
+    """/api/complexes/stats?ids= 와 /{complex_id}/stats 일치, 100개 초과 400"""
+    from fastapi.testclient import TestClient
+    from app.core.database import get_db
+    from app.main import app
+
+    def override_get_db():
+        db = TestSession()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    client = TestClient(app)
+
+    response = client.get("/api/complexes/stats", params={"ids": "full, rent,,missing"})
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert sorted(body) == ["full", "rent"]
+
+    db = TestSession()
+    for complex_id in body:
+        single = client.get(f"/api/complexes/{complex_id}/stats")
+        assert single.status_code == 200, single.text
+        assert body[complex_id] == single.json() == jsonable_encoder(legacy_complex_stats(db, complex_id))
+    db.close()
+
+    assert client.get("/api/complexes/missing/stats").status_code == 404
+
+    ids = ",".join(f"c{i}" for i in range(MAX_BATCH_COMPLEXES))
+    assert client.get("/api/complexes/stats", params={"ids": ids}).status_code == 200
+    response = client.get("/api/complexes/stats", params={"ids": ids + ",one-more"})
+    assert response.status_code == 400, response.text
+
+    app.dependency_overrides.clear()
+    print(f"✅ /api/complexes/stats (최대 {MAX_BATCH_COMPLEXES}개)")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🧪 단지 통계 일괄 조회 테스트")
+    print("=" * 60)
+
+    try:
+        test_batch_matches_legacy()
+        test_endpoints()
+        print("\n✅ 모든 테스트 완료!")
+
+    except Exception as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,181 @@
+"""
+분산 전체 크롤링 테스트 스크립트 (단지별 태스크 + chord 집계)
+
+Celery eager 모드와 SQLite 메모리 DB로 단지 목록이 레인(chain)으로 나뉘어 모두 크롤링되는지,
+일부 단지가 실패해도 나머지가 계속되는지, chord 콜백이 CrawlJob을 한 번 마무리하는지,
+acks_late로 같은 단지가 다시 전달돼도 진행 상황을 한 번만 더하는지 확인합니다.
+실제 브라우저 크롤링 대신 단지 ID로 결과를 만드는 가짜 엔진과 집합만 흉내 내는 가짜 Redis를 사용합니다.
+"""
+import sys
+import os
+
+# 프로젝트 루트를 파이썬 경로에 추가
+sys.path.insert(0, os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "tests", "stubs"))
+
+from sqlite_db import create_test_session
+
+import app.tasks.scheduler as scheduler
+from app.core.celery_app import celery_app
+from app.models.complex import Complex, CrawlJob
+
+TestSession = create_test_session()
+
+COMPLEX_IDS = [f"c{i:02d}" for i in range(10)]
+FAILING = {"c03", "c07"}
+crawled = []
+
+
+class FakeEngine:
+    """단지 ID로 결과를 만드는 크롤링 엔진 (c03, c07은 실패, c05는 예외)"""
+
+    def __init__(self, concurrency=None, rate_limiter=None, on_result=None, crawl_job_id=None):
+        self.crawl_job_id = crawl_job_id
+
+    async def run(self, complex_ids):
+        results = []
+        for complex_id in complex_ids:
+            crawled.append(complex_id)
+            if complex_id == "c05":
+                raise RuntimeError("브라우저 오류")
+            if complex_id in FAILING:
+                results.append({"complex_id": complex_id, "success": False, "error": "timeout"})
+            else:
+                results.append({
+                    "complex_id": complex_id, "success": True,
+                    "articles_collected": 10, "articles_new": 2, "articles_updated": 1, "articles_removed": 1
+                })
+        return results
+
+
+class FakeRedis:
+    """진행 상황 중복 방지에 쓰는 집합 명령만 구현"""
+
+    def __init__(self):
+        self.sets = {}
+
+    def sadd(self, key, member):
+        members = self.sets.setdefault(key, set())
+        added = member not in members
+        members.add(member)
+        return int(added)
+
+    def srem(self, key, member):
+        self.sets.get(key, set()).discard(member)
+
+    def expire(self, key, seconds):
+        return True
+
+
+progress_redis = FakeRedis()
+
+
+def _setup():
+    """Celery eager 모드 + SQLite 세션 + 가짜 엔진으로 교체, 단지 생성"""
+    celery_app.conf.task_always_eager = True
+    scheduler.SessionLocal = TestSession
+    scheduler.CrawlEngine = FakeEngine
+    scheduler._get_shared_rate_limiter = lambda: None
+    scheduler._get_progress_redis = lambda: progress_redis
+
+    db = TestSession()
+    for complex_id in COMPLEX_IDS:
+        db.add(Complex(complex_id=complex_id, complex_name=f"단지 {complex_id}"))
+    db.commit()
+    db.close()
+
+
+# 스크립트 실행 / pytest 모두 실제 DB·브라우저 대신 테스트 환경을 쓰도록 임포트 시점에 교체
+_setup()
+
+
+def test_fanout():
+    """모든 단지가 레인으로 나뉘어 크롤링되고 chord 콜백이 CrawlJob을 마무리"""
+    dispatched = scheduler._dispatch_crawl_fanout("parent-task", "manual", send_briefing=False)
+    assert dispatched["status"] == "dispatched", dispatched
+    assert dispatched["total_complexes"] == 10 and dispatched["lanes"] == scheduler.CRAWL_FANOUT_CONCURRENCY
+
+    assert sorted(crawled) == COMPLEX_IDS, crawled
+
+    db = TestSession()
+    job = db.query(CrawlJob).filter(CrawlJob.job_id == dispatched["job_id"]).one()
+    assert job.status == "failed"  # 일부 단지 실패
+    assert job.articles_collected == 70 and job.articles_new == 14 and job.articles_removed == 7
+    assert job.error_message.count("크롤링 실패") == 3 and "브라우저 오류" in job.error_message
+    assert job.finished_at is not None and job.duration_seconds is not None
+    assert job.celery_task_id == "parent-task" and job.complex_name == "전체 10개 단지"
+    db.close()
+    print(f"✅ 분산 크롤링: 레인 {dispatched['lanes']}개, 단지 {len(crawled)}개, 실패 3개 포함 집계")
+
+
+def test_finalize_counts():
+    """chord 콜백이 레인별 결과를 평탄화해 집계 (진행 중 누적값이 아닌 최종 합계로 기록)"""
+    db = TestSession()
+    job = scheduler._create_crawl_job(db, "scheduled", "parent")
+    job_id = job.job_id
+    db.close()
+
+    lane_results = [
+        [{"complex_id": "c00", "success": True, "articles_collected": 5}],
+        [{"complex_id": "c01", "success": True, "articles_collected": 7},
+         {"complex_id": "c02", "success": True, "articles_collected": 1}],
+    ]
+    results = scheduler.finalize_crawl_fanout(lane_results, job_id, send_briefing=False)
+    assert results["success"] == 3 and results["failed"] == 0
+    assert results["total_articles_collected"] == 13
+
+    db = TestSession()
+    job = db.query(CrawlJob).filter(CrawlJob.job_id == job_id).one()
+    assert job.status == "success" and job.articles_collected == 13
+    db.close()
+    print("✅ chord 콜백 집계")
+
+
+def test_redelivered_item():
+    """같은 단지 태스크가 다시 실행돼도 CrawlJob 진행 상황은 한 번만 더함"""
+    db = TestSession()
+    job = scheduler._create_crawl_job(db, "manual", "parent-redelivery")
+    job_id = job.job_id
+    db.close()
+
+    first = scheduler.crawl_complex_item([], "c00", job_id)
+    again = scheduler.crawl_complex_item([], "c00", job_id)
+    assert first == again and first[0]["success"]
+    scheduler.crawl_complex_item([], "c01", job_id)
+
+    db = TestSession()
+    job = db.query(CrawlJob).filter(CrawlJob.job_id == job_id).one()
+    assert job.articles_collected == 20 and job.articles_new == 4, (job.articles_collected, job.articles_new)
+    db.close()
+    print("✅ 재전달된 단지 진행 상황 1회만 반영")
+
+
+def test_empty():
+    """단지가 없으면 하위 태스크 없이 바로 완료"""
+    results = scheduler._dispatch_crawl_fanout("parent-empty", "manual", complex_ids=[], send_briefing=False)
+    assert results["total_complexes"] == 0
+
+    db = TestSession()
+    job = db.query(CrawlJob).filter(CrawlJob.job_id == results["job_id"]).one()
+    assert job.status == "success"
+    db.close()
+    print("✅ 대상 단지 없음")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🧪 분산 전체 크롤링 테스트")
+    print("=" * 60)
+
+    try:
+        test_fanout()
+        test_finalize_counts()
+        test_redelivered_item()
+        test_empty()
+        print("\n✅ 모든 테스트 완료!")
+
+    except Exception as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
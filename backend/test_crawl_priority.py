@@ -0,0 +1,189 @@
+"""
+우선순위 크롤링 큐 테스트 스크립트
+
+SQLite 메모리 DB에 단지/변동 이력/관심 단지/크롤링 세션을 만들어
+변동이 잦고 관심이 많은 단지가 먼저 선택되는지, 시간당 예산이 지켜지는지,
+/api/scheduler/priority-queue 가 같은 결과를 반환하는지 확인합니다.
+"""
+import sys
+import os
+
+# 프로젝트 루트를 파이썬 경로에 추가
+sys.path.insert(0, os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "tests", "stubs"))
+
+from datetime import datetime, timedelta, timezone
+
+from sqlite_db import create_test_session
+
+from app.models.complex import ArticleChange, Complex, CrawlJob, CrawlSession, FavoriteComplex, User
+from app.services.crawl_priority import CrawlPriorityPlanner
+
+TestSession = create_test_session()
+
+NOW = datetime.now().replace(microsecond=0)
+
+# (단지 ID, 이름, 최근 14일 변동 수, 관심 수, 마지막 크롤링 몇 시간 전 (None: 한 번도 안 함), 크롤링 소요(분))
+COMPLEXES = [
+    ("hot", "변동 많은 단지", 60, 0, 6, 2),
+    ("fav", "관심 많은 단지", 10, 4, 6, 2),
+    ("quiet", "조용한 단지", 0, 0, 6, 2),
+    ("fresh", "방금 크롤링한 단지", 80, 2, 0.25, 2),
+    ("new", "신규 등록 단지", 0, 0, None, None),
+]
+
+
+def _seed():
+    db = TestSession()
+    user = User(email="tester@example.com", username="tester", hashed_password="x")
+    db.add(user)
+    db.flush()
+
+    for complex_id, name, changes, favorites, hours_ago, minutes in COMPLEXES:
+        db.add(Complex(complex_id=complex_id, complex_name=name))
+        db.flush()
+        for i in range(changes):
+            db.add(ArticleChange(
+                complex_id=complex_id, change_type="NEW",
+                detected_at=NOW - timedelta(hours=(i * 5) % (14 * 24))
+            ))
+        for i in range(favorites):
+            if i == 0:
+                db.add(FavoriteComplex(user_id=user.id, complex_id=complex_id))
+            else:
+                other = User(email=f"{complex_id}{i}@example.com", username=f"u{i}", hashed_password="x")
+                db.add(other)
+                db.flush()
+                db.add(FavoriteComplex(user_id=other.id, complex_id=complex_id))
+        if hours_ago is not None:
+            started = NOW - timedelta(hours=hours_ago)
+            db.add(CrawlSession(
+                session_id=f"session-{complex_id}", complex_id=complex_id,
+                started_at=started, finished_at=started + timedelta(minutes=minutes)
+            ))
+    db.commit()
+    db.close()
+
+
+# 스크립트 실행 / pytest 모두 같은 데이터로 시작하도록 임포트 시점에 생성
+_seed()
+
+
+def test_rank():
+    """강제 대상(신규) → 기대 변동/비용 순, 최근 크롤링 단지 제외"""
+    db = TestSession()
+    queue = CrawlPriorityPlanner(db, now=NOW).rank()
+    db.close()
+
+    order = [item["complex_id"] for item in queue]
+    by_id = {item["complex_id"]: item for item in queue}
+
+    assert order[0] == "new" and by_id["new"]["forced"], order
+    assert order.index("hot") < order.index("fav") < order.index("quiet"), order
+    assert not by_id["fresh"]["eligible"] and by_id["hot"]["eligible"]
+    assert by_id["fav"]["favorites"] == 4
+    assert by_id["quiet"]["score"] > 0  # 변동 0건이어도 사전값으로 0이 아님
+    assert by_id["hot"]["cost_minutes"] == 2.0 and by_id["new"]["cost_minutes"] == 1.0
+    print(f"✅ 우선순위 정렬: {order}")
+
+
+def test_budget():
+    """회당 예산 안에서만 선택, 예산 소진 시 선택 없음"""
+    db = TestSession()
+
+    # 회당 예산 = 20 × 15 / 60 = 5분 → 신규(1분) + hot(2분) + fav(2분)
+    plan = CrawlPriorityPlanner(db, budget_minutes_per_hour=20, interval_minutes=15, now=NOW).plan()
+    selected = [item["complex_id"] for item in plan["selected"]]
+    assert selected == ["new", "hot", "fav"], selected
+    assert plan["budget"]["tick_minutes"] == 5.0 and plan["budget"]["planned_minutes"] == 5.0
+    assert plan["budget"]["spent_minutes_last_hour"] == 2.0  # 15분 전 시작한 fresh 세션
+
+    # 예산이 단지 하나 비용보다 작아도 최소 1개는 선택
+    plan = CrawlPriorityPlanner(db, budget_minutes_per_hour=4, interval_minutes=5, now=NOW).plan()
+    assert [item["complex_id"] for item in plan["selected"]] == ["new"]
+
+    # 최근 1시간 사용량이 예산 이상이면 선택 없음
+    plan = CrawlPriorityPlanner(db, budget_minutes_per_hour=2, interval_minutes=15, now=NOW).plan()
+    assert plan["selected"] == [] and plan["budget"]["remaining_minutes"] == 0
+
+    db.close()
+    print(f"✅ 예산 내 선택: {selected}")
+
+
+def test_running_jobs():
+    """실행 중인 작업의 단지는 다시 고르지 않고, 여러 단지 작업이 실행 중이면 이번 실행은 건너뜀"""
+    db = TestSession()
+    started_at = datetime.now(timezone.utc)
+
+    single = CrawlJob(job_id="running-hot", job_type="manual", complex_id="hot", status="running", started_at=started_at)
+    db.add(single)
+    db.commit()
+
+    plan = CrawlPriorityPlanner(db, budget_minutes_per_hour=20, interval_minutes=15, now=NOW).plan()
+    by_id = {item["complex_id"]: item for item in plan["queue"]}
+    assert by_id["hot"]["running"] and not by_id["hot"]["eligible"]
+    assert "hot" not in [item["complex_id"] for item in plan["selected"]]
+
+    batch = CrawlJob(job_id="running-sweep", job_type="priority", status="running", started_at=started_at)
+    db.add(batch)
+    db.commit()
+    plan = CrawlPriorityPlanner(db, budget_minutes_per_hour=20, interval_minutes=15, now=NOW).plan()
+    assert plan["selected"] == [] and plan["budget"]["blocked_by_job"] == "running-sweep"
+
+    # 오래전에 멈춘 running 작업은 무시
+    batch.started_at = started_at - timedelta(hours=24)
+    db.commit()
+    plan = CrawlPriorityPlanner(db, budget_minutes_per_hour=20, interval_minutes=15, now=NOW).plan()
+    assert plan["budget"]["blocked_by_job"] is None and plan["selected"]
+
+    db.delete(single)
+    db.delete(batch)
+    db.commit()
+    db.close()
+    print("✅ 실행 중인 작업 제외")
+
+
+def test_endpoint():
+    """/api/scheduler/priority-queue"""
+    from fastapi.testclient import TestClient
+    from app.core.database import get_db
+    from app.main import app
+
+    def override_get_db():
+        db = TestSession()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    client = TestClient(app)
+
+    response = client.get("/api/scheduler/priority-queue", params={"limit": 2})
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["total"] == len(COMPLEXES) and len(body["queue"]) == 2
+    assert body["queue"][0]["complex_id"] == "new"
+    assert "tick_minutes" in body["budget"] and body["selected"]
+
+    app.dependency_overrides.clear()
+    print("✅ /api/scheduler/priority-queue")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🧪 우선순위 크롤링 큐 테스트")
+    print("=" * 60)
+
+    try:
+        test_rank()
+        test_budget()
+        test_running_jobs()
+        test_endpoint()
+        print("\n✅ 모든 테스트 완료!")
+
+    except Exception as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,102 @@
+"""
+API 직접 조회(direct fetch) 모드 오프라인 테스트 스크립트
+
+tests/stubs/naver_land_stub.py 스텁 서버를 띄우고 녹화된 픽스처로 크롤링합니다.
+브라우저와 DB 없이 실행됩니다.
+"""
+import asyncio
+import os
+import sys
+import time
+
+# 프로젝트 루트를 파이썬 경로에 추가
+sys.path.insert(0, os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "tests", "stubs"))
+
+from naver_land_stub import start_stub_server, stub_auth_token
+
+STUB_COMPLEX_ID = "109208"
+EXPECTED_ARTICLES = 46  # 3페이지 47건 중 페이지 경계 중복 1건 제외
+
+
+class RecordingRateLimiter:
+    """acquire 호출 URL을 기록하는 요청 간격 제한기 (대기 없음)"""
+
+    def __init__(self):
+        self.acquired = []
+
+    async def acquire(self, host_or_url):
+        self.acquired.append(host_or_url)
+
+
+def test_direct_fetch():
+    """스텁 서버 대상으로 direct 모드 크롤링"""
+    server = start_stub_server()
+    port = server.server_address[1]
+
+    # 모듈 로드 전에 API 주소 지정
+    os.environ["NAVER_LAND_API_BASE"] = f"http://127.0.0.1:{port}/api"
+    os.environ["DIRECT_FETCH_PAGE_DELAY"] = "0"
+
+    from app.services import article_fetcher
+    from app.services.crawler_service import NaverRealEstateCrawler
+
+    # 브라우저 토큰 캡처 대신 스텁 토큰을 인증 캐시에 넣음
+    article_fetcher._cached_auth = article_fetcher.NaverAuth(stub_auth_token(), {})
+    assert article_fetcher._cached_auth.expires_at is not None
+
+    print("=" * 60)
+    print(f"⚡ direct 모드 크롤링 테스트 (스텁: 127.0.0.1:{port})")
+    print("=" * 60)
+
+    try:
+        crawler = NaverRealEstateCrawler()
+        started = time.monotonic()
+        result = asyncio.run(crawler.crawl_complex(STUB_COMPLEX_ID, fetch_mode="direct"))
+        elapsed = time.monotonic() - started
+
+        articles = result['articles']['articleList']
+        article_nos = [a['articleNo'] for a in articles]
+
+        assert result['complex']['complexNo'] == STUB_COMPLEX_ID
+        assert len(articles) == EXPECTED_ARTICLES, f"매물 수 불일치: {len(articles)}"
+        assert len(set(article_nos)) == len(article_nos), "중복 매물 존재"
+
+        page_requests = [p for p in server.request_log if "/articles/complex/" in p]
+        assert len(page_requests) == 3, f"페이지 요청 수 불일치: {len(page_requests)}"
+        assert result['articles']['isMoreData'] is False, "마지막 페이지까지 조회되어야 함"
+
+        # 최대 페이지 수에서 멈추면 불완전한 목록으로 표시 (사라진 매물 비활성화 생략 대상)
+        fetcher = article_fetcher.DirectArticleFetcher(
+            article_fetcher.NaverAuth(stub_auth_token(), {}), base_url=f"http://127.0.0.1:{port}/api", page_delay=0, max_pages=2
+        )
+        truncated = asyncio.run(fetcher.fetch_complex(STUB_COMPLEX_ID))['articles']
+        assert truncated['isMoreData'] is True and len(truncated['articleList']) < EXPECTED_ARTICLES
+
+        # 요청 간격 제한기는 단지 1회가 아니라 API 요청마다 슬롯 예약 (단지 정보 1회 + 페이지 3회)
+        limiter = RecordingRateLimiter()
+        limited = NaverRealEstateCrawler(rate_limiter=limiter)
+        asyncio.run(limited.crawl_complex(STUB_COMPLEX_ID, fetch_mode="direct"))
+        assert len(limiter.acquired) == 4, f"요청 슬롯 예약 수 불일치: {limiter.acquired}"
+        assert all(url.startswith(f"http://127.0.0.1:{port}/api/") for url in limiter.acquired)
+
+        print(f"\n✅ 단지: {result['complex']['complexName']}")
+        print(f"✅ 매물: {len(articles)}건 (페이지 요청 {len(page_requests)}회)")
+        print(f"✅ 요청 간격 제한: 요청 {len(limiter.acquired)}회 모두 슬롯 예약")
+        print(f"✅ 최대 페이지(2) 도달: {len(truncated['articleList'])}건, 불완전 목록으로 표시")
+        print(f"⏱️  소요 시간: {elapsed:.2f}초")
+    finally:
+        article_fetcher.invalidate_naver_auth()
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    try:
+        test_direct_fetch()
+        print("\n✅ 모든 테스트 완료!")
+
+    except Exception as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,106 @@
+"""
+국토부 실거래가 페이지 캐시 테스트 스크립트
+
+tests/stubs/molit_stub.py 스텁 서버로 20개 지역 × 24개월 백필을 두 번 실행하여
+두 번째 실행은 과거 월을 캐시에서, 이번 달/지난달만 API에서 받는지 확인합니다.
+네트워크와 DB 없이 실행됩니다.
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from datetime import date
+from unittest import mock
+
+# 프로젝트 루트를 파이썬 경로에 추가
+sys.path.insert(0, os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "tests", "stubs"))
+
+from molit_stub import start_stub_server
+
+server = start_stub_server()
+STUB_BASE = f"http://127.0.0.1:{server.server_address[1]}/1613000"
+
+# 모듈 로드 전에 API 주소 지정
+os.environ["MOLIT_API_BASE"] = STUB_BASE
+
+from app.services import molit_cache
+from app.services.molit_cache import DiskPageCache, page_ttl, MOLIT_CACHE_TTL_PAST, MOLIT_CACHE_TTL_RECENT
+from app.services.molit_client import AsyncMOLITClient, DailyQuota
+from app.services.molit_service import recent_year_months
+
+REGIONS = [str(11110 + i * 10) for i in range(20)]
+MONTHS = 24
+
+
+def test_page_ttl():
+    """이번 달/지난달은 짧게, 그 이전은 길게"""
+    today = date(2025, 3, 15)
+    assert page_ttl("202503", today) == MOLIT_CACHE_TTL_RECENT
+    assert page_ttl("202502", today) == MOLIT_CACHE_TTL_RECENT
+    assert page_ttl("202501", today) == MOLIT_CACHE_TTL_PAST
+    assert page_ttl("202412", date(2025, 1, 2)) == MOLIT_CACHE_TTL_RECENT
+    assert page_ttl("202411", date(2025, 1, 2)) == MOLIT_CACHE_TTL_PAST
+    print("✅ 년월별 TTL")
+
+
+def _backfill(cache) -> AsyncMOLITClient:
+    keys = [(region, ym) for region in REGIONS for ym in recent_year_months(MONTHS)]
+
+    async def run():
+        async with AsyncMOLITClient("stub", concurrency=8, quota=DailyQuota(0), cache=cache) as client:
+            pages = await client.fetch_region_months("trade", keys)
+            assert all(len(items) == server.rows_per_month for items in pages.values())
+            return client
+
+    return asyncio.run(run())
+
+
+def test_backfill_served_from_cache():
+    """24개월 × 20개 지역 백필 재실행 시 과거 월은 캐시 적중"""
+    server.rows_per_month = 10
+    real_time = time.time
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = DiskPageCache(tmp)
+
+        server.request_log.clear()
+        first = _backfill(cache)
+        assert first.request_count == len(REGIONS) * MONTHS
+        assert len(server.request_log) == first.request_count
+
+        # 짧은 TTL(이번 달/지난달)만 만료되는 시점으로 이동
+        with mock.patch.object(molit_cache.time, "time", lambda: real_time() + MOLIT_CACHE_TTL_RECENT + 60):
+            server.request_log.clear()
+            second = _backfill(cache)
+
+        assert second.request_count == len(REGIONS) * 2, f"재요청 {second.request_count}회"
+        assert second.cache_hits == len(REGIONS) * (MONTHS - 2)
+
+        stats = cache.stats()
+        assert stats["entries"] == len(REGIONS) * MONTHS
+        print(
+            f"✅ 백필 {len(REGIONS)}개 지역 × {MONTHS}개월: 1회차 요청 {first.request_count}회 → "
+            f"2회차 요청 {second.request_count}회 (캐시 {second.cache_hits}페이지, "
+            f"적중률 {stats['hit_rate']:.0%}, {stats['size_bytes'] / 1024:.0f}KB)"
+        )
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print(f"🧪 국토부 페이지 캐시 테스트 (스텁: {STUB_BASE})")
+    print("=" * 60)
+
+    try:
+        test_page_ttl()
+        test_backfill_served_from_cache()
+        print("\n✅ 모든 테스트 완료!")
+
+    except Exception as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        server.shutdown()
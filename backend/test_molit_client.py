@@ -0,0 +1,272 @@
+"""
+국토부 실거래가 비동기 클라이언트 오프라인 테스트 스크립트
+
+tests/stubs/molit_stub.py 스텁 서버를 띄우고 페이지 프리페치 / 재시도 / 일일 한도 / 동시 요청을 확인합니다.
+네트워크와 DB 없이 실행됩니다.
+"""
+import asyncio
+import os
+import sys
+import time
+
+# 프로젝트 루트를 파이썬 경로에 추가
+sys.path.insert(0, os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "tests", "stubs"))
+
+from molit_stub import start_stub_server
+
+server = start_stub_server()
+STUB_BASE = f"http://127.0.0.1:{server.server_address[1]}/1613000"
+
+# 모듈 로드 전에 API 주소/키/백오프 지정
+os.environ["MOLIT_API_BASE"] = STUB_BASE
+os.environ["MOLIT_API_KEY"] = "stub"
+os.environ["MOLIT_RETRY_BASE_DELAY"] = "0.01"
+os.environ["MOLIT_CACHE_BACKEND"] = "none"
+
+from app.services.molit_client import AsyncMOLITClient, DailyQuota, MOLITQuotaExceeded, MOLITRequestError
+from app.services.molit_parser import parse_trade_page
+from app.services.molit_service import MOLITService, recent_year_months
+
+KEYS = [(lawd_cd, ym) for lawd_cd in ("11680", "41135") for ym in ("202501", "202412", "202411")]
+
+
+def _reset(rows: int = 2500, delay: float = 0.0):
+    server.request_log.clear()
+    server.rows_per_month = rows
+    server.delay = delay
+    server.fail_next = 0
+    server.quota_limit = 0
+    server.result_codes = {}
+
+
+async def _fetch(keys, endpoint="trade", **kwargs):
+    async with AsyncMOLITClient("stub", quota=DailyQuota(0), **kwargs) as client:
+        return await client.fetch_region_months(endpoint, keys)
+
+
+def test_fetch_all_pages():
+    """지역-월 × 페이지 전체 조회 (2,500건 → 3페이지)"""
+    _reset()
+    pages = asyncio.run(_fetch(KEYS))
+
+    assert set(pages) == set(KEYS)
+    for key, items in pages.items():
+        assert len(items) == 2500, f"{key}: {len(items)}건"
+        assert items[0]["trade_date"][:6] == key[1] and items[0]["deal_price"] > 0
+    assert len(server.request_log) == len(KEYS) * 3, f"요청 수: {len(server.request_log)}"
+    print(f"✅ 전체 페이지 조회: {len(KEYS)}개 지역-월, 요청 {len(server.request_log)}회")
+
+
+def test_retry_on_5xx():
+    """503 응답은 재시도 후 성공"""
+    _reset(rows=10)
+    server.fail_next = 2
+    pages = asyncio.run(_fetch(KEYS[:1]))
+
+    assert len(pages[KEYS[0]]) == 10
+    assert len(server.request_log) == 3
+    print("✅ 5xx 재시도: 503 2회 후 성공")
+
+    _reset(rows=10)
+    server.fail_next = 10
+    try:
+        asyncio.run(_fetch(KEYS[:1], max_retries=2))
+        raise AssertionError("재시도 초과 시 MOLITRequestError가 발생해야 합니다")
+    except MOLITRequestError:
+        pass
+    assert len(server.request_log) == 3
+    print("✅ 재시도 초과: MOLITRequestError (요청 3회)")
+
+
+def test_quota():
+    """일일 호출 한도 (API 응답 + 프로세스 내 카운터)"""
+    _reset(rows=10)
+    server.quota_limit = 1
+    quota = DailyQuota(100)
+
+    async def run():
+        async with AsyncMOLITClient("stub", quota=quota) as client:
+            await client.fetch_region_months("trade", KEYS)
+
+    try:
+        asyncio.run(run())
+        raise AssertionError("한도 초과 응답 시 MOLITQuotaExceeded가 발생해야 합니다")
+    except MOLITQuotaExceeded:
+        pass
+    assert quota.remaining == 0
+    print("✅ 한도 초과 응답: MOLITQuotaExceeded, 남은 호출 0")
+
+    _reset(rows=10)
+    quota = DailyQuota(2)
+    quota.acquire()
+    quota.acquire()
+    try:
+        quota.acquire()
+        raise AssertionError("카운터 한도 초과 시 MOLITQuotaExceeded가 발생해야 합니다")
+    except MOLITQuotaExceeded:
+        pass
+    print("✅ 프로세스 내 카운터: 한도 2회 후 차단")
+
+
+def test_concurrency():
+    """동시 요청 수 제한 안에서 병렬 조회"""
+    _reset(rows=10, delay=0.1)
+
+    started = time.monotonic()
+    asyncio.run(_fetch(KEYS, concurrency=1))
+    sequential = time.monotonic() - started
+
+    started = time.monotonic()
+    asyncio.run(_fetch(KEYS, concurrency=6))
+    concurrent = time.monotonic() - started
+
+    assert concurrent < sequential / 2, f"동시 {concurrent:.2f}초 / 순차 {sequential:.2f}초"
+    print(f"✅ 동시 조회: 순차 {sequential:.2f}초 → 동시(6) {concurrent:.2f}초")
+
+
+def test_parser_field_names():
+    """스트리밍 파서: 한글 태그 응답도 parse_trade_to_dict와 같은 결과"""
+    xml = (
+        "<response><header><resultCode>00</resultCode><resultMsg>OK</resultMsg></header><body><items>"
+        "<item><거래금액>  82,500</거래금액><년>2015</년><월>6</월><일> 3</일><아파트>은마</아파트>"
+        "<전용면적>76.79</전용면적><층>-1</층><법정동>대치동</법정동><지번>316</지번></item>"
+        "</items><totalCount>1</totalCount></body></response>"
+    )
+    page = parse_trade_page(xml)
+    raw = {"거래금액": "  82,500", "년": "2015", "월": "6", "일": " 3", "아파트": "은마",
+           "전용면적": "76.79", "층": "-1", "법정동": "대치동", "지번": "316"}
+
+    assert page["result_code"] == "00" and page["total_count"] == 1
+    assert page["items"] == [MOLITService().parse_trade_to_dict(raw)]
+    assert parse_trade_page("<OpenAPI_ServiceResponse/>")["result_code"] == "ERROR"
+    print("✅ 스트리밍 파서: 한글 태그 정규화")
+
+
+def test_service_sync_wrapper():
+    """MOLITService 동기 메서드 (이벤트 루프 실행 중에도 동작)"""
+    _reset(rows=1200)
+    service = MOLITService()
+    trades = service.get_recent_trades("11680", "은마", months=3)
+
+    assert len(server.request_log) == 6
+    assert trades and all(t["complex_name"] == "은마" for t in trades)
+    assert {t["trade_date"][:6] for t in trades} == set(recent_year_months(3))
+
+    async def inside_loop():
+        return service.get_apt_rent_data("11680", "202501")
+
+    rents = asyncio.run(inside_loop())
+    assert len(rents) == 1200 and rents[0]["deposit"] > 0 and rents[0]["contract_type"] in ("신규", "갱신")
+    print(f"✅ MOLITService: 최근 3개월 {len(trades)}건, 실행 중인 루프 안에서 전월세 {len(rents)}건")
+
+
+def test_partial_failure():
+    """일부 지역-월 실패/한도 도달 시 성공한 지역-월은 유지, 실패한 지역-월만 기록 후 재조회"""
+    from app.services.molit_client import get_daily_quota
+    from app.services.transaction_ingest import RegionTransactionIngestor
+
+    # 클라이언트: errors를 넘기면 예외 대신 지역-월별 기록
+    _reset(rows=10)
+    server.quota_limit = 2
+    errors = {}
+
+    async def run():
+        async with AsyncMOLITClient("stub", quota=DailyQuota(100), concurrency=1) as client:
+            return await client.fetch_region_months("trade", KEYS, errors=errors)
+
+    pages = asyncio.run(run())
+    assert len(pages) == 2 and all(len(items) == 10 for items in pages.values())
+    assert set(errors) == set(KEYS) - set(pages)
+    assert all(isinstance(error, MOLITQuotaExceeded) for error in errors.values())
+    print(f"✅ 클라이언트 부분 실패: 성공 {len(pages)}개, 실패 {len(errors)}개")
+
+    # 수집기: 실패한 지역-월은 캐시하지 않고 결과에 표시, api_calls는 성공한 지역-월만
+    _reset(rows=10)
+    server.quota_limit = 2
+    ingestor = RegionTransactionIngestor(None, molit_service=MOLITService())
+    ingestor.molit_service.api_key = "stub"
+    try:
+        ingestor.prefetch(KEYS, "trade")
+        ingestor.prefetch(KEYS, "trade")  # 공용 한도가 막혀 있어 여전히 실패
+        assert ingestor.api_calls == 2 and len(ingestor._page_cache) == 2
+        assert len(ingestor.failed) == len(KEYS) - 2 and ingestor.quota_exceeded
+        failed_key = next(iter(ingestor.failed))
+        assert ingestor.fetch_region_month(failed_key[1], failed_key[2], "trade") == []
+
+        # 한도가 풀리면 실패했던 지역-월만 다시 조회
+        get_daily_quota().used = 0
+        server.quota_limit = 0
+        server.request_log.clear()
+        ingestor.prefetch(KEYS, "trade")
+        assert len(server.request_log) == len(KEYS) - 2
+        assert not ingestor.failed and len(ingestor._page_cache) == len(KEYS) and ingestor.api_calls == len(KEYS)
+    finally:
+        get_daily_quota().used = 0
+    print("✅ 수집기 부분 실패: 실패 지역-월만 재조회")
+
+
+def test_result_codes():
+    """HTTP 200 안의 resultCode: 03은 빈 달, 22/30 등은 실패로 기록 (수집 결과 불완전)"""
+    from app.services.transaction_ingest import RegionTransactionIngestor
+
+    no_data, quota_key, bad_key = KEYS[0], KEYS[1], KEYS[2]
+    _reset(rows=10)
+    server.result_codes = {no_data: "03", bad_key: "30"}
+    errors = {}
+
+    async def run():
+        async with AsyncMOLITClient("stub", quota=DailyQuota(0), concurrency=1) as client:
+            return await client.fetch_region_months("trade", KEYS, errors=errors)
+
+    pages = asyncio.run(run())
+    assert pages[no_data] == [] and set(errors) == {bad_key}
+    assert isinstance(errors[bad_key], MOLITRequestError) and " 30 " in str(errors[bad_key])
+
+    # 22: 한도 초과로 기록되고 오늘 남은 호출 차단
+    _reset(rows=10)
+    server.result_codes = {quota_key: "22"}
+    errors = {}
+    quota = DailyQuota(100)
+
+    async def run_quota():
+        async with AsyncMOLITClient("stub", quota=quota, concurrency=1) as client:
+            return await client.fetch_region_months("trade", [quota_key], errors=errors)
+
+    assert asyncio.run(run_quota()) == {}
+    assert isinstance(errors[quota_key], MOLITQuotaExceeded) and quota.remaining == 0
+
+    # 수집기: 오류 코드 지역-월은 실패로 남아 complete가 False
+    _reset(rows=10)
+    server.result_codes = {no_data: "03", bad_key: "30"}
+    ingestor = RegionTransactionIngestor(None, molit_service=MOLITService())
+    ingestor.molit_service.api_key = "stub"
+    ingestor.prefetch(KEYS, "trade")
+    assert set(key[1:] for key in ingestor.failed) == {bad_key}, ingestor.failed
+    assert not ingestor.quota_exceeded
+    print("✅ resultCode 처리: 03 빈 달, 22 한도 초과, 30 실패")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print(f"🧪 국토부 실거래가 클라이언트 테스트 (스텁: {STUB_BASE})")
+    print("=" * 60)
+
+    try:
+        test_fetch_all_pages()
+        test_retry_on_5xx()
+        test_quota()
+        test_concurrency()
+        test_parser_field_names()
+        test_service_sync_wrapper()
+        test_partial_failure()
+        test_result_codes()
+        print("\n✅ 모든 테스트 완료!")
+
+    except Exception as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        server.shutdown()
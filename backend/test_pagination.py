@@ -0,0 +1,183 @@
+"""
+키셋(커서) 페이지네이션 테스트 스크립트
+
+커서 인코딩/디코딩 왕복, 정렬 키(last_seen_at)가 같은 행이 많을 때 id로 이어서 빠짐/중복 없이 넘기는지,
+잘못된 커서가 400을 반환하는지, 비로그인/로그인 사용자별 페이지 크기 상한을 SQLite 메모리 DB로 확인합니다.
+"""
+import sys
+import os
+
+# 프로젝트 루트를 파이썬 경로에 추가
+sys.path.insert(0, os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "tests", "stubs"))
+
+from datetime import datetime, timedelta
+
+from fastapi import HTTPException
+
+from sqlite_db import create_test_session
+
+from app.core.pagination import (
+    NEXT_CURSOR_HEADER, PAGE_LIMIT_ANONYMOUS, PAGE_LIMIT_AUTHENTICATED,
+    decode_cursor, encode_cursor, keyset_paginate, resolve_page_limit
+)
+from app.models.complex import Article, Complex, User
+
+TestSession = create_test_session()
+
+NOW = datetime(2024, 5, 1, 12, 0, 0)
+ARTICLE_COUNT = 23
+
+
+def _seed():
+    """매물 23건 - last_seen_at이 3가지 값뿐이라 같은 값이 여러 페이지에 걸침"""
+    db = TestSession()
+    db.add(Complex(complex_id="P", complex_name="페이지 단지"))
+    db.add(User(email="active@example.com", username="active", hashed_password="x"))
+    for i in range(ARTICLE_COUNT):
+        db.add(Article(
+            article_no=f"P-{i:02d}", complex_id="P", trade_type="매매", price="5억", price_value=50000,
+            last_seen_at=NOW - timedelta(hours=i % 3)
+        ))
+    db.commit()
+    db.close()
+
+
+_seed()
+
+
+def _walk(limit, descending):
+    """keyset_paginate로 마지막 페이지까지 넘기며 (last_seen_at, id) 목록 수집"""
+    db = TestSession()
+    seen, cursor, pages = [], None, 0
+    while True:
+        rows, cursor = keyset_paginate(
+            db.query(Article).filter(Article.complex_id == "P"),
+            (Article.last_seen_at, Article.id), cursor, limit, descending=descending
+        )
+        pages += 1
+        seen.extend((a.last_seen_at, a.id) for a in rows)
+        if cursor is None:
+            break
+    db.close()
+    return seen, pages
+
+
+def test_cursor_round_trip():
+    """정렬 키 값(datetime, int) → 커서 → 원래 값"""
+    columns = (Article.last_seen_at, Article.id)
+    cursor = encode_cursor([NOW, 42])
+    assert "=" not in cursor  # URL에 그대로 넣을 수 있는 패딩 없는 base64
+    assert decode_cursor(cursor, columns) == [NOW, 42]
+    assert decode_cursor(encode_cursor([None, 7]), columns) == [None, 7]
+    print("✅ 커서 인코딩/디코딩 왕복")
+
+
+def test_malformed_cursor():
+    """형식이 잘못된 커서는 400"""
+    columns = (Article.last_seen_at, Article.id)
+    for bad in ["not-a-cursor", encode_cursor([NOW]), encode_cursor(["not-a-date", 1])]:
+        try:
+            decode_cursor(bad, columns)
+        except HTTPException as e:
+            assert e.status_code == 400, e
+        else:
+            raise AssertionError(f"잘못된 커서가 통과함: {bad}")
+    print("✅ 잘못된 커서 → 400")
+
+
+def test_ties_on_sort_key():
+    """같은 last_seen_at이 여러 페이지에 걸쳐도 id로 이어서 빠짐/중복 없음 (내림차순/오름차순)"""
+    for descending in (True, False):
+        for limit in (1, 4, 7, ARTICLE_COUNT, ARTICLE_COUNT + 5):
+            seen, pages = _walk(limit, descending)
+            assert len(seen) == ARTICLE_COUNT and len(set(seen)) == ARTICLE_COUNT, (limit, descending, seen)
+            assert seen == sorted(seen, reverse=descending), (limit, descending)
+            assert pages == max(1, -(-ARTICLE_COUNT // limit)), (limit, pages)
+    print("✅ 정렬 키 동률 처리 (last_seen_at, id)")
+
+
+def test_resolve_page_limit():
+    """비로그인 / 로그인 / 비활성 사용자별 페이지 크기 상한"""
+    active = User(email="a@example.com", username="a", hashed_password="x", is_active=True)
+    inactive = User(email="i@example.com", username="i", hashed_password="x", is_active=False)
+
+    assert resolve_page_limit(PAGE_LIMIT_ANONYMOUS, None) == PAGE_LIMIT_ANONYMOUS
+    assert resolve_page_limit(PAGE_LIMIT_AUTHENTICATED, active) == PAGE_LIMIT_AUTHENTICATED
+
+    for limit, user in [
+        (PAGE_LIMIT_ANONYMOUS + 1, None),
+        (PAGE_LIMIT_ANONYMOUS + 1, inactive),
+        (PAGE_LIMIT_AUTHENTICATED + 1, active),
+    ]:
+        try:
+            resolve_page_limit(limit, user)
+        except HTTPException as e:
+            assert e.status_code == 400
+        else:
+            raise AssertionError(f"상한 초과가 통과함: {limit}")
+    print(f"✅ 페이지 크기 상한 (비로그인 {PAGE_LIMIT_ANONYMOUS} / 로그인 {PAGE_LIMIT_AUTHENTICATED})")
+
+
+def test_endpoint():
+    """/api/articles/ 커서 헤더, 잘못된 커서, 로그인 여부별 상한"""
+    from fastapi.testclient import TestClient
+    from app.core.database import get_db
+    from app.core.security import create_access_token
+    from app.main import app
+
+    def override_get_db():
+        db = TestSession()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    client = TestClient(app)
+
+    collected, cursor = [], None
+    while True:
+        params = {"complex_id": "P", "limit": 10}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/api/articles/", params=params)
+        assert response.status_code == 200, response.text
+        collected.extend(a["article_no"] for a in response.json())
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if not cursor:
+            break
+    assert sorted(collected) == [f"P-{i:02d}" for i in range(ARTICLE_COUNT)], collected
+
+    assert client.get("/api/articles/", params={"cursor": "garbage"}).status_code == 400
+    assert client.get("/api/articles/", params={"limit": PAGE_LIMIT_ANONYMOUS + 1}).status_code == 400
+
+    token = create_access_token({"sub": "active@example.com"})
+    response = client.get(
+        "/api/articles/", params={"limit": PAGE_LIMIT_ANONYMOUS + 1},
+        headers={"Authorization": f"Bearer {token}"}
+    )
+    assert response.status_code == 200, response.text
+
+    app.dependency_overrides.clear()
+    print("✅ /api/articles/ 커서 페이지네이션")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🧪 키셋 페이지네이션 테스트")
+    print("=" * 60)
+
+    try:
+        test_cursor_round_trip()
+        test_malformed_cursor()
+        test_ties_on_sort_key()
+        test_resolve_page_limit()
+        test_endpoint()
+        print("\n✅ 모든 테스트 완료!")
+
+    except Exception as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,82 @@
+"""
+가격 문자열 파서 테스트 스크립트
+"""
+import sys
+import os
+
+# 프로젝트 루트를 파이썬 경로에 추가
+sys.path.insert(0, os.path.dirname(__file__))
+
+from app.services.price_parser import format_price, parse_price, parse_rent_price, split_rent_price
+
+
+PARSE_CASES = [
+    ("3억 5,000", 35000),
+    ("3억5,000", 35000),
+    ("12억", 120000),
+    ("1억 2,000만", 12000),
+    ("1.5억", 15000),
+    ("5,000", 5000),
+    ("140", 140),
+    ("9,500만", 9500),
+    ("", None),
+    (None, None),
+    ("-", None),
+    ("가격문의", None),
+]
+
+RENT_CASES = [
+    ("5,000/140", (5000, 140)),
+    ("1억/250", (10000, 250)),
+    ("2억 5,000/80", (25000, 80)),
+    ("3,000", (3000, None)),
+]
+
+FORMAT_CASES = [
+    (35000, "3억 5,000"),
+    (120000, "12억"),
+    (5000, "5,000"),
+    (140, "140"),
+    (None, None),
+]
+
+
+def test_parse_price():
+    """parse_price: 만원 단위 변환"""
+    for price_str, expected in PARSE_CASES:
+        result = parse_price(price_str)
+        assert result == expected, f"parse_price({price_str!r}) = {result}, 기대값 {expected}"
+    print(f"✅ parse_price: {len(PARSE_CASES)}건 통과")
+
+
+def test_parse_rent_price():
+    """parse_rent_price: 보증금/월세 분리"""
+    for price_str, expected in RENT_CASES:
+        result = parse_rent_price(price_str)
+        assert result == expected, f"parse_rent_price({price_str!r}) = {result}, 기대값 {expected}"
+    assert split_rent_price("5,000/140") == ("5,000", "140")
+    print(f"✅ parse_rent_price: {len(RENT_CASES)}건 통과")
+
+
+def test_format_price():
+    """format_price: 네이버 표기 변환 및 왕복 변환"""
+    for value, expected in FORMAT_CASES:
+        result = format_price(value)
+        assert result == expected, f"format_price({value!r}) = {result!r}, 기대값 {expected!r}"
+
+    for value in (1, 999, 10000, 10001, 35000, 123456):
+        assert parse_price(format_price(value)) == value, f"왕복 변환 실패: {value}"
+    print(f"✅ format_price: {len(FORMAT_CASES)}건 + 왕복 변환 통과")
+
+
+if __name__ == "__main__":
+    try:
+        test_parse_price()
+        test_parse_rent_price()
+        test_format_price()
+
+        print("\n✅ 모든 테스트 완료!")
+
+    except AssertionError as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        sys.exit(1)
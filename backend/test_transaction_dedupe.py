@@ -0,0 +1,164 @@
+"""
+실거래 중복 방지(row_hash) 저장 테스트 스크립트
+
+SQLite 메모리 DB에서 매매/전월세 실거래를 저장하며 다음을 확인합니다.
+- 같은 페이지를 다시 저장하면 0건 저장 (배치 내 중복 포함)
+- 면적 표기(84.97 / 84.970000001, 114 / 114.0)가 달라도 같은 해시
+- 저장된 컬럼만으로 다시 계산한 해시가 row_hash와 같음 (기존 행 백필)
+- ON CONFLICT ... RETURNING 을 쓸 수 없는 DB용 대체 경로도 같은 결과
+"""
+import sys
+import os
+
+# 프로젝트 루트를 파이썬 경로에 추가
+sys.path.insert(0, os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "tests", "stubs"))
+
+from sqlite_db import create_test_session
+
+import app.services.transaction_service as transaction_service
+from app.models.complex import Complex, RentTransaction, Transaction
+from app.services.transaction_service import (
+    TransactionService, rent_transaction_row_hash, transaction_row_hash
+)
+
+TestSession = create_test_session()
+
+# 국토부 매매 조회 결과 (parse_trade_to_dict 형식)
+TRADES = [
+    {"trade_date": "20240105", "deal_price": 105000, "floor": 12, "exclusive_area": 84.97},
+    {"trade_date": "20240105", "deal_price": 105000, "floor": 12, "exclusive_area": 84.97},  # 배치 내 중복
+    {"trade_date": "20240105", "deal_price": 105000, "floor": 13, "exclusive_area": 84.97},  # 다른 층
+    {"trade_date": "20240120", "deal_price": 98000, "floor": 3, "exclusive_area": 59.99},
+    {"trade_date": "20240131", "deal_price": 120000, "floor": None, "exclusive_area": 114.0},
+    None,  # 파싱 실패
+]
+
+# 국토부 전월세 조회 결과 (get_apt_rent_data 형식)
+RENTS = [
+    {"trade_date": "20240110", "deposit": 60000, "monthly_rent": 0, "floor": 7,
+     "exclusive_area": 84.97, "contract_type": "신규", "contract_term": "24.02~26.02"},
+    {"trade_date": "20240110", "deposit": 60000, "monthly_rent": 0, "floor": 7,
+     "exclusive_area": 84.97, "contract_type": "갱신", "contract_term": "24.02~26.02"},  # 계약 구분만 다름
+    {"trade_date": "20240110", "deposit": 5000, "monthly_rent": 150, "floor": 7,
+     "exclusive_area": 84.97, "contract_type": "", "contract_term": ""},
+    {"trade_date": "20240110", "deposit": 5000, "monthly_rent": 150, "floor": 7,
+     "exclusive_area": 84.97, "contract_type": None, "contract_term": None},  # "" 와 None 은 같은 계약
+]
+
+
+def test_row_hash_formatting():
+    """면적 float 표기/정수 여부와 관계없이 같은 해시, 값이 다르면 다른 해시"""
+    base = transaction_row_hash("1", "매매", "20240105", 84.97, 12, 105000)
+    assert len(base) == 64
+    assert transaction_row_hash("1", "매매", "20240105", float("84.97"), 12, 105000) == base
+    assert transaction_row_hash("1", "매매", "20240105", 84.970000001, 12, 105000) == base
+    assert transaction_row_hash("1", "매매", "20240105", 84.98, 12, 105000) != base
+    assert transaction_row_hash("1", "매매", "20240105", 84.97, 13, 105000) != base
+    assert transaction_row_hash("2", "매매", "20240105", 84.97, 12, 105000) != base
+
+    assert transaction_row_hash("1", "매매", "20240131", 114, None, 120000) == \
+        transaction_row_hash("1", "매매", "20240131", 114.0, None, 120000)
+
+    rent = rent_transaction_row_hash("1", "20240110", 84.97, 7, 60000, 0, None)
+    assert rent_transaction_row_hash("1", "20240110", 84.970000001, 7, 60000, 0, None) == rent
+    assert rent_transaction_row_hash("1", "20240110", 84.97, 7, 60000, 0, "신규") != rent
+    assert rent_transaction_row_hash("1", "20240110", 84.97, 7, 60000, None, None) != rent
+    print("✅ row_hash 면적 표기 정규화")
+
+
+def run_save_scenario(complex_id):
+    """저장 → 같은 페이지 재저장(0건) → 저장된 컬럼으로 해시 재계산"""
+    db = TestSession()
+    db.add(Complex(complex_id=complex_id, complex_name=f"단지 {complex_id}"))
+    db.commit()
+    service = TransactionService(db)
+
+    assert service.save_trades(complex_id, TRADES) == (4, 2)
+    assert service.save_trades(complex_id, TRADES) == (0, len(TRADES))
+    assert service.save_trades(complex_id, []) == (0, 0)
+
+    assert service.save_rent_trades(complex_id, RENTS) == (3, 1)
+    assert service.save_rent_trades(complex_id, RENTS) == (0, len(RENTS))
+
+    # 다른 단지의 같은 거래는 별개로 저장
+    other_id = f"{complex_id}-other"
+    db.add(Complex(complex_id=other_id, complex_name="다른 단지"))
+    db.commit()
+    assert service.save_trades(other_id, TRADES[:1]) == (1, 0)
+
+    trades = db.query(Transaction).filter(Transaction.complex_id == complex_id).all()
+    assert len(trades) == 4
+    for trade in trades:
+        assert trade.row_hash == transaction_row_hash(
+            trade.complex_id, trade.trade_type, trade.trade_date,
+            trade.exclusive_area, trade.floor, trade.deal_price
+        ), trade.id
+    assert {t.formatted_price for t in trades} >= {"10억 5,000만", "9억 8,000만"}
+
+    rents = db.query(RentTransaction).filter(RentTransaction.complex_id == complex_id).all()
+    assert sorted(r.rent_type for r in rents) == ["월세", "전세", "전세"]
+    for rent in rents:
+        assert rent.row_hash == rent_transaction_row_hash(
+            rent.complex_id, rent.trade_date, rent.exclusive_area, rent.floor,
+            rent.deposit, rent.monthly_rent, rent.contract_type
+        ), rent.id
+    db.close()
+
+
+def test_save_on_conflict():
+    """INSERT ... ON CONFLICT DO NOTHING RETURNING 경로 (SQLite 방언)"""
+    run_save_scenario("A")
+    print("✅ 재수집 시 0건 저장 (ON CONFLICT)")
+
+
+def test_save_fallback():
+    """ON CONFLICT/RETURNING 미지원 DB용 기존 해시 조회 경로"""
+    original = transaction_service.get_conflict_insert
+    transaction_service.get_conflict_insert = lambda db: None
+    try:
+        run_save_scenario("B")
+    finally:
+        transaction_service.get_conflict_insert = original
+    print("✅ 재수집 시 0건 저장 (대체 경로)")
+
+
+def test_insert_batches():
+    """배치 크기보다 많은 행도 빠짐없이 저장하고 재저장 시 0건"""
+    original = transaction_service.TRANSACTION_INSERT_BATCH_SIZE
+    transaction_service.TRANSACTION_INSERT_BATCH_SIZE = 3
+    try:
+        db = TestSession()
+        db.add(Complex(complex_id="C", complex_name="단지 C"))
+        db.commit()
+        service = TransactionService(db)
+
+        trades = [
+            {"trade_date": "20240201", "deal_price": 90000 + i, "floor": i, "exclusive_area": 59.99}
+            for i in range(10)
+        ]
+        assert service.save_trades("C", trades) == (10, 0)
+        assert service.save_trades("C", trades) == (0, 10)
+        db.close()
+    finally:
+        transaction_service.TRANSACTION_INSERT_BATCH_SIZE = original
+    print("✅ 배치 분할 저장")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🧪 실거래 중복 방지 저장 테스트")
+    print("=" * 60)
+
+    try:
+        test_row_hash_formatting()
+        test_save_on_conflict()
+        test_save_fallback()
+        test_insert_batches()
+        print("\n✅ 모든 테스트 완료!")
+
+    except Exception as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
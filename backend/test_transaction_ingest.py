@@ -0,0 +1,58 @@
+"""
+지역 단위 실거래가 수집 테스트 스크립트 (단지 매칭 / 조회 년월)
+"""
+import sys
+import os
+from datetime import date
+
+# 프로젝트 루트를 파이썬 경로에 추가
+sys.path.insert(0, os.path.dirname(__file__))
+
+from app.models.complex import Complex
+from app.services.molit_service import recent_year_months
+from app.services.transaction_ingest import ComplexMatcher, extract_dong
+
+
+def test_recent_year_months():
+    """recent_year_months: 달력 기준 월 (30일 단위 계산의 누락/중복 없음)"""
+    assert recent_year_months(3, date(2025, 3, 31)) == ["202503", "202502", "202501"]
+    assert recent_year_months(2, date(2025, 1, 1)) == ["202501", "202412"]
+    months = recent_year_months(24, date(2025, 5, 31))
+    assert len(set(months)) == 24 and months[-1] == "202306"
+    print("✅ recent_year_months 통과")
+
+
+def test_extract_dong():
+    """extract_dong: 지번 주소에서 법정동 추출"""
+    assert extract_dong("서울특별시 강남구 대치동 316") == "대치동"
+    assert extract_dong("경기도 성남시 분당구 정자동 1") == "정자동"
+    assert extract_dong("서울특별시 종로구 종로1가 1") == "종로1가"
+    assert extract_dong(None) is None
+    print("✅ extract_dong 통과")
+
+
+def test_complex_matcher():
+    """ComplexMatcher: 단지명 포함 + 법정동 일치 + 긴 이름 우선"""
+    matcher = ComplexMatcher([
+        Complex(complex_id="1", complex_name="래미안", address="서울특별시 강남구 대치동 1"),
+        Complex(complex_id="2", complex_name="래미안 대치팰리스", address="서울특별시 강남구 대치동 2"),
+    ])
+
+    assert matcher.match({"complex_name": "래미안대치팰리스", "dong": "대치동"}) == "2"
+    assert matcher.match({"complex_name": "래미안(대치)", "dong": "대치동"}) == "1"
+    assert matcher.match({"complex_name": "래미안", "dong": "역삼동"}) is None
+    assert matcher.match({"complex_name": "은마", "dong": "대치동"}) is None
+    print("✅ ComplexMatcher 통과")
+
+
+if __name__ == "__main__":
+    try:
+        test_recent_year_months()
+        test_extract_dong()
+        test_complex_matcher()
+
+        print("\n✅ 모든 테스트 완료!")
+
+    except AssertionError as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        sys.exit(1)
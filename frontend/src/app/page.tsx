@@ -1,7 +1,7 @@
 'use client';
 
 import { useEffect, useState } from 'react';
-import { complexAPI, articleAPI } from '@/lib/api';
+import { complexAPI } from '@/lib/api';
 import type { Complex } from '@/types';
 
 interface ComplexStats {
@@ -51,40 +51,41 @@ export default function Home() {
       const complexesData = response.data;
       setComplexes(complexesData);
 
-      // 각 단지의 상세 통계 가져오기
-      const statsPromises = complexesData.map(async (complex) => {
-        try {
-          const [statsRes, changesRes] = await Promise.all([
-            complexAPI.getStats(complex.complex_id),
-            articleAPI.getChangeSummary(complex.complex_id, 24).catch(() => ({
-              data: { summary: { new: 0, removed: 0, price_up: 0, price_down: 0 } }
-            }))
-          ]);
-
-          return {
-            complex_id: complex.complex_id,
-            complex_name: complex.complex_name,
-            complex_type: complex.complex_type,
-            address: complex.address,
-            total_households: complex.total_households,
-            articles: statsRes.data.articles,
-            price_range: statsRes.data.price_range,
-            changes_24h: changesRes.data.summary,
-            min_price: complex.min_price,
-            max_price: complex.max_price,
-          } as ComplexStats;
-        } catch (err) {
-          console.log(`단지 ${complex.complex_id} 통계 로딩 실패`);
-          return null;
-        }
-      });
-
-      const statsResults = await Promise.all(statsPromises);
+      // 전체 단지 통계를 일괄 조회 (요청당 최대 100개 단지)
       const statsMap: Record<string, ComplexStats> = {};
-      statsResults.forEach((stat) => {
-        if (stat) {
-          statsMap[stat.complex_id] = stat;
+      const ids = complexesData.map((complex) => complex.complex_id);
+      const chunks: string[][] = [];
+      for (let i = 0; i < ids.length; i += 100) {
+        chunks.push(ids.slice(i, i + 100));
+      }
+
+      const statsResponses = await Promise.all(
+        chunks.map((chunk) =>
+          complexAPI.getStatsBatch(chunk).catch(() => {
+            console.log(`단지 통계 로딩 실패: ${chunk.join(',')}`);
+            return { data: {} as Record<string, any> };
+          })
+        )
+      );
+      const statsById = Object.assign({}, ...statsResponses.map((res) => res.data));
+
+      complexesData.forEach((complex) => {
+        const stats = statsById[complex.complex_id];
+        if (!stats) {
+          return;
         }
+        statsMap[complex.complex_id] = {
+          complex_id: complex.complex_id,
+          complex_name: complex.complex_name,
+          complex_type: complex.complex_type,
+          address: complex.address,
+          total_households: complex.total_households,
+          articles: stats.articles,
+          price_range: stats.price_range,
+          changes_24h: stats.changes_24h,
+          min_price: complex.min_price,
+          max_price: complex.max_price,
+        } as ComplexStats;
       });
       setComplexStats(statsMap);
     } catch (error) {
@@ -21,6 +21,8 @@ export const complexAPI = {
   getById: (id: number) => api.get<Complex>(`/api/complexes/${id}`),
   getDetail: (id: string) => api.get(`/api/complexes/${id}`),
   getStats: (id: string) => api.get(`/api/complexes/${id}/stats`),
+  getStatsBatch: (ids: string[]) =>
+    api.get<Record<string, any>>('/api/complexes/stats', { params: { ids: ids.join(',') } }),
   delete: (id: string) => api.delete(`/api/complexes/${id}`),
   getList: (offset: number, limit: number) => api.get<Complex[]>(`/api/complexes/?offset=${offset}&limit=${limit}`),
   updateAddress: (id: string, address: string) => api.patch(`/api/complexes/${id}/address`, { address }),
@@ -0,0 +1,119 @@
+"""
+주소 → 시군구 코드 매칭 벤치마크: 선형 `name in address` 탐색(기존) vs AddressResolver 색인
+
+backend/app/data/dong_code_active.txt 의 실제 법정동 이름으로 주소 N개를 만들어
+(정식 명칭 / 시도 약칭 / 시도 생략 / 띄어쓰기 없음 + 지번, 도로명 주소 일부)
+두 방식의 주소당 시간과 정답(법정동 코드 앞 5자리) 일치율을 비교합니다.
+
+사용 방법:
+    python tests/benchmarks/bench_address_resolver.py
+    python tests/benchmarks/bench_address_resolver.py --count 10000 --seed 7
+"""
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+
+BACKEND_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "backend")
+sys.path.insert(0, BACKEND_DIR)
+
+# 기존 구현의 수동 매핑 (LocationParser.extract_sigungu_code에 하드코딩되어 있던 값)
+LEGACY_MANUAL_MAP = {
+    "강남구": "11680", "서초구": "11650", "송파구": "11710", "강동구": "11740",
+    "서대문구": "11410", "마포구": "11440", "분당구": "41135", "수지구": "41465",
+    "화성시": "41590", "안양시 동안구": "41173", "동안구": "41173", "안양시 만안구": "41171",
+    "만안구": "41171", "용인시 수지구": "41465", "용인시 기흥구": "41463", "기흥구": "41463",
+    "성남시 분당구": "41135", "성남시 중원구": "41133", "중원구": "41133", "경주시": "47130",
+    "전주시 완산구": "52111", "완산구": "52111", "전주시 덕진구": "52113", "덕진구": "52113",
+}
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="주소 매칭 벤치마크")
+    parser.add_argument("--count", type=int, default=10000, help="주소 수")
+    parser.add_argument("--seed", type=int, default=7)
+    return parser.parse_args()
+
+
+def legacy_extract(location_parser, address):
+    """기존 방식: 시군구 → 법정동 → 수동 매핑 순서로 전체 선형 탐색"""
+    for location_name, sigungu_code in location_parser.sigungu_code_map.items():
+        if location_name in address:
+            return sigungu_code
+    for location_name, full_code in location_parser.dong_code_map.items():
+        if location_name in address:
+            return full_code[:5]
+    for key, code in LEGACY_MANUAL_MAP.items():
+        if key in address:
+            return code
+    return None
+
+
+def build_addresses(location_parser, resolver, count, seed):
+    """실제 법정동 이름으로 (주소, 정답 시군구 코드) 생성"""
+    from app.services.address_resolver import SIDO_ALIASES
+
+    rng = random.Random(seed)
+    rows = sorted((code, name) for name, code in location_parser.dong_code_map.items() if code[5:8] != "000")
+    addresses = []
+
+    for _ in range(count):
+        code, name = rng.choice(rows)
+        tokens = name.split()
+        jibun = f"{rng.randint(1, 999)}-{rng.randint(1, 30)}" if rng.random() < 0.7 else str(rng.randint(1, 999))
+        style = rng.random()
+
+        if style < 0.4:
+            address = f"{name} {jibun}"
+        elif style < 0.6:
+            alias = SIDO_ALIASES.get(code[:2], (tokens[0],))[0]
+            address = " ".join([alias, *tokens[1:], jibun])
+        elif style < 0.8:
+            address = " ".join([*tokens[1:], jibun])
+        elif style < 0.9:
+            address = "".join(tokens) + f" {jibun}"
+        else:
+            # 도로명 주소: 시도 시군구 + 도로명 (법정동 없음)
+            sigungu_name = resolver.sigungu_name(code[:5])
+            address = f"{sigungu_name} {rng.choice(['중앙로', '시청로', '대학로'])} {rng.randint(1, 300)}"
+
+        addresses.append((address, code[:5]))
+
+    return addresses
+
+
+def measure(label, func, addresses):
+    started = time.perf_counter()
+    results = [func(address) for address, _ in addresses]
+    elapsed = time.perf_counter() - started
+
+    correct = sum(1 for result, (_, expected) in zip(results, addresses) if result == expected)
+    wrong = sum(1 for result, (_, expected) in zip(results, addresses) if result and result != expected)
+    print(
+        f"  {label:<24} {elapsed / len(addresses) * 1e6:9.1f} µs/주소  {len(addresses) / elapsed:10,.0f} 주소/초  "
+        f"정답 {correct / len(addresses):6.1%}  오답 {wrong:,}  미해석 {len(addresses) - correct - wrong:,}"
+    )
+    return elapsed, correct
+
+
+def main():
+    args = parse_args()
+    logging.disable(logging.WARNING)  # 미해석 경고 로그 생략
+
+    from app.services.location_parser import LocationParser
+
+    location_parser = LocationParser()
+    addresses = build_addresses(location_parser, location_parser.resolver, args.count, args.seed)
+
+    print(f"🏠 주소 {len(addresses):,}개 (법정동 {len(location_parser.dong_code_map):,}개, seed {args.seed})")
+    legacy_time, legacy_correct = measure("선형 탐색 (기존)", lambda a: legacy_extract(location_parser, a), addresses)
+    resolver_time, resolver_correct = measure("AddressResolver", location_parser.extract_sigungu_code, addresses)
+
+    assert resolver_correct >= legacy_correct, "AddressResolver 정답 수가 기존보다 적습니다"
+    print(f"✅ {legacy_time / resolver_time:.0f}배 빠름, 정답 {resolver_correct - legacy_correct:+,}건")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+국토부 실거래가 XML 파싱 벤치마크: ET.fromstring + parse_trade_to_dict(기존) vs iterparse 스트리밍 (molit_parser)
+
+tests/fixtures/molit/trade_11680_202501_page1.xml.gz (1,000건, 아이템당 32개 태그) 한 페이지를
+반복 파싱하여 페이지당 시간과 최대 메모리(tracemalloc)를 비교합니다.
+스트리밍 파서의 이득은 최대 메모리(약 6배 감소)이며, 페이지당 시간은 기존과 같은 수준입니다. (tests/README.md 참고)
+
+사용 방법:
+    python tests/benchmarks/bench_molit_parser.py
+    python tests/benchmarks/bench_molit_parser.py --repeat 50
+"""
+import argparse
+import gzip
+import os
+import sys
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+BACKEND_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "backend")
+sys.path.insert(0, BACKEND_DIR)
+
+FIXTURE = Path(__file__).resolve().parent.parent / "fixtures" / "molit" / "trade_11680_202501_page1.xml.gz"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="국토부 XML 파싱 벤치마크")
+    parser.add_argument("--repeat", type=int, default=20, help="반복 횟수")
+    return parser.parse_args()
+
+
+def parse_legacy(content: bytes, service):
+    """기존 방식: 전체 트리 → 아이템 dict → parse_trade_to_dict"""
+    root = ET.fromstring(content)
+    items = [
+        {child.tag: child.text if child.text else "" for child in item}
+        for item in root.find("body").find("items").findall("item")
+    ]
+    return [service.parse_trade_to_dict(item) for item in items]
+
+
+def parse_streaming(content: bytes):
+    from app.services.molit_parser import parse_trade_page
+    return parse_trade_page(content, "trade")["items"]
+
+
+def measure(label, func, repeat):
+    func()  # 워밍업
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        records = func()
+    per_page = (time.perf_counter() - started) / repeat
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"  {label:<28} {per_page * 1000:8.1f} ms/페이지  {len(records) / per_page:10,.0f} 건/초  최대 메모리 {peak / 1024 / 1024:6.2f} MB")
+    return records, per_page, peak
+
+
+def main():
+    args = parse_args()
+
+    from app.services.molit_service import MOLITService
+
+    content = gzip.decompress(FIXTURE.read_bytes())
+    service = MOLITService()
+
+    print(f"📄 픽스처: {FIXTURE.name} ({len(content) / 1024:.0f} KB, 반복 {args.repeat}회)")
+    legacy, legacy_time, legacy_peak = measure("ET.fromstring + 정규화", lambda: parse_legacy(content, service), args.repeat)
+    streaming, streaming_time, streaming_peak = measure("iterparse 스트리밍", lambda: parse_streaming(content), args.repeat)
+
+    assert len(legacy) == len(streaming) == 1000
+    assert legacy == streaming, "두 파서의 결과가 다릅니다"
+
+    print(
+        f"✅ 결과 동일 ({len(streaming):,}건), 최대 메모리 {legacy_peak / streaming_peak:.2f}배 감소 "
+        f"(시간 비 {legacy_time / streaming_time:.2f})"
+    )
+
+
+if __name__ == "__main__":
+    main()
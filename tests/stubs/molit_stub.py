@@ -0,0 +1,199 @@
+"""
+국토교통부 실거래가 API 스텁 서버 (오프라인 테스트용)
+
+(시군구 코드, 년월)마다 결정적인 가짜 거래를 만들어 실제 API와 같은 XML 형식으로 반환합니다.
+
+    GET /1613000/RTMSDataSvcAptTradeDev/getRTMSDataSvcAptTradeDev?LAWD_CD=&DEAL_YMD=&pageNo=&numOfRows=
+    GET /1613000/RTMSDataSvcAptRent/getRTMSDataSvcAptRent?LAWD_CD=&DEAL_YMD=&pageNo=&numOfRows=
+
+테스트에서 조정할 수 있는 서버 속성:
+    server.rows_per_month: 지역-월당 거래 수 (기본 2,500 → 3페이지)
+    server.delay: 응답 지연(초)
+    server.fail_next: 앞으로 N개 요청에 503 응답 (재시도 테스트)
+    server.quota_limit: N번째 이후 요청에 일일 한도 초과 응답 (0이면 제한 없음)
+    server.result_codes: (LAWD_CD, DEAL_YMD) → resultCode, HTTP 200 + header만 있는 오류 응답
+                         (예: "03" 데이터 없음, "22" 한도 초과, "30" 미등록 키)
+    server.request_log: 요청 경로 목록
+
+사용 방법:
+    python tests/stubs/molit_stub.py --port 8766
+
+    MOLIT_API_BASE=http://127.0.0.1:8766/1613000 MOLIT_API_KEY=stub python backend/test_molit_client.py
+"""
+import argparse
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+from xml.sax.saxutils import escape
+
+TRADE_PATH = "/1613000/RTMSDataSvcAptTradeDev/getRTMSDataSvcAptTradeDev"
+RENT_PATH = "/1613000/RTMSDataSvcAptRent/getRTMSDataSvcAptRent"
+
+APT_NAMES = ["래미안대치팰리스", "은마", "한솔마을5단지", "느티마을3단지", "상록마을우성", "파크뷰"]
+DONGS = ["대치동", "대치동", "정자동", "정자동", "정자동", "정자동"]
+
+QUOTA_EXCEEDED_XML = (
+    "<OpenAPI_ServiceResponse><cmmMsgHeader>"
+    "<errMsg>SERVICE ERROR</errMsg>"
+    "<returnAuthMsg>LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS_ERROR</returnAuthMsg>"
+    "<returnReasonCode>22</returnReasonCode>"
+    "</cmmMsgHeader></OpenAPI_ServiceResponse>"
+)
+
+
+def build_result_code_xml(result_code: str) -> str:
+    """body 없이 header만 있는 응답 (데이터 없음/오류 코드)"""
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f"<response><header><resultCode>{result_code}</resultCode>"
+        f"<resultMsg>ERROR {result_code}</resultMsg></header></response>"
+    )
+
+
+def make_item(endpoint: str, lawd_cd: str, deal_ymd: str, index: int) -> dict:
+    """지역-월의 index번째 가짜 거래 (같은 인자면 항상 같은 값)"""
+    apt = index % len(APT_NAMES)
+    item = {
+        "aptNm": APT_NAMES[apt],
+        "umdNm": DONGS[apt],
+        "sggCd": lawd_cd,
+        "jibun": str(100 + apt),
+        "dealYear": deal_ymd[:4],
+        "dealMonth": str(int(deal_ymd[4:])),
+        "dealDay": str(index % 28 + 1),
+        "excluUseAr": f"{59 + (index % 3) * 25}.{index % 100:02d}",
+        "floor": str(index % 25 + 1),
+        "buildYear": str(1990 + apt * 4),
+    }
+    if endpoint == "rent":
+        monthly = (index % 3) * 50
+        item.update({
+            "deposit": f"{30000 + (index % 40) * 500:,}",
+            "monthlyRent": str(monthly),
+            "contractType": "갱신" if index % 4 == 0 else "신규",
+            "contractTerm": f"{deal_ymd[2:]}~{int(deal_ymd[2:4]) + 2:02d}{deal_ymd[4:]}",
+        })
+    else:
+        item["dealAmount"] = f"{100000 + (index % 50) * 1000 + apt * 20000:,}"
+    return item
+
+
+def build_page_xml(endpoint: str, lawd_cd: str, deal_ymd: str, page_no: int, num_rows: int, total: int) -> str:
+    """실제 API와 같은 구조의 페이지 XML"""
+    start = (page_no - 1) * num_rows
+    end = min(start + num_rows, total)
+
+    parts = [
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>',
+        "<response><header><resultCode>000</resultCode><resultMsg>OK</resultMsg></header>",
+        "<body><items>",
+    ]
+    for index in range(start, end):
+        item = make_item(endpoint, lawd_cd, deal_ymd, index)
+        parts.append("<item>" + "".join(f"<{k}>{escape(v)}</{k}>" for k, v in item.items()) + "</item>")
+    parts.append(
+        f"</items><numOfRows>{num_rows}</numOfRows><pageNo>{page_no}</pageNo>"
+        f"<totalCount>{total}</totalCount></body></response>"
+    )
+    return "".join(parts)
+
+
+class MOLITStubHandler(BaseHTTPRequestHandler):
+    """가짜 실거래 XML을 반환하는 요청 핸들러"""
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        server = self.server
+
+        with server.lock:
+            server.request_log.append(self.path)
+            request_no = len(server.request_log)
+            fail = server.fail_next > 0
+            if fail:
+                server.fail_next -= 1
+
+        if server.delay:
+            time.sleep(server.delay)
+
+        if fail:
+            self._send(503, "<error>Service Unavailable</error>")
+            return
+
+        if server.quota_limit and request_no > server.quota_limit:
+            self._send(200, QUOTA_EXCEEDED_XML)
+            return
+
+        endpoint = {TRADE_PATH: "trade", RENT_PATH: "rent"}.get(parsed.path)
+        if endpoint is None:
+            self._send(404, "<error>not found</error>")
+            return
+
+        query = parse_qs(parsed.query)
+        lawd_cd = query.get("LAWD_CD", [""])[0]
+        deal_ymd = query.get("DEAL_YMD", [""])[0]
+        page_no = int(query.get("pageNo", ["1"])[0])
+        num_rows = int(query.get("numOfRows", ["10"])[0])
+
+        result_code = server.result_codes.get((lawd_cd, deal_ymd))
+        if result_code:
+            self._send(200, build_result_code_xml(result_code))
+            return
+
+        self._send(200, build_page_xml(endpoint, lawd_cd, deal_ymd, page_no, num_rows, server.rows_per_month))
+
+    def _send(self, status: int, body: str):
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/xml;charset=UTF-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _create_server(port: int) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(("127.0.0.1", port), MOLITStubHandler)
+    server.request_log = []
+    server.lock = threading.Lock()
+    server.rows_per_month = 2500
+    server.delay = 0.0
+    server.fail_next = 0
+    server.quota_limit = 0
+    server.result_codes = {}
+    return server
+
+
+def start_stub_server(port: int = 0) -> ThreadingHTTPServer:
+    """
+    백그라운드 스레드에서 스텁 서버 시작
+
+    Args:
+        port: 포트 (0이면 임의 포트)
+
+    Returns:
+        서버 객체 (server.server_address 로 포트 확인, server.shutdown() 으로 종료)
+    """
+    server = _create_server(port)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="국토교통부 실거래가 API 스텁 서버")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--rows", type=int, default=2500, help="지역-월당 거래 수")
+    parser.add_argument("--delay", type=float, default=0.0, help="응답 지연(초)")
+    args = parser.parse_args()
+
+    server = _create_server(args.port)
+    server.rows_per_month = args.rows
+    server.delay = args.delay
+    print(f"🧪 국토부 실거래가 스텁 서버: http://127.0.0.1:{args.port}/1613000")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
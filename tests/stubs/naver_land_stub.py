@@ -0,0 +1,130 @@
+"""
+네이버 부동산 API 스텁 서버 (오프라인 테스트용)
+
+tests/fixtures/naver_land/ 의 녹화된 JSON 응답을 그대로 돌려줍니다.
+
+    complex_{단지ID}_overview.json         → GET /api/complexes/overview/{단지ID}
+    complex_{단지ID}_articles_page{N}.json → GET /api/articles/complex/{단지ID}?page=N
+
+사용 방법:
+    python tests/stubs/naver_land_stub.py --port 8765
+
+    NAVER_LAND_API_BASE=http://127.0.0.1:8765/api 로 지정하고,
+    브라우저 토큰 캡처 대신 stub_auth_token() 으로 만든 토큰을 인증 캐시에 넣어 사용합니다.
+
+        from app.services import article_fetcher
+        article_fetcher._cached_auth = article_fetcher.NaverAuth(stub_auth_token(), {})
+"""
+import argparse
+import base64
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+FIXTURE_DIR = Path(__file__).resolve().parent.parent / "fixtures" / "naver_land"
+
+OVERVIEW_PATH = re.compile(r"^/api/complexes/overview/(\d+)$")
+ARTICLES_PATH = re.compile(r"^/api/articles/complex/(\d+)$")
+
+
+def stub_auth_token(ttl: int = 3600) -> str:
+    """
+    스텁 서버용 Bearer 토큰 (exp가 들어 있는 JWT 형식이라 NaverAuth가 만료 시각을 읽을 수 있음)
+
+    Args:
+        ttl: 유효 시간(초)
+    """
+    def encode(part: dict) -> str:
+        return base64.urlsafe_b64encode(json.dumps(part).encode("utf-8")).decode("ascii").rstrip("=")
+
+    header = encode({"alg": "none", "typ": "JWT"})
+    payload = encode({"sub": "stub", "exp": int(time.time()) + ttl})
+    return f"Bearer {header}.{payload}.stub"
+
+
+class NaverLandStubHandler(BaseHTTPRequestHandler):
+    """녹화된 픽스처를 반환하는 요청 핸들러"""
+
+    # 서버 인스턴스별 요청 로그 (테스트에서 확인용)
+    def _record(self, path: str):
+        self.server.request_log.append(path)
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        self._record(self.path)
+
+        if not self.headers.get("Authorization", "").startswith("Bearer "):
+            self._send_json(401, {"error": "unauthorized"})
+            return
+
+        match = OVERVIEW_PATH.match(parsed.path)
+        if match:
+            self._send_fixture(f"complex_{match.group(1)}_overview.json")
+            return
+
+        match = ARTICLES_PATH.match(parsed.path)
+        if match:
+            page = parse_qs(parsed.query).get("page", ["1"])[0]
+            fixture = FIXTURE_DIR / f"complex_{match.group(1)}_articles_page{page}.json"
+            if not fixture.exists():
+                # 녹화 범위를 벗어난 페이지는 빈 목록
+                self._send_json(200, {"isMoreData": False, "articleList": []})
+                return
+            self._send_fixture(fixture.name)
+            return
+
+        self._send_json(404, {"error": "not found"})
+
+    def _send_fixture(self, name: str):
+        path = FIXTURE_DIR / name
+        if not path.exists():
+            self._send_json(404, {"error": f"fixture not found: {name}"})
+            return
+        self._send_json(200, json.loads(path.read_text(encoding="utf-8")))
+
+    def _send_json(self, status: int, body):
+        payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json;charset=UTF-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server(port: int = 0) -> ThreadingHTTPServer:
+    """
+    백그라운드 스레드에서 스텁 서버 시작
+
+    Args:
+        port: 포트 (0이면 임의 포트)
+
+    Returns:
+        서버 객체 (server.server_address 로 포트 확인, server.shutdown() 으로 종료)
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", port), NaverLandStubHandler)
+    server.request_log = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="네이버 부동산 API 스텁 서버")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), NaverLandStubHandler)
+    server.request_log = []
+    print(f"🧪 네이버 부동산 스텁 서버: http://127.0.0.1:{args.port}/api")
+    print(f"   픽스처: {FIXTURE_DIR}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
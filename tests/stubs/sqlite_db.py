@@ -0,0 +1,61 @@
+"""
+SQLite 테스트 DB 하네스 (backend/test_*.py, tests/benchmarks 공용)
+
+PostgreSQL 없이 모델 전체 테이블을 SQLite에 만들어 테스트/벤치마크를 실행합니다.
+이 모듈을 임포트하면 BigInteger 컬럼이 SQLite에서 INTEGER로 생성됩니다.
+(SQLite는 BIGINT PRIMARY KEY 자동 증가를 지원하지 않음)
+
+사용 방법:
+    # backend/test_*.py - 프로세스 안에서만 쓰는 메모리 DB
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "tests", "stubs"))
+    from sqlite_db import create_test_session
+    TestSession = create_test_session()
+
+    # tests/benchmarks - DATABASE_URL을 지정하고 app.core.database 엔진에 테이블 생성
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "stubs"))
+    from sqlite_db import setup_database
+    setup_database("sqlite:///tmp/bench.db")  # 또는 PostgreSQL URL
+"""
+import os
+
+from sqlalchemy import BigInteger, create_engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+
+@compiles(BigInteger, "sqlite")
+def _bigint_as_integer(type_, compiler, **kw):
+    return "INTEGER"
+
+
+def create_test_session() -> sessionmaker:
+    """
+    모든 테이블을 만든 SQLite 메모리 DB 세션 팩토리
+
+    StaticPool로 연결 하나를 공유하므로 세션/스레드(TestClient)가 달라도 같은 DB를 봅니다.
+
+    Returns:
+        sessionmaker (TestSession)
+    """
+    from app.models.complex import Base
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)
+
+
+def setup_database(database_url: str):
+    """
+    DATABASE_URL을 지정하고 앱 기본 엔진(app.core.database)에 모든 테이블 생성
+
+    app.core.database가 DATABASE_URL을 임포트 시점에 읽으므로 앱 모듈을 임포트하기 전에 호출해야 합니다.
+
+    Args:
+        database_url: SQLite 파일 또는 PostgreSQL 테스트 DB URL
+    """
+    os.environ["DATABASE_URL"] = database_url
+
+    from app.core.database import engine
+    from app.models.complex import Base
+    Base.metadata.create_all(bind=engine)